@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+
+# This benchmark measures the time it takes to import sisl
+# in a fresh interpreter (the best of a number of runs).
+
+# This benchmark may be called using:
+#
+#  python $0 [runs]
+#
+# Additionally the modules imported may be profiled using:
+#
+#  python -X importtime -c "import sisl"
+#
+
+import sys
+import subprocess
+
+if len(sys.argv) > 1:
+    N = int(sys.argv[1])
+else:
+    N = 10
+print("N = {}".format(N))
+
+code = '''
+import time
+t0 = time.time()
+import sisl
+t1 = time.time()
+print(t1 - t0)
+'''
+
+times = []
+for _ in range(N):
+    out = subprocess.check_output([sys.executable, '-c', code])
+    times.append(float(out.decode().split()[-1]))
+
+print("import sisl: best {:.3f} s, average {:.3f} s".format(min(times), sum(times) / N))
@@ -28,6 +28,7 @@ Generic classes
    Atom
    Atoms
    Geometry
+   Trajectory
    SuperCell
    Grid
 
@@ -104,6 +105,7 @@ from .atom import *
 
 from .orbital import *
 from .geometry import *
+from .trajectory import *
 from .grid import *
 
 from .sparse import *
@@ -0,0 +1,211 @@
+""" Separable interpolation of regular 3D grids
+
+The interpolation of a grid from one shape to another is separable along
+the lattice vectors. Each direction is interpolated using a 1D operator which
+is either a (sparse/dense) weight matrix, or an FFT resampling.
+The grid is processed in slabs such that only the output array and a single
+slab need to be allocated (FFT and spline interpolation requires an additional
+intermediate array of the partially interpolated grid).
+"""
+from __future__ import print_function, division
+
+import numpy as np
+from scipy.sparse import csr_matrix, issparse
+
+from . import _array as _a
+
+__all__ = ['interp_weights', 'interp_grid']
+
+
+# Number of elements in each processed slab
+_SLAB_SIZE = 2 ** 22
+
+
+def _coordinates(n, periodic):
+    """ Fractional coordinates of the grid points along a direction """
+    if periodic:
+        return _a.aranged(n) / n
+    return np.linspace(0, 1, n)
+
+
+def interp_weights(n_old, n_new, method='linear', periodic=True, **kwargs):
+    r""" Weight matrix for interpolating `n_old` equi-spaced values to `n_new` values
+
+    The returned matrix, :math:`\mathbf W`, interpolates a vector by :math:`\mathbf W\mathbf v`.
+
+    For periodic directions the grid points are located at ``i / n`` (and the interpolation
+    uses the periodic image of the first point), otherwise the end points are located
+    at 0 and 1.
+
+    Parameters
+    ----------
+    n_old : int
+       number of values in the original vector
+    n_new : int
+       number of values in the interpolated vector
+    method : {'linear', 'nearest', 'cubic'}
+       the interpolation method, 'linear' and 'nearest' returns a sparse matrix, while
+       'cubic' (cubic spline) returns a dense matrix
+    periodic : bool, optional
+       whether the direction is periodic
+    **kwargs : optional
+       passed to `scipy.interpolate.CubicSpline` (only used for ``method='cubic'``)
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix or numpy.ndarray : the weight matrix with shape ``(n_new, n_old)``
+    """
+    x = _coordinates(n_new, periodic)
+
+    if n_old == 1:
+        return csr_matrix(np.ones([n_new, 1]))
+
+    if method == 'cubic':
+        from scipy.interpolate import CubicSpline
+        I = np.identity(n_old)
+        if periodic:
+            # The periodic image of the first point closes the spline
+            spline = CubicSpline(_a.aranged(n_old + 1) / n_old, np.vstack((I, I[:1])),
+                                 axis=0, bc_type='periodic', **kwargs)
+        else:
+            spline = CubicSpline(_coordinates(n_old, periodic), I, axis=0, **kwargs)
+        return spline(x)
+
+    # Position of the new points in units of the old grid spacing
+    if periodic:
+        t = x * n_old
+    else:
+        t = x * (n_old - 1)
+
+    if method == 'nearest':
+        idx = np.ceil(t - 0.5).astype(np.int32)
+        if periodic:
+            idx %= n_old
+        else:
+            np.clip(idx, 0, n_old - 1, out=idx)
+        return csr_matrix((np.ones(n_new), idx, _a.arangei(n_new + 1)), shape=(n_new, n_old))
+
+    elif method == 'linear':
+        idx = np.floor(t).astype(np.int32)
+        if not periodic:
+            np.clip(idx, 0, n_old - 2, out=idx)
+        w = t - idx
+        col = np.empty([n_new, 2], np.int32)
+        col[:, 0] = idx
+        col[:, 1] = idx + 1
+        if periodic:
+            col %= n_old
+        weight = np.empty([n_new, 2], np.float64)
+        weight[:, 0] = 1 - w
+        weight[:, 1] = w
+        W = csr_matrix((weight.ravel(), col.ravel(), _a.arangei(0, n_new * 2 + 1, 2)),
+                       shape=(n_new, n_old))
+        # Sum duplicate entries (when periodic with only 1 element)
+        W.sum_duplicates()
+        return W
+
+    raise ValueError("interp_weights: unknown interpolation method '{}'".format(method))
+
+
+def _apply_axis(op, arr, axis):
+    """ Apply the 1D interpolation operator `op` along `axis` of `arr` """
+    if op is None:
+        return arr
+    elif callable(op):
+        return op(arr, axis)
+    arr = np.moveaxis(arr, axis, 0)
+    shape = arr.shape
+    out = op.dot(arr.reshape(shape[0], -1))
+    return np.moveaxis(out.reshape((op.shape[0],) + shape[1:]), 0, axis)
+
+
+def _fft_resample(n, **kwargs):
+    """ Return a function which Fourier-resamples an array to `n` points along an axis """
+    from scipy.signal import resample
+
+    def func(arr, axis):
+        return resample(arr, n, axis=axis, **kwargs)
+    return func
+
+
+def interp_grid(grid, shape, method='linear', periodic=(True, True, True), out=None, **kwargs):
+    """ Interpolate a 3D array to a new shape using separable interpolation
+
+    Parameters
+    ----------
+    grid : (nx, ny, nz) numpy.ndarray
+       the grid values
+    shape : (3,) of int
+       the new shape of the grid
+    method : {'linear', 'nearest', 'cubic', 'fft'}
+       interpolation method. 'fft' uses periodic Fourier resampling
+       (trigonometric interpolation) for periodic directions, and cubic
+       splines for non-periodic directions.
+    periodic : (3,) of bool, optional
+       whether each direction is periodic
+    out : numpy.ndarray, optional
+       the output array (of shape `shape`)
+    **kwargs : optional
+       passed to the 1D interpolation routines, `scipy.interpolate.CubicSpline` for
+       ``method='cubic'`` and `scipy.signal.resample` for ``method='fft'`` (only along
+       periodic directions, non-periodic directions use default cubic splines).
+       Not allowed for 'linear' and 'nearest'.
+
+    Returns
+    -------
+    numpy.ndarray : the interpolated grid values
+    """
+    shape = tuple(_a.asarrayi(shape).ravel())
+    if len(shape) != 3 or grid.ndim != 3:
+        raise ValueError('interp_grid requires 3D grids')
+    if len(kwargs) > 0 and method in ('linear', 'nearest'):
+        raise ValueError("interp_grid: keyword arguments are not used for method '{}'".format(method))
+    if out is None:
+        out = np.empty(shape, dtype=grid.dtype)
+
+    # Create the operators for each direction
+    ops = []
+    for n_old, n_new, per in zip(grid.shape, shape, periodic):
+        if n_old == n_new:
+            ops.append(None)
+        elif method == 'fft' and per:
+            ops.append(_fft_resample(n_new, **kwargs))
+        elif method == 'fft':
+            ops.append(interp_weights(n_old, n_new, 'cubic', per))
+        else:
+            ops.append(interp_weights(n_old, n_new, method, per, **kwargs))
+
+    def yz(arr):
+        return _apply_axis(ops[2], _apply_axis(ops[1], arr, 1), 2)
+
+    if ops[0] is None or issparse(ops[0]):
+        # The first direction only requires few planes of the input grid
+        # for each output plane. Hence we only process one slab at a time.
+        nslab = max(1, _SLAB_SIZE // max(grid.shape[1] * grid.shape[2], shape[1] * shape[2]))
+        for i0 in range(0, shape[0], nslab):
+            i1 = min(i0 + nslab, shape[0])
+            if ops[0] is None:
+                out[i0:i1] = yz(grid[i0:i1])
+                continue
+            W = ops[0][i0:i1]
+            cols = np.unique(W.indices)
+            slab = W[:, cols].dot(grid[cols].reshape(len(cols), -1))
+            out[i0:i1] = yz(slab.reshape((i1 - i0,) + grid.shape[1:]))
+
+    else:
+        # Dense operators couple all planes, first interpolate the
+        # last two directions (per slab) and subsequently the first direction
+        # (per slab along the 2nd direction).
+        tmp = np.empty((grid.shape[0],) + shape[1:], dtype=out.dtype)
+        nslab = max(1, _SLAB_SIZE // max(grid.shape[1] * grid.shape[2], shape[1] * shape[2]))
+        for i0 in range(0, grid.shape[0], nslab):
+            i1 = min(i0 + nslab, grid.shape[0])
+            tmp[i0:i1] = yz(grid[i0:i1])
+
+        nslab = max(1, _SLAB_SIZE // max(grid.shape[0] * shape[2], shape[0] * shape[2]))
+        for i0 in range(0, shape[1], nslab):
+            i1 = min(i0 + nslab, shape[1])
+            out[:, i0:i1] = _apply_axis(ops[0], tmp[:, i0:i1], 0)
+        del tmp
+
+    return out
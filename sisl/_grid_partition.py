@@ -0,0 +1,144 @@
+""" Partitioning of regular 3D grids into atomic regions
+
+Each grid point is labelled by the atom it belongs to. The labels are
+calculated once (in slabs to reduce memory) using a k-d tree of the atomic
+coordinates (including the periodic images), and may subsequently be used for
+integrating any number of grids with the same shape in a single pass each.
+"""
+from __future__ import print_function, division
+
+from itertools import product
+
+import numpy as np
+
+from . import _array as _a
+
+__all__ = ['partition_grid']
+
+
+# Number of grid points in each processed slab
+_SLAB_SIZE = 2 ** 20
+
+
+def _periodic_images(xyz, cell, periodic):
+    """ Atomic coordinates folded into the cell, and their nearest periodic images
+
+    Returns
+    -------
+    numpy.ndarray : coordinates of all images
+    numpy.ndarray : atomic index of each of the images
+    """
+    # Fold the atoms into the primary cell along the periodic directions
+    fxyz = np.dot(xyz, np.linalg.inv(cell))
+    for i, p in enumerate(periodic):
+        if p:
+            fxyz[:, i] %= 1.
+    xyz = np.dot(fxyz, cell)
+
+    isc = _a.arrayd(list(product(*[(-1, 0, 1) if p else (0,) for p in periodic])))
+    off = np.dot(isc, cell)
+    na = len(xyz)
+    return (xyz.reshape(1, -1, 3) + off.reshape(-1, 1, 3)).reshape(-1, 3), np.tile(_a.arangei(na), len(off))
+
+
+def _closest_within(tree, xyz, ia, R, upper, k=8):
+    """ Closest atom which has the points `xyz` within its radius
+
+    Several atoms may be within range, but the closest may have a smaller radius than
+    the second closest. The number of queried neighbours is doubled for the points
+    without a match until all neighbours within `upper` have been checked.
+
+    Returns
+    -------
+    numpy.ndarray : atomic index for each point, -1 if no atom has the point within its radius
+    """
+    n_img = tree.n
+    a = _a.fulli(len(xyz), -1)
+    idx = _a.arangei(len(xyz))
+    while len(idx) > 0:
+        k = min(k, n_img)
+        d, j = tree.query(xyz[idx], k=k, distance_upper_bound=upper)
+        d = d.reshape(-1, k)
+        j = j.reshape(-1, k)
+        # Non-found neighbours are returned with index n_img
+        found = j < n_img
+        aj = np.where(found, ia[np.where(found, j, 0)], -1)
+        within = found & (d <= R[aj])
+        first = np.argmax(within, axis=1)
+        rows = _a.arangei(len(idx))
+        match = within[rows, first]
+        a[idx[match]] = aj[rows, first][match]
+        if k == n_img:
+            break
+        # Only if all k neighbours are within range may a further neighbour match
+        idx = idx[~match & found[:, -1]]
+        k *= 2
+    return a
+
+
+def partition_grid(shape, dcell, xyz, periodic=(True, True, True), R=None):
+    """ Label each grid point by the (closest) atom
+
+    Parameters
+    ----------
+    shape : (3,) of int
+       the shape of the grid
+    dcell : (3, 3) numpy.ndarray
+       the voxel cell, the grid points are located at ``dot(index, dcell)``
+    xyz : (na, 3) numpy.ndarray
+       atomic coordinates (relative to the grid origo)
+    periodic : (3,) of bool, optional
+       whether each direction is periodic, the images of the atoms in the neighbouring
+       cells are taken into account along periodic directions
+    R : (na,) numpy.ndarray, optional
+       the radius of each atom. If passed a grid point is only assigned the closest
+       atom which has the grid point within its radius. Otherwise (Voronoi) all grid points
+       are assigned the closest atom.
+
+    Returns
+    -------
+    numpy.ndarray : int32 labels with shape `shape`, grid points not belonging to any atom are -1
+    """
+    shape = tuple(_a.asarrayi(shape).ravel())
+    dcell = _a.asarrayd(dcell)
+    xyz = _a.asarrayd(xyz).reshape(-1, 3)
+    cell = dcell * _a.asarrayd(shape).reshape(3, 1)
+
+    labels = _a.emptyi(shape)
+    if len(xyz) == 0:
+        labels.fill(-1)
+        return labels
+
+    # scipy.spatial is slow to import, only do it when needed
+    from scipy.spatial import cKDTree
+    ixyz, ia = _periodic_images(xyz, cell, periodic)
+    tree = cKDTree(ixyz)
+
+    if R is not None:
+        R = _a.asarrayd(R).ravel()
+        if R.size == 1:
+            R = np.repeat(R, len(xyz))
+        # Same tolerance as for the shapes (points on the sphere are within)
+        R = R * (1. + 1.e-12)
+        # The upper bound is exclusive
+        upper = np.nextafter(R.max(), np.inf)
+
+    # Coordinates of the grid points along the 2nd and 3rd directions
+    iy = _a.aranged(shape[1]).reshape(-1, 1, 1)
+    iz = _a.aranged(shape[2]).reshape(1, -1, 1)
+    yz = iy * dcell[1].reshape(1, 1, 3) + iz * dcell[2].reshape(1, 1, 3)
+
+    nslab = max(1, _SLAB_SIZE // (shape[1] * shape[2]))
+    for i0 in range(0, shape[0], nslab):
+        i1 = min(i0 + nslab, shape[0])
+        ix = _a.aranged(i0, i1).reshape(-1, 1, 1, 1)
+        rxyz = (ix * dcell[0].reshape(1, 1, 1, 3) + yz.reshape(1, shape[1], shape[2], 3)).reshape(-1, 3)
+        if R is None:
+            # All points are assigned
+            a = ia[tree.query(rxyz)[1]]
+        else:
+            a = _closest_within(tree, rxyz, ia, R, upper)
+        del rxyz
+        labels[i0:i1] = a.reshape(i1 - i0, shape[1], shape[2])
+
+    return labels
@@ -0,0 +1,173 @@
+""" Spectral Poisson solvers for regular 3D grids
+
+The Poisson equation is solved in the fractional (lattice) coordinates of the
+grid, such that arbitrary (non-orthogonal) cells are handled exactly.
+
+Periodic directions are diagonalized with FFT's. A single non-periodic direction
+(Dirichlet or Neumann boundary conditions) is solved with a finite-difference
+stencil (including the cross-terms of non-orthogonal cells) using a tridiagonal
+solver, for each of the Fourier components of the periodic directions.
+"""
+from __future__ import print_function, division
+
+from math import pi
+
+import numpy as np
+
+__all__ = ['poisson_fft']
+
+
+def _wavenumbers(n, real=False, odd=False):
+    """ Angular wave-numbers (per fractional coordinate) for `n` grid points
+
+    For odd derivatives (`odd`) the Nyquist component (even `n`) is 0 to retain
+    the symmetry of the spectrum of real functions.
+    """
+    if real:
+        k = 2 * pi * np.fft.rfftfreq(n, 1. / n)
+    else:
+        k = 2 * pi * np.fft.fftfreq(n, 1. / n)
+    if odd and n % 2 == 0:
+        k[n // 2] = 0.
+    return k
+
+
+def _tridiagonal_solve(a, b, c, d):
+    """ Solve many tridiagonal systems simultaneously (Thomas algorithm)
+
+    The systems are stored along the first axis, i.e. for each column::
+
+        a[i] x[i-1] + b[i] x[i] + c[i] x[i+1] = d[i]
+
+    `b` and `d` are overwritten.
+    """
+    n = b.shape[0]
+    for i in range(1, n):
+        w = a[i] / b[i-1]
+        b[i] -= w * c[i-1]
+        d[i] -= w * d[i-1]
+    d[-1] /= b[-1]
+    for i in range(n - 2, -1, -1):
+        d[i] = (d[i] - c[i] * d[i+1]) / b[i]
+    return d
+
+
+def poisson_fft(rho, icell, periodic=(True, True, True), neumann=(False, False)):
+    r""" Solve the Poisson equation :math:`\nabla^2 V = -\rho` on a regular grid
+
+    For fully periodic grids the average of `rho` is removed (a compensating
+    homogeneous background) and the average of the solution is 0.
+
+    For non-periodic directions, the boundaries are located one grid spacing
+    outside the grid (as in a finite difference stencil with ghost points).
+    Dirichlet boundaries fix the potential to 0 at the boundary while Neumann
+    boundaries have zero normal derivative.
+
+    Parameters
+    ----------
+    rho : (nx, ny, nz) numpy.ndarray
+       the source term
+    icell : (3, 3) numpy.ndarray
+       the inverse cell (without :math:`2\pi`), i.e. ``SuperCell.icell``
+    periodic : (3,) of bool, optional
+       whether each direction is periodic, at most one direction may be non-periodic
+    neumann : (2,) of bool, optional
+       for the non-periodic direction, whether the lower/upper boundary is Neumann,
+       else it is Dirichlet
+
+    Returns
+    -------
+    numpy.ndarray : the solution :math:`V` with the same shape as `rho`
+    """
+    periodic = list(periodic)
+    is_real = not np.iscomplexobj(rho)
+
+    # Metric tensor for the Laplacian in fractional coordinates
+    # \nabla^2 = \sum_ij G_ij \partial_i \partial_j
+    G = np.dot(icell, icell.T)
+
+    if all(periodic):
+        if is_real:
+            rho_k = np.fft.rfftn(rho)
+        else:
+            rho_k = np.fft.fftn(rho)
+        shape = ((-1, 1, 1), (1, -1, 1), (1, 1, -1))
+        k = [_wavenumbers(n, is_real and i == 2).reshape(shape[i])
+             for i, n in enumerate(rho.shape)]
+        k_odd = [_wavenumbers(n, is_real and i == 2, True).reshape(shape[i])
+                 for i, n in enumerate(rho.shape)]
+
+        # Calculate |k|^2 for all k (in-place to reduce memory)
+        k_sq = np.zeros(rho_k.shape, dtype=np.float64)
+        for i in range(3):
+            k_sq += G[i, i] * k[i] ** 2
+            for j in range(i + 1, 3):
+                k_sq += 2 * G[i, j] * k_odd[i] * k_odd[j]
+        # Remove the average component
+        k_sq[0, 0, 0] = 1.
+        rho_k /= k_sq
+        rho_k[0, 0, 0] = 0.
+        del k_sq
+
+        if is_real:
+            return np.fft.irfftn(rho_k, s=rho.shape)
+        return np.fft.ifftn(rho_k)
+
+    if periodic.count(False) > 1:
+        raise NotImplementedError('poisson_fft only allows a single non-periodic direction')
+
+    # Move the non-periodic direction to the first axis
+    ax = periodic.index(False)
+    p = [i for i in range(3) if i != ax]
+    rho = np.moveaxis(rho, ax, 0)
+    n = rho.shape[0]
+    h = 1. / n
+
+    # Fourier transform the periodic directions
+    rho_k = np.fft.fft2(rho, axes=(1, 2))
+    shape = rho_k.shape
+    rho_k = rho_k.reshape(n, -1)
+    k1 = _wavenumbers(shape[1]).reshape(-1, 1)
+    k2 = _wavenumbers(shape[2]).reshape(1, -1)
+    k1_odd = _wavenumbers(shape[1], odd=True).reshape(-1, 1)
+    k2_odd = _wavenumbers(shape[2], odd=True).reshape(1, -1)
+
+    # Coefficients of the 1D equation for each Fourier component
+    #   G_aa V'' + 2i (G_a1 k1 + G_a2 k2) V' - (k . G . k) V = - rho
+    k_sq = (G[p[0], p[0]] * k1 ** 2 + 2 * G[p[0], p[1]] * k1_odd * k2_odd + G[p[1], p[1]] * k2 ** 2).ravel()
+    cross = (G[ax, p[0]] * k1_odd + G[ax, p[1]] * k2_odd).ravel()
+    off = G[ax, ax] / h ** 2
+    a = np.empty(rho_k.shape, dtype=np.complex128)
+    c = np.empty(rho_k.shape, dtype=np.complex128)
+    b = np.empty(rho_k.shape, dtype=np.complex128)
+    a[:] = off - 1j * cross / h
+    c[:] = off + 1j * cross / h
+    b[:] = - 2 * off - k_sq
+
+    # Boundary conditions (ghost points)
+    if neumann[0]:
+        b[0] += a[0]
+    if neumann[1]:
+        b[-1] += c[-1]
+    a[0] = 0.
+    c[-1] = 0.
+
+    rho_k *= -1
+    if neumann[0] and neumann[1]:
+        # The average component is only defined up to a constant
+        rho_k[:, 0] -= rho_k[:, 0].mean()
+        a[1, 0] = 0.
+        b[0, 0] = 1.
+        c[0, 0] = 0.
+        rho_k[0, 0] = 0.
+
+    V = _tridiagonal_solve(a, b, c, rho_k)
+    del a, b, c
+    if neumann[0] and neumann[1]:
+        V[:, 0] -= V[:, 0].mean()
+
+    V = V.reshape(shape)
+    V = np.fft.ifft2(V, axes=(1, 2))
+    if is_real:
+        V = V.real
+    return np.ascontiguousarray(np.moveaxis(V, 0, ax))
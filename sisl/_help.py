@@ -32,6 +32,21 @@ else:
     _range = xrange
 
 
+# Maximum number of elements in the temporary arrays of chunked calculations
+_CHUNK_SIZE = 2 ** 21
+
+
+def _pool_map(func, args, processes):
+    """ Return ``[func(arg) for arg in args]`` calculated by a pool of `processes` processes """
+    from multiprocessing import Pool
+    pool = Pool(processes)
+    try:
+        return pool.map(func, args)
+    finally:
+        pool.close()
+        pool.join()
+
+
 # Load the correct xml-parser
 try:
     from defusedxml.ElementTree import parse as xml_parse
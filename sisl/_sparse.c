@@ -959,11 +959,6 @@ typedef volatile __pyx_atomic_int_type __pyx_atomic_int;
             __pyx_sub_acquisition_count_locked(__pyx_get_slice_count_pointer(memview), memview->lock)
 #endif
 
-/* ForceInitThreads.proto */
-#ifndef __PYX_FORCE_INIT_THREADS
-  #define __PYX_FORCE_INIT_THREADS 0
-#endif
-
 /* NoFastGil.proto */
 #define __Pyx_PyGILState_Ensure PyGILState_Ensure
 #define __Pyx_PyGILState_Release PyGILState_Release
@@ -971,6 +966,11 @@ typedef volatile __pyx_atomic_int_type __pyx_atomic_int;
 #define __Pyx_FastGIL_Forget()
 #define __Pyx_FastGilFuncInit()
 
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
 
 /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":776
  * # in Cython to enable them only on the right systems.
@@ -1929,6 +1929,23 @@ static int __pyx_slices_overlap(__Pyx_memviewslice *slice1,
 /* Capsule.proto */
 static CYTHON_INLINE PyObject *__pyx_capsule_create(void *p, const char *sig);
 
+/* TypeInfoCompare.proto */
+static int __pyx_typeinfo_cmp(__Pyx_TypeInfo *a, __Pyx_TypeInfo *b);
+
+/* MemviewSliceValidateAndInit.proto */
+static int __Pyx_ValidateAndInit_memviewslice(
+                int *axes_specs,
+                int c_or_f_flag,
+                int buf_flags,
+                int ndim,
+                __Pyx_TypeInfo *dtype,
+                __Pyx_BufFmt_StackElem stack[],
+                __Pyx_memviewslice *memviewslice,
+                PyObject *original_obj);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_char__const__(PyObject *, int writable_flag);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
@@ -2056,22 +2073,17 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 /* CIntFromPy.proto */
 static CYTHON_INLINE char __Pyx_PyInt_As_char(PyObject *);
 
-/* TypeInfoCompare.proto */
-static int __pyx_typeinfo_cmp(__Pyx_TypeInfo *a, __Pyx_TypeInfo *b);
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_int(PyObject *, int writable_flag);
 
-/* MemviewSliceValidateAndInit.proto */
-static int __Pyx_ValidateAndInit_memviewslice(
-                int *axes_specs,
-                int c_or_f_flag,
-                int buf_flags,
-                int ndim,
-                __Pyx_TypeInfo *dtype,
-                __Pyx_BufFmt_StackElem stack[],
-                __Pyx_memviewslice *memviewslice,
-                PyObject *original_obj);
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_int(PyObject *, int writable_flag);
 
 /* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_int(PyObject *, int writable_flag);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_int(PyObject *, int writable_flag);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_char(PyObject *, int writable_flag);
 
 /* CheckBinaryVersion.proto */
 static int __Pyx_check_binary_version(void);
@@ -2099,10 +2111,10 @@ static PyObject *__pyx_memoryviewslice_assign_item_from_object(struct __pyx_memo
 
 /* Module declarations from 'libc.math' */
 
-/* Module declarations from 'cpython.buffer' */
-
 /* Module declarations from 'libc.string' */
 
+/* Module declarations from 'cpython.buffer' */
+
 /* Module declarations from 'libc.stdio' */
 
 /* Module declarations from '__builtin__' */
@@ -2178,7 +2190,10 @@ static void __pyx_memoryview_slice_assign_scalar(__Pyx_memviewslice *, int, size
 static void __pyx_memoryview__slice_assign_scalar(char *, Py_ssize_t *, Py_ssize_t *, int, size_t, void *); /*proto*/
 static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *, PyObject *); /*proto*/
 static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t = { "int32_t", NULL, sizeof(__pyx_t_5numpy_int32_t), { 0 }, 0, IS_UNSIGNED(__pyx_t_5numpy_int32_t) ? 'U' : 'I', IS_UNSIGNED(__pyx_t_5numpy_int32_t), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_uint8_t = { "uint8_t", NULL, sizeof(__pyx_t_5numpy_uint8_t), { 0 }, 0, IS_UNSIGNED(__pyx_t_5numpy_uint8_t) ? 'U' : 'I', IS_UNSIGNED(__pyx_t_5numpy_uint8_t), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_unsigned_char__const__ = { "const unsigned char", NULL, sizeof(unsigned char const ), { 0 }, 0, IS_UNSIGNED(unsigned char const ) ? 'U' : 'I', IS_UNSIGNED(unsigned char const ), 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_int = { "int", NULL, sizeof(int), { 0 }, 0, IS_UNSIGNED(int) ? 'U' : 'I', IS_UNSIGNED(int), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_unsigned_char = { "unsigned char", NULL, sizeof(unsigned char), { 0 }, 0, IS_UNSIGNED(unsigned char) ? 'U' : 'I', IS_UNSIGNED(unsigned char), 0 };
 #define __Pyx_MODULE_NAME "sisl._sparse"
 extern int __pyx_module_is_main_sisl___sparse;
 int __pyx_module_is_main_sisl___sparse = 0;
@@ -2194,62 +2209,122 @@ static PyObject *__pyx_builtin_TypeError;
 static PyObject *__pyx_builtin_Ellipsis;
 static PyObject *__pyx_builtin_id;
 static PyObject *__pyx_builtin_IndexError;
+static const char __pyx_k_D[] = "D";
+static const char __pyx_k_M[] = "M_";
 static const char __pyx_k_O[] = "O";
+static const char __pyx_k_Q[] = "Q_";
 static const char __pyx_k_c[] = "c";
+static const char __pyx_k_i[] = "i";
+static const char __pyx_k_j[] = "j";
+static const char __pyx_k_n[] = "n";
 static const char __pyx_k_r[] = "r";
+static const char __pyx_k_s[] = "s";
 static const char __pyx_k_id[] = "id";
+static const char __pyx_k_nc[] = "nc";
 static const char __pyx_k_np[] = "np";
 static const char __pyx_k_nr[] = "nr";
 static const char __pyx_k_nz[] = "nz";
+static const char __pyx_k_p0[] = "p0";
+static const char __pyx_k_p1[] = "p1";
+static const char __pyx_k_p2[] = "p2";
 static const char __pyx_k_rr[] = "rr";
+static const char __pyx_k_t0[] = "t0";
+static const char __pyx_k_t1[] = "t1";
+static const char __pyx_k_t2[] = "t2";
 static const char __pyx_k_COL[] = "COL";
+static const char __pyx_k_D_n[] = "D_n";
+static const char __pyx_k_IDX[] = "IDX";
+static const char __pyx_k_M_2[] = "M";
 static const char __pyx_k_PTR[] = "PTR";
+static const char __pyx_k_Q_2[] = "Q";
 static const char __pyx_k_col[] = "col";
+static const char __pyx_k_d_n[] = "d_n";
+static const char __pyx_k_hsc[] = "hsc";
+static const char __pyx_k_idx[] = "idx";
 static const char __pyx_k_ind[] = "ind";
+static const char __pyx_k_lin[] = "lin";
+static const char __pyx_k_n_n[] = "n_n";
 static const char __pyx_k_new[] = "__new__";
 static const char __pyx_k_obj[] = "obj";
 static const char __pyx_k_ptr[] = "ptr";
 static const char __pyx_k_tmp[] = "tmp";
+static const char __pyx_k_BASE[] = "BASE";
+static const char __pyx_k_MULT[] = "MULT";
 static const char __pyx_k_NCOL[] = "NCOL";
+static const char __pyx_k_REPS[] = "REPS";
+static const char __pyx_k_WORK[] = "WORK";
 static const char __pyx_k_base[] = "base";
 static const char __pyx_k_copy[] = "copy";
 static const char __pyx_k_dict[] = "__dict__";
+static const char __pyx_k_full[] = "full";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_mode[] = "mode";
+static const char __pyx_k_mult[] = "mult";
 static const char __pyx_k_name[] = "name";
 static const char __pyx_k_ncol[] = "ncol";
 static const char __pyx_k_ndim[] = "ndim";
 static const char __pyx_k_pack[] = "pack";
+static const char __pyx_k_reps[] = "reps";
 static const char __pyx_k_size[] = "size";
 static const char __pyx_k_sort[] = "sort";
 static const char __pyx_k_step[] = "step";
 static const char __pyx_k_stop[] = "stop";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_work[] = "work";
 static const char __pyx_k_ASCII[] = "ASCII";
+static const char __pyx_k_COL_A[] = "COL_A";
+static const char __pyx_k_COL_B[] = "COL_B";
+static const char __pyx_k_COL_n[] = "COL_n";
+static const char __pyx_k_PTR_A[] = "PTR_A";
+static const char __pyx_k_PTR_B[] = "PTR_B";
+static const char __pyx_k_PTR_n[] = "PTR_n";
 static const char __pyx_k_class[] = "__class__";
+static const char __pyx_k_col_a[] = "col_a";
+static const char __pyx_k_col_b[] = "col_b";
+static const char __pyx_k_col_n[] = "col_n";
 static const char __pyx_k_dtype[] = "dtype";
 static const char __pyx_k_empty[] = "empty";
 static const char __pyx_k_error[] = "error";
 static const char __pyx_k_flags[] = "flags";
+static const char __pyx_k_ind_n[] = "ind_n";
 static const char __pyx_k_int32[] = "int32";
 static const char __pyx_k_numpy[] = "numpy";
+static const char __pyx_k_ptr_a[] = "ptr_a";
+static const char __pyx_k_ptr_b[] = "ptr_b";
+static const char __pyx_k_ptr_n[] = "ptr_n";
 static const char __pyx_k_range[] = "range";
 static const char __pyx_k_shape[] = "shape";
 static const char __pyx_k_start[] = "start";
+static const char __pyx_k_uint8[] = "uint8";
+static const char __pyx_k_NCOL_A[] = "NCOL_A";
+static const char __pyx_k_NCOL_B[] = "NCOL_B";
+static const char __pyx_k_NCOL_n[] = "NCOL_n";
+static const char __pyx_k_SC_OFF[] = "SC_OFF";
 static const char __pyx_k_encode[] = "encode";
 static const char __pyx_k_format[] = "format";
 static const char __pyx_k_import[] = "__import__";
 static const char __pyx_k_name_2[] = "__name__";
+static const char __pyx_k_nbytes[] = "nbytes";
+static const char __pyx_k_ncol_a[] = "ncol_a";
+static const char __pyx_k_ncol_b[] = "ncol_b";
+static const char __pyx_k_ncol_n[] = "ncol_n";
+static const char __pyx_k_np_max[] = "np_max";
 static const char __pyx_k_pickle[] = "pickle";
 static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_sc_off[] = "sc_off";
 static const char __pyx_k_struct[] = "struct";
 static const char __pyx_k_unpack[] = "unpack";
 static const char __pyx_k_update[] = "update";
+static const char __pyx_k_ISC_OFF[] = "ISC_OFF";
+static const char __pyx_k_STRIDES[] = "STRIDES";
 static const char __pyx_k_fortran[] = "fortran";
+static const char __pyx_k_isc_off[] = "isc_off";
 static const char __pyx_k_memview[] = "memview";
+static const char __pyx_k_strides[] = "strides";
 static const char __pyx_k_Ellipsis[] = "Ellipsis";
 static const char __pyx_k_FOLD_col[] = "FOLD_col";
 static const char __pyx_k_FOLD_ptr[] = "FOLD_ptr";
+static const char __pyx_k_csr_tile[] = "csr_tile";
 static const char __pyx_k_fold_col[] = "fold_col";
 static const char __pyx_k_fold_ptr[] = "fold_ptr";
 static const char __pyx_k_getstate[] = "__getstate__";
@@ -2273,6 +2348,7 @@ static const char __pyx_k_RuntimeError[] = "RuntimeError";
 static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
 static const char __pyx_k_sisl__sparse[] = "sisl._sparse";
 static const char __pyx_k_stringsource[] = "stringsource";
+static const char __pyx_k_csr_index_map[] = "csr_index_map";
 static const char __pyx_k_pyx_getbuffer[] = "__pyx_getbuffer";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_View_MemoryView[] = "View.MemoryView";
@@ -2315,6 +2391,7 @@ static const char __pyx_k_Invalid_mode_expected_c_or_fortr[] = "Invalid mode, ex
 static const char __pyx_k_Non_native_byte_order_not_suppor[] = "Non-native byte order not supported";
 static const char __pyx_k_Out_of_bounds_on_buffer_access_a[] = "Out of bounds on buffer access (axis %d)";
 static const char __pyx_k_Unable_to_convert_item_to_object[] = "Unable to convert item to object";
+static const char __pyx_k_csr_tile_requesting_a_non_existi[] = "csr_tile requesting a non-existing supercell index";
 static const char __pyx_k_got_differing_extents_in_dimensi[] = "got differing extents in dimension %d (got %d and %d)";
 static const char __pyx_k_ndarray_is_not_Fortran_contiguou[] = "ndarray is not Fortran contiguous";
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
@@ -2322,12 +2399,18 @@ static const char __pyx_k_numpy_core_umath_failed_to_impor[] = "numpy.core.umath
 static const char __pyx_k_unable_to_allocate_shape_and_str[] = "unable to allocate shape and strides.";
 static const char __pyx_k_Format_string_allocated_too_shor_2[] = "Format string allocated too short.";
 static PyObject *__pyx_n_s_ASCII;
+static PyObject *__pyx_n_s_BASE;
 static PyObject *__pyx_kp_s_Buffer_view_does_not_expose_stri;
 static PyObject *__pyx_n_s_COL;
+static PyObject *__pyx_n_s_COL_A;
+static PyObject *__pyx_n_s_COL_B;
+static PyObject *__pyx_n_s_COL_n;
 static PyObject *__pyx_kp_s_Can_only_create_a_buffer_that_is;
 static PyObject *__pyx_kp_s_Cannot_assign_to_read_only_memor;
 static PyObject *__pyx_kp_s_Cannot_create_writable_memory_vi;
 static PyObject *__pyx_kp_s_Cannot_index_with_type_s;
+static PyObject *__pyx_n_s_D;
+static PyObject *__pyx_n_s_D_n;
 static PyObject *__pyx_n_s_Ellipsis;
 static PyObject *__pyx_kp_s_Empty_shape_tuple_for_cython_arr;
 static PyObject *__pyx_n_s_FOLD_col;
@@ -2335,26 +2418,43 @@ static PyObject *__pyx_n_s_FOLD_ncol;
 static PyObject *__pyx_n_s_FOLD_ptr;
 static PyObject *__pyx_kp_u_Format_string_allocated_too_shor;
 static PyObject *__pyx_kp_u_Format_string_allocated_too_shor_2;
+static PyObject *__pyx_n_s_IDX;
+static PyObject *__pyx_n_s_ISC_OFF;
 static PyObject *__pyx_n_s_ImportError;
 static PyObject *__pyx_kp_s_Incompatible_checksums_s_vs_0xb0;
 static PyObject *__pyx_n_s_IndexError;
 static PyObject *__pyx_kp_s_Indirect_dimensions_not_supporte;
 static PyObject *__pyx_kp_s_Invalid_mode_expected_c_or_fortr;
 static PyObject *__pyx_kp_s_Invalid_shape_in_axis_d_d;
+static PyObject *__pyx_n_s_M;
+static PyObject *__pyx_n_s_MULT;
+static PyObject *__pyx_n_s_M_2;
 static PyObject *__pyx_n_s_MemoryError;
 static PyObject *__pyx_kp_s_MemoryView_of_r_at_0x_x;
 static PyObject *__pyx_kp_s_MemoryView_of_r_object;
 static PyObject *__pyx_n_s_NCOL;
+static PyObject *__pyx_n_s_NCOL_A;
+static PyObject *__pyx_n_s_NCOL_B;
+static PyObject *__pyx_n_s_NCOL_n;
 static PyObject *__pyx_kp_u_Non_native_byte_order_not_suppor;
 static PyObject *__pyx_n_b_O;
 static PyObject *__pyx_kp_s_Out_of_bounds_on_buffer_access_a;
 static PyObject *__pyx_n_s_PTR;
+static PyObject *__pyx_n_s_PTR_A;
+static PyObject *__pyx_n_s_PTR_B;
+static PyObject *__pyx_n_s_PTR_n;
 static PyObject *__pyx_n_s_PickleError;
+static PyObject *__pyx_n_s_Q;
+static PyObject *__pyx_n_s_Q_2;
+static PyObject *__pyx_n_s_REPS;
 static PyObject *__pyx_n_s_RuntimeError;
+static PyObject *__pyx_n_s_SC_OFF;
+static PyObject *__pyx_n_s_STRIDES;
 static PyObject *__pyx_n_s_TypeError;
 static PyObject *__pyx_kp_s_Unable_to_convert_item_to_object;
 static PyObject *__pyx_n_s_ValueError;
 static PyObject *__pyx_n_s_View_MemoryView;
+static PyObject *__pyx_n_s_WORK;
 static PyObject *__pyx_n_s_allocate_buffer;
 static PyObject *__pyx_n_s_base;
 static PyObject *__pyx_n_s_c;
@@ -2362,9 +2462,16 @@ static PyObject *__pyx_n_u_c;
 static PyObject *__pyx_n_s_class;
 static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_n_s_col;
+static PyObject *__pyx_n_s_col_a;
+static PyObject *__pyx_n_s_col_b;
+static PyObject *__pyx_n_s_col_n;
 static PyObject *__pyx_kp_s_contiguous_and_direct;
 static PyObject *__pyx_kp_s_contiguous_and_indirect;
 static PyObject *__pyx_n_s_copy;
+static PyObject *__pyx_n_s_csr_index_map;
+static PyObject *__pyx_n_s_csr_tile;
+static PyObject *__pyx_kp_s_csr_tile_requesting_a_non_existi;
+static PyObject *__pyx_n_s_d_n;
 static PyObject *__pyx_n_s_dict;
 static PyObject *__pyx_n_s_dtype;
 static PyObject *__pyx_n_s_dtype_is_object;
@@ -2382,35 +2489,58 @@ static PyObject *__pyx_n_s_fold_ptr;
 static PyObject *__pyx_n_s_format;
 static PyObject *__pyx_n_s_fortran;
 static PyObject *__pyx_n_u_fortran;
+static PyObject *__pyx_n_s_full;
 static PyObject *__pyx_n_s_getstate;
 static PyObject *__pyx_kp_s_got_differing_extents_in_dimensi;
+static PyObject *__pyx_n_s_hsc;
+static PyObject *__pyx_n_s_i;
 static PyObject *__pyx_n_s_id;
+static PyObject *__pyx_n_s_idx;
 static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_s_ind;
+static PyObject *__pyx_n_s_ind_n;
 static PyObject *__pyx_n_s_int32;
+static PyObject *__pyx_n_s_isc_off;
 static PyObject *__pyx_n_s_itemsize;
 static PyObject *__pyx_kp_s_itemsize_0_for_cython_array;
+static PyObject *__pyx_n_s_j;
+static PyObject *__pyx_n_s_lin;
 static PyObject *__pyx_n_s_main;
 static PyObject *__pyx_n_s_memview;
 static PyObject *__pyx_n_s_mode;
+static PyObject *__pyx_n_s_mult;
+static PyObject *__pyx_n_s_n;
+static PyObject *__pyx_n_s_n_n;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_name_2;
+static PyObject *__pyx_n_s_nbytes;
+static PyObject *__pyx_n_s_nc;
 static PyObject *__pyx_n_s_ncol;
+static PyObject *__pyx_n_s_ncol_a;
+static PyObject *__pyx_n_s_ncol_b;
+static PyObject *__pyx_n_s_ncol_n;
 static PyObject *__pyx_kp_u_ndarray_is_not_C_contiguous;
 static PyObject *__pyx_kp_u_ndarray_is_not_Fortran_contiguou;
 static PyObject *__pyx_n_s_ndim;
 static PyObject *__pyx_n_s_new;
 static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
 static PyObject *__pyx_n_s_np;
+static PyObject *__pyx_n_s_np_max;
 static PyObject *__pyx_n_s_nr;
 static PyObject *__pyx_n_s_numpy;
 static PyObject *__pyx_kp_s_numpy_core_multiarray_failed_to;
 static PyObject *__pyx_kp_s_numpy_core_umath_failed_to_impor;
 static PyObject *__pyx_n_s_nz;
 static PyObject *__pyx_n_s_obj;
+static PyObject *__pyx_n_s_p0;
+static PyObject *__pyx_n_s_p1;
+static PyObject *__pyx_n_s_p2;
 static PyObject *__pyx_n_s_pack;
 static PyObject *__pyx_n_s_pickle;
 static PyObject *__pyx_n_s_ptr;
+static PyObject *__pyx_n_s_ptr_a;
+static PyObject *__pyx_n_s_ptr_b;
+static PyObject *__pyx_n_s_ptr_n;
 static PyObject *__pyx_n_s_pyx_PickleError;
 static PyObject *__pyx_n_s_pyx_checksum;
 static PyObject *__pyx_n_s_pyx_getbuffer;
@@ -2424,7 +2554,10 @@ static PyObject *__pyx_n_s_range;
 static PyObject *__pyx_n_s_reduce;
 static PyObject *__pyx_n_s_reduce_cython;
 static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_reps;
 static PyObject *__pyx_n_s_rr;
+static PyObject *__pyx_n_s_s;
+static PyObject *__pyx_n_s_sc_off;
 static PyObject *__pyx_n_s_setstate;
 static PyObject *__pyx_n_s_setstate_cython;
 static PyObject *__pyx_n_s_shape;
@@ -2441,18 +2574,26 @@ static PyObject *__pyx_n_s_stop;
 static PyObject *__pyx_kp_s_strided_and_direct;
 static PyObject *__pyx_kp_s_strided_and_direct_or_indirect;
 static PyObject *__pyx_kp_s_strided_and_indirect;
+static PyObject *__pyx_n_s_strides;
 static PyObject *__pyx_kp_s_stringsource;
 static PyObject *__pyx_n_s_struct;
+static PyObject *__pyx_n_s_t0;
+static PyObject *__pyx_n_s_t1;
+static PyObject *__pyx_n_s_t2;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_tmp;
+static PyObject *__pyx_n_s_uint8;
 static PyObject *__pyx_kp_s_unable_to_allocate_array_data;
 static PyObject *__pyx_kp_s_unable_to_allocate_shape_and_str;
 static PyObject *__pyx_kp_u_unknown_dtype_code_in_numpy_pxd;
 static PyObject *__pyx_n_s_unpack;
 static PyObject *__pyx_n_s_update;
+static PyObject *__pyx_n_s_work;
 static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL); /* proto */
 static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL); /* proto */
 static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL); /* proto */
+static PyObject *__pyx_pf_4sisl_7_sparse_6csr_index_map(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR_A, PyArrayObject *__pyx_v_NCOL_A, PyArrayObject *__pyx_v_COL_A, PyArrayObject *__pyx_v_PTR_B, PyArrayObject *__pyx_v_NCOL_B, PyArrayObject *__pyx_v_COL_B); /* proto */
+static PyObject *__pyx_pf_4sisl_7_sparse_8csr_tile(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL, __Pyx_memviewslice __pyx_v_D, PyArrayObject *__pyx_v_BASE, PyArrayObject *__pyx_v_MULT, PyArrayObject *__pyx_v_SC_OFF, PyArrayObject *__pyx_v_ISC_OFF, PyArrayObject *__pyx_v_REPS, PyArrayObject *__pyx_v_STRIDES); /* proto */
 static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
 static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __pyx_array_obj *__pyx_v_self, PyObject *__pyx_v_shape, Py_ssize_t __pyx_v_itemsize, PyObject *__pyx_v_format, PyObject *__pyx_v_mode, int __pyx_v_allocate_buffer); /* proto */
@@ -2503,6 +2644,7 @@ static PyObject *__pyx_tp_new_memoryview(PyTypeObject *t, PyObject *a, PyObject
 static PyObject *__pyx_tp_new__memoryviewslice(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_1;
+static PyObject *__pyx_int_3;
 static PyObject *__pyx_int_184977713;
 static PyObject *__pyx_int_neg_1;
 static PyObject *__pyx_tuple_;
@@ -2514,7 +2656,7 @@ static PyObject *__pyx_tuple__6;
 static PyObject *__pyx_tuple__7;
 static PyObject *__pyx_tuple__8;
 static PyObject *__pyx_tuple__9;
-static PyObject *__pyx_slice__25;
+static PyObject *__pyx_slice__26;
 static PyObject *__pyx_tuple__10;
 static PyObject *__pyx_tuple__11;
 static PyObject *__pyx_tuple__12;
@@ -2530,25 +2672,30 @@ static PyObject *__pyx_tuple__21;
 static PyObject *__pyx_tuple__22;
 static PyObject *__pyx_tuple__23;
 static PyObject *__pyx_tuple__24;
-static PyObject *__pyx_tuple__26;
+static PyObject *__pyx_tuple__25;
 static PyObject *__pyx_tuple__27;
 static PyObject *__pyx_tuple__28;
 static PyObject *__pyx_tuple__29;
-static PyObject *__pyx_tuple__31;
-static PyObject *__pyx_tuple__33;
-static PyObject *__pyx_tuple__35;
+static PyObject *__pyx_tuple__30;
+static PyObject *__pyx_tuple__32;
+static PyObject *__pyx_tuple__34;
 static PyObject *__pyx_tuple__36;
-static PyObject *__pyx_tuple__37;
 static PyObject *__pyx_tuple__38;
-static PyObject *__pyx_tuple__39;
 static PyObject *__pyx_tuple__40;
-static PyObject *__pyx_codeobj__30;
-static PyObject *__pyx_codeobj__32;
-static PyObject *__pyx_codeobj__34;
-static PyObject *__pyx_codeobj__41;
+static PyObject *__pyx_tuple__41;
+static PyObject *__pyx_tuple__42;
+static PyObject *__pyx_tuple__43;
+static PyObject *__pyx_tuple__44;
+static PyObject *__pyx_tuple__45;
+static PyObject *__pyx_codeobj__31;
+static PyObject *__pyx_codeobj__33;
+static PyObject *__pyx_codeobj__35;
+static PyObject *__pyx_codeobj__37;
+static PyObject *__pyx_codeobj__39;
+static PyObject *__pyx_codeobj__46;
 /* Late includes */
 
-/* "sisl/_sparse.pyx":16
+/* "sisl/_sparse.pyx":17
  * @cython.wraparound(False)
  * @cython.initializedcheck(False)
  * cdef inline int _sum(const int[::1] array) nogil:             # <<<<<<<<<<<<<<
@@ -2565,7 +2712,7 @@ static CYTHON_INLINE int __pyx_f_4sisl_7_sparse__sum(__Pyx_memviewslice __pyx_v_
   int __pyx_t_3;
   Py_ssize_t __pyx_t_4;
 
-  /* "sisl/_sparse.pyx":19
+  /* "sisl/_sparse.pyx":20
  *     cdef int total, i
  * 
  *     total = 0             # <<<<<<<<<<<<<<
@@ -2574,7 +2721,7 @@ static CYTHON_INLINE int __pyx_f_4sisl_7_sparse__sum(__Pyx_memviewslice __pyx_v_
  */
   __pyx_v_total = 0;
 
-  /* "sisl/_sparse.pyx":20
+  /* "sisl/_sparse.pyx":21
  * 
  *     total = 0
  *     for i in range(array.shape[0]):             # <<<<<<<<<<<<<<
@@ -2586,7 +2733,7 @@ static CYTHON_INLINE int __pyx_f_4sisl_7_sparse__sum(__Pyx_memviewslice __pyx_v_
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_i = __pyx_t_3;
 
-    /* "sisl/_sparse.pyx":21
+    /* "sisl/_sparse.pyx":22
  *     total = 0
  *     for i in range(array.shape[0]):
  *         total += array[i]             # <<<<<<<<<<<<<<
@@ -2597,7 +2744,7 @@ static CYTHON_INLINE int __pyx_f_4sisl_7_sparse__sum(__Pyx_memviewslice __pyx_v_
     __pyx_v_total = (__pyx_v_total + (*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_array.data) + __pyx_t_4)) ))));
   }
 
-  /* "sisl/_sparse.pyx":22
+  /* "sisl/_sparse.pyx":23
  *     for i in range(array.shape[0]):
  *         total += array[i]
  *     return total             # <<<<<<<<<<<<<<
@@ -2607,7 +2754,7 @@ static CYTHON_INLINE int __pyx_f_4sisl_7_sparse__sum(__Pyx_memviewslice __pyx_v_
   __pyx_r = __pyx_v_total;
   goto __pyx_L0;
 
-  /* "sisl/_sparse.pyx":16
+  /* "sisl/_sparse.pyx":17
  * @cython.wraparound(False)
  * @cython.initializedcheck(False)
  * cdef inline int _sum(const int[::1] array) nogil:             # <<<<<<<<<<<<<<
@@ -2620,7 +2767,7 @@ static CYTHON_INLINE int __pyx_f_4sisl_7_sparse__sum(__Pyx_memviewslice __pyx_v_
   return __pyx_r;
 }
 
-/* "sisl/_sparse.pyx":29
+/* "sisl/_sparse.pyx":30
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
@@ -2664,17 +2811,17 @@ static PyObject *__pyx_pw_4sisl_7_sparse_1fold_csr_matrix(PyObject *__pyx_self,
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix", 1, 3, 3, 1); __PYX_ERR(0, 29, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix", 1, 3, 3, 1); __PYX_ERR(0, 30, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix", 1, 3, 3, 2); __PYX_ERR(0, 29, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix", 1, 3, 3, 2); __PYX_ERR(0, 30, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "fold_csr_matrix") < 0)) __PYX_ERR(0, 29, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "fold_csr_matrix") < 0)) __PYX_ERR(0, 30, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -2689,15 +2836,15 @@ static PyObject *__pyx_pw_4sisl_7_sparse_1fold_csr_matrix(PyObject *__pyx_self,
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("fold_csr_matrix", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 29, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("fold_csr_matrix", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 30, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("sisl._sparse.fold_csr_matrix", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 29, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 30, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 31, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 30, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 31, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 32, __pyx_L1_error)
   __pyx_r = __pyx_pf_4sisl_7_sparse_fold_csr_matrix(__pyx_self, __pyx_v_PTR, __pyx_v_NCOL, __pyx_v_COL);
 
   /* function exit code */
@@ -2812,57 +2959,57 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
   __pyx_pybuffernd_COL.rcbuffer = &__pyx_pybuffer_COL;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 29, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 30, __pyx_L1_error)
   }
   __pyx_pybuffernd_PTR.diminfo[0].strides = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR.diminfo[0].shape = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 29, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 30, __pyx_L1_error)
   }
   __pyx_pybuffernd_NCOL.diminfo[0].strides = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL.diminfo[0].shape = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 29, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 30, __pyx_L1_error)
   }
   __pyx_pybuffernd_COL.diminfo[0].strides = __pyx_pybuffernd_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL.diminfo[0].shape = __pyx_pybuffernd_COL.rcbuffer->pybuffer.shape[0];
 
-  /* "sisl/_sparse.pyx":33
+  /* "sisl/_sparse.pyx":34
  *                     np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  *     """ Fold all columns into a square matrix """
  *     cdef int[::1] ptr = PTR             # <<<<<<<<<<<<<<
  *     cdef int[::1] ncol = NCOL
  *     cdef int[::1] col = COL
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 33, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 34, __pyx_L1_error)
   __pyx_v_ptr = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":34
+  /* "sisl/_sparse.pyx":35
  *     """ Fold all columns into a square matrix """
  *     cdef int[::1] ptr = PTR
  *     cdef int[::1] ncol = NCOL             # <<<<<<<<<<<<<<
  *     cdef int[::1] col = COL
  *     # Number of rows
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 35, __pyx_L1_error)
   __pyx_v_ncol = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":35
+  /* "sisl/_sparse.pyx":36
  *     cdef int[::1] ptr = PTR
  *     cdef int[::1] ncol = NCOL
  *     cdef int[::1] col = COL             # <<<<<<<<<<<<<<
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 35, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 36, __pyx_L1_error)
   __pyx_v_col = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":37
+  /* "sisl/_sparse.pyx":38
  *     cdef int[::1] col = COL
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]             # <<<<<<<<<<<<<<
@@ -2871,51 +3018,51 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
  */
   __pyx_v_nr = (__pyx_v_ncol.shape[0]);
 
-  /* "sisl/_sparse.pyx":38
+  /* "sisl/_sparse.pyx":39
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr + 1], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr], dtype=np.int32)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyInt_From_long((__pyx_v_nr + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_long((__pyx_v_nr + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_GIVEREF(__pyx_t_2);
   PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 38, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 38, __pyx_L1_error)
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 39, __pyx_L1_error)
   __pyx_t_7 = ((PyArrayObject *)__pyx_t_6);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_ptr = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 38, __pyx_L1_error)
+      __PYX_ERR(0, 39, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_ptr.diminfo[0].strides = __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_ptr.diminfo[0].shape = __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -2923,63 +3070,63 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
   __pyx_v_FOLD_ptr = ((PyArrayObject *)__pyx_t_6);
   __pyx_t_6 = 0;
 
-  /* "sisl/_sparse.pyx":39
+  /* "sisl/_sparse.pyx":40
  *     cdef int nr = ncol.shape[0]
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr + 1], dtype=np.int32)
  *     cdef int[::1] fold_ptr = FOLD_ptr             # <<<<<<<<<<<<<<
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ptr), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 39, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ptr), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 40, __pyx_L1_error)
   __pyx_v_fold_ptr = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":40
+  /* "sisl/_sparse.pyx":41
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr + 1], dtype=np.int32)
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol)], dtype=np.int32)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nr); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nr); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_6);
   PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
   __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 40, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 40, __pyx_L1_error)
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 41, __pyx_L1_error)
   __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_ncol = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 40, __pyx_L1_error)
+      __PYX_ERR(0, 41, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_ncol.diminfo[0].strides = __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_ncol.diminfo[0].shape = __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -2987,63 +3134,63 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
   __pyx_v_FOLD_ncol = ((PyArrayObject *)__pyx_t_5);
   __pyx_t_5 = 0;
 
-  /* "sisl/_sparse.pyx":41
+  /* "sisl/_sparse.pyx":42
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol             # <<<<<<<<<<<<<<
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol)], dtype=np.int32)
  *     cdef int[::1] fold_col = FOLD_col
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ncol), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 41, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ncol), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 42, __pyx_L1_error)
   __pyx_v_fold_ncol = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":42
+  /* "sisl/_sparse.pyx":43
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol)], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_col = FOLD_col
  *     # local variables
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 43, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 43, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_f_4sisl_7_sparse__sum(__pyx_v_ncol)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_f_4sisl_7_sparse__sum(__pyx_v_ncol)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 43, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 43, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_5);
   PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
   __pyx_t_5 = 0;
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 43, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_6);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
   __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 43, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 43, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 43, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 42, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 43, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 42, __pyx_L1_error)
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 43, __pyx_L1_error)
   __pyx_t_9 = ((PyArrayObject *)__pyx_t_3);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer, (PyObject*)__pyx_t_9, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_col = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 42, __pyx_L1_error)
+      __PYX_ERR(0, 43, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_col.diminfo[0].strides = __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_col.diminfo[0].shape = __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -3051,19 +3198,19 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
   __pyx_v_FOLD_col = ((PyArrayObject *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "sisl/_sparse.pyx":43
+  /* "sisl/_sparse.pyx":44
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol)], dtype=np.int32)
  *     cdef int[::1] fold_col = FOLD_col             # <<<<<<<<<<<<<<
  *     # local variables
  *     cdef int r, ind, nz, c
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_col), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_col), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 44, __pyx_L1_error)
   __pyx_v_fold_col = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":47
+  /* "sisl/_sparse.pyx":48
  *     cdef int r, ind, nz, c
  * 
  *     nz = 0             # <<<<<<<<<<<<<<
@@ -3072,7 +3219,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
  */
   __pyx_v_nz = 0;
 
-  /* "sisl/_sparse.pyx":48
+  /* "sisl/_sparse.pyx":49
  * 
  *     nz = 0
  *     fold_ptr[0] = 0             # <<<<<<<<<<<<<<
@@ -3082,7 +3229,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
   __pyx_t_10 = 0;
   *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_10)) )) = 0;
 
-  /* "sisl/_sparse.pyx":50
+  /* "sisl/_sparse.pyx":51
  *     fold_ptr[0] = 0
  *     # Loop on all rows
  *     for r in range(nr):             # <<<<<<<<<<<<<<
@@ -3094,7 +3241,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
   for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
     __pyx_v_r = __pyx_t_13;
 
-    /* "sisl/_sparse.pyx":53
+    /* "sisl/_sparse.pyx":54
  * 
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:             # <<<<<<<<<<<<<<
@@ -3105,7 +3252,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
     __pyx_t_15 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_14)) ))) > 0) != 0);
     if (__pyx_t_15) {
 
-      /* "sisl/_sparse.pyx":54
+      /* "sisl/_sparse.pyx":55
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:
  *             fold_ncol[r] = 1             # <<<<<<<<<<<<<<
@@ -3115,7 +3262,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
       __pyx_t_16 = __pyx_v_r;
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_16)) )) = 1;
 
-      /* "sisl/_sparse.pyx":55
+      /* "sisl/_sparse.pyx":56
  *         if ncol[r] > 0:
  *             fold_ncol[r] = 1
  *             fold_col[fold_ptr[r]] = col[ptr[r]] % nr             # <<<<<<<<<<<<<<
@@ -3128,7 +3275,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
       __pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_19)) )));
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_20)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_18)) ))) % __pyx_v_nr);
 
-      /* "sisl/_sparse.pyx":53
+      /* "sisl/_sparse.pyx":54
  * 
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:             # <<<<<<<<<<<<<<
@@ -3138,7 +3285,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
       goto __pyx_L5;
     }
 
-    /* "sisl/_sparse.pyx":57
+    /* "sisl/_sparse.pyx":58
  *             fold_col[fold_ptr[r]] = col[ptr[r]] % nr
  *         else:
  *             fold_ncol[r] = 0             # <<<<<<<<<<<<<<
@@ -3151,7 +3298,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
     }
     __pyx_L5:;
 
-    /* "sisl/_sparse.pyx":59
+    /* "sisl/_sparse.pyx":60
  *             fold_ncol[r] = 0
  * 
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):             # <<<<<<<<<<<<<<
@@ -3166,7 +3313,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
     for (__pyx_t_27 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_25)) ))) + 1); __pyx_t_27 < __pyx_t_26; __pyx_t_27+=1) {
       __pyx_v_ind = __pyx_t_27;
 
-      /* "sisl/_sparse.pyx":60
+      /* "sisl/_sparse.pyx":61
  * 
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = col[ind] % nr             # <<<<<<<<<<<<<<
@@ -3176,7 +3323,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
       __pyx_t_28 = __pyx_v_ind;
       __pyx_v_c = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_28)) ))) % __pyx_v_nr);
 
-      /* "sisl/_sparse.pyx":61
+      /* "sisl/_sparse.pyx":62
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = col[ind] % nr
  *             if not in_1d(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]], c):             # <<<<<<<<<<<<<<
@@ -3204,7 +3351,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_fold_csr_matrix(CYTHON_UNUSED PyObject
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 61, __pyx_L1_error)
+    __PYX_ERR(0, 62, __pyx_L1_error)
 }
 
 __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0);
@@ -3213,7 +3360,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
       __pyx_t_1.data = NULL;
       if (__pyx_t_15) {
 
-        /* "sisl/_sparse.pyx":62
+        /* "sisl/_sparse.pyx":63
  *             c = col[ind] % nr
  *             if not in_1d(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]], c):
  *                 fold_col[fold_ptr[r] + fold_ncol[r]] = c             # <<<<<<<<<<<<<<
@@ -3225,7 +3372,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_35 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_33)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_34)) ))));
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_35)) )) = __pyx_v_c;
 
-        /* "sisl/_sparse.pyx":63
+        /* "sisl/_sparse.pyx":64
  *             if not in_1d(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]], c):
  *                 fold_col[fold_ptr[r] + fold_ncol[r]] = c
  *                 fold_ncol[r] += 1             # <<<<<<<<<<<<<<
@@ -3235,7 +3382,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_36 = __pyx_v_r;
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_36)) )) += 1;
 
-        /* "sisl/_sparse.pyx":61
+        /* "sisl/_sparse.pyx":62
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = col[ind] % nr
  *             if not in_1d(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]], c):             # <<<<<<<<<<<<<<
@@ -3245,16 +3392,16 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
       }
     }
 
-    /* "sisl/_sparse.pyx":66
+    /* "sisl/_sparse.pyx":67
  * 
  *         # Sort indices (we should implement our own sorting algorithm)
  *         tmp = np.sort(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]])             # <<<<<<<<<<<<<<
  *         for ind in range(fold_ncol[r]):
  *             fold_col[fold_ptr[r] + ind] = tmp[ind]
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 66, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 67, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 66, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 67, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __pyx_t_37 = __pyx_v_r;
@@ -3278,10 +3425,10 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 66, __pyx_L1_error)
+    __PYX_ERR(0, 67, __pyx_L1_error)
 }
 
-__pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __pyx_memview_get_int, (int (*)(char *, PyObject *)) __pyx_memview_set_int, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 66, __pyx_L1_error)
+__pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __pyx_memview_get_int, (int (*)(char *, PyObject *)) __pyx_memview_set_int, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 67, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
     __pyx_t_1.memview = NULL;
@@ -3299,13 +3446,13 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_t_3 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_2, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6);
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 66, __pyx_L1_error)
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 67, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_XDECREF_SET(__pyx_v_tmp, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "sisl/_sparse.pyx":67
+    /* "sisl/_sparse.pyx":68
  *         # Sort indices (we should implement our own sorting algorithm)
  *         tmp = np.sort(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]])
  *         for ind in range(fold_ncol[r]):             # <<<<<<<<<<<<<<
@@ -3318,23 +3465,23 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     for (__pyx_t_27 = 0; __pyx_t_27 < __pyx_t_26; __pyx_t_27+=1) {
       __pyx_v_ind = __pyx_t_27;
 
-      /* "sisl/_sparse.pyx":68
+      /* "sisl/_sparse.pyx":69
  *         tmp = np.sort(fold_col[fold_ptr[r]:fold_ptr[r] + fold_ncol[r]])
  *         for ind in range(fold_ncol[r]):
  *             fold_col[fold_ptr[r] + ind] = tmp[ind]             # <<<<<<<<<<<<<<
  * 
  *         fold_ptr[r + 1] = fold_ptr[r] + fold_ncol[r]
  */
-      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_tmp, __pyx_v_ind, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 68, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_tmp, __pyx_v_ind, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 69, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_32 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_32 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 68, __pyx_L1_error)
+      __pyx_t_32 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_32 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 69, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_t_41 = __pyx_v_r;
       __pyx_t_42 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_41)) ))) + __pyx_v_ind);
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_42)) )) = __pyx_t_32;
     }
 
-    /* "sisl/_sparse.pyx":70
+    /* "sisl/_sparse.pyx":71
  *             fold_col[fold_ptr[r] + ind] = tmp[ind]
  * 
  *         fold_ptr[r + 1] = fold_ptr[r] + fold_ncol[r]             # <<<<<<<<<<<<<<
@@ -3346,7 +3493,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_t_45 = (__pyx_v_r + 1);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_45)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_43)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_44)) ))));
 
-    /* "sisl/_sparse.pyx":71
+    /* "sisl/_sparse.pyx":72
  * 
  *         fold_ptr[r + 1] = fold_ptr[r] + fold_ncol[r]
  *         nz += fold_ncol[r]             # <<<<<<<<<<<<<<
@@ -3357,7 +3504,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_v_nz = (__pyx_v_nz + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_46)) ))));
   }
 
-  /* "sisl/_sparse.pyx":73
+  /* "sisl/_sparse.pyx":74
  *         nz += fold_ncol[r]
  * 
  *     if nz > fold_col.shape[0]:             # <<<<<<<<<<<<<<
@@ -3367,20 +3514,20 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   __pyx_t_15 = ((__pyx_v_nz > (__pyx_v_fold_col.shape[0])) != 0);
   if (unlikely(__pyx_t_15)) {
 
-    /* "sisl/_sparse.pyx":74
+    /* "sisl/_sparse.pyx":75
  * 
  *     if nz > fold_col.shape[0]:
  *         raise ValueError('something went wrong')             # <<<<<<<<<<<<<<
  * 
  *     # Return objects
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 74, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 75, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 74, __pyx_L1_error)
+    __PYX_ERR(0, 75, __pyx_L1_error)
 
-    /* "sisl/_sparse.pyx":73
+    /* "sisl/_sparse.pyx":74
  *         nz += fold_ncol[r]
  * 
  *     if nz > fold_col.shape[0]:             # <<<<<<<<<<<<<<
@@ -3389,7 +3536,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
  */
   }
 
-  /* "sisl/_sparse.pyx":77
+  /* "sisl/_sparse.pyx":78
  * 
  *     # Return objects
  *     return FOLD_ptr, FOLD_ncol, FOLD_col[:nz].copy()             # <<<<<<<<<<<<<<
@@ -3397,15 +3544,15 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 78, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 78, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_FOLD_col), __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_FOLD_col), __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 78, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_copy); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_copy); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 78, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_5 = NULL;
@@ -3420,10 +3567,10 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   }
   __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 77, __pyx_L1_error)
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 78, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 78, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_INCREF(((PyObject *)__pyx_v_FOLD_ptr));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_FOLD_ptr));
@@ -3438,7 +3585,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   __pyx_t_6 = 0;
   goto __pyx_L0;
 
-  /* "sisl/_sparse.pyx":29
+  /* "sisl/_sparse.pyx":30
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
@@ -3491,7 +3638,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   return __pyx_r;
 }
 
-/* "sisl/_sparse.pyx":84
+/* "sisl/_sparse.pyx":85
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
@@ -3535,17 +3682,17 @@ static PyObject *__pyx_pw_4sisl_7_sparse_3fold_csr_matrix_nc(PyObject *__pyx_sel
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix_nc", 1, 3, 3, 1); __PYX_ERR(0, 84, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix_nc", 1, 3, 3, 1); __PYX_ERR(0, 85, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix_nc", 1, 3, 3, 2); __PYX_ERR(0, 84, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("fold_csr_matrix_nc", 1, 3, 3, 2); __PYX_ERR(0, 85, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "fold_csr_matrix_nc") < 0)) __PYX_ERR(0, 84, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "fold_csr_matrix_nc") < 0)) __PYX_ERR(0, 85, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -3560,15 +3707,15 @@ static PyObject *__pyx_pw_4sisl_7_sparse_3fold_csr_matrix_nc(PyObject *__pyx_sel
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("fold_csr_matrix_nc", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 84, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("fold_csr_matrix_nc", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 85, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("sisl._sparse.fold_csr_matrix_nc", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 84, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 85, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 86, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 85, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 86, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 87, __pyx_L1_error)
   __pyx_r = __pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(__pyx_self, __pyx_v_PTR, __pyx_v_NCOL, __pyx_v_COL);
 
   /* function exit code */
@@ -3696,57 +3843,57 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
   __pyx_pybuffernd_COL.rcbuffer = &__pyx_pybuffer_COL;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 84, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 85, __pyx_L1_error)
   }
   __pyx_pybuffernd_PTR.diminfo[0].strides = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR.diminfo[0].shape = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 84, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 85, __pyx_L1_error)
   }
   __pyx_pybuffernd_NCOL.diminfo[0].strides = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL.diminfo[0].shape = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 84, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 85, __pyx_L1_error)
   }
   __pyx_pybuffernd_COL.diminfo[0].strides = __pyx_pybuffernd_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL.diminfo[0].shape = __pyx_pybuffernd_COL.rcbuffer->pybuffer.shape[0];
 
-  /* "sisl/_sparse.pyx":88
+  /* "sisl/_sparse.pyx":89
  *                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  *     """ Fold all columns into a square matrix """
  *     cdef int[::1] ptr = PTR             # <<<<<<<<<<<<<<
  *     cdef int[::1] ncol = NCOL
  *     cdef int[::1] col = COL
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 89, __pyx_L1_error)
   __pyx_v_ptr = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":89
+  /* "sisl/_sparse.pyx":90
  *     """ Fold all columns into a square matrix """
  *     cdef int[::1] ptr = PTR
  *     cdef int[::1] ncol = NCOL             # <<<<<<<<<<<<<<
  *     cdef int[::1] col = COL
  *     # Number of rows
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 90, __pyx_L1_error)
   __pyx_v_ncol = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":90
+  /* "sisl/_sparse.pyx":91
  *     cdef int[::1] ptr = PTR
  *     cdef int[::1] ncol = NCOL
  *     cdef int[::1] col = COL             # <<<<<<<<<<<<<<
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 91, __pyx_L1_error)
   __pyx_v_col = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":92
+  /* "sisl/_sparse.pyx":93
  *     cdef int[::1] col = COL
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]             # <<<<<<<<<<<<<<
@@ -3755,51 +3902,51 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
  */
   __pyx_v_nr = (__pyx_v_ncol.shape[0]);
 
-  /* "sisl/_sparse.pyx":94
+  /* "sisl/_sparse.pyx":95
  *     cdef int nr = ncol.shape[0]
  * 
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr * 2 + 1], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyInt_From_long(((__pyx_v_nr * 2) + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_long(((__pyx_v_nr * 2) + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_GIVEREF(__pyx_t_2);
   PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 94, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 94, __pyx_L1_error)
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 95, __pyx_L1_error)
   __pyx_t_7 = ((PyArrayObject *)__pyx_t_6);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_ptr = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 94, __pyx_L1_error)
+      __PYX_ERR(0, 95, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_ptr.diminfo[0].strides = __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_ptr.diminfo[0].shape = __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -3807,63 +3954,63 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
   __pyx_v_FOLD_ptr = ((PyArrayObject *)__pyx_t_6);
   __pyx_t_6 = 0;
 
-  /* "sisl/_sparse.pyx":95
+  /* "sisl/_sparse.pyx":96
  * 
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr * 2 + 1], dtype=np.int32)
  *     cdef int[::1] fold_ptr = FOLD_ptr             # <<<<<<<<<<<<<<
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ptr), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ptr), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 96, __pyx_L1_error)
   __pyx_v_fold_ptr = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":96
+  /* "sisl/_sparse.pyx":97
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr * 2 + 1], dtype=np.int32)
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     # We have to multiply by 4, 2 times the number of rows, and each row couples to 2 more elements
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 97, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 97, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyInt_From_long((__pyx_v_nr * 2)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_From_long((__pyx_v_nr * 2)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 97, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 97, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_6);
   PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
   __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 97, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 97, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 97, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 97, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 96, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 97, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 97, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 96, __pyx_L1_error)
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 97, __pyx_L1_error)
   __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_ncol = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 96, __pyx_L1_error)
+      __PYX_ERR(0, 97, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_ncol.diminfo[0].strides = __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_ncol.diminfo[0].shape = __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -3871,63 +4018,63 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
   __pyx_v_FOLD_ncol = ((PyArrayObject *)__pyx_t_5);
   __pyx_t_5 = 0;
 
-  /* "sisl/_sparse.pyx":97
+  /* "sisl/_sparse.pyx":98
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol             # <<<<<<<<<<<<<<
  *     # We have to multiply by 4, 2 times the number of rows, and each row couples to 2 more elements
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol) * 4], dtype=np.int32)
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ncol), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ncol), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 98, __pyx_L1_error)
   __pyx_v_fold_ncol = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":99
+  /* "sisl/_sparse.pyx":100
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     # We have to multiply by 4, 2 times the number of rows, and each row couples to 2 more elements
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol) * 4], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_col = FOLD_col
  *     # local variables
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyInt_From_long((__pyx_f_4sisl_7_sparse__sum(__pyx_v_ncol) * 4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_long((__pyx_f_4sisl_7_sparse__sum(__pyx_v_ncol) * 4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_5);
   PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
   __pyx_t_5 = 0;
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_6);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
   __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 99, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 99, __pyx_L1_error)
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 100, __pyx_L1_error)
   __pyx_t_9 = ((PyArrayObject *)__pyx_t_3);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer, (PyObject*)__pyx_t_9, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_col = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 99, __pyx_L1_error)
+      __PYX_ERR(0, 100, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_col.diminfo[0].strides = __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_col.diminfo[0].shape = __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -3935,19 +4082,19 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
   __pyx_v_FOLD_col = ((PyArrayObject *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "sisl/_sparse.pyx":100
+  /* "sisl/_sparse.pyx":101
  *     # We have to multiply by 4, 2 times the number of rows, and each row couples to 2 more elements
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol) * 4], dtype=np.int32)
  *     cdef int[::1] fold_col = FOLD_col             # <<<<<<<<<<<<<<
  *     # local variables
  *     cdef int r, rr, ind, nz, c
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_col), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_col), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 101, __pyx_L1_error)
   __pyx_v_fold_col = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":104
+  /* "sisl/_sparse.pyx":105
  *     cdef int r, rr, ind, nz, c
  * 
  *     nz = 0             # <<<<<<<<<<<<<<
@@ -3956,7 +4103,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
  */
   __pyx_v_nz = 0;
 
-  /* "sisl/_sparse.pyx":105
+  /* "sisl/_sparse.pyx":106
  * 
  *     nz = 0
  *     fold_ptr[0] = 0             # <<<<<<<<<<<<<<
@@ -3966,7 +4113,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
   __pyx_t_10 = 0;
   *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_10)) )) = 0;
 
-  /* "sisl/_sparse.pyx":107
+  /* "sisl/_sparse.pyx":108
  *     fold_ptr[0] = 0
  *     # Loop on all rows
  *     for r in range(nr):             # <<<<<<<<<<<<<<
@@ -3978,7 +4125,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
   for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
     __pyx_v_r = __pyx_t_13;
 
-    /* "sisl/_sparse.pyx":108
+    /* "sisl/_sparse.pyx":109
  *     # Loop on all rows
  *     for r in range(nr):
  *         rr = r * 2             # <<<<<<<<<<<<<<
@@ -3987,7 +4134,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
  */
     __pyx_v_rr = (__pyx_v_r * 2);
 
-    /* "sisl/_sparse.pyx":111
+    /* "sisl/_sparse.pyx":112
  * 
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:             # <<<<<<<<<<<<<<
@@ -3998,7 +4145,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
     __pyx_t_15 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_14)) ))) > 0) != 0);
     if (__pyx_t_15) {
 
-      /* "sisl/_sparse.pyx":112
+      /* "sisl/_sparse.pyx":113
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:
  *             c = (col[ptr[r]] % nr) * 2             # <<<<<<<<<<<<<<
@@ -4009,7 +4156,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
       __pyx_t_17 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_16)) )));
       __pyx_v_c = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_17)) ))) % __pyx_v_nr) * 2);
 
-      /* "sisl/_sparse.pyx":113
+      /* "sisl/_sparse.pyx":114
  *         if ncol[r] > 0:
  *             c = (col[ptr[r]] % nr) * 2
  *             fold_ncol[rr] = 2             # <<<<<<<<<<<<<<
@@ -4019,7 +4166,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
       __pyx_t_18 = __pyx_v_rr;
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_18)) )) = 2;
 
-      /* "sisl/_sparse.pyx":114
+      /* "sisl/_sparse.pyx":115
  *             c = (col[ptr[r]] % nr) * 2
  *             fold_ncol[rr] = 2
  *             fold_col[fold_ptr[rr]] = c             # <<<<<<<<<<<<<<
@@ -4030,7 +4177,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
       __pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_19)) )));
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_20)) )) = __pyx_v_c;
 
-      /* "sisl/_sparse.pyx":115
+      /* "sisl/_sparse.pyx":116
  *             fold_ncol[rr] = 2
  *             fold_col[fold_ptr[rr]] = c
  *             fold_col[fold_ptr[rr] + 1] = c + 1             # <<<<<<<<<<<<<<
@@ -4041,7 +4188,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
       __pyx_t_22 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_21)) ))) + 1);
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_22)) )) = (__pyx_v_c + 1);
 
-      /* "sisl/_sparse.pyx":111
+      /* "sisl/_sparse.pyx":112
  * 
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:             # <<<<<<<<<<<<<<
@@ -4051,7 +4198,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
       goto __pyx_L5;
     }
 
-    /* "sisl/_sparse.pyx":117
+    /* "sisl/_sparse.pyx":118
  *             fold_col[fold_ptr[rr] + 1] = c + 1
  *         else:
  *             fold_ncol[rr] = 0             # <<<<<<<<<<<<<<
@@ -4064,7 +4211,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
     }
     __pyx_L5:;
 
-    /* "sisl/_sparse.pyx":119
+    /* "sisl/_sparse.pyx":120
  *             fold_ncol[rr] = 0
  * 
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):             # <<<<<<<<<<<<<<
@@ -4079,7 +4226,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
     for (__pyx_t_29 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_27)) ))) + 1); __pyx_t_29 < __pyx_t_28; __pyx_t_29+=1) {
       __pyx_v_ind = __pyx_t_29;
 
-      /* "sisl/_sparse.pyx":120
+      /* "sisl/_sparse.pyx":121
  * 
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = (col[ind] % nr) * 2             # <<<<<<<<<<<<<<
@@ -4089,7 +4236,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
       __pyx_t_30 = __pyx_v_ind;
       __pyx_v_c = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_30)) ))) % __pyx_v_nr) * 2);
 
-      /* "sisl/_sparse.pyx":121
+      /* "sisl/_sparse.pyx":122
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = (col[ind] % nr) * 2
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):             # <<<<<<<<<<<<<<
@@ -4117,7 +4264,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_2fold_csr_matrix_nc(CYTHON_UNUSED PyObj
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 121, __pyx_L1_error)
+    __PYX_ERR(0, 122, __pyx_L1_error)
 }
 
 __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0);
@@ -4126,7 +4273,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
       __pyx_t_1.data = NULL;
       if (__pyx_t_15) {
 
-        /* "sisl/_sparse.pyx":122
+        /* "sisl/_sparse.pyx":123
  *             c = (col[ind] % nr) * 2
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr]] = c             # <<<<<<<<<<<<<<
@@ -4138,7 +4285,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_37 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_35)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_36)) ))));
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_37)) )) = __pyx_v_c;
 
-        /* "sisl/_sparse.pyx":123
+        /* "sisl/_sparse.pyx":124
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr]] = c
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr] + 1] = c + 1             # <<<<<<<<<<<<<<
@@ -4150,7 +4297,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_40 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_38)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_39)) )))) + 1);
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_40)) )) = (__pyx_v_c + 1);
 
-        /* "sisl/_sparse.pyx":124
+        /* "sisl/_sparse.pyx":125
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr]] = c
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr] + 1] = c + 1
  *                 fold_ncol[rr] += 2             # <<<<<<<<<<<<<<
@@ -4160,7 +4307,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_41 = __pyx_v_rr;
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_41)) )) += 2;
 
-        /* "sisl/_sparse.pyx":121
+        /* "sisl/_sparse.pyx":122
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = (col[ind] % nr) * 2
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):             # <<<<<<<<<<<<<<
@@ -4170,7 +4317,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
       }
     }
 
-    /* "sisl/_sparse.pyx":127
+    /* "sisl/_sparse.pyx":128
  * 
  *         # Duplicate pointers and counters for next row (off-diagonal)
  *         fold_ptr[rr + 1] = fold_ptr[rr] + fold_ncol[rr]             # <<<<<<<<<<<<<<
@@ -4182,7 +4329,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     __pyx_t_44 = (__pyx_v_rr + 1);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_44)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_42)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_43)) ))));
 
-    /* "sisl/_sparse.pyx":128
+    /* "sisl/_sparse.pyx":129
  *         # Duplicate pointers and counters for next row (off-diagonal)
  *         fold_ptr[rr + 1] = fold_ptr[rr] + fold_ncol[rr]
  *         fold_ncol[rr + 1] = fold_ncol[rr]             # <<<<<<<<<<<<<<
@@ -4193,16 +4340,16 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     __pyx_t_46 = (__pyx_v_rr + 1);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_46)) )) = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_45)) )));
 
-    /* "sisl/_sparse.pyx":131
+    /* "sisl/_sparse.pyx":132
  * 
  *         # Sort indices (we should implement our own sorting algorithm)
  *         tmp = np.sort(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]])             # <<<<<<<<<<<<<<
  *         for ind in range(fold_ncol[rr]):
  *             c = tmp[ind]
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 131, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 132, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 131, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 132, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __pyx_t_47 = __pyx_v_rr;
@@ -4226,10 +4373,10 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 131, __pyx_L1_error)
+    __PYX_ERR(0, 132, __pyx_L1_error)
 }
 
-__pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __pyx_memview_get_int, (int (*)(char *, PyObject *)) __pyx_memview_set_int, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 131, __pyx_L1_error)
+__pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __pyx_memview_get_int, (int (*)(char *, PyObject *)) __pyx_memview_set_int, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 132, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
     __pyx_t_1.memview = NULL;
@@ -4247,13 +4394,13 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_t_3 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_2, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6);
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 131, __pyx_L1_error)
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 132, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_XDECREF_SET(__pyx_v_tmp, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "sisl/_sparse.pyx":132
+    /* "sisl/_sparse.pyx":133
  *         # Sort indices (we should implement our own sorting algorithm)
  *         tmp = np.sort(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]])
  *         for ind in range(fold_ncol[rr]):             # <<<<<<<<<<<<<<
@@ -4266,20 +4413,20 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     for (__pyx_t_29 = 0; __pyx_t_29 < __pyx_t_28; __pyx_t_29+=1) {
       __pyx_v_ind = __pyx_t_29;
 
-      /* "sisl/_sparse.pyx":133
+      /* "sisl/_sparse.pyx":134
  *         tmp = np.sort(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]])
  *         for ind in range(fold_ncol[rr]):
  *             c = tmp[ind]             # <<<<<<<<<<<<<<
  *             fold_col[fold_ptr[rr] + ind] = c
  *             # Copy to next row as well
  */
-      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_tmp, __pyx_v_ind, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 133, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_tmp, __pyx_v_ind, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 134, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_34 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_34 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 133, __pyx_L1_error)
+      __pyx_t_34 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_34 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 134, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_v_c = __pyx_t_34;
 
-      /* "sisl/_sparse.pyx":134
+      /* "sisl/_sparse.pyx":135
  *         for ind in range(fold_ncol[rr]):
  *             c = tmp[ind]
  *             fold_col[fold_ptr[rr] + ind] = c             # <<<<<<<<<<<<<<
@@ -4290,7 +4437,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
       __pyx_t_52 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_51)) ))) + __pyx_v_ind);
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_52)) )) = __pyx_v_c;
 
-      /* "sisl/_sparse.pyx":136
+      /* "sisl/_sparse.pyx":137
  *             fold_col[fold_ptr[rr] + ind] = c
  *             # Copy to next row as well
  *             fold_col[fold_ptr[rr+1] + ind] = c             # <<<<<<<<<<<<<<
@@ -4302,7 +4449,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_54)) )) = __pyx_v_c;
     }
 
-    /* "sisl/_sparse.pyx":139
+    /* "sisl/_sparse.pyx":140
  * 
  *         # Increment the next row
  *         fold_ptr[rr + 2] = fold_ptr[rr + 1] + fold_ncol[rr + 1]             # <<<<<<<<<<<<<<
@@ -4314,7 +4461,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_t_57 = (__pyx_v_rr + 2);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_57)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_55)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_56)) ))));
 
-    /* "sisl/_sparse.pyx":140
+    /* "sisl/_sparse.pyx":141
  *         # Increment the next row
  *         fold_ptr[rr + 2] = fold_ptr[rr + 1] + fold_ncol[rr + 1]
  *         nz += fold_ncol[rr] * 2             # <<<<<<<<<<<<<<
@@ -4325,7 +4472,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_v_nz = (__pyx_v_nz + ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_58)) ))) * 2));
   }
 
-  /* "sisl/_sparse.pyx":142
+  /* "sisl/_sparse.pyx":143
  *         nz += fold_ncol[rr] * 2
  * 
  *     if nz > fold_col.shape[0]:             # <<<<<<<<<<<<<<
@@ -4335,20 +4482,20 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   __pyx_t_15 = ((__pyx_v_nz > (__pyx_v_fold_col.shape[0])) != 0);
   if (unlikely(__pyx_t_15)) {
 
-    /* "sisl/_sparse.pyx":143
+    /* "sisl/_sparse.pyx":144
  * 
  *     if nz > fold_col.shape[0]:
  *         raise ValueError('something went wrong NC')             # <<<<<<<<<<<<<<
  * 
  *     # Return objects
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 143, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 144, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 143, __pyx_L1_error)
+    __PYX_ERR(0, 144, __pyx_L1_error)
 
-    /* "sisl/_sparse.pyx":142
+    /* "sisl/_sparse.pyx":143
  *         nz += fold_ncol[rr] * 2
  * 
  *     if nz > fold_col.shape[0]:             # <<<<<<<<<<<<<<
@@ -4357,7 +4504,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
  */
   }
 
-  /* "sisl/_sparse.pyx":146
+  /* "sisl/_sparse.pyx":147
  * 
  *     # Return objects
  *     return FOLD_ptr, FOLD_ncol, FOLD_col[:nz].copy()             # <<<<<<<<<<<<<<
@@ -4365,15 +4512,15 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_FOLD_col), __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_FOLD_col), __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_copy); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_copy); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_5 = NULL;
@@ -4388,10 +4535,10 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   }
   __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 146, __pyx_L1_error)
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_INCREF(((PyObject *)__pyx_v_FOLD_ptr));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_FOLD_ptr));
@@ -4406,7 +4553,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   __pyx_t_6 = 0;
   goto __pyx_L0;
 
-  /* "sisl/_sparse.pyx":84
+  /* "sisl/_sparse.pyx":85
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
@@ -4459,7 +4606,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   return __pyx_r;
 }
 
-/* "sisl/_sparse.pyx":153
+/* "sisl/_sparse.pyx":154
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_diagonal_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
@@ -4503,17 +4650,17 @@ static PyObject *__pyx_pw_4sisl_7_sparse_5fold_csr_diagonal_nc(PyObject *__pyx_s
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("fold_csr_diagonal_nc", 1, 3, 3, 1); __PYX_ERR(0, 153, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("fold_csr_diagonal_nc", 1, 3, 3, 1); __PYX_ERR(0, 154, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("fold_csr_diagonal_nc", 1, 3, 3, 2); __PYX_ERR(0, 153, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("fold_csr_diagonal_nc", 1, 3, 3, 2); __PYX_ERR(0, 154, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "fold_csr_diagonal_nc") < 0)) __PYX_ERR(0, 153, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "fold_csr_diagonal_nc") < 0)) __PYX_ERR(0, 154, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -4528,15 +4675,15 @@ static PyObject *__pyx_pw_4sisl_7_sparse_5fold_csr_diagonal_nc(PyObject *__pyx_s
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("fold_csr_diagonal_nc", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 153, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("fold_csr_diagonal_nc", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 154, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("sisl._sparse.fold_csr_diagonal_nc", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 153, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 154, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 155, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 154, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 155, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 156, __pyx_L1_error)
   __pyx_r = __pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(__pyx_self, __pyx_v_PTR, __pyx_v_NCOL, __pyx_v_COL);
 
   /* function exit code */
@@ -4659,57 +4806,57 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
   __pyx_pybuffernd_COL.rcbuffer = &__pyx_pybuffer_COL;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 153, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 154, __pyx_L1_error)
   }
   __pyx_pybuffernd_PTR.diminfo[0].strides = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR.diminfo[0].shape = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 153, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 154, __pyx_L1_error)
   }
   __pyx_pybuffernd_NCOL.diminfo[0].strides = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL.diminfo[0].shape = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 153, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 154, __pyx_L1_error)
   }
   __pyx_pybuffernd_COL.diminfo[0].strides = __pyx_pybuffernd_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL.diminfo[0].shape = __pyx_pybuffernd_COL.rcbuffer->pybuffer.shape[0];
 
-  /* "sisl/_sparse.pyx":157
+  /* "sisl/_sparse.pyx":158
  *                          np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  *     """ Fold all columns into a square matrix """
  *     cdef int[::1] ptr = PTR             # <<<<<<<<<<<<<<
  *     cdef int[::1] ncol = NCOL
  *     cdef int[::1] col = COL
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 158, __pyx_L1_error)
   __pyx_v_ptr = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":158
+  /* "sisl/_sparse.pyx":159
  *     """ Fold all columns into a square matrix """
  *     cdef int[::1] ptr = PTR
  *     cdef int[::1] ncol = NCOL             # <<<<<<<<<<<<<<
  *     cdef int[::1] col = COL
  *     # Number of rows
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 158, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 159, __pyx_L1_error)
   __pyx_v_ncol = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":159
+  /* "sisl/_sparse.pyx":160
  *     cdef int[::1] ptr = PTR
  *     cdef int[::1] ncol = NCOL
  *     cdef int[::1] col = COL             # <<<<<<<<<<<<<<
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 159, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 160, __pyx_L1_error)
   __pyx_v_col = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":161
+  /* "sisl/_sparse.pyx":162
  *     cdef int[::1] col = COL
  *     # Number of rows
  *     cdef int nr = ncol.shape[0]             # <<<<<<<<<<<<<<
@@ -4718,51 +4865,51 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
  */
   __pyx_v_nr = (__pyx_v_ncol.shape[0]);
 
-  /* "sisl/_sparse.pyx":163
+  /* "sisl/_sparse.pyx":164
  *     cdef int nr = ncol.shape[0]
  * 
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr * 2 + 1], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 164, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 164, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyInt_From_long(((__pyx_v_nr * 2) + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_long(((__pyx_v_nr * 2) + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 164, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 164, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_GIVEREF(__pyx_t_2);
   PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 164, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 164, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 164, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 164, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 163, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 164, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 164, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 163, __pyx_L1_error)
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 164, __pyx_L1_error)
   __pyx_t_7 = ((PyArrayObject *)__pyx_t_6);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_ptr = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 163, __pyx_L1_error)
+      __PYX_ERR(0, 164, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_ptr.diminfo[0].strides = __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_ptr.diminfo[0].shape = __pyx_pybuffernd_FOLD_ptr.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -4770,63 +4917,63 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
   __pyx_v_FOLD_ptr = ((PyArrayObject *)__pyx_t_6);
   __pyx_t_6 = 0;
 
-  /* "sisl/_sparse.pyx":164
+  /* "sisl/_sparse.pyx":165
  * 
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr * 2 + 1], dtype=np.int32)
  *     cdef int[::1] fold_ptr = FOLD_ptr             # <<<<<<<<<<<<<<
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ptr), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 164, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ptr), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 165, __pyx_L1_error)
   __pyx_v_fold_ptr = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":165
+  /* "sisl/_sparse.pyx":166
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ptr = np.empty([nr * 2 + 1], dtype=np.int32)
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     # We have to multiply by 2, 2 times the number of rows
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyInt_From_long((__pyx_v_nr * 2)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_From_long((__pyx_v_nr * 2)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_6);
   PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
   __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 165, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 165, __pyx_L1_error)
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 166, __pyx_L1_error)
   __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_ncol = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 165, __pyx_L1_error)
+      __PYX_ERR(0, 166, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_ncol.diminfo[0].strides = __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_ncol.diminfo[0].shape = __pyx_pybuffernd_FOLD_ncol.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -4834,63 +4981,63 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
   __pyx_v_FOLD_ncol = ((PyArrayObject *)__pyx_t_5);
   __pyx_t_5 = 0;
 
-  /* "sisl/_sparse.pyx":166
+  /* "sisl/_sparse.pyx":167
  *     cdef int[::1] fold_ptr = FOLD_ptr
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_ncol = np.empty([nr * 2], dtype=np.int32)
  *     cdef int[::1] fold_ncol = FOLD_ncol             # <<<<<<<<<<<<<<
  *     # We have to multiply by 2, 2 times the number of rows
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol) * 2], dtype=np.int32)
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ncol), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_ncol), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 167, __pyx_L1_error)
   __pyx_v_fold_ncol = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":168
+  /* "sisl/_sparse.pyx":169
  *     cdef int[::1] fold_ncol = FOLD_ncol
  *     # We have to multiply by 2, 2 times the number of rows
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol) * 2], dtype=np.int32)             # <<<<<<<<<<<<<<
  *     cdef int[::1] fold_col = FOLD_col
  *     # local variables
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyInt_From_long((__pyx_f_4sisl_7_sparse__sum(__pyx_v_ncol) * 2)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_long((__pyx_f_4sisl_7_sparse__sum(__pyx_v_ncol) * 2)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_5);
   PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
   __pyx_t_5 = 0;
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_6);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
   __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 168, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 168, __pyx_L1_error)
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 169, __pyx_L1_error)
   __pyx_t_9 = ((PyArrayObject *)__pyx_t_3);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer, (PyObject*)__pyx_t_9, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_FOLD_col = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 168, __pyx_L1_error)
+      __PYX_ERR(0, 169, __pyx_L1_error)
     } else {__pyx_pybuffernd_FOLD_col.diminfo[0].strides = __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_FOLD_col.diminfo[0].shape = __pyx_pybuffernd_FOLD_col.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -4898,19 +5045,19 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
   __pyx_v_FOLD_col = ((PyArrayObject *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "sisl/_sparse.pyx":169
+  /* "sisl/_sparse.pyx":170
  *     # We have to multiply by 2, 2 times the number of rows
  *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] FOLD_col = np.empty([_sum(ncol) * 2], dtype=np.int32)
  *     cdef int[::1] fold_col = FOLD_col             # <<<<<<<<<<<<<<
  *     # local variables
  *     cdef int r, rr, ind, nz, c
  */
-  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_col), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 169, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_FOLD_col), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 170, __pyx_L1_error)
   __pyx_v_fold_col = __pyx_t_1;
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
 
-  /* "sisl/_sparse.pyx":173
+  /* "sisl/_sparse.pyx":174
  *     cdef int r, rr, ind, nz, c
  * 
  *     nz = 0             # <<<<<<<<<<<<<<
@@ -4919,7 +5066,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
  */
   __pyx_v_nz = 0;
 
-  /* "sisl/_sparse.pyx":174
+  /* "sisl/_sparse.pyx":175
  * 
  *     nz = 0
  *     fold_ptr[0] = 0             # <<<<<<<<<<<<<<
@@ -4929,7 +5076,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
   __pyx_t_10 = 0;
   *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_10)) )) = 0;
 
-  /* "sisl/_sparse.pyx":176
+  /* "sisl/_sparse.pyx":177
  *     fold_ptr[0] = 0
  *     # Loop on all rows
  *     for r in range(nr):             # <<<<<<<<<<<<<<
@@ -4941,7 +5088,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
   for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
     __pyx_v_r = __pyx_t_13;
 
-    /* "sisl/_sparse.pyx":177
+    /* "sisl/_sparse.pyx":178
  *     # Loop on all rows
  *     for r in range(nr):
  *         rr = r * 2             # <<<<<<<<<<<<<<
@@ -4950,7 +5097,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
  */
     __pyx_v_rr = (__pyx_v_r * 2);
 
-    /* "sisl/_sparse.pyx":180
+    /* "sisl/_sparse.pyx":181
  * 
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:             # <<<<<<<<<<<<<<
@@ -4961,7 +5108,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
     __pyx_t_15 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_14)) ))) > 0) != 0);
     if (__pyx_t_15) {
 
-      /* "sisl/_sparse.pyx":181
+      /* "sisl/_sparse.pyx":182
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:
  *             c = (col[ptr[r]] % nr) * 2             # <<<<<<<<<<<<<<
@@ -4972,7 +5119,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
       __pyx_t_17 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_16)) )));
       __pyx_v_c = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_17)) ))) % __pyx_v_nr) * 2);
 
-      /* "sisl/_sparse.pyx":182
+      /* "sisl/_sparse.pyx":183
  *         if ncol[r] > 0:
  *             c = (col[ptr[r]] % nr) * 2
  *             fold_ncol[rr] = 1             # <<<<<<<<<<<<<<
@@ -4982,7 +5129,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
       __pyx_t_18 = __pyx_v_rr;
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_18)) )) = 1;
 
-      /* "sisl/_sparse.pyx":183
+      /* "sisl/_sparse.pyx":184
  *             c = (col[ptr[r]] % nr) * 2
  *             fold_ncol[rr] = 1
  *             fold_col[fold_ptr[rr]] = c             # <<<<<<<<<<<<<<
@@ -4993,7 +5140,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
       __pyx_t_20 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_19)) )));
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_20)) )) = __pyx_v_c;
 
-      /* "sisl/_sparse.pyx":180
+      /* "sisl/_sparse.pyx":181
  * 
  *         # Initialize the pointer arrays
  *         if ncol[r] > 0:             # <<<<<<<<<<<<<<
@@ -5003,7 +5150,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
       goto __pyx_L5;
     }
 
-    /* "sisl/_sparse.pyx":185
+    /* "sisl/_sparse.pyx":186
  *             fold_col[fold_ptr[rr]] = c
  *         else:
  *             fold_ncol[rr] = 0             # <<<<<<<<<<<<<<
@@ -5016,7 +5163,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
     }
     __pyx_L5:;
 
-    /* "sisl/_sparse.pyx":187
+    /* "sisl/_sparse.pyx":188
  *             fold_ncol[rr] = 0
  * 
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):             # <<<<<<<<<<<<<<
@@ -5031,7 +5178,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
     for (__pyx_t_27 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_25)) ))) + 1); __pyx_t_27 < __pyx_t_26; __pyx_t_27+=1) {
       __pyx_v_ind = __pyx_t_27;
 
-      /* "sisl/_sparse.pyx":188
+      /* "sisl/_sparse.pyx":189
  * 
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = (col[ind] % nr) * 2             # <<<<<<<<<<<<<<
@@ -5041,7 +5188,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
       __pyx_t_28 = __pyx_v_ind;
       __pyx_v_c = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_28)) ))) % __pyx_v_nr) * 2);
 
-      /* "sisl/_sparse.pyx":189
+      /* "sisl/_sparse.pyx":190
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = (col[ind] % nr) * 2
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):             # <<<<<<<<<<<<<<
@@ -5069,7 +5216,7 @@ static PyObject *__pyx_pf_4sisl_7_sparse_4fold_csr_diagonal_nc(CYTHON_UNUSED PyO
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 189, __pyx_L1_error)
+    __PYX_ERR(0, 190, __pyx_L1_error)
 }
 
 __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0);
@@ -5078,7 +5225,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
       __pyx_t_1.data = NULL;
       if (__pyx_t_15) {
 
-        /* "sisl/_sparse.pyx":190
+        /* "sisl/_sparse.pyx":191
  *             c = (col[ind] % nr) * 2
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr]] = c             # <<<<<<<<<<<<<<
@@ -5090,7 +5237,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_35 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_33)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_34)) ))));
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_35)) )) = __pyx_v_c;
 
-        /* "sisl/_sparse.pyx":191
+        /* "sisl/_sparse.pyx":192
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):
  *                 fold_col[fold_ptr[rr] + fold_ncol[rr]] = c
  *                 fold_ncol[rr] += 1             # <<<<<<<<<<<<<<
@@ -5100,7 +5247,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
         __pyx_t_36 = __pyx_v_rr;
         *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_36)) )) += 1;
 
-        /* "sisl/_sparse.pyx":189
+        /* "sisl/_sparse.pyx":190
  *         for ind in range(ptr[r] + 1, ptr[r] + ncol[r]):
  *             c = (col[ind] % nr) * 2
  *             if not in_1d(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]], c):             # <<<<<<<<<<<<<<
@@ -5110,7 +5257,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
       }
     }
 
-    /* "sisl/_sparse.pyx":194
+    /* "sisl/_sparse.pyx":195
  * 
  *         # Duplicate pointers and counters for next row (off-diagonal)
  *         fold_ptr[rr + 1] = fold_ptr[rr] + fold_ncol[rr]             # <<<<<<<<<<<<<<
@@ -5122,7 +5269,7 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     __pyx_t_39 = (__pyx_v_rr + 1);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_39)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_37)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_38)) ))));
 
-    /* "sisl/_sparse.pyx":195
+    /* "sisl/_sparse.pyx":196
  *         # Duplicate pointers and counters for next row (off-diagonal)
  *         fold_ptr[rr + 1] = fold_ptr[rr] + fold_ncol[rr]
  *         fold_ncol[rr + 1] = fold_ncol[rr]             # <<<<<<<<<<<<<<
@@ -5133,16 +5280,16 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     __pyx_t_41 = (__pyx_v_rr + 1);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_41)) )) = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_40)) )));
 
-    /* "sisl/_sparse.pyx":198
+    /* "sisl/_sparse.pyx":199
  * 
  *         # Sort indices (we should implement our own sorting algorithm)
  *         tmp = np.sort(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]])             # <<<<<<<<<<<<<<
  *         for ind in range(fold_ncol[rr]):
  *             c = tmp[ind]
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 199, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_sort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 199, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __pyx_t_42 = __pyx_v_rr;
@@ -5166,10 +5313,10 @@ __pyx_t_15 = ((!(__pyx_f_4sisl_8_indices_in_1d(__pyx_t_1, __pyx_v_c) != 0)) != 0
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 198, __pyx_L1_error)
+    __PYX_ERR(0, 199, __pyx_L1_error)
 }
 
-__pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __pyx_memview_get_int, (int (*)(char *, PyObject *)) __pyx_memview_set_int, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 198, __pyx_L1_error)
+__pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __pyx_memview_get_int, (int (*)(char *, PyObject *)) __pyx_memview_set_int, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 199, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
     __pyx_t_1.memview = NULL;
@@ -5187,13 +5334,13 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_t_3 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_2, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6);
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 198, __pyx_L1_error)
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 199, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_XDECREF_SET(__pyx_v_tmp, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "sisl/_sparse.pyx":199
+    /* "sisl/_sparse.pyx":200
  *         # Sort indices (we should implement our own sorting algorithm)
  *         tmp = np.sort(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]])
  *         for ind in range(fold_ncol[rr]):             # <<<<<<<<<<<<<<
@@ -5206,20 +5353,20 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     for (__pyx_t_27 = 0; __pyx_t_27 < __pyx_t_26; __pyx_t_27+=1) {
       __pyx_v_ind = __pyx_t_27;
 
-      /* "sisl/_sparse.pyx":200
+      /* "sisl/_sparse.pyx":201
  *         tmp = np.sort(fold_col[fold_ptr[rr]:fold_ptr[rr] + fold_ncol[rr]])
  *         for ind in range(fold_ncol[rr]):
  *             c = tmp[ind]             # <<<<<<<<<<<<<<
  *             fold_col[fold_ptr[rr] + ind] = c
  *             # Copy to next row as well
  */
-      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_tmp, __pyx_v_ind, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_tmp, __pyx_v_ind, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 201, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_32 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_32 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 200, __pyx_L1_error)
+      __pyx_t_32 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_32 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 201, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_v_c = __pyx_t_32;
 
-      /* "sisl/_sparse.pyx":201
+      /* "sisl/_sparse.pyx":202
  *         for ind in range(fold_ncol[rr]):
  *             c = tmp[ind]
  *             fold_col[fold_ptr[rr] + ind] = c             # <<<<<<<<<<<<<<
@@ -5230,7 +5377,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
       __pyx_t_47 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_46)) ))) + __pyx_v_ind);
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_47)) )) = __pyx_v_c;
 
-      /* "sisl/_sparse.pyx":203
+      /* "sisl/_sparse.pyx":204
  *             fold_col[fold_ptr[rr] + ind] = c
  *             # Copy to next row as well
  *             fold_col[fold_ptr[rr+1] + ind] = c + 1             # <<<<<<<<<<<<<<
@@ -5242,7 +5389,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
       *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_col.data) + __pyx_t_49)) )) = (__pyx_v_c + 1);
     }
 
-    /* "sisl/_sparse.pyx":206
+    /* "sisl/_sparse.pyx":207
  * 
  *         # Increment the next row
  *         fold_ptr[rr + 2] = fold_ptr[rr + 1] + fold_ncol[rr + 1]             # <<<<<<<<<<<<<<
@@ -5254,7 +5401,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_t_52 = (__pyx_v_rr + 2);
     *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_52)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ptr.data) + __pyx_t_50)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_51)) ))));
 
-    /* "sisl/_sparse.pyx":207
+    /* "sisl/_sparse.pyx":208
  *         # Increment the next row
  *         fold_ptr[rr + 2] = fold_ptr[rr + 1] + fold_ncol[rr + 1]
  *         nz += fold_ncol[rr] * 2             # <<<<<<<<<<<<<<
@@ -5265,7 +5412,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
     __pyx_v_nz = (__pyx_v_nz + ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_fold_ncol.data) + __pyx_t_53)) ))) * 2));
   }
 
-  /* "sisl/_sparse.pyx":209
+  /* "sisl/_sparse.pyx":210
  *         nz += fold_ncol[rr] * 2
  * 
  *     if nz > fold_col.shape[0]:             # <<<<<<<<<<<<<<
@@ -5275,20 +5422,20 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   __pyx_t_15 = ((__pyx_v_nz > (__pyx_v_fold_col.shape[0])) != 0);
   if (unlikely(__pyx_t_15)) {
 
-    /* "sisl/_sparse.pyx":210
+    /* "sisl/_sparse.pyx":211
  * 
  *     if nz > fold_col.shape[0]:
  *         raise ValueError('something went wrong overlap NC')             # <<<<<<<<<<<<<<
  * 
  *     # Return objects
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 210, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 211, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 210, __pyx_L1_error)
+    __PYX_ERR(0, 211, __pyx_L1_error)
 
-    /* "sisl/_sparse.pyx":209
+    /* "sisl/_sparse.pyx":210
  *         nz += fold_ncol[rr] * 2
  * 
  *     if nz > fold_col.shape[0]:             # <<<<<<<<<<<<<<
@@ -5297,21 +5444,23 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
  */
   }
 
-  /* "sisl/_sparse.pyx":213
+  /* "sisl/_sparse.pyx":214
  * 
  *     # Return objects
  *     return FOLD_ptr, FOLD_ncol, FOLD_col[:nz].copy()             # <<<<<<<<<<<<<<
+ * 
+ * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 214, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_5, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 214, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_FOLD_col), __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_FOLD_col), __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 214, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_copy); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_copy); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 214, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_5 = NULL;
@@ -5326,10 +5475,10 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   }
   __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 213, __pyx_L1_error)
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 214, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 214, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_INCREF(((PyObject *)__pyx_v_FOLD_ptr));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_FOLD_ptr));
@@ -5344,7 +5493,7 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   __pyx_t_6 = 0;
   goto __pyx_L0;
 
-  /* "sisl/_sparse.pyx":153
+  /* "sisl/_sparse.pyx":154
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_diagonal_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
@@ -5397,204 +5546,2873 @@ __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_t_1, 1, (PyObject *(*)(char *)) __p
   return __pyx_r;
 }
 
-/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":258
- *         # experimental exception made for __getbuffer__ and __releasebuffer__
- *         # -- the details of this may change.
- *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
- *             # This implementation of getbuffer is geared towards Cython
- *             # requirements, and does not yet fulfill the PEP.
+/* "sisl/_sparse.pyx":220
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def csr_index_map(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR_A,             # <<<<<<<<<<<<<<
+ *                   np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL_A,
+ *                   np.ndarray[np.int32_t, ndim=1, mode='c'] COL_A,
  */
 
 /* Python wrapper */
-static CYTHON_UNUSED int __pyx_pw_5numpy_7ndarray_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /*proto*/
-static CYTHON_UNUSED int __pyx_pw_5numpy_7ndarray_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
-  int __pyx_r;
+static PyObject *__pyx_pw_4sisl_7_sparse_7csr_index_map(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4sisl_7_sparse_6csr_index_map[] = " Indices of the non-zero elements of the CSR pattern B in the CSR pattern A\n\n    The column indices need not be sorted. The elements of B are\n    traversed row by row (i.e. as in a finalized matrix), and an index of ``-1``\n    signals that the element does not exist in A.\n    This is an O(nnz) operation using a work array of the number of columns.\n    ";
+static PyMethodDef __pyx_mdef_4sisl_7_sparse_7csr_index_map = {"csr_index_map", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4sisl_7_sparse_7csr_index_map, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4sisl_7_sparse_6csr_index_map};
+static PyObject *__pyx_pw_4sisl_7_sparse_7csr_index_map(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_PTR_A = 0;
+  PyArrayObject *__pyx_v_NCOL_A = 0;
+  PyArrayObject *__pyx_v_COL_A = 0;
+  PyArrayObject *__pyx_v_PTR_B = 0;
+  PyArrayObject *__pyx_v_NCOL_B = 0;
+  PyArrayObject *__pyx_v_COL_B = 0;
+  PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__getbuffer__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5numpy_7ndarray___getbuffer__(((PyArrayObject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info), ((int)__pyx_v_flags));
+  __Pyx_RefNannySetupContext("csr_index_map (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_PTR_A,&__pyx_n_s_NCOL_A,&__pyx_n_s_COL_A,&__pyx_n_s_PTR_B,&__pyx_n_s_NCOL_B,&__pyx_n_s_COL_B,0};
+    PyObject* values[6] = {0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_PTR_A)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL_A)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_index_map", 1, 6, 6, 1); __PYX_ERR(0, 220, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL_A)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_index_map", 1, 6, 6, 2); __PYX_ERR(0, 220, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_PTR_B)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_index_map", 1, 6, 6, 3); __PYX_ERR(0, 220, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL_B)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_index_map", 1, 6, 6, 4); __PYX_ERR(0, 220, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL_B)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_index_map", 1, 6, 6, 5); __PYX_ERR(0, 220, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "csr_index_map") < 0)) __PYX_ERR(0, 220, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+    }
+    __pyx_v_PTR_A = ((PyArrayObject *)values[0]);
+    __pyx_v_NCOL_A = ((PyArrayObject *)values[1]);
+    __pyx_v_COL_A = ((PyArrayObject *)values[2]);
+    __pyx_v_PTR_B = ((PyArrayObject *)values[3]);
+    __pyx_v_NCOL_B = ((PyArrayObject *)values[4]);
+    __pyx_v_COL_B = ((PyArrayObject *)values[5]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("csr_index_map", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 220, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("sisl._sparse.csr_index_map", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR_A), __pyx_ptype_5numpy_ndarray, 1, "PTR_A", 0))) __PYX_ERR(0, 220, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL_A), __pyx_ptype_5numpy_ndarray, 1, "NCOL_A", 0))) __PYX_ERR(0, 221, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL_A), __pyx_ptype_5numpy_ndarray, 1, "COL_A", 0))) __PYX_ERR(0, 222, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR_B), __pyx_ptype_5numpy_ndarray, 1, "PTR_B", 0))) __PYX_ERR(0, 223, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL_B), __pyx_ptype_5numpy_ndarray, 1, "NCOL_B", 0))) __PYX_ERR(0, 224, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL_B), __pyx_ptype_5numpy_ndarray, 1, "COL_B", 0))) __PYX_ERR(0, 225, __pyx_L1_error)
+  __pyx_r = __pyx_pf_4sisl_7_sparse_6csr_index_map(__pyx_self, __pyx_v_PTR_A, __pyx_v_NCOL_A, __pyx_v_COL_A, __pyx_v_PTR_B, __pyx_v_NCOL_B, __pyx_v_COL_B);
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
-  int __pyx_v_i;
-  int __pyx_v_ndim;
-  int __pyx_v_endian_detector;
-  int __pyx_v_little_endian;
-  int __pyx_v_t;
-  char *__pyx_v_f;
-  PyArray_Descr *__pyx_v_descr = 0;
-  int __pyx_v_offset;
-  int __pyx_r;
+static PyObject *__pyx_pf_4sisl_7_sparse_6csr_index_map(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR_A, PyArrayObject *__pyx_v_NCOL_A, PyArrayObject *__pyx_v_COL_A, PyArrayObject *__pyx_v_PTR_B, PyArrayObject *__pyx_v_NCOL_B, PyArrayObject *__pyx_v_COL_B) {
+  __Pyx_memviewslice __pyx_v_ptr_a = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ncol_a = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_col_a = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ptr_b = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ncol_b = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_col_b = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_nr;
+  int __pyx_v_r;
+  int __pyx_v_ind;
+  int __pyx_v_nc;
+  int __pyx_v_nz;
+  PyArrayObject *__pyx_v_WORK = 0;
+  __Pyx_memviewslice __pyx_v_work = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyArrayObject *__pyx_v_IDX = 0;
+  __Pyx_memviewslice __pyx_v_idx = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_COL_A;
+  __Pyx_Buffer __pyx_pybuffer_COL_A;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_COL_B;
+  __Pyx_Buffer __pyx_pybuffer_COL_B;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_IDX;
+  __Pyx_Buffer __pyx_pybuffer_IDX;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_NCOL_A;
+  __Pyx_Buffer __pyx_pybuffer_NCOL_A;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_NCOL_B;
+  __Pyx_Buffer __pyx_pybuffer_NCOL_B;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_PTR_A;
+  __Pyx_Buffer __pyx_pybuffer_PTR_A;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_PTR_B;
+  __Pyx_Buffer __pyx_pybuffer_PTR_B;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_WORK;
+  __Pyx_Buffer __pyx_pybuffer_WORK;
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
+  __Pyx_memviewslice __pyx_t_1 = { 0, 0, { 0 }, { 0 }, { 0 } };
   int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_3;
   int __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  PyArray_Descr *__pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  char *__pyx_t_9;
-  if (__pyx_v_info == NULL) {
-    PyErr_SetString(PyExc_BufferError, "PyObject_GetBuffer: view==NULL argument is obsolete");
-    return -1;
+  Py_ssize_t __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  int __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  int __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  Py_ssize_t __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
+  Py_ssize_t __pyx_t_19;
+  PyObject *__pyx_t_20 = NULL;
+  PyObject *__pyx_t_21 = NULL;
+  PyObject *__pyx_t_22 = NULL;
+  PyObject *__pyx_t_23 = NULL;
+  PyObject *__pyx_t_24 = NULL;
+  PyArrayObject *__pyx_t_25 = NULL;
+  PyArrayObject *__pyx_t_26 = NULL;
+  Py_ssize_t __pyx_t_27;
+  Py_ssize_t __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  Py_ssize_t __pyx_t_30;
+  Py_ssize_t __pyx_t_31;
+  Py_ssize_t __pyx_t_32;
+  Py_ssize_t __pyx_t_33;
+  Py_ssize_t __pyx_t_34;
+  Py_ssize_t __pyx_t_35;
+  Py_ssize_t __pyx_t_36;
+  Py_ssize_t __pyx_t_37;
+  Py_ssize_t __pyx_t_38;
+  Py_ssize_t __pyx_t_39;
+  Py_ssize_t __pyx_t_40;
+  Py_ssize_t __pyx_t_41;
+  Py_ssize_t __pyx_t_42;
+  __Pyx_RefNannySetupContext("csr_index_map", 0);
+  __pyx_pybuffer_WORK.pybuffer.buf = NULL;
+  __pyx_pybuffer_WORK.refcount = 0;
+  __pyx_pybuffernd_WORK.data = NULL;
+  __pyx_pybuffernd_WORK.rcbuffer = &__pyx_pybuffer_WORK;
+  __pyx_pybuffer_IDX.pybuffer.buf = NULL;
+  __pyx_pybuffer_IDX.refcount = 0;
+  __pyx_pybuffernd_IDX.data = NULL;
+  __pyx_pybuffernd_IDX.rcbuffer = &__pyx_pybuffer_IDX;
+  __pyx_pybuffer_PTR_A.pybuffer.buf = NULL;
+  __pyx_pybuffer_PTR_A.refcount = 0;
+  __pyx_pybuffernd_PTR_A.data = NULL;
+  __pyx_pybuffernd_PTR_A.rcbuffer = &__pyx_pybuffer_PTR_A;
+  __pyx_pybuffer_NCOL_A.pybuffer.buf = NULL;
+  __pyx_pybuffer_NCOL_A.refcount = 0;
+  __pyx_pybuffernd_NCOL_A.data = NULL;
+  __pyx_pybuffernd_NCOL_A.rcbuffer = &__pyx_pybuffer_NCOL_A;
+  __pyx_pybuffer_COL_A.pybuffer.buf = NULL;
+  __pyx_pybuffer_COL_A.refcount = 0;
+  __pyx_pybuffernd_COL_A.data = NULL;
+  __pyx_pybuffernd_COL_A.rcbuffer = &__pyx_pybuffer_COL_A;
+  __pyx_pybuffer_PTR_B.pybuffer.buf = NULL;
+  __pyx_pybuffer_PTR_B.refcount = 0;
+  __pyx_pybuffernd_PTR_B.data = NULL;
+  __pyx_pybuffernd_PTR_B.rcbuffer = &__pyx_pybuffer_PTR_B;
+  __pyx_pybuffer_NCOL_B.pybuffer.buf = NULL;
+  __pyx_pybuffer_NCOL_B.refcount = 0;
+  __pyx_pybuffernd_NCOL_B.data = NULL;
+  __pyx_pybuffernd_NCOL_B.rcbuffer = &__pyx_pybuffer_NCOL_B;
+  __pyx_pybuffer_COL_B.pybuffer.buf = NULL;
+  __pyx_pybuffer_COL_B.refcount = 0;
+  __pyx_pybuffernd_COL_B.data = NULL;
+  __pyx_pybuffernd_COL_B.rcbuffer = &__pyx_pybuffer_COL_B;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR_A.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR_A, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 220, __pyx_L1_error)
   }
-  __Pyx_RefNannySetupContext("__getbuffer__", 0);
-  __pyx_v_info->obj = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_GIVEREF(__pyx_v_info->obj);
+  __pyx_pybuffernd_PTR_A.diminfo[0].strides = __pyx_pybuffernd_PTR_A.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR_A.diminfo[0].shape = __pyx_pybuffernd_PTR_A.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL_A.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL_A, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 220, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_NCOL_A.diminfo[0].strides = __pyx_pybuffernd_NCOL_A.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL_A.diminfo[0].shape = __pyx_pybuffernd_NCOL_A.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL_A.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL_A, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 220, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_COL_A.diminfo[0].strides = __pyx_pybuffernd_COL_A.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL_A.diminfo[0].shape = __pyx_pybuffernd_COL_A.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR_B.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR_B, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 220, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_PTR_B.diminfo[0].strides = __pyx_pybuffernd_PTR_B.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR_B.diminfo[0].shape = __pyx_pybuffernd_PTR_B.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL_B.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL_B, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 220, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_NCOL_B.diminfo[0].strides = __pyx_pybuffernd_NCOL_B.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL_B.diminfo[0].shape = __pyx_pybuffernd_NCOL_B.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL_B.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL_B, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 220, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_COL_B.diminfo[0].strides = __pyx_pybuffernd_COL_B.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL_B.diminfo[0].shape = __pyx_pybuffernd_COL_B.rcbuffer->pybuffer.shape[0];
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":265
- * 
- *             cdef int i, ndim
- *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
- *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
- * 
+  /* "sisl/_sparse.pyx":233
+ *     This is an O(nnz) operation using a work array of the number of columns.
+ *     """
+ *     cdef int[::1] ptr_a = PTR_A             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ncol_a = NCOL_A
+ *     cdef int[::1] col_a = COL_A
  */
-  __pyx_v_endian_detector = 1;
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR_A), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_v_ptr_a = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":266
- *             cdef int i, ndim
- *             cdef int endian_detector = 1
- *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
- * 
- *             ndim = PyArray_NDIM(self)
+  /* "sisl/_sparse.pyx":234
+ *     """
+ *     cdef int[::1] ptr_a = PTR_A
+ *     cdef int[::1] ncol_a = NCOL_A             # <<<<<<<<<<<<<<
+ *     cdef int[::1] col_a = COL_A
+ *     cdef int[::1] ptr_b = PTR_B
  */
-  __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL_A), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __pyx_v_ncol_a = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":268
- *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
+  /* "sisl/_sparse.pyx":235
+ *     cdef int[::1] ptr_a = PTR_A
+ *     cdef int[::1] ncol_a = NCOL_A
+ *     cdef int[::1] col_a = COL_A             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ptr_b = PTR_B
+ *     cdef int[::1] ncol_b = NCOL_B
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL_A), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 235, __pyx_L1_error)
+  __pyx_v_col_a = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":236
+ *     cdef int[::1] ncol_a = NCOL_A
+ *     cdef int[::1] col_a = COL_A
+ *     cdef int[::1] ptr_b = PTR_B             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ncol_b = NCOL_B
+ *     cdef int[::1] col_b = COL_B
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR_B), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __pyx_v_ptr_b = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":237
+ *     cdef int[::1] col_a = COL_A
+ *     cdef int[::1] ptr_b = PTR_B
+ *     cdef int[::1] ncol_b = NCOL_B             # <<<<<<<<<<<<<<
+ *     cdef int[::1] col_b = COL_B
+ *     # Number of rows
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL_B), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 237, __pyx_L1_error)
+  __pyx_v_ncol_b = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":238
+ *     cdef int[::1] ptr_b = PTR_B
+ *     cdef int[::1] ncol_b = NCOL_B
+ *     cdef int[::1] col_b = COL_B             # <<<<<<<<<<<<<<
+ *     # Number of rows
+ *     cdef int nr = ncol_a.shape[0]
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL_B), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __pyx_v_col_b = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":240
+ *     cdef int[::1] col_b = COL_B
+ *     # Number of rows
+ *     cdef int nr = ncol_a.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int r, ind, c, nc, nz
  * 
- *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
+ */
+  __pyx_v_nr = (__pyx_v_ncol_a.shape[0]);
+
+  /* "sisl/_sparse.pyx":244
  * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ *     # Figure out the size of the work array
+ *     nc = 0             # <<<<<<<<<<<<<<
+ *     nz = 0
+ *     for r in range(nr):
  */
-  __pyx_v_ndim = PyArray_NDIM(__pyx_v_self);
+  __pyx_v_nc = 0;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":270
- *             ndim = PyArray_NDIM(self)
+  /* "sisl/_sparse.pyx":245
+ *     # Figure out the size of the work array
+ *     nc = 0
+ *     nz = 0             # <<<<<<<<<<<<<<
+ *     for r in range(nr):
+ *         for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):
+ */
+  __pyx_v_nz = 0;
+
+  /* "sisl/_sparse.pyx":246
+ *     nc = 0
+ *     nz = 0
+ *     for r in range(nr):             # <<<<<<<<<<<<<<
+ *         for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):
+ *             if col_a[ind] >= nc:
+ */
+  __pyx_t_2 = __pyx_v_nr;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_r = __pyx_t_4;
+
+    /* "sisl/_sparse.pyx":247
+ *     nz = 0
+ *     for r in range(nr):
+ *         for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):             # <<<<<<<<<<<<<<
+ *             if col_a[ind] >= nc:
+ *                 nc = col_a[ind] + 1
+ */
+    __pyx_t_5 = __pyx_v_r;
+    __pyx_t_6 = __pyx_v_r;
+    __pyx_t_7 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_a.data) + __pyx_t_5)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol_a.data) + __pyx_t_6)) ))));
+    __pyx_t_8 = __pyx_v_r;
+    __pyx_t_9 = __pyx_t_7;
+    for (__pyx_t_10 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_a.data) + __pyx_t_8)) ))); __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+      __pyx_v_ind = __pyx_t_10;
+
+      /* "sisl/_sparse.pyx":248
+ *     for r in range(nr):
+ *         for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):
+ *             if col_a[ind] >= nc:             # <<<<<<<<<<<<<<
+ *                 nc = col_a[ind] + 1
+ *         for ind in range(ptr_b[r], ptr_b[r] + ncol_b[r]):
+ */
+      __pyx_t_11 = __pyx_v_ind;
+      __pyx_t_12 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col_a.data) + __pyx_t_11)) ))) >= __pyx_v_nc) != 0);
+      if (__pyx_t_12) {
+
+        /* "sisl/_sparse.pyx":249
+ *         for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):
+ *             if col_a[ind] >= nc:
+ *                 nc = col_a[ind] + 1             # <<<<<<<<<<<<<<
+ *         for ind in range(ptr_b[r], ptr_b[r] + ncol_b[r]):
+ *             if col_b[ind] >= nc:
+ */
+        __pyx_t_13 = __pyx_v_ind;
+        __pyx_v_nc = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col_a.data) + __pyx_t_13)) ))) + 1);
+
+        /* "sisl/_sparse.pyx":248
+ *     for r in range(nr):
+ *         for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):
+ *             if col_a[ind] >= nc:             # <<<<<<<<<<<<<<
+ *                 nc = col_a[ind] + 1
+ *         for ind in range(ptr_b[r], ptr_b[r] + ncol_b[r]):
+ */
+      }
+    }
+
+    /* "sisl/_sparse.pyx":250
+ *             if col_a[ind] >= nc:
+ *                 nc = col_a[ind] + 1
+ *         for ind in range(ptr_b[r], ptr_b[r] + ncol_b[r]):             # <<<<<<<<<<<<<<
+ *             if col_b[ind] >= nc:
+ *                 nc = col_b[ind] + 1
+ */
+    __pyx_t_14 = __pyx_v_r;
+    __pyx_t_15 = __pyx_v_r;
+    __pyx_t_7 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_b.data) + __pyx_t_14)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol_b.data) + __pyx_t_15)) ))));
+    __pyx_t_16 = __pyx_v_r;
+    __pyx_t_9 = __pyx_t_7;
+    for (__pyx_t_10 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_b.data) + __pyx_t_16)) ))); __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+      __pyx_v_ind = __pyx_t_10;
+
+      /* "sisl/_sparse.pyx":251
+ *                 nc = col_a[ind] + 1
+ *         for ind in range(ptr_b[r], ptr_b[r] + ncol_b[r]):
+ *             if col_b[ind] >= nc:             # <<<<<<<<<<<<<<
+ *                 nc = col_b[ind] + 1
+ *         nz += ncol_b[r]
+ */
+      __pyx_t_17 = __pyx_v_ind;
+      __pyx_t_12 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col_b.data) + __pyx_t_17)) ))) >= __pyx_v_nc) != 0);
+      if (__pyx_t_12) {
+
+        /* "sisl/_sparse.pyx":252
+ *         for ind in range(ptr_b[r], ptr_b[r] + ncol_b[r]):
+ *             if col_b[ind] >= nc:
+ *                 nc = col_b[ind] + 1             # <<<<<<<<<<<<<<
+ *         nz += ncol_b[r]
+ * 
+ */
+        __pyx_t_18 = __pyx_v_ind;
+        __pyx_v_nc = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col_b.data) + __pyx_t_18)) ))) + 1);
+
+        /* "sisl/_sparse.pyx":251
+ *                 nc = col_a[ind] + 1
+ *         for ind in range(ptr_b[r], ptr_b[r] + ncol_b[r]):
+ *             if col_b[ind] >= nc:             # <<<<<<<<<<<<<<
+ *                 nc = col_b[ind] + 1
+ *         nz += ncol_b[r]
+ */
+      }
+    }
+
+    /* "sisl/_sparse.pyx":253
+ *             if col_b[ind] >= nc:
+ *                 nc = col_b[ind] + 1
+ *         nz += ncol_b[r]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] WORK = np.full([nc], -1, dtype=np.int32)
+ */
+    __pyx_t_19 = __pyx_v_r;
+    __pyx_v_nz = (__pyx_v_nz + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol_b.data) + __pyx_t_19)) ))));
+  }
+
+  /* "sisl/_sparse.pyx":255
+ *         nz += ncol_b[r]
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] WORK = np.full([nc], -1, dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] work = WORK
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([nz], dtype=np.int32)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_20, __pyx_n_s_np); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __pyx_t_21 = __Pyx_PyObject_GetAttrStr(__pyx_t_20, __pyx_n_s_full); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+  __pyx_t_20 = __Pyx_PyInt_From_int(__pyx_v_nc); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __pyx_t_22 = PyList_New(1); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __Pyx_GIVEREF(__pyx_t_20);
+  PyList_SET_ITEM(__pyx_t_22, 0, __pyx_t_20);
+  __pyx_t_20 = 0;
+  __pyx_t_20 = PyTuple_New(2); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __Pyx_GIVEREF(__pyx_t_22);
+  PyTuple_SET_ITEM(__pyx_t_20, 0, __pyx_t_22);
+  __Pyx_INCREF(__pyx_int_neg_1);
+  __Pyx_GIVEREF(__pyx_int_neg_1);
+  PyTuple_SET_ITEM(__pyx_t_20, 1, __pyx_int_neg_1);
+  __pyx_t_22 = 0;
+  __pyx_t_22 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __Pyx_GetModuleGlobalName(__pyx_t_23, __pyx_n_s_np); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __pyx_t_24 = __Pyx_PyObject_GetAttrStr(__pyx_t_23, __pyx_n_s_int32); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
+  if (PyDict_SetItem(__pyx_t_22, __pyx_n_s_dtype, __pyx_t_24) < 0) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_24); __pyx_t_24 = 0;
+  __pyx_t_24 = __Pyx_PyObject_Call(__pyx_t_21, __pyx_t_20, __pyx_t_22); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+  __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+  __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
+  if (!(likely(((__pyx_t_24) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_24, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 255, __pyx_L1_error)
+  __pyx_t_25 = ((PyArrayObject *)__pyx_t_24);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_WORK.rcbuffer->pybuffer, (PyObject*)__pyx_t_25, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_WORK = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_WORK.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 255, __pyx_L1_error)
+    } else {__pyx_pybuffernd_WORK.diminfo[0].strides = __pyx_pybuffernd_WORK.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_WORK.diminfo[0].shape = __pyx_pybuffernd_WORK.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_25 = 0;
+  __pyx_v_WORK = ((PyArrayObject *)__pyx_t_24);
+  __pyx_t_24 = 0;
+
+  /* "sisl/_sparse.pyx":256
  * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not C contiguous")
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] WORK = np.full([nc], -1, dtype=np.int32)
+ *     cdef int[::1] work = WORK             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([nz], dtype=np.int32)
+ *     cdef int[::1] idx = IDX
  */
-  __pyx_t_2 = (((__pyx_v_flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS) != 0);
-  if (__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L4_bool_binop_done;
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_WORK), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 256, __pyx_L1_error)
+  __pyx_v_work = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":257
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] WORK = np.full([nc], -1, dtype=np.int32)
+ *     cdef int[::1] work = WORK
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([nz], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] idx = IDX
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_24, __pyx_n_s_np); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __pyx_t_22 = __Pyx_PyObject_GetAttrStr(__pyx_t_24, __pyx_n_s_empty); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __Pyx_DECREF(__pyx_t_24); __pyx_t_24 = 0;
+  __pyx_t_24 = __Pyx_PyInt_From_int(__pyx_v_nz); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __pyx_t_20 = PyList_New(1); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __Pyx_GIVEREF(__pyx_t_24);
+  PyList_SET_ITEM(__pyx_t_20, 0, __pyx_t_24);
+  __pyx_t_24 = 0;
+  __pyx_t_24 = PyTuple_New(1); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_GIVEREF(__pyx_t_20);
+  PyTuple_SET_ITEM(__pyx_t_24, 0, __pyx_t_20);
+  __pyx_t_20 = 0;
+  __pyx_t_20 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __Pyx_GetModuleGlobalName(__pyx_t_21, __pyx_n_s_np); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __pyx_t_23 = __Pyx_PyObject_GetAttrStr(__pyx_t_21, __pyx_n_s_int32); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+  if (PyDict_SetItem(__pyx_t_20, __pyx_n_s_dtype, __pyx_t_23) < 0) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
+  __pyx_t_23 = __Pyx_PyObject_Call(__pyx_t_22, __pyx_t_24, __pyx_t_20); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
+  __Pyx_DECREF(__pyx_t_24); __pyx_t_24 = 0;
+  __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+  if (!(likely(((__pyx_t_23) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_23, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 257, __pyx_L1_error)
+  __pyx_t_26 = ((PyArrayObject *)__pyx_t_23);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_IDX.rcbuffer->pybuffer, (PyObject*)__pyx_t_26, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_IDX = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_IDX.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 257, __pyx_L1_error)
+    } else {__pyx_pybuffernd_IDX.diminfo[0].strides = __pyx_pybuffernd_IDX.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_IDX.diminfo[0].shape = __pyx_pybuffernd_IDX.rcbuffer->pybuffer.shape[0];
+    }
   }
+  __pyx_t_26 = 0;
+  __pyx_v_IDX = ((PyArrayObject *)__pyx_t_23);
+  __pyx_t_23 = 0;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":271
+  /* "sisl/_sparse.pyx":258
+ *     cdef int[::1] work = WORK
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([nz], dtype=np.int32)
+ *     cdef int[::1] idx = IDX             # <<<<<<<<<<<<<<
  * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
- *                 raise ValueError(u"ndarray is not C contiguous")
+ *     nz = 0
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_IDX), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 258, __pyx_L1_error)
+  __pyx_v_idx = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":260
+ *     cdef int[::1] idx = IDX
  * 
+ *     nz = 0             # <<<<<<<<<<<<<<
+ *     for r in range(nr):
+ *         # Store the locations of the A elements
  */
-  __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_ARRAY_C_CONTIGUOUS) != 0)) != 0);
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L4_bool_binop_done:;
+  __pyx_v_nz = 0;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":270
- *             ndim = PyArray_NDIM(self)
+  /* "sisl/_sparse.pyx":261
  * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not C contiguous")
+ *     nz = 0
+ *     for r in range(nr):             # <<<<<<<<<<<<<<
+ *         # Store the locations of the A elements
+ *         for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):
  */
-  if (unlikely(__pyx_t_1)) {
+  __pyx_t_2 = __pyx_v_nr;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_r = __pyx_t_4;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":272
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
+    /* "sisl/_sparse.pyx":263
+ *     for r in range(nr):
+ *         # Store the locations of the A elements
+ *         for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):             # <<<<<<<<<<<<<<
+ *             work[col_a[ind]] = ind
  * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 272, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(1, 272, __pyx_L1_error)
+    __pyx_t_27 = __pyx_v_r;
+    __pyx_t_28 = __pyx_v_r;
+    __pyx_t_7 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_a.data) + __pyx_t_27)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol_a.data) + __pyx_t_28)) ))));
+    __pyx_t_29 = __pyx_v_r;
+    __pyx_t_9 = __pyx_t_7;
+    for (__pyx_t_10 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_a.data) + __pyx_t_29)) ))); __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+      __pyx_v_ind = __pyx_t_10;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":270
- *             ndim = PyArray_NDIM(self)
+      /* "sisl/_sparse.pyx":264
+ *         # Store the locations of the A elements
+ *         for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):
+ *             work[col_a[ind]] = ind             # <<<<<<<<<<<<<<
  * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not C contiguous")
+ *         for ind in range(ptr_b[r], ptr_b[r] + ncol_b[r]):
  */
-  }
+      __pyx_t_30 = __pyx_v_ind;
+      __pyx_t_31 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col_a.data) + __pyx_t_30)) )));
+      *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_work.data) + __pyx_t_31)) )) = __pyx_v_ind;
+    }
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":274
- *                 raise ValueError(u"ndarray is not C contiguous")
+    /* "sisl/_sparse.pyx":266
+ *             work[col_a[ind]] = ind
  * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ *         for ind in range(ptr_b[r], ptr_b[r] + ncol_b[r]):             # <<<<<<<<<<<<<<
+ *             idx[nz] = work[col_b[ind]]
+ *             nz += 1
  */
-  __pyx_t_2 = (((__pyx_v_flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS) != 0);
-  if (__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L7_bool_binop_done;
-  }
+    __pyx_t_32 = __pyx_v_r;
+    __pyx_t_33 = __pyx_v_r;
+    __pyx_t_7 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_b.data) + __pyx_t_32)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol_b.data) + __pyx_t_33)) ))));
+    __pyx_t_34 = __pyx_v_r;
+    __pyx_t_9 = __pyx_t_7;
+    for (__pyx_t_10 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_b.data) + __pyx_t_34)) ))); __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+      __pyx_v_ind = __pyx_t_10;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":275
+      /* "sisl/_sparse.pyx":267
  * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
- *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ *         for ind in range(ptr_b[r], ptr_b[r] + ncol_b[r]):
+ *             idx[nz] = work[col_b[ind]]             # <<<<<<<<<<<<<<
+ *             nz += 1
  * 
  */
-  __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_ARRAY_F_CONTIGUOUS) != 0)) != 0);
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L7_bool_binop_done:;
+      __pyx_t_35 = __pyx_v_ind;
+      __pyx_t_36 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col_b.data) + __pyx_t_35)) )));
+      __pyx_t_37 = __pyx_v_nz;
+      *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_idx.data) + __pyx_t_37)) )) = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_work.data) + __pyx_t_36)) )));
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":274
- *                 raise ValueError(u"ndarray is not C contiguous")
+      /* "sisl/_sparse.pyx":268
+ *         for ind in range(ptr_b[r], ptr_b[r] + ncol_b[r]):
+ *             idx[nz] = work[col_b[ind]]
+ *             nz += 1             # <<<<<<<<<<<<<<
  * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ *         # Reset the work array
  */
-  if (unlikely(__pyx_t_1)) {
+      __pyx_v_nz = (__pyx_v_nz + 1);
+    }
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":276
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
+    /* "sisl/_sparse.pyx":271
+ * 
+ *         # Reset the work array
+ *         for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):             # <<<<<<<<<<<<<<
+ *             work[col_a[ind]] = -1
  * 
- *             info.buf = PyArray_DATA(self)
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 276, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(1, 276, __pyx_L1_error)
+    __pyx_t_38 = __pyx_v_r;
+    __pyx_t_39 = __pyx_v_r;
+    __pyx_t_7 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_a.data) + __pyx_t_38)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol_a.data) + __pyx_t_39)) ))));
+    __pyx_t_40 = __pyx_v_r;
+    __pyx_t_9 = __pyx_t_7;
+    for (__pyx_t_10 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_a.data) + __pyx_t_40)) ))); __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+      __pyx_v_ind = __pyx_t_10;
 
-    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":274
- *                 raise ValueError(u"ndarray is not C contiguous")
+      /* "sisl/_sparse.pyx":272
+ *         # Reset the work array
+ *         for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):
+ *             work[col_a[ind]] = -1             # <<<<<<<<<<<<<<
  * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
- *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ *     return IDX
  */
+      __pyx_t_41 = __pyx_v_ind;
+      __pyx_t_42 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col_a.data) + __pyx_t_41)) )));
+      *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_work.data) + __pyx_t_42)) )) = -1;
+    }
   }
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":278
- *                 raise ValueError(u"ndarray is not Fortran contiguous")
+  /* "sisl/_sparse.pyx":274
+ *             work[col_a[ind]] = -1
+ * 
+ *     return IDX             # <<<<<<<<<<<<<<
+ * 
  * 
- *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
- *             info.ndim = ndim
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  */
-  __pyx_v_info->buf = PyArray_DATA(__pyx_v_self);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_IDX));
+  __pyx_r = ((PyObject *)__pyx_v_IDX);
+  goto __pyx_L0;
 
-  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":279
+  /* "sisl/_sparse.pyx":220
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def csr_index_map(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR_A,             # <<<<<<<<<<<<<<
+ *                   np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL_A,
+ *                   np.ndarray[np.int32_t, ndim=1, mode='c'] COL_A,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
+  __Pyx_XDECREF(__pyx_t_20);
+  __Pyx_XDECREF(__pyx_t_21);
+  __Pyx_XDECREF(__pyx_t_22);
+  __Pyx_XDECREF(__pyx_t_23);
+  __Pyx_XDECREF(__pyx_t_24);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL_A.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL_B.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_IDX.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL_A.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL_B.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR_A.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR_B.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_WORK.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("sisl._sparse.csr_index_map", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL_A.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL_B.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_IDX.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL_A.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL_B.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR_A.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR_B.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_WORK.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ptr_a, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ncol_a, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_col_a, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ptr_b, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ncol_b, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_col_b, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_WORK);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_work, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_IDX);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_idx, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "sisl/_sparse.pyx":281
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def csr_tile(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *              np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *              np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4sisl_7_sparse_9csr_tile(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4sisl_7_sparse_8csr_tile[] = " Tile/repeat a sparse pattern of a geometry into a supercell in a single pass\n\n    The ``n`` rows of the original pattern are replicated ``R = prod(REPS)`` times.\n    The replica of row ``i`` in block ``t = (t0, t1, t2)`` becomes row::\n\n        BASE[i] + MULT[i] * dot(t, STRIDES)\n\n    which both describes tiling (``BASE[i] = i``, ``MULT[i] = n``) and repeating\n    (e.g. ``BASE[i] = R * i``, ``MULT[i] = 1``).\n    The column ``c`` (in supercell ``isc = SC_OFF[c // n]``) of block ``t`` is the\n    column (in the same way as rows) in block ``(t + isc) % REPS`` and supercell\n    ``(t + isc) // REPS`` which is looked up in ``ISC_OFF`` of the new supercell.\n\n    The data `D` is passed as bytes (one row per non-zero element) and copied\n    directly into the new data array.\n\n    Returns\n    -------\n    PTR, NCOL, COL, D of the new sparse pattern\n    ";
+static PyMethodDef __pyx_mdef_4sisl_7_sparse_9csr_tile = {"csr_tile", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4sisl_7_sparse_9csr_tile, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4sisl_7_sparse_8csr_tile};
+static PyObject *__pyx_pw_4sisl_7_sparse_9csr_tile(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_PTR = 0;
+  PyArrayObject *__pyx_v_NCOL = 0;
+  PyArrayObject *__pyx_v_COL = 0;
+  __Pyx_memviewslice __pyx_v_D = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyArrayObject *__pyx_v_BASE = 0;
+  PyArrayObject *__pyx_v_MULT = 0;
+  PyArrayObject *__pyx_v_SC_OFF = 0;
+  PyArrayObject *__pyx_v_ISC_OFF = 0;
+  PyArrayObject *__pyx_v_REPS = 0;
+  PyArrayObject *__pyx_v_STRIDES = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("csr_tile (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_PTR,&__pyx_n_s_NCOL,&__pyx_n_s_COL,&__pyx_n_s_D,&__pyx_n_s_BASE,&__pyx_n_s_MULT,&__pyx_n_s_SC_OFF,&__pyx_n_s_ISC_OFF,&__pyx_n_s_REPS,&__pyx_n_s_STRIDES,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_PTR)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_NCOL)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_tile", 1, 10, 10, 1); __PYX_ERR(0, 281, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_COL)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_tile", 1, 10, 10, 2); __PYX_ERR(0, 281, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_D)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_tile", 1, 10, 10, 3); __PYX_ERR(0, 281, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_BASE)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_tile", 1, 10, 10, 4); __PYX_ERR(0, 281, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_MULT)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_tile", 1, 10, 10, 5); __PYX_ERR(0, 281, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_SC_OFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_tile", 1, 10, 10, 6); __PYX_ERR(0, 281, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ISC_OFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_tile", 1, 10, 10, 7); __PYX_ERR(0, 281, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_REPS)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_tile", 1, 10, 10, 8); __PYX_ERR(0, 281, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_STRIDES)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("csr_tile", 1, 10, 10, 9); __PYX_ERR(0, 281, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "csr_tile") < 0)) __PYX_ERR(0, 281, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_PTR = ((PyArrayObject *)values[0]);
+    __pyx_v_NCOL = ((PyArrayObject *)values[1]);
+    __pyx_v_COL = ((PyArrayObject *)values[2]);
+    __pyx_v_D = __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_char__const__(values[3], 0); if (unlikely(!__pyx_v_D.memview)) __PYX_ERR(0, 284, __pyx_L3_error)
+    __pyx_v_BASE = ((PyArrayObject *)values[4]);
+    __pyx_v_MULT = ((PyArrayObject *)values[5]);
+    __pyx_v_SC_OFF = ((PyArrayObject *)values[6]);
+    __pyx_v_ISC_OFF = ((PyArrayObject *)values[7]);
+    __pyx_v_REPS = ((PyArrayObject *)values[8]);
+    __pyx_v_STRIDES = ((PyArrayObject *)values[9]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("csr_tile", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 281, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("sisl._sparse.csr_tile", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_PTR), __pyx_ptype_5numpy_ndarray, 1, "PTR", 0))) __PYX_ERR(0, 281, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_NCOL), __pyx_ptype_5numpy_ndarray, 1, "NCOL", 0))) __PYX_ERR(0, 282, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_COL), __pyx_ptype_5numpy_ndarray, 1, "COL", 0))) __PYX_ERR(0, 283, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_BASE), __pyx_ptype_5numpy_ndarray, 1, "BASE", 0))) __PYX_ERR(0, 285, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_MULT), __pyx_ptype_5numpy_ndarray, 1, "MULT", 0))) __PYX_ERR(0, 286, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_SC_OFF), __pyx_ptype_5numpy_ndarray, 1, "SC_OFF", 0))) __PYX_ERR(0, 287, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ISC_OFF), __pyx_ptype_5numpy_ndarray, 1, "ISC_OFF", 0))) __PYX_ERR(0, 288, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_REPS), __pyx_ptype_5numpy_ndarray, 1, "REPS", 0))) __PYX_ERR(0, 289, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_STRIDES), __pyx_ptype_5numpy_ndarray, 1, "STRIDES", 0))) __PYX_ERR(0, 290, __pyx_L1_error)
+  __pyx_r = __pyx_pf_4sisl_7_sparse_8csr_tile(__pyx_self, __pyx_v_PTR, __pyx_v_NCOL, __pyx_v_COL, __pyx_v_D, __pyx_v_BASE, __pyx_v_MULT, __pyx_v_SC_OFF, __pyx_v_ISC_OFF, __pyx_v_REPS, __pyx_v_STRIDES);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4sisl_7_sparse_8csr_tile(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_PTR, PyArrayObject *__pyx_v_NCOL, PyArrayObject *__pyx_v_COL, __Pyx_memviewslice __pyx_v_D, PyArrayObject *__pyx_v_BASE, PyArrayObject *__pyx_v_MULT, PyArrayObject *__pyx_v_SC_OFF, PyArrayObject *__pyx_v_ISC_OFF, PyArrayObject *__pyx_v_REPS, PyArrayObject *__pyx_v_STRIDES) {
+  __Pyx_memviewslice __pyx_v_ptr = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ncol = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_col = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_base = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_mult = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_sc_off = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_isc_off = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_reps = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_strides = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_n;
+  int __pyx_v_n_n;
+  Py_ssize_t __pyx_v_nbytes;
+  int __pyx_v_i;
+  int __pyx_v_t0;
+  int __pyx_v_t1;
+  int __pyx_v_t2;
+  int __pyx_v_lin;
+  int __pyx_v_r;
+  int __pyx_v_ind;
+  int __pyx_v_ind_n;
+  int __pyx_v_j;
+  int __pyx_v_s;
+  int __pyx_v_p0;
+  int __pyx_v_p1;
+  int __pyx_v_p2;
+  int __pyx_v_hsc;
+  int __pyx_v_np_max;
+  PyArrayObject *__pyx_v_M_ = 0;
+  __Pyx_memviewslice __pyx_v_M = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyArrayObject *__pyx_v_Q_ = 0;
+  __Pyx_memviewslice __pyx_v_Q = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyArrayObject *__pyx_v_PTR_n = 0;
+  __Pyx_memviewslice __pyx_v_ptr_n = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyArrayObject *__pyx_v_NCOL_n = 0;
+  __Pyx_memviewslice __pyx_v_ncol_n = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyArrayObject *__pyx_v_COL_n = 0;
+  __Pyx_memviewslice __pyx_v_col_n = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyArrayObject *__pyx_v_D_n = 0;
+  __Pyx_memviewslice __pyx_v_d_n = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_BASE;
+  __Pyx_Buffer __pyx_pybuffer_BASE;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_COL;
+  __Pyx_Buffer __pyx_pybuffer_COL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_COL_n;
+  __Pyx_Buffer __pyx_pybuffer_COL_n;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_D_n;
+  __Pyx_Buffer __pyx_pybuffer_D_n;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_ISC_OFF;
+  __Pyx_Buffer __pyx_pybuffer_ISC_OFF;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_MULT;
+  __Pyx_Buffer __pyx_pybuffer_MULT;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_M_;
+  __Pyx_Buffer __pyx_pybuffer_M_;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_NCOL;
+  __Pyx_Buffer __pyx_pybuffer_NCOL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_NCOL_n;
+  __Pyx_Buffer __pyx_pybuffer_NCOL_n;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_PTR;
+  __Pyx_Buffer __pyx_pybuffer_PTR;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_PTR_n;
+  __Pyx_Buffer __pyx_pybuffer_PTR_n;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_Q_;
+  __Pyx_Buffer __pyx_pybuffer_Q_;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_REPS;
+  __Pyx_Buffer __pyx_pybuffer_REPS;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_SC_OFF;
+  __Pyx_Buffer __pyx_pybuffer_SC_OFF;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_STRIDES;
+  __Pyx_Buffer __pyx_pybuffer_STRIDES;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_memviewslice __pyx_t_1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_2 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_3 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  Py_ssize_t __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
+  Py_ssize_t __pyx_t_19;
+  PyObject *__pyx_t_20 = NULL;
+  PyObject *__pyx_t_21 = NULL;
+  PyObject *__pyx_t_22 = NULL;
+  PyObject *__pyx_t_23 = NULL;
+  PyObject *__pyx_t_24 = NULL;
+  PyArrayObject *__pyx_t_25 = NULL;
+  PyArrayObject *__pyx_t_26 = NULL;
+  Py_ssize_t __pyx_t_27;
+  int __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  Py_ssize_t __pyx_t_30;
+  Py_ssize_t __pyx_t_31;
+  Py_ssize_t __pyx_t_32;
+  Py_ssize_t __pyx_t_33;
+  Py_ssize_t __pyx_t_34;
+  Py_ssize_t __pyx_t_35;
+  int __pyx_t_36;
+  Py_ssize_t __pyx_t_37;
+  Py_ssize_t __pyx_t_38;
+  Py_ssize_t __pyx_t_39;
+  int __pyx_t_40;
+  Py_ssize_t __pyx_t_41;
+  Py_ssize_t __pyx_t_42;
+  Py_ssize_t __pyx_t_43;
+  Py_ssize_t __pyx_t_44;
+  PyArrayObject *__pyx_t_45 = NULL;
+  PyArrayObject *__pyx_t_46 = NULL;
+  Py_ssize_t __pyx_t_47;
+  int __pyx_t_48;
+  Py_ssize_t __pyx_t_49;
+  int __pyx_t_50;
+  int __pyx_t_51;
+  int __pyx_t_52;
+  Py_ssize_t __pyx_t_53;
+  int __pyx_t_54;
+  int __pyx_t_55;
+  int __pyx_t_56;
+  Py_ssize_t __pyx_t_57;
+  Py_ssize_t __pyx_t_58;
+  Py_ssize_t __pyx_t_59;
+  Py_ssize_t __pyx_t_60;
+  Py_ssize_t __pyx_t_61;
+  Py_ssize_t __pyx_t_62;
+  Py_ssize_t __pyx_t_63;
+  Py_ssize_t __pyx_t_64;
+  Py_ssize_t __pyx_t_65;
+  Py_ssize_t __pyx_t_66;
+  Py_ssize_t __pyx_t_67;
+  Py_ssize_t __pyx_t_68;
+  PyArrayObject *__pyx_t_69 = NULL;
+  Py_ssize_t __pyx_t_70;
+  PyArrayObject *__pyx_t_71 = NULL;
+  __Pyx_memviewslice __pyx_t_72 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_73;
+  Py_ssize_t __pyx_t_74;
+  Py_ssize_t __pyx_t_75;
+  Py_ssize_t __pyx_t_76;
+  Py_ssize_t __pyx_t_77;
+  Py_ssize_t __pyx_t_78;
+  Py_ssize_t __pyx_t_79;
+  Py_ssize_t __pyx_t_80;
+  Py_ssize_t __pyx_t_81;
+  Py_ssize_t __pyx_t_82;
+  Py_ssize_t __pyx_t_83;
+  Py_ssize_t __pyx_t_84;
+  Py_ssize_t __pyx_t_85;
+  Py_ssize_t __pyx_t_86;
+  Py_ssize_t __pyx_t_87;
+  Py_ssize_t __pyx_t_88;
+  Py_ssize_t __pyx_t_89;
+  Py_ssize_t __pyx_t_90;
+  int __pyx_t_91;
+  Py_ssize_t __pyx_t_92;
+  int __pyx_t_93;
+  int __pyx_t_94;
+  Py_ssize_t __pyx_t_95;
+  Py_ssize_t __pyx_t_96;
+  Py_ssize_t __pyx_t_97;
+  Py_ssize_t __pyx_t_98;
+  Py_ssize_t __pyx_t_99;
+  Py_ssize_t __pyx_t_100;
+  Py_ssize_t __pyx_t_101;
+  Py_ssize_t __pyx_t_102;
+  Py_ssize_t __pyx_t_103;
+  Py_ssize_t __pyx_t_104;
+  Py_ssize_t __pyx_t_105;
+  Py_ssize_t __pyx_t_106;
+  Py_ssize_t __pyx_t_107;
+  Py_ssize_t __pyx_t_108;
+  Py_ssize_t __pyx_t_109;
+  Py_ssize_t __pyx_t_110;
+  Py_ssize_t __pyx_t_111;
+  Py_ssize_t __pyx_t_112;
+  Py_ssize_t __pyx_t_113;
+  Py_ssize_t __pyx_t_114;
+  Py_ssize_t __pyx_t_115;
+  Py_ssize_t __pyx_t_116;
+  Py_ssize_t __pyx_t_117;
+  Py_ssize_t __pyx_t_118;
+  Py_ssize_t __pyx_t_119;
+  Py_ssize_t __pyx_t_120;
+  __Pyx_RefNannySetupContext("csr_tile", 0);
+  __pyx_pybuffer_M_.pybuffer.buf = NULL;
+  __pyx_pybuffer_M_.refcount = 0;
+  __pyx_pybuffernd_M_.data = NULL;
+  __pyx_pybuffernd_M_.rcbuffer = &__pyx_pybuffer_M_;
+  __pyx_pybuffer_Q_.pybuffer.buf = NULL;
+  __pyx_pybuffer_Q_.refcount = 0;
+  __pyx_pybuffernd_Q_.data = NULL;
+  __pyx_pybuffernd_Q_.rcbuffer = &__pyx_pybuffer_Q_;
+  __pyx_pybuffer_PTR_n.pybuffer.buf = NULL;
+  __pyx_pybuffer_PTR_n.refcount = 0;
+  __pyx_pybuffernd_PTR_n.data = NULL;
+  __pyx_pybuffernd_PTR_n.rcbuffer = &__pyx_pybuffer_PTR_n;
+  __pyx_pybuffer_NCOL_n.pybuffer.buf = NULL;
+  __pyx_pybuffer_NCOL_n.refcount = 0;
+  __pyx_pybuffernd_NCOL_n.data = NULL;
+  __pyx_pybuffernd_NCOL_n.rcbuffer = &__pyx_pybuffer_NCOL_n;
+  __pyx_pybuffer_COL_n.pybuffer.buf = NULL;
+  __pyx_pybuffer_COL_n.refcount = 0;
+  __pyx_pybuffernd_COL_n.data = NULL;
+  __pyx_pybuffernd_COL_n.rcbuffer = &__pyx_pybuffer_COL_n;
+  __pyx_pybuffer_D_n.pybuffer.buf = NULL;
+  __pyx_pybuffer_D_n.refcount = 0;
+  __pyx_pybuffernd_D_n.data = NULL;
+  __pyx_pybuffernd_D_n.rcbuffer = &__pyx_pybuffer_D_n;
+  __pyx_pybuffer_PTR.pybuffer.buf = NULL;
+  __pyx_pybuffer_PTR.refcount = 0;
+  __pyx_pybuffernd_PTR.data = NULL;
+  __pyx_pybuffernd_PTR.rcbuffer = &__pyx_pybuffer_PTR;
+  __pyx_pybuffer_NCOL.pybuffer.buf = NULL;
+  __pyx_pybuffer_NCOL.refcount = 0;
+  __pyx_pybuffernd_NCOL.data = NULL;
+  __pyx_pybuffernd_NCOL.rcbuffer = &__pyx_pybuffer_NCOL;
+  __pyx_pybuffer_COL.pybuffer.buf = NULL;
+  __pyx_pybuffer_COL.refcount = 0;
+  __pyx_pybuffernd_COL.data = NULL;
+  __pyx_pybuffernd_COL.rcbuffer = &__pyx_pybuffer_COL;
+  __pyx_pybuffer_BASE.pybuffer.buf = NULL;
+  __pyx_pybuffer_BASE.refcount = 0;
+  __pyx_pybuffernd_BASE.data = NULL;
+  __pyx_pybuffernd_BASE.rcbuffer = &__pyx_pybuffer_BASE;
+  __pyx_pybuffer_MULT.pybuffer.buf = NULL;
+  __pyx_pybuffer_MULT.refcount = 0;
+  __pyx_pybuffernd_MULT.data = NULL;
+  __pyx_pybuffernd_MULT.rcbuffer = &__pyx_pybuffer_MULT;
+  __pyx_pybuffer_SC_OFF.pybuffer.buf = NULL;
+  __pyx_pybuffer_SC_OFF.refcount = 0;
+  __pyx_pybuffernd_SC_OFF.data = NULL;
+  __pyx_pybuffernd_SC_OFF.rcbuffer = &__pyx_pybuffer_SC_OFF;
+  __pyx_pybuffer_ISC_OFF.pybuffer.buf = NULL;
+  __pyx_pybuffer_ISC_OFF.refcount = 0;
+  __pyx_pybuffernd_ISC_OFF.data = NULL;
+  __pyx_pybuffernd_ISC_OFF.rcbuffer = &__pyx_pybuffer_ISC_OFF;
+  __pyx_pybuffer_REPS.pybuffer.buf = NULL;
+  __pyx_pybuffer_REPS.refcount = 0;
+  __pyx_pybuffernd_REPS.data = NULL;
+  __pyx_pybuffernd_REPS.rcbuffer = &__pyx_pybuffer_REPS;
+  __pyx_pybuffer_STRIDES.pybuffer.buf = NULL;
+  __pyx_pybuffer_STRIDES.refcount = 0;
+  __pyx_pybuffernd_STRIDES.data = NULL;
+  __pyx_pybuffernd_STRIDES.rcbuffer = &__pyx_pybuffer_STRIDES;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer, (PyObject*)__pyx_v_PTR, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 281, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_PTR.diminfo[0].strides = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR.diminfo[0].shape = __pyx_pybuffernd_PTR.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer, (PyObject*)__pyx_v_NCOL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 281, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_NCOL.diminfo[0].strides = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL.diminfo[0].shape = __pyx_pybuffernd_NCOL.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL.rcbuffer->pybuffer, (PyObject*)__pyx_v_COL, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 281, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_COL.diminfo[0].strides = __pyx_pybuffernd_COL.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL.diminfo[0].shape = __pyx_pybuffernd_COL.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_BASE.rcbuffer->pybuffer, (PyObject*)__pyx_v_BASE, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 281, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_BASE.diminfo[0].strides = __pyx_pybuffernd_BASE.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_BASE.diminfo[0].shape = __pyx_pybuffernd_BASE.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_MULT.rcbuffer->pybuffer, (PyObject*)__pyx_v_MULT, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 281, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_MULT.diminfo[0].strides = __pyx_pybuffernd_MULT.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_MULT.diminfo[0].shape = __pyx_pybuffernd_MULT.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_SC_OFF.rcbuffer->pybuffer, (PyObject*)__pyx_v_SC_OFF, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) __PYX_ERR(0, 281, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_SC_OFF.diminfo[0].strides = __pyx_pybuffernd_SC_OFF.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_SC_OFF.diminfo[0].shape = __pyx_pybuffernd_SC_OFF.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_SC_OFF.diminfo[1].strides = __pyx_pybuffernd_SC_OFF.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_SC_OFF.diminfo[1].shape = __pyx_pybuffernd_SC_OFF.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_ISC_OFF.rcbuffer->pybuffer, (PyObject*)__pyx_v_ISC_OFF, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 3, 0, __pyx_stack) == -1)) __PYX_ERR(0, 281, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_ISC_OFF.diminfo[0].strides = __pyx_pybuffernd_ISC_OFF.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_ISC_OFF.diminfo[0].shape = __pyx_pybuffernd_ISC_OFF.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_ISC_OFF.diminfo[1].strides = __pyx_pybuffernd_ISC_OFF.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_ISC_OFF.diminfo[1].shape = __pyx_pybuffernd_ISC_OFF.rcbuffer->pybuffer.shape[1]; __pyx_pybuffernd_ISC_OFF.diminfo[2].strides = __pyx_pybuffernd_ISC_OFF.rcbuffer->pybuffer.strides[2]; __pyx_pybuffernd_ISC_OFF.diminfo[2].shape = __pyx_pybuffernd_ISC_OFF.rcbuffer->pybuffer.shape[2];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_REPS.rcbuffer->pybuffer, (PyObject*)__pyx_v_REPS, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 281, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_REPS.diminfo[0].strides = __pyx_pybuffernd_REPS.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_REPS.diminfo[0].shape = __pyx_pybuffernd_REPS.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_STRIDES.rcbuffer->pybuffer, (PyObject*)__pyx_v_STRIDES, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 281, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_STRIDES.diminfo[0].strides = __pyx_pybuffernd_STRIDES.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_STRIDES.diminfo[0].shape = __pyx_pybuffernd_STRIDES.rcbuffer->pybuffer.shape[0];
+
+  /* "sisl/_sparse.pyx":311
+ *     PTR, NCOL, COL, D of the new sparse pattern
+ *     """
+ *     cdef int[::1] ptr = PTR             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ncol = NCOL
+ *     cdef int[::1] col = COL
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 311, __pyx_L1_error)
+  __pyx_v_ptr = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":312
+ *     """
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] ncol = NCOL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] base = BASE
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 312, __pyx_L1_error)
+  __pyx_v_ncol = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":313
+ *     cdef int[::1] ptr = PTR
+ *     cdef int[::1] ncol = NCOL
+ *     cdef int[::1] col = COL             # <<<<<<<<<<<<<<
+ *     cdef int[::1] base = BASE
+ *     cdef int[::1] mult = MULT
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 313, __pyx_L1_error)
+  __pyx_v_col = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":314
+ *     cdef int[::1] ncol = NCOL
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] base = BASE             # <<<<<<<<<<<<<<
+ *     cdef int[::1] mult = MULT
+ *     cdef int[:, ::1] sc_off = SC_OFF
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_BASE), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 314, __pyx_L1_error)
+  __pyx_v_base = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":315
+ *     cdef int[::1] col = COL
+ *     cdef int[::1] base = BASE
+ *     cdef int[::1] mult = MULT             # <<<<<<<<<<<<<<
+ *     cdef int[:, ::1] sc_off = SC_OFF
+ *     cdef int[:, :, ::1] isc_off = ISC_OFF
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_MULT), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __pyx_v_mult = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":316
+ *     cdef int[::1] base = BASE
+ *     cdef int[::1] mult = MULT
+ *     cdef int[:, ::1] sc_off = SC_OFF             # <<<<<<<<<<<<<<
+ *     cdef int[:, :, ::1] isc_off = ISC_OFF
+ *     cdef int[::1] reps = REPS
+ */
+  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_int(((PyObject *)__pyx_v_SC_OFF), PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __pyx_v_sc_off = __pyx_t_2;
+  __pyx_t_2.memview = NULL;
+  __pyx_t_2.data = NULL;
+
+  /* "sisl/_sparse.pyx":317
+ *     cdef int[::1] mult = MULT
+ *     cdef int[:, ::1] sc_off = SC_OFF
+ *     cdef int[:, :, ::1] isc_off = ISC_OFF             # <<<<<<<<<<<<<<
+ *     cdef int[::1] reps = REPS
+ *     cdef int[::1] strides = STRIDES
+ */
+  __pyx_t_3 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_int(((PyObject *)__pyx_v_ISC_OFF), PyBUF_WRITABLE); if (unlikely(!__pyx_t_3.memview)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __pyx_v_isc_off = __pyx_t_3;
+  __pyx_t_3.memview = NULL;
+  __pyx_t_3.data = NULL;
+
+  /* "sisl/_sparse.pyx":318
+ *     cdef int[:, ::1] sc_off = SC_OFF
+ *     cdef int[:, :, ::1] isc_off = ISC_OFF
+ *     cdef int[::1] reps = REPS             # <<<<<<<<<<<<<<
+ *     cdef int[::1] strides = STRIDES
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_REPS), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __pyx_v_reps = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":319
+ *     cdef int[:, :, ::1] isc_off = ISC_OFF
+ *     cdef int[::1] reps = REPS
+ *     cdef int[::1] strides = STRIDES             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int n = ncol.shape[0]
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_STRIDES), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __pyx_v_strides = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":321
+ *     cdef int[::1] strides = STRIDES
+ * 
+ *     cdef int n = ncol.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int n_n = n * reps[0] * reps[1] * reps[2]
+ *     cdef Py_ssize_t nbytes = D.shape[1]
+ */
+  __pyx_v_n = (__pyx_v_ncol.shape[0]);
+
+  /* "sisl/_sparse.pyx":322
+ * 
+ *     cdef int n = ncol.shape[0]
+ *     cdef int n_n = n * reps[0] * reps[1] * reps[2]             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t nbytes = D.shape[1]
+ *     cdef int i, t0, t1, t2, lin, r, ind, ind_n, j, s, p0, p1, p2
+ */
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 1;
+  __pyx_t_6 = 2;
+  __pyx_v_n_n = (((__pyx_v_n * (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_4)) )))) * (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_5)) )))) * (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_6)) ))));
+
+  /* "sisl/_sparse.pyx":323
+ *     cdef int n = ncol.shape[0]
+ *     cdef int n_n = n * reps[0] * reps[1] * reps[2]
+ *     cdef Py_ssize_t nbytes = D.shape[1]             # <<<<<<<<<<<<<<
+ *     cdef int i, t0, t1, t2, lin, r, ind, ind_n, j, s, p0, p1, p2
+ * 
+ */
+  __pyx_v_nbytes = (__pyx_v_D.shape[1]);
+
+  /* "sisl/_sparse.pyx":328
+ *     # Lookup tables for the block offset (M) and the supercell (Q) along
+ *     # each lattice vector for t + isc, with t + isc in [-hsc, reps + hsc[
+ *     cdef int hsc = 0             # <<<<<<<<<<<<<<
+ *     for s in range(sc_off.shape[0]):
+ *         for i in range(3):
+ */
+  __pyx_v_hsc = 0;
+
+  /* "sisl/_sparse.pyx":329
+ *     # each lattice vector for t + isc, with t + isc in [-hsc, reps + hsc[
+ *     cdef int hsc = 0
+ *     for s in range(sc_off.shape[0]):             # <<<<<<<<<<<<<<
+ *         for i in range(3):
+ *             if abs(sc_off[s, i]) > hsc:
+ */
+  __pyx_t_7 = (__pyx_v_sc_off.shape[0]);
+  __pyx_t_8 = __pyx_t_7;
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_s = __pyx_t_9;
+
+    /* "sisl/_sparse.pyx":330
+ *     cdef int hsc = 0
+ *     for s in range(sc_off.shape[0]):
+ *         for i in range(3):             # <<<<<<<<<<<<<<
+ *             if abs(sc_off[s, i]) > hsc:
+ *                 hsc = abs(sc_off[s, i])
+ */
+    for (__pyx_t_10 = 0; __pyx_t_10 < 3; __pyx_t_10+=1) {
+      __pyx_v_i = __pyx_t_10;
+
+      /* "sisl/_sparse.pyx":331
+ *     for s in range(sc_off.shape[0]):
+ *         for i in range(3):
+ *             if abs(sc_off[s, i]) > hsc:             # <<<<<<<<<<<<<<
+ *                 hsc = abs(sc_off[s, i])
+ *     cdef int np_max = max(reps[0], max(reps[1], reps[2])) + 2 * hsc
+ */
+      __pyx_t_11 = __pyx_v_s;
+      __pyx_t_12 = __pyx_v_i;
+      __pyx_t_13 = abs((*((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_sc_off.data + __pyx_t_11 * __pyx_v_sc_off.strides[0]) )) + __pyx_t_12)) )))); if (unlikely(__pyx_t_13 == ((int)-1))) __PYX_ERR(0, 331, __pyx_L1_error)
+      __pyx_t_14 = ((__pyx_t_13 > __pyx_v_hsc) != 0);
+      if (__pyx_t_14) {
+
+        /* "sisl/_sparse.pyx":332
+ *         for i in range(3):
+ *             if abs(sc_off[s, i]) > hsc:
+ *                 hsc = abs(sc_off[s, i])             # <<<<<<<<<<<<<<
+ *     cdef int np_max = max(reps[0], max(reps[1], reps[2])) + 2 * hsc
+ *     cdef np.ndarray[np.int32_t, ndim=2, mode='c'] M_ = np.empty([3, np_max], dtype=np.int32)
+ */
+        __pyx_t_15 = __pyx_v_s;
+        __pyx_t_16 = __pyx_v_i;
+        __pyx_t_13 = abs((*((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_sc_off.data + __pyx_t_15 * __pyx_v_sc_off.strides[0]) )) + __pyx_t_16)) )))); if (unlikely(__pyx_t_13 == ((int)-1))) __PYX_ERR(0, 332, __pyx_L1_error)
+        __pyx_v_hsc = __pyx_t_13;
+
+        /* "sisl/_sparse.pyx":331
+ *     for s in range(sc_off.shape[0]):
+ *         for i in range(3):
+ *             if abs(sc_off[s, i]) > hsc:             # <<<<<<<<<<<<<<
+ *                 hsc = abs(sc_off[s, i])
+ *     cdef int np_max = max(reps[0], max(reps[1], reps[2])) + 2 * hsc
+ */
+      }
+    }
+  }
+
+  /* "sisl/_sparse.pyx":333
+ *             if abs(sc_off[s, i]) > hsc:
+ *                 hsc = abs(sc_off[s, i])
+ *     cdef int np_max = max(reps[0], max(reps[1], reps[2])) + 2 * hsc             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=2, mode='c'] M_ = np.empty([3, np_max], dtype=np.int32)
+ *     cdef int[:, ::1] M = M_
+ */
+  __pyx_t_17 = 2;
+  __pyx_t_9 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_17)) )));
+  __pyx_t_18 = 1;
+  __pyx_t_10 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_18)) )));
+  if (((__pyx_t_9 > __pyx_t_10) != 0)) {
+    __pyx_t_13 = __pyx_t_9;
+  } else {
+    __pyx_t_13 = __pyx_t_10;
+  }
+  __pyx_t_9 = __pyx_t_13;
+  __pyx_t_19 = 0;
+  __pyx_t_13 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_19)) )));
+  if (((__pyx_t_9 > __pyx_t_13) != 0)) {
+    __pyx_t_10 = __pyx_t_9;
+  } else {
+    __pyx_t_10 = __pyx_t_13;
+  }
+  __pyx_v_np_max = (__pyx_t_10 + (2 * __pyx_v_hsc));
+
+  /* "sisl/_sparse.pyx":334
+ *                 hsc = abs(sc_off[s, i])
+ *     cdef int np_max = max(reps[0], max(reps[1], reps[2])) + 2 * hsc
+ *     cdef np.ndarray[np.int32_t, ndim=2, mode='c'] M_ = np.empty([3, np_max], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[:, ::1] M = M_
+ *     cdef np.ndarray[np.int32_t, ndim=2, mode='c'] Q_ = np.empty([3, np_max], dtype=np.int32)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_20, __pyx_n_s_np); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __pyx_t_21 = __Pyx_PyObject_GetAttrStr(__pyx_t_20, __pyx_n_s_empty); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+  __pyx_t_20 = __Pyx_PyInt_From_int(__pyx_v_np_max); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __pyx_t_22 = PyList_New(2); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __Pyx_INCREF(__pyx_int_3);
+  __Pyx_GIVEREF(__pyx_int_3);
+  PyList_SET_ITEM(__pyx_t_22, 0, __pyx_int_3);
+  __Pyx_GIVEREF(__pyx_t_20);
+  PyList_SET_ITEM(__pyx_t_22, 1, __pyx_t_20);
+  __pyx_t_20 = 0;
+  __pyx_t_20 = PyTuple_New(1); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __Pyx_GIVEREF(__pyx_t_22);
+  PyTuple_SET_ITEM(__pyx_t_20, 0, __pyx_t_22);
+  __pyx_t_22 = 0;
+  __pyx_t_22 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __Pyx_GetModuleGlobalName(__pyx_t_23, __pyx_n_s_np); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __pyx_t_24 = __Pyx_PyObject_GetAttrStr(__pyx_t_23, __pyx_n_s_int32); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
+  if (PyDict_SetItem(__pyx_t_22, __pyx_n_s_dtype, __pyx_t_24) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_24); __pyx_t_24 = 0;
+  __pyx_t_24 = __Pyx_PyObject_Call(__pyx_t_21, __pyx_t_20, __pyx_t_22); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+  __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+  __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
+  if (!(likely(((__pyx_t_24) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_24, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 334, __pyx_L1_error)
+  __pyx_t_25 = ((PyArrayObject *)__pyx_t_24);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_M_.rcbuffer->pybuffer, (PyObject*)__pyx_t_25, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) {
+      __pyx_v_M_ = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_M_.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 334, __pyx_L1_error)
+    } else {__pyx_pybuffernd_M_.diminfo[0].strides = __pyx_pybuffernd_M_.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_M_.diminfo[0].shape = __pyx_pybuffernd_M_.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_M_.diminfo[1].strides = __pyx_pybuffernd_M_.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_M_.diminfo[1].shape = __pyx_pybuffernd_M_.rcbuffer->pybuffer.shape[1];
+    }
+  }
+  __pyx_t_25 = 0;
+  __pyx_v_M_ = ((PyArrayObject *)__pyx_t_24);
+  __pyx_t_24 = 0;
+
+  /* "sisl/_sparse.pyx":335
+ *     cdef int np_max = max(reps[0], max(reps[1], reps[2])) + 2 * hsc
+ *     cdef np.ndarray[np.int32_t, ndim=2, mode='c'] M_ = np.empty([3, np_max], dtype=np.int32)
+ *     cdef int[:, ::1] M = M_             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=2, mode='c'] Q_ = np.empty([3, np_max], dtype=np.int32)
+ *     cdef int[:, ::1] Q = Q_
+ */
+  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_int(((PyObject *)__pyx_v_M_), PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __pyx_v_M = __pyx_t_2;
+  __pyx_t_2.memview = NULL;
+  __pyx_t_2.data = NULL;
+
+  /* "sisl/_sparse.pyx":336
+ *     cdef np.ndarray[np.int32_t, ndim=2, mode='c'] M_ = np.empty([3, np_max], dtype=np.int32)
+ *     cdef int[:, ::1] M = M_
+ *     cdef np.ndarray[np.int32_t, ndim=2, mode='c'] Q_ = np.empty([3, np_max], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[:, ::1] Q = Q_
+ *     for i in range(3):
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_24, __pyx_n_s_np); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __pyx_t_22 = __Pyx_PyObject_GetAttrStr(__pyx_t_24, __pyx_n_s_empty); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __Pyx_DECREF(__pyx_t_24); __pyx_t_24 = 0;
+  __pyx_t_24 = __Pyx_PyInt_From_int(__pyx_v_np_max); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __pyx_t_20 = PyList_New(2); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __Pyx_INCREF(__pyx_int_3);
+  __Pyx_GIVEREF(__pyx_int_3);
+  PyList_SET_ITEM(__pyx_t_20, 0, __pyx_int_3);
+  __Pyx_GIVEREF(__pyx_t_24);
+  PyList_SET_ITEM(__pyx_t_20, 1, __pyx_t_24);
+  __pyx_t_24 = 0;
+  __pyx_t_24 = PyTuple_New(1); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_GIVEREF(__pyx_t_20);
+  PyTuple_SET_ITEM(__pyx_t_24, 0, __pyx_t_20);
+  __pyx_t_20 = 0;
+  __pyx_t_20 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __Pyx_GetModuleGlobalName(__pyx_t_21, __pyx_n_s_np); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __pyx_t_23 = __Pyx_PyObject_GetAttrStr(__pyx_t_21, __pyx_n_s_int32); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+  if (PyDict_SetItem(__pyx_t_20, __pyx_n_s_dtype, __pyx_t_23) < 0) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
+  __pyx_t_23 = __Pyx_PyObject_Call(__pyx_t_22, __pyx_t_24, __pyx_t_20); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
+  __Pyx_DECREF(__pyx_t_24); __pyx_t_24 = 0;
+  __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+  if (!(likely(((__pyx_t_23) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_23, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 336, __pyx_L1_error)
+  __pyx_t_26 = ((PyArrayObject *)__pyx_t_23);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_Q_.rcbuffer->pybuffer, (PyObject*)__pyx_t_26, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) {
+      __pyx_v_Q_ = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_Q_.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 336, __pyx_L1_error)
+    } else {__pyx_pybuffernd_Q_.diminfo[0].strides = __pyx_pybuffernd_Q_.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_Q_.diminfo[0].shape = __pyx_pybuffernd_Q_.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_Q_.diminfo[1].strides = __pyx_pybuffernd_Q_.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_Q_.diminfo[1].shape = __pyx_pybuffernd_Q_.rcbuffer->pybuffer.shape[1];
+    }
+  }
+  __pyx_t_26 = 0;
+  __pyx_v_Q_ = ((PyArrayObject *)__pyx_t_23);
+  __pyx_t_23 = 0;
+
+  /* "sisl/_sparse.pyx":337
+ *     cdef int[:, ::1] M = M_
+ *     cdef np.ndarray[np.int32_t, ndim=2, mode='c'] Q_ = np.empty([3, np_max], dtype=np.int32)
+ *     cdef int[:, ::1] Q = Q_             # <<<<<<<<<<<<<<
+ *     for i in range(3):
+ *         for p0 in range(- hsc, reps[i] + hsc):
+ */
+  __pyx_t_2 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_int(((PyObject *)__pyx_v_Q_), PyBUF_WRITABLE); if (unlikely(!__pyx_t_2.memview)) __PYX_ERR(0, 337, __pyx_L1_error)
+  __pyx_v_Q = __pyx_t_2;
+  __pyx_t_2.memview = NULL;
+  __pyx_t_2.data = NULL;
+
+  /* "sisl/_sparse.pyx":338
+ *     cdef np.ndarray[np.int32_t, ndim=2, mode='c'] Q_ = np.empty([3, np_max], dtype=np.int32)
+ *     cdef int[:, ::1] Q = Q_
+ *     for i in range(3):             # <<<<<<<<<<<<<<
+ *         for p0 in range(- hsc, reps[i] + hsc):
+ *             # floor division
+ */
+  for (__pyx_t_10 = 0; __pyx_t_10 < 3; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "sisl/_sparse.pyx":339
+ *     cdef int[:, ::1] Q = Q_
+ *     for i in range(3):
+ *         for p0 in range(- hsc, reps[i] + hsc):             # <<<<<<<<<<<<<<
+ *             # floor division
+ *             if p0 >= 0:
+ */
+    __pyx_t_27 = __pyx_v_i;
+    __pyx_t_9 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_27)) ))) + __pyx_v_hsc);
+    __pyx_t_13 = __pyx_t_9;
+    for (__pyx_t_28 = (-__pyx_v_hsc); __pyx_t_28 < __pyx_t_13; __pyx_t_28+=1) {
+      __pyx_v_p0 = __pyx_t_28;
+
+      /* "sisl/_sparse.pyx":341
+ *         for p0 in range(- hsc, reps[i] + hsc):
+ *             # floor division
+ *             if p0 >= 0:             # <<<<<<<<<<<<<<
+ *                 p1 = p0 / reps[i]
+ *             else:
+ */
+      __pyx_t_14 = ((__pyx_v_p0 >= 0) != 0);
+      if (__pyx_t_14) {
+
+        /* "sisl/_sparse.pyx":342
+ *             # floor division
+ *             if p0 >= 0:
+ *                 p1 = p0 / reps[i]             # <<<<<<<<<<<<<<
+ *             else:
+ *                 p1 = - ((- p0 + reps[i] - 1) / reps[i])
+ */
+        __pyx_t_29 = __pyx_v_i;
+        __pyx_v_p1 = (__pyx_v_p0 / (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_29)) ))));
+
+        /* "sisl/_sparse.pyx":341
+ *         for p0 in range(- hsc, reps[i] + hsc):
+ *             # floor division
+ *             if p0 >= 0:             # <<<<<<<<<<<<<<
+ *                 p1 = p0 / reps[i]
+ *             else:
+ */
+        goto __pyx_L12;
+      }
+
+      /* "sisl/_sparse.pyx":344
+ *                 p1 = p0 / reps[i]
+ *             else:
+ *                 p1 = - ((- p0 + reps[i] - 1) / reps[i])             # <<<<<<<<<<<<<<
+ *             M[i, p0 + hsc] = (p0 - p1 * reps[i]) * strides[i]
+ *             if p1 < 0:
+ */
+      /*else*/ {
+        __pyx_t_30 = __pyx_v_i;
+        __pyx_t_31 = __pyx_v_i;
+        __pyx_v_p1 = (-((((-__pyx_v_p0) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_30)) )))) - 1) / (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_31)) )))));
+      }
+      __pyx_L12:;
+
+      /* "sisl/_sparse.pyx":345
+ *             else:
+ *                 p1 = - ((- p0 + reps[i] - 1) / reps[i])
+ *             M[i, p0 + hsc] = (p0 - p1 * reps[i]) * strides[i]             # <<<<<<<<<<<<<<
+ *             if p1 < 0:
+ *                 p1 = p1 + isc_off.shape[i]
+ */
+      __pyx_t_32 = __pyx_v_i;
+      __pyx_t_33 = __pyx_v_i;
+      __pyx_t_34 = __pyx_v_i;
+      __pyx_t_35 = (__pyx_v_p0 + __pyx_v_hsc);
+      *((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_M.data + __pyx_t_34 * __pyx_v_M.strides[0]) )) + __pyx_t_35)) )) = ((__pyx_v_p0 - (__pyx_v_p1 * (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_32)) ))))) * (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_strides.data) + __pyx_t_33)) ))));
+
+      /* "sisl/_sparse.pyx":346
+ *                 p1 = - ((- p0 + reps[i] - 1) / reps[i])
+ *             M[i, p0 + hsc] = (p0 - p1 * reps[i]) * strides[i]
+ *             if p1 < 0:             # <<<<<<<<<<<<<<
+ *                 p1 = p1 + isc_off.shape[i]
+ *             if p1 < 0 or p1 >= isc_off.shape[i]:
+ */
+      __pyx_t_14 = ((__pyx_v_p1 < 0) != 0);
+      if (__pyx_t_14) {
+
+        /* "sisl/_sparse.pyx":347
+ *             M[i, p0 + hsc] = (p0 - p1 * reps[i]) * strides[i]
+ *             if p1 < 0:
+ *                 p1 = p1 + isc_off.shape[i]             # <<<<<<<<<<<<<<
+ *             if p1 < 0 or p1 >= isc_off.shape[i]:
+ *                 # flag non-existing supercells
+ */
+        __pyx_v_p1 = (__pyx_v_p1 + (__pyx_v_isc_off.shape[__pyx_v_i]));
+
+        /* "sisl/_sparse.pyx":346
+ *                 p1 = - ((- p0 + reps[i] - 1) / reps[i])
+ *             M[i, p0 + hsc] = (p0 - p1 * reps[i]) * strides[i]
+ *             if p1 < 0:             # <<<<<<<<<<<<<<
+ *                 p1 = p1 + isc_off.shape[i]
+ *             if p1 < 0 or p1 >= isc_off.shape[i]:
+ */
+      }
+
+      /* "sisl/_sparse.pyx":348
+ *             if p1 < 0:
+ *                 p1 = p1 + isc_off.shape[i]
+ *             if p1 < 0 or p1 >= isc_off.shape[i]:             # <<<<<<<<<<<<<<
+ *                 # flag non-existing supercells
+ *                 p1 = -1
+ */
+      __pyx_t_36 = ((__pyx_v_p1 < 0) != 0);
+      if (!__pyx_t_36) {
+      } else {
+        __pyx_t_14 = __pyx_t_36;
+        goto __pyx_L15_bool_binop_done;
+      }
+      __pyx_t_36 = ((__pyx_v_p1 >= (__pyx_v_isc_off.shape[__pyx_v_i])) != 0);
+      __pyx_t_14 = __pyx_t_36;
+      __pyx_L15_bool_binop_done:;
+      if (__pyx_t_14) {
+
+        /* "sisl/_sparse.pyx":350
+ *             if p1 < 0 or p1 >= isc_off.shape[i]:
+ *                 # flag non-existing supercells
+ *                 p1 = -1             # <<<<<<<<<<<<<<
+ *             Q[i, p0 + hsc] = p1
+ *     for s in range(sc_off.shape[0]):
+ */
+        __pyx_v_p1 = -1;
+
+        /* "sisl/_sparse.pyx":348
+ *             if p1 < 0:
+ *                 p1 = p1 + isc_off.shape[i]
+ *             if p1 < 0 or p1 >= isc_off.shape[i]:             # <<<<<<<<<<<<<<
+ *                 # flag non-existing supercells
+ *                 p1 = -1
+ */
+      }
+
+      /* "sisl/_sparse.pyx":351
+ *                 # flag non-existing supercells
+ *                 p1 = -1
+ *             Q[i, p0 + hsc] = p1             # <<<<<<<<<<<<<<
+ *     for s in range(sc_off.shape[0]):
+ *         for i in range(3):
+ */
+      __pyx_t_37 = __pyx_v_i;
+      __pyx_t_38 = (__pyx_v_p0 + __pyx_v_hsc);
+      *((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_Q.data + __pyx_t_37 * __pyx_v_Q.strides[0]) )) + __pyx_t_38)) )) = __pyx_v_p1;
+    }
+  }
+
+  /* "sisl/_sparse.pyx":352
+ *                 p1 = -1
+ *             Q[i, p0 + hsc] = p1
+ *     for s in range(sc_off.shape[0]):             # <<<<<<<<<<<<<<
+ *         for i in range(3):
+ *             for t0 in range(reps[i]):
+ */
+  __pyx_t_7 = (__pyx_v_sc_off.shape[0]);
+  __pyx_t_8 = __pyx_t_7;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_8; __pyx_t_10+=1) {
+    __pyx_v_s = __pyx_t_10;
+
+    /* "sisl/_sparse.pyx":353
+ *             Q[i, p0 + hsc] = p1
+ *     for s in range(sc_off.shape[0]):
+ *         for i in range(3):             # <<<<<<<<<<<<<<
+ *             for t0 in range(reps[i]):
+ *                 if Q[i, t0 + sc_off[s, i] + hsc] < 0:
+ */
+    for (__pyx_t_9 = 0; __pyx_t_9 < 3; __pyx_t_9+=1) {
+      __pyx_v_i = __pyx_t_9;
+
+      /* "sisl/_sparse.pyx":354
+ *     for s in range(sc_off.shape[0]):
+ *         for i in range(3):
+ *             for t0 in range(reps[i]):             # <<<<<<<<<<<<<<
+ *                 if Q[i, t0 + sc_off[s, i] + hsc] < 0:
+ *                     raise ValueError('csr_tile requesting a non-existing supercell index')
+ */
+      __pyx_t_39 = __pyx_v_i;
+      __pyx_t_13 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_39)) )));
+      __pyx_t_28 = __pyx_t_13;
+      for (__pyx_t_40 = 0; __pyx_t_40 < __pyx_t_28; __pyx_t_40+=1) {
+        __pyx_v_t0 = __pyx_t_40;
+
+        /* "sisl/_sparse.pyx":355
+ *         for i in range(3):
+ *             for t0 in range(reps[i]):
+ *                 if Q[i, t0 + sc_off[s, i] + hsc] < 0:             # <<<<<<<<<<<<<<
+ *                     raise ValueError('csr_tile requesting a non-existing supercell index')
+ * 
+ */
+        __pyx_t_41 = __pyx_v_s;
+        __pyx_t_42 = __pyx_v_i;
+        __pyx_t_43 = __pyx_v_i;
+        __pyx_t_44 = ((__pyx_v_t0 + (*((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_sc_off.data + __pyx_t_41 * __pyx_v_sc_off.strides[0]) )) + __pyx_t_42)) )))) + __pyx_v_hsc);
+        __pyx_t_14 = (((*((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_Q.data + __pyx_t_43 * __pyx_v_Q.strides[0]) )) + __pyx_t_44)) ))) < 0) != 0);
+        if (unlikely(__pyx_t_14)) {
+
+          /* "sisl/_sparse.pyx":356
+ *             for t0 in range(reps[i]):
+ *                 if Q[i, t0 + sc_off[s, i] + hsc] < 0:
+ *                     raise ValueError('csr_tile requesting a non-existing supercell index')             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] PTR_n = np.empty([n_n + 1], dtype=np.int32)
+ */
+          __pyx_t_23 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 356, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_23);
+          __Pyx_Raise(__pyx_t_23, 0, 0, 0);
+          __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
+          __PYX_ERR(0, 356, __pyx_L1_error)
+
+          /* "sisl/_sparse.pyx":355
+ *         for i in range(3):
+ *             for t0 in range(reps[i]):
+ *                 if Q[i, t0 + sc_off[s, i] + hsc] < 0:             # <<<<<<<<<<<<<<
+ *                     raise ValueError('csr_tile requesting a non-existing supercell index')
+ * 
+ */
+        }
+      }
+    }
+  }
+
+  /* "sisl/_sparse.pyx":358
+ *                     raise ValueError('csr_tile requesting a non-existing supercell index')
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] PTR_n = np.empty([n_n + 1], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ptr_n = PTR_n
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL_n = np.empty([n_n], dtype=np.int32)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_23, __pyx_n_s_np); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __pyx_t_20 = __Pyx_PyObject_GetAttrStr(__pyx_t_23, __pyx_n_s_empty); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
+  __pyx_t_23 = __Pyx_PyInt_From_long((__pyx_v_n_n + 1)); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __pyx_t_24 = PyList_New(1); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_GIVEREF(__pyx_t_23);
+  PyList_SET_ITEM(__pyx_t_24, 0, __pyx_t_23);
+  __pyx_t_23 = 0;
+  __pyx_t_23 = PyTuple_New(1); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __Pyx_GIVEREF(__pyx_t_24);
+  PyTuple_SET_ITEM(__pyx_t_23, 0, __pyx_t_24);
+  __pyx_t_24 = 0;
+  __pyx_t_24 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_GetModuleGlobalName(__pyx_t_22, __pyx_n_s_np); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __pyx_t_21 = __Pyx_PyObject_GetAttrStr(__pyx_t_22, __pyx_n_s_int32); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
+  if (PyDict_SetItem(__pyx_t_24, __pyx_n_s_dtype, __pyx_t_21) < 0) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+  __pyx_t_21 = __Pyx_PyObject_Call(__pyx_t_20, __pyx_t_23, __pyx_t_24); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+  __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
+  __Pyx_DECREF(__pyx_t_24); __pyx_t_24 = 0;
+  if (!(likely(((__pyx_t_21) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_21, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 358, __pyx_L1_error)
+  __pyx_t_45 = ((PyArrayObject *)__pyx_t_21);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_PTR_n.rcbuffer->pybuffer, (PyObject*)__pyx_t_45, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_PTR_n = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_PTR_n.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 358, __pyx_L1_error)
+    } else {__pyx_pybuffernd_PTR_n.diminfo[0].strides = __pyx_pybuffernd_PTR_n.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_PTR_n.diminfo[0].shape = __pyx_pybuffernd_PTR_n.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_45 = 0;
+  __pyx_v_PTR_n = ((PyArrayObject *)__pyx_t_21);
+  __pyx_t_21 = 0;
+
+  /* "sisl/_sparse.pyx":359
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] PTR_n = np.empty([n_n + 1], dtype=np.int32)
+ *     cdef int[::1] ptr_n = PTR_n             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL_n = np.empty([n_n], dtype=np.int32)
+ *     cdef int[::1] ncol_n = NCOL_n
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_PTR_n), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 359, __pyx_L1_error)
+  __pyx_v_ptr_n = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":360
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] PTR_n = np.empty([n_n + 1], dtype=np.int32)
+ *     cdef int[::1] ptr_n = PTR_n
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL_n = np.empty([n_n], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] ncol_n = NCOL_n
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_21, __pyx_n_s_np); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __pyx_t_24 = __Pyx_PyObject_GetAttrStr(__pyx_t_21, __pyx_n_s_empty); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+  __pyx_t_21 = __Pyx_PyInt_From_int(__pyx_v_n_n); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __pyx_t_23 = PyList_New(1); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __Pyx_GIVEREF(__pyx_t_21);
+  PyList_SET_ITEM(__pyx_t_23, 0, __pyx_t_21);
+  __pyx_t_21 = 0;
+  __pyx_t_21 = PyTuple_New(1); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __Pyx_GIVEREF(__pyx_t_23);
+  PyTuple_SET_ITEM(__pyx_t_21, 0, __pyx_t_23);
+  __pyx_t_23 = 0;
+  __pyx_t_23 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __Pyx_GetModuleGlobalName(__pyx_t_20, __pyx_n_s_np); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __pyx_t_22 = __Pyx_PyObject_GetAttrStr(__pyx_t_20, __pyx_n_s_int32); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+  if (PyDict_SetItem(__pyx_t_23, __pyx_n_s_dtype, __pyx_t_22) < 0) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
+  __pyx_t_22 = __Pyx_PyObject_Call(__pyx_t_24, __pyx_t_21, __pyx_t_23); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __Pyx_DECREF(__pyx_t_24); __pyx_t_24 = 0;
+  __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+  __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
+  if (!(likely(((__pyx_t_22) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_22, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 360, __pyx_L1_error)
+  __pyx_t_46 = ((PyArrayObject *)__pyx_t_22);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_NCOL_n.rcbuffer->pybuffer, (PyObject*)__pyx_t_46, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_NCOL_n = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_NCOL_n.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 360, __pyx_L1_error)
+    } else {__pyx_pybuffernd_NCOL_n.diminfo[0].strides = __pyx_pybuffernd_NCOL_n.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_NCOL_n.diminfo[0].shape = __pyx_pybuffernd_NCOL_n.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_46 = 0;
+  __pyx_v_NCOL_n = ((PyArrayObject *)__pyx_t_22);
+  __pyx_t_22 = 0;
+
+  /* "sisl/_sparse.pyx":361
+ *     cdef int[::1] ptr_n = PTR_n
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL_n = np.empty([n_n], dtype=np.int32)
+ *     cdef int[::1] ncol_n = NCOL_n             # <<<<<<<<<<<<<<
+ * 
+ *     # Number of elements per row
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_NCOL_n), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 361, __pyx_L1_error)
+  __pyx_v_ncol_n = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":364
+ * 
+ *     # Number of elements per row
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             for t0 in range(reps[0]):
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sisl/_sparse.pyx":365
+ *     # Number of elements per row
+ *     with nogil:
+ *         for i in range(n):             # <<<<<<<<<<<<<<
+ *             for t0 in range(reps[0]):
+ *                 for t1 in range(reps[1]):
+ */
+        __pyx_t_10 = __pyx_v_n;
+        __pyx_t_9 = __pyx_t_10;
+        for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_9; __pyx_t_13+=1) {
+          __pyx_v_i = __pyx_t_13;
+
+          /* "sisl/_sparse.pyx":366
+ *     with nogil:
+ *         for i in range(n):
+ *             for t0 in range(reps[0]):             # <<<<<<<<<<<<<<
+ *                 for t1 in range(reps[1]):
+ *                     for t2 in range(reps[2]):
+ */
+          __pyx_t_47 = 0;
+          __pyx_t_28 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_47)) )));
+          __pyx_t_40 = __pyx_t_28;
+          for (__pyx_t_48 = 0; __pyx_t_48 < __pyx_t_40; __pyx_t_48+=1) {
+            __pyx_v_t0 = __pyx_t_48;
+
+            /* "sisl/_sparse.pyx":367
+ *         for i in range(n):
+ *             for t0 in range(reps[0]):
+ *                 for t1 in range(reps[1]):             # <<<<<<<<<<<<<<
+ *                     for t2 in range(reps[2]):
+ *                         lin = t0 * strides[0] + t1 * strides[1] + t2 * strides[2]
+ */
+            __pyx_t_49 = 1;
+            __pyx_t_50 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_49)) )));
+            __pyx_t_51 = __pyx_t_50;
+            for (__pyx_t_52 = 0; __pyx_t_52 < __pyx_t_51; __pyx_t_52+=1) {
+              __pyx_v_t1 = __pyx_t_52;
+
+              /* "sisl/_sparse.pyx":368
+ *             for t0 in range(reps[0]):
+ *                 for t1 in range(reps[1]):
+ *                     for t2 in range(reps[2]):             # <<<<<<<<<<<<<<
+ *                         lin = t0 * strides[0] + t1 * strides[1] + t2 * strides[2]
+ *                         ncol_n[base[i] + mult[i] * lin] = ncol[i]
+ */
+              __pyx_t_53 = 2;
+              __pyx_t_54 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_53)) )));
+              __pyx_t_55 = __pyx_t_54;
+              for (__pyx_t_56 = 0; __pyx_t_56 < __pyx_t_55; __pyx_t_56+=1) {
+                __pyx_v_t2 = __pyx_t_56;
+
+                /* "sisl/_sparse.pyx":369
+ *                 for t1 in range(reps[1]):
+ *                     for t2 in range(reps[2]):
+ *                         lin = t0 * strides[0] + t1 * strides[1] + t2 * strides[2]             # <<<<<<<<<<<<<<
+ *                         ncol_n[base[i] + mult[i] * lin] = ncol[i]
+ *         ptr_n[0] = 0
+ */
+                __pyx_t_57 = 0;
+                __pyx_t_58 = 1;
+                __pyx_t_59 = 2;
+                __pyx_v_lin = (((__pyx_v_t0 * (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_strides.data) + __pyx_t_57)) )))) + (__pyx_v_t1 * (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_strides.data) + __pyx_t_58)) ))))) + (__pyx_v_t2 * (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_strides.data) + __pyx_t_59)) )))));
+
+                /* "sisl/_sparse.pyx":370
+ *                     for t2 in range(reps[2]):
+ *                         lin = t0 * strides[0] + t1 * strides[1] + t2 * strides[2]
+ *                         ncol_n[base[i] + mult[i] * lin] = ncol[i]             # <<<<<<<<<<<<<<
+ *         ptr_n[0] = 0
+ *         for r in range(n_n):
+ */
+                __pyx_t_60 = __pyx_v_i;
+                __pyx_t_61 = __pyx_v_i;
+                __pyx_t_62 = __pyx_v_i;
+                __pyx_t_63 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_base.data) + __pyx_t_61)) ))) + ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_mult.data) + __pyx_t_62)) ))) * __pyx_v_lin));
+                *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol_n.data) + __pyx_t_63)) )) = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_60)) )));
+              }
+            }
+          }
+        }
+
+        /* "sisl/_sparse.pyx":371
+ *                         lin = t0 * strides[0] + t1 * strides[1] + t2 * strides[2]
+ *                         ncol_n[base[i] + mult[i] * lin] = ncol[i]
+ *         ptr_n[0] = 0             # <<<<<<<<<<<<<<
+ *         for r in range(n_n):
+ *             ptr_n[r + 1] = ptr_n[r] + ncol_n[r]
+ */
+        __pyx_t_64 = 0;
+        *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_n.data) + __pyx_t_64)) )) = 0;
+
+        /* "sisl/_sparse.pyx":372
+ *                         ncol_n[base[i] + mult[i] * lin] = ncol[i]
+ *         ptr_n[0] = 0
+ *         for r in range(n_n):             # <<<<<<<<<<<<<<
+ *             ptr_n[r + 1] = ptr_n[r] + ncol_n[r]
+ * 
+ */
+        __pyx_t_10 = __pyx_v_n_n;
+        __pyx_t_9 = __pyx_t_10;
+        for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_9; __pyx_t_13+=1) {
+          __pyx_v_r = __pyx_t_13;
+
+          /* "sisl/_sparse.pyx":373
+ *         ptr_n[0] = 0
+ *         for r in range(n_n):
+ *             ptr_n[r + 1] = ptr_n[r] + ncol_n[r]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] COL_n = np.empty([ptr_n[n_n]], dtype=np.int32)
+ */
+          __pyx_t_65 = __pyx_v_r;
+          __pyx_t_66 = __pyx_v_r;
+          __pyx_t_67 = (__pyx_v_r + 1);
+          *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_n.data) + __pyx_t_67)) )) = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_n.data) + __pyx_t_65)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol_n.data) + __pyx_t_66)) ))));
+        }
+      }
+
+      /* "sisl/_sparse.pyx":364
+ * 
+ *     # Number of elements per row
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             for t0 in range(reps[0]):
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L26;
+        }
+        __pyx_L26:;
+      }
+  }
+
+  /* "sisl/_sparse.pyx":375
+ *             ptr_n[r + 1] = ptr_n[r] + ncol_n[r]
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] COL_n = np.empty([ptr_n[n_n]], dtype=np.int32)             # <<<<<<<<<<<<<<
+ *     cdef int[::1] col_n = COL_n
+ *     cdef np.ndarray[np.uint8_t, ndim=2, mode='c'] D_n = np.empty([ptr_n[n_n], nbytes], dtype=np.uint8)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_22, __pyx_n_s_np); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __pyx_t_23 = __Pyx_PyObject_GetAttrStr(__pyx_t_22, __pyx_n_s_empty); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
+  __pyx_t_68 = __pyx_v_n_n;
+  __pyx_t_22 = __Pyx_PyInt_From_int((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_n.data) + __pyx_t_68)) )))); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __pyx_t_21 = PyList_New(1); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __Pyx_GIVEREF(__pyx_t_22);
+  PyList_SET_ITEM(__pyx_t_21, 0, __pyx_t_22);
+  __pyx_t_22 = 0;
+  __pyx_t_22 = PyTuple_New(1); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __Pyx_GIVEREF(__pyx_t_21);
+  PyTuple_SET_ITEM(__pyx_t_22, 0, __pyx_t_21);
+  __pyx_t_21 = 0;
+  __pyx_t_21 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __Pyx_GetModuleGlobalName(__pyx_t_24, __pyx_n_s_np); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __pyx_t_20 = __Pyx_PyObject_GetAttrStr(__pyx_t_24, __pyx_n_s_int32); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __Pyx_DECREF(__pyx_t_24); __pyx_t_24 = 0;
+  if (PyDict_SetItem(__pyx_t_21, __pyx_n_s_dtype, __pyx_t_20) < 0) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+  __pyx_t_20 = __Pyx_PyObject_Call(__pyx_t_23, __pyx_t_22, __pyx_t_21); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
+  __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
+  __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+  if (!(likely(((__pyx_t_20) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_20, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 375, __pyx_L1_error)
+  __pyx_t_69 = ((PyArrayObject *)__pyx_t_20);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_COL_n.rcbuffer->pybuffer, (PyObject*)__pyx_t_69, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_COL_n = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_COL_n.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 375, __pyx_L1_error)
+    } else {__pyx_pybuffernd_COL_n.diminfo[0].strides = __pyx_pybuffernd_COL_n.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_COL_n.diminfo[0].shape = __pyx_pybuffernd_COL_n.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_69 = 0;
+  __pyx_v_COL_n = ((PyArrayObject *)__pyx_t_20);
+  __pyx_t_20 = 0;
+
+  /* "sisl/_sparse.pyx":376
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] COL_n = np.empty([ptr_n[n_n]], dtype=np.int32)
+ *     cdef int[::1] col_n = COL_n             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.uint8_t, ndim=2, mode='c'] D_n = np.empty([ptr_n[n_n], nbytes], dtype=np.uint8)
+ *     cdef unsigned char[:, ::1] d_n = D_n
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_dc_int(((PyObject *)__pyx_v_COL_n), PyBUF_WRITABLE); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 376, __pyx_L1_error)
+  __pyx_v_col_n = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "sisl/_sparse.pyx":377
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] COL_n = np.empty([ptr_n[n_n]], dtype=np.int32)
+ *     cdef int[::1] col_n = COL_n
+ *     cdef np.ndarray[np.uint8_t, ndim=2, mode='c'] D_n = np.empty([ptr_n[n_n], nbytes], dtype=np.uint8)             # <<<<<<<<<<<<<<
+ *     cdef unsigned char[:, ::1] d_n = D_n
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_20, __pyx_n_s_np); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __pyx_t_21 = __Pyx_PyObject_GetAttrStr(__pyx_t_20, __pyx_n_s_empty); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+  __pyx_t_70 = __pyx_v_n_n;
+  __pyx_t_20 = __Pyx_PyInt_From_int((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_n.data) + __pyx_t_70)) )))); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __pyx_t_22 = PyInt_FromSsize_t(__pyx_v_nbytes); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __pyx_t_23 = PyList_New(2); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __Pyx_GIVEREF(__pyx_t_20);
+  PyList_SET_ITEM(__pyx_t_23, 0, __pyx_t_20);
+  __Pyx_GIVEREF(__pyx_t_22);
+  PyList_SET_ITEM(__pyx_t_23, 1, __pyx_t_22);
+  __pyx_t_20 = 0;
+  __pyx_t_22 = 0;
+  __pyx_t_22 = PyTuple_New(1); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __Pyx_GIVEREF(__pyx_t_23);
+  PyTuple_SET_ITEM(__pyx_t_22, 0, __pyx_t_23);
+  __pyx_t_23 = 0;
+  __pyx_t_23 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __Pyx_GetModuleGlobalName(__pyx_t_20, __pyx_n_s_np); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __pyx_t_24 = __Pyx_PyObject_GetAttrStr(__pyx_t_20, __pyx_n_s_uint8); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+  if (PyDict_SetItem(__pyx_t_23, __pyx_n_s_dtype, __pyx_t_24) < 0) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_24); __pyx_t_24 = 0;
+  __pyx_t_24 = __Pyx_PyObject_Call(__pyx_t_21, __pyx_t_22, __pyx_t_23); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+  __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
+  __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
+  if (!(likely(((__pyx_t_24) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_24, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 377, __pyx_L1_error)
+  __pyx_t_71 = ((PyArrayObject *)__pyx_t_24);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_D_n.rcbuffer->pybuffer, (PyObject*)__pyx_t_71, &__Pyx_TypeInfo_nn___pyx_t_5numpy_uint8_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 2, 0, __pyx_stack) == -1)) {
+      __pyx_v_D_n = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_D_n.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 377, __pyx_L1_error)
+    } else {__pyx_pybuffernd_D_n.diminfo[0].strides = __pyx_pybuffernd_D_n.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_D_n.diminfo[0].shape = __pyx_pybuffernd_D_n.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_D_n.diminfo[1].strides = __pyx_pybuffernd_D_n.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_D_n.diminfo[1].shape = __pyx_pybuffernd_D_n.rcbuffer->pybuffer.shape[1];
+    }
+  }
+  __pyx_t_71 = 0;
+  __pyx_v_D_n = ((PyArrayObject *)__pyx_t_24);
+  __pyx_t_24 = 0;
+
+  /* "sisl/_sparse.pyx":378
+ *     cdef int[::1] col_n = COL_n
+ *     cdef np.ndarray[np.uint8_t, ndim=2, mode='c'] D_n = np.empty([ptr_n[n_n], nbytes], dtype=np.uint8)
+ *     cdef unsigned char[:, ::1] d_n = D_n             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __pyx_t_72 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_char(((PyObject *)__pyx_v_D_n), PyBUF_WRITABLE); if (unlikely(!__pyx_t_72.memview)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __pyx_v_d_n = __pyx_t_72;
+  __pyx_t_72.memview = NULL;
+  __pyx_t_72.data = NULL;
+
+  /* "sisl/_sparse.pyx":380
+ *     cdef unsigned char[:, ::1] d_n = D_n
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             for t0 in range(reps[0]):
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "sisl/_sparse.pyx":381
+ * 
+ *     with nogil:
+ *         for i in range(n):             # <<<<<<<<<<<<<<
+ *             for t0 in range(reps[0]):
+ *                 for t1 in range(reps[1]):
+ */
+        __pyx_t_10 = __pyx_v_n;
+        __pyx_t_9 = __pyx_t_10;
+        for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_9; __pyx_t_13+=1) {
+          __pyx_v_i = __pyx_t_13;
+
+          /* "sisl/_sparse.pyx":382
+ *     with nogil:
+ *         for i in range(n):
+ *             for t0 in range(reps[0]):             # <<<<<<<<<<<<<<
+ *                 for t1 in range(reps[1]):
+ *                     for t2 in range(reps[2]):
+ */
+          __pyx_t_73 = 0;
+          __pyx_t_28 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_73)) )));
+          __pyx_t_40 = __pyx_t_28;
+          for (__pyx_t_48 = 0; __pyx_t_48 < __pyx_t_40; __pyx_t_48+=1) {
+            __pyx_v_t0 = __pyx_t_48;
+
+            /* "sisl/_sparse.pyx":383
+ *         for i in range(n):
+ *             for t0 in range(reps[0]):
+ *                 for t1 in range(reps[1]):             # <<<<<<<<<<<<<<
+ *                     for t2 in range(reps[2]):
+ *                         lin = t0 * strides[0] + t1 * strides[1] + t2 * strides[2]
+ */
+            __pyx_t_74 = 1;
+            __pyx_t_50 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_74)) )));
+            __pyx_t_51 = __pyx_t_50;
+            for (__pyx_t_52 = 0; __pyx_t_52 < __pyx_t_51; __pyx_t_52+=1) {
+              __pyx_v_t1 = __pyx_t_52;
+
+              /* "sisl/_sparse.pyx":384
+ *             for t0 in range(reps[0]):
+ *                 for t1 in range(reps[1]):
+ *                     for t2 in range(reps[2]):             # <<<<<<<<<<<<<<
+ *                         lin = t0 * strides[0] + t1 * strides[1] + t2 * strides[2]
+ *                         r = base[i] + mult[i] * lin
+ */
+              __pyx_t_75 = 2;
+              __pyx_t_54 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_reps.data) + __pyx_t_75)) )));
+              __pyx_t_55 = __pyx_t_54;
+              for (__pyx_t_56 = 0; __pyx_t_56 < __pyx_t_55; __pyx_t_56+=1) {
+                __pyx_v_t2 = __pyx_t_56;
+
+                /* "sisl/_sparse.pyx":385
+ *                 for t1 in range(reps[1]):
+ *                     for t2 in range(reps[2]):
+ *                         lin = t0 * strides[0] + t1 * strides[1] + t2 * strides[2]             # <<<<<<<<<<<<<<
+ *                         r = base[i] + mult[i] * lin
+ *                         ind_n = ptr_n[r]
+ */
+                __pyx_t_76 = 0;
+                __pyx_t_77 = 1;
+                __pyx_t_78 = 2;
+                __pyx_v_lin = (((__pyx_v_t0 * (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_strides.data) + __pyx_t_76)) )))) + (__pyx_v_t1 * (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_strides.data) + __pyx_t_77)) ))))) + (__pyx_v_t2 * (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_strides.data) + __pyx_t_78)) )))));
+
+                /* "sisl/_sparse.pyx":386
+ *                     for t2 in range(reps[2]):
+ *                         lin = t0 * strides[0] + t1 * strides[1] + t2 * strides[2]
+ *                         r = base[i] + mult[i] * lin             # <<<<<<<<<<<<<<
+ *                         ind_n = ptr_n[r]
+ *                         if ncol[i] > 0 and nbytes > 0:
+ */
+                __pyx_t_79 = __pyx_v_i;
+                __pyx_t_80 = __pyx_v_i;
+                __pyx_v_r = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_base.data) + __pyx_t_79)) ))) + ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_mult.data) + __pyx_t_80)) ))) * __pyx_v_lin));
+
+                /* "sisl/_sparse.pyx":387
+ *                         lin = t0 * strides[0] + t1 * strides[1] + t2 * strides[2]
+ *                         r = base[i] + mult[i] * lin
+ *                         ind_n = ptr_n[r]             # <<<<<<<<<<<<<<
+ *                         if ncol[i] > 0 and nbytes > 0:
+ *                             memcpy(&d_n[ind_n, 0], &D[ptr[i], 0], ncol[i] * nbytes)
+ */
+                __pyx_t_81 = __pyx_v_r;
+                __pyx_v_ind_n = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr_n.data) + __pyx_t_81)) )));
+
+                /* "sisl/_sparse.pyx":388
+ *                         r = base[i] + mult[i] * lin
+ *                         ind_n = ptr_n[r]
+ *                         if ncol[i] > 0 and nbytes > 0:             # <<<<<<<<<<<<<<
+ *                             memcpy(&d_n[ind_n, 0], &D[ptr[i], 0], ncol[i] * nbytes)
+ * 
+ */
+                __pyx_t_82 = __pyx_v_i;
+                __pyx_t_36 = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_82)) ))) > 0) != 0);
+                if (__pyx_t_36) {
+                } else {
+                  __pyx_t_14 = __pyx_t_36;
+                  goto __pyx_L49_bool_binop_done;
+                }
+                __pyx_t_36 = ((__pyx_v_nbytes > 0) != 0);
+                __pyx_t_14 = __pyx_t_36;
+                __pyx_L49_bool_binop_done:;
+                if (__pyx_t_14) {
+
+                  /* "sisl/_sparse.pyx":389
+ *                         ind_n = ptr_n[r]
+ *                         if ncol[i] > 0 and nbytes > 0:
+ *                             memcpy(&d_n[ind_n, 0], &D[ptr[i], 0], ncol[i] * nbytes)             # <<<<<<<<<<<<<<
+ * 
+ *                         for ind in range(ptr[i], ptr[i] + ncol[i]):
+ */
+                  __pyx_t_83 = __pyx_v_ind_n;
+                  __pyx_t_84 = 0;
+                  __pyx_t_85 = __pyx_v_i;
+                  __pyx_t_86 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_85)) )));
+                  __pyx_t_87 = 0;
+                  __pyx_t_88 = __pyx_v_i;
+                  (void)(memcpy((&(*((unsigned char *) ( /* dim=1 */ ((char *) (((unsigned char *) ( /* dim=0 */ (__pyx_v_d_n.data + __pyx_t_83 * __pyx_v_d_n.strides[0]) )) + __pyx_t_84)) )))), (&(*((unsigned char const  *) ( /* dim=1 */ ((char *) (((unsigned char const  *) ( /* dim=0 */ (__pyx_v_D.data + __pyx_t_86 * __pyx_v_D.strides[0]) )) + __pyx_t_87)) )))), ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_88)) ))) * __pyx_v_nbytes)));
+
+                  /* "sisl/_sparse.pyx":388
+ *                         r = base[i] + mult[i] * lin
+ *                         ind_n = ptr_n[r]
+ *                         if ncol[i] > 0 and nbytes > 0:             # <<<<<<<<<<<<<<
+ *                             memcpy(&d_n[ind_n, 0], &D[ptr[i], 0], ncol[i] * nbytes)
+ * 
+ */
+                }
+
+                /* "sisl/_sparse.pyx":391
+ *                             memcpy(&d_n[ind_n, 0], &D[ptr[i], 0], ncol[i] * nbytes)
+ * 
+ *                         for ind in range(ptr[i], ptr[i] + ncol[i]):             # <<<<<<<<<<<<<<
+ *                             j = col[ind] % n
+ *                             s = col[ind] / n
+ */
+                __pyx_t_89 = __pyx_v_i;
+                __pyx_t_90 = __pyx_v_i;
+                __pyx_t_91 = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_89)) ))) + (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ncol.data) + __pyx_t_90)) ))));
+                __pyx_t_92 = __pyx_v_i;
+                __pyx_t_93 = __pyx_t_91;
+                for (__pyx_t_94 = (*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_ptr.data) + __pyx_t_92)) ))); __pyx_t_94 < __pyx_t_93; __pyx_t_94+=1) {
+                  __pyx_v_ind = __pyx_t_94;
+
+                  /* "sisl/_sparse.pyx":392
+ * 
+ *                         for ind in range(ptr[i], ptr[i] + ncol[i]):
+ *                             j = col[ind] % n             # <<<<<<<<<<<<<<
+ *                             s = col[ind] / n
+ *                             p0 = t0 + sc_off[s, 0] + hsc
+ */
+                  __pyx_t_95 = __pyx_v_ind;
+                  __pyx_v_j = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_95)) ))) % __pyx_v_n);
+
+                  /* "sisl/_sparse.pyx":393
+ *                         for ind in range(ptr[i], ptr[i] + ncol[i]):
+ *                             j = col[ind] % n
+ *                             s = col[ind] / n             # <<<<<<<<<<<<<<
+ *                             p0 = t0 + sc_off[s, 0] + hsc
+ *                             p1 = t1 + sc_off[s, 1] + hsc
+ */
+                  __pyx_t_96 = __pyx_v_ind;
+                  __pyx_v_s = ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col.data) + __pyx_t_96)) ))) / __pyx_v_n);
+
+                  /* "sisl/_sparse.pyx":394
+ *                             j = col[ind] % n
+ *                             s = col[ind] / n
+ *                             p0 = t0 + sc_off[s, 0] + hsc             # <<<<<<<<<<<<<<
+ *                             p1 = t1 + sc_off[s, 1] + hsc
+ *                             p2 = t2 + sc_off[s, 2] + hsc
+ */
+                  __pyx_t_97 = __pyx_v_s;
+                  __pyx_t_98 = 0;
+                  __pyx_v_p0 = ((__pyx_v_t0 + (*((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_sc_off.data + __pyx_t_97 * __pyx_v_sc_off.strides[0]) )) + __pyx_t_98)) )))) + __pyx_v_hsc);
+
+                  /* "sisl/_sparse.pyx":395
+ *                             s = col[ind] / n
+ *                             p0 = t0 + sc_off[s, 0] + hsc
+ *                             p1 = t1 + sc_off[s, 1] + hsc             # <<<<<<<<<<<<<<
+ *                             p2 = t2 + sc_off[s, 2] + hsc
+ *                             col_n[ind_n] = base[j] + mult[j] * (M[0, p0] + M[1, p1] + M[2, p2]) + \
+ */
+                  __pyx_t_99 = __pyx_v_s;
+                  __pyx_t_100 = 1;
+                  __pyx_v_p1 = ((__pyx_v_t1 + (*((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_sc_off.data + __pyx_t_99 * __pyx_v_sc_off.strides[0]) )) + __pyx_t_100)) )))) + __pyx_v_hsc);
+
+                  /* "sisl/_sparse.pyx":396
+ *                             p0 = t0 + sc_off[s, 0] + hsc
+ *                             p1 = t1 + sc_off[s, 1] + hsc
+ *                             p2 = t2 + sc_off[s, 2] + hsc             # <<<<<<<<<<<<<<
+ *                             col_n[ind_n] = base[j] + mult[j] * (M[0, p0] + M[1, p1] + M[2, p2]) + \
+ *                                            isc_off[Q[0, p0], Q[1, p1], Q[2, p2]] * n_n
+ */
+                  __pyx_t_101 = __pyx_v_s;
+                  __pyx_t_102 = 2;
+                  __pyx_v_p2 = ((__pyx_v_t2 + (*((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_sc_off.data + __pyx_t_101 * __pyx_v_sc_off.strides[0]) )) + __pyx_t_102)) )))) + __pyx_v_hsc);
+
+                  /* "sisl/_sparse.pyx":397
+ *                             p1 = t1 + sc_off[s, 1] + hsc
+ *                             p2 = t2 + sc_off[s, 2] + hsc
+ *                             col_n[ind_n] = base[j] + mult[j] * (M[0, p0] + M[1, p1] + M[2, p2]) + \             # <<<<<<<<<<<<<<
+ *                                            isc_off[Q[0, p0], Q[1, p1], Q[2, p2]] * n_n
+ *                             ind_n += 1
+ */
+                  __pyx_t_103 = __pyx_v_j;
+                  __pyx_t_104 = __pyx_v_j;
+                  __pyx_t_105 = 0;
+                  __pyx_t_106 = __pyx_v_p0;
+                  __pyx_t_107 = 1;
+                  __pyx_t_108 = __pyx_v_p1;
+                  __pyx_t_109 = 2;
+                  __pyx_t_110 = __pyx_v_p2;
+
+                  /* "sisl/_sparse.pyx":398
+ *                             p2 = t2 + sc_off[s, 2] + hsc
+ *                             col_n[ind_n] = base[j] + mult[j] * (M[0, p0] + M[1, p1] + M[2, p2]) + \
+ *                                            isc_off[Q[0, p0], Q[1, p1], Q[2, p2]] * n_n             # <<<<<<<<<<<<<<
+ *                             ind_n += 1
+ * 
+ */
+                  __pyx_t_111 = 0;
+                  __pyx_t_112 = __pyx_v_p0;
+                  __pyx_t_113 = 1;
+                  __pyx_t_114 = __pyx_v_p1;
+                  __pyx_t_115 = 2;
+                  __pyx_t_116 = __pyx_v_p2;
+                  __pyx_t_117 = (*((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_Q.data + __pyx_t_111 * __pyx_v_Q.strides[0]) )) + __pyx_t_112)) )));
+                  __pyx_t_118 = (*((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_Q.data + __pyx_t_113 * __pyx_v_Q.strides[0]) )) + __pyx_t_114)) )));
+                  __pyx_t_119 = (*((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_Q.data + __pyx_t_115 * __pyx_v_Q.strides[0]) )) + __pyx_t_116)) )));
+
+                  /* "sisl/_sparse.pyx":397
+ *                             p1 = t1 + sc_off[s, 1] + hsc
+ *                             p2 = t2 + sc_off[s, 2] + hsc
+ *                             col_n[ind_n] = base[j] + mult[j] * (M[0, p0] + M[1, p1] + M[2, p2]) + \             # <<<<<<<<<<<<<<
+ *                                            isc_off[Q[0, p0], Q[1, p1], Q[2, p2]] * n_n
+ *                             ind_n += 1
+ */
+                  __pyx_t_120 = __pyx_v_ind_n;
+                  *((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_col_n.data) + __pyx_t_120)) )) = (((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_base.data) + __pyx_t_103)) ))) + ((*((int *) ( /* dim=0 */ ((char *) (((int *) __pyx_v_mult.data) + __pyx_t_104)) ))) * (((*((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_M.data + __pyx_t_105 * __pyx_v_M.strides[0]) )) + __pyx_t_106)) ))) + (*((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_M.data + __pyx_t_107 * __pyx_v_M.strides[0]) )) + __pyx_t_108)) )))) + (*((int *) ( /* dim=1 */ ((char *) (((int *) ( /* dim=0 */ (__pyx_v_M.data + __pyx_t_109 * __pyx_v_M.strides[0]) )) + __pyx_t_110)) )))))) + ((*((int *) ( /* dim=2 */ ((char *) (((int *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_isc_off.data + __pyx_t_117 * __pyx_v_isc_off.strides[0]) ) + __pyx_t_118 * __pyx_v_isc_off.strides[1]) )) + __pyx_t_119)) ))) * __pyx_v_n_n));
+
+                  /* "sisl/_sparse.pyx":399
+ *                             col_n[ind_n] = base[j] + mult[j] * (M[0, p0] + M[1, p1] + M[2, p2]) + \
+ *                                            isc_off[Q[0, p0], Q[1, p1], Q[2, p2]] * n_n
+ *                             ind_n += 1             # <<<<<<<<<<<<<<
+ * 
+ *     return PTR_n, NCOL_n, COL_n, D_n
+ */
+                  __pyx_v_ind_n = (__pyx_v_ind_n + 1);
+                }
+              }
+            }
+          }
+        }
+      }
+
+      /* "sisl/_sparse.pyx":380
+ *     cdef unsigned char[:, ::1] d_n = D_n
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(n):
+ *             for t0 in range(reps[0]):
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L39;
+        }
+        __pyx_L39:;
+      }
+  }
+
+  /* "sisl/_sparse.pyx":401
+ *                             ind_n += 1
+ * 
+ *     return PTR_n, NCOL_n, COL_n, D_n             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_24 = PyTuple_New(4); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 401, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_INCREF(((PyObject *)__pyx_v_PTR_n));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_PTR_n));
+  PyTuple_SET_ITEM(__pyx_t_24, 0, ((PyObject *)__pyx_v_PTR_n));
+  __Pyx_INCREF(((PyObject *)__pyx_v_NCOL_n));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_NCOL_n));
+  PyTuple_SET_ITEM(__pyx_t_24, 1, ((PyObject *)__pyx_v_NCOL_n));
+  __Pyx_INCREF(((PyObject *)__pyx_v_COL_n));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_COL_n));
+  PyTuple_SET_ITEM(__pyx_t_24, 2, ((PyObject *)__pyx_v_COL_n));
+  __Pyx_INCREF(((PyObject *)__pyx_v_D_n));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_D_n));
+  PyTuple_SET_ITEM(__pyx_t_24, 3, ((PyObject *)__pyx_v_D_n));
+  __pyx_r = __pyx_t_24;
+  __pyx_t_24 = 0;
+  goto __pyx_L0;
+
+  /* "sisl/_sparse.pyx":281
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def csr_tile(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *              np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *              np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_2, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_3, 1);
+  __Pyx_XDECREF(__pyx_t_20);
+  __Pyx_XDECREF(__pyx_t_21);
+  __Pyx_XDECREF(__pyx_t_22);
+  __Pyx_XDECREF(__pyx_t_23);
+  __Pyx_XDECREF(__pyx_t_24);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_72, 1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_BASE.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL_n.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_D_n.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ISC_OFF.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_MULT.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_M_.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL_n.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR_n.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_Q_.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_REPS.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_SC_OFF.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_STRIDES.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("sisl._sparse.csr_tile", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_BASE.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_COL_n.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_D_n.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_ISC_OFF.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_MULT.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_M_.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_NCOL_n.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_PTR_n.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_Q_.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_REPS.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_SC_OFF.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_STRIDES.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ptr, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ncol, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_col, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_base, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_mult, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_sc_off, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_isc_off, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_reps, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_strides, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_M_);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_M, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_Q_);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_Q, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_PTR_n);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ptr_n, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_NCOL_n);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ncol_n, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_COL_n);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_col_n, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_D_n);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_d_n, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_D, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":258
+ *         # experimental exception made for __getbuffer__ and __releasebuffer__
+ *         # -- the details of this may change.
+ *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
+ *             # This implementation of getbuffer is geared towards Cython
+ *             # requirements, and does not yet fulfill the PEP.
+ */
+
+/* Python wrapper */
+static CYTHON_UNUSED int __pyx_pw_5numpy_7ndarray_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /*proto*/
+static CYTHON_UNUSED int __pyx_pw_5numpy_7ndarray_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__getbuffer__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5numpy_7ndarray___getbuffer__(((PyArrayObject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info), ((int)__pyx_v_flags));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
+  int __pyx_v_i;
+  int __pyx_v_ndim;
+  int __pyx_v_endian_detector;
+  int __pyx_v_little_endian;
+  int __pyx_v_t;
+  char *__pyx_v_f;
+  PyArray_Descr *__pyx_v_descr = 0;
+  int __pyx_v_offset;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyArray_Descr *__pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  char *__pyx_t_9;
+  if (__pyx_v_info == NULL) {
+    PyErr_SetString(PyExc_BufferError, "PyObject_GetBuffer: view==NULL argument is obsolete");
+    return -1;
+  }
+  __Pyx_RefNannySetupContext("__getbuffer__", 0);
+  __pyx_v_info->obj = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(__pyx_v_info->obj);
+
+  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":265
+ * 
+ *             cdef int i, ndim
+ *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
+ *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
+ * 
+ */
+  __pyx_v_endian_detector = 1;
+
+  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":266
+ *             cdef int i, ndim
+ *             cdef int endian_detector = 1
+ *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
+ * 
+ *             ndim = PyArray_NDIM(self)
+ */
+  __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
+
+  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":268
+ *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
+ * 
+ *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ */
+  __pyx_v_ndim = PyArray_NDIM(__pyx_v_self);
+
+  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":270
+ *             ndim = PyArray_NDIM(self)
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ */
+  __pyx_t_2 = (((__pyx_v_flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":271
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ */
+  __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_ARRAY_C_CONTIGUOUS) != 0)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":270
+ *             ndim = PyArray_NDIM(self)
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ */
+  if (unlikely(__pyx_t_1)) {
+
+    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":272
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 272, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(1, 272, __pyx_L1_error)
+
+    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":270
+ *             ndim = PyArray_NDIM(self)
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ */
+  }
+
+  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":274
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ */
+  __pyx_t_2 = (((__pyx_v_flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L7_bool_binop_done;
+  }
+
+  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":275
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ * 
+ */
+  __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_ARRAY_F_CONTIGUOUS) != 0)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L7_bool_binop_done:;
+
+  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":274
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ */
+  if (unlikely(__pyx_t_1)) {
+
+    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":276
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
+ * 
+ *             info.buf = PyArray_DATA(self)
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 276, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(1, 276, __pyx_L1_error)
+
+    /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":274
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ */
+  }
+
+  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":278
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ * 
+ *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
+ *             info.ndim = ndim
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ */
+  __pyx_v_info->buf = PyArray_DATA(__pyx_v_self);
+
+  /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":279
  * 
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim             # <<<<<<<<<<<<<<
@@ -5828,7 +8646,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 306, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 306, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -6708,7 +9526,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 856, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 856, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -6776,7 +9594,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  *             # One could encode it in the format string and have Cython
  *             # complain instead, BUT: < and > in format strings also imply
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 860, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 860, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -6885,7 +9703,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 880, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 880, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_Raise(__pyx_t_4, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -7513,7 +10331,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
  * 
  * cdef inline int import_umath() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1038, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1038, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -7642,7 +10460,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
  * 
  * cdef inline int import_ufunc() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1044, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1044, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -7768,7 +10586,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1050, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1050, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -8012,7 +10830,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  *         if itemsize <= 0:
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 133, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 133, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -8044,7 +10862,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  *         if not isinstance(format, bytes):
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 136, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 136, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -8171,7 +10989,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  * 
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 148, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 148, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -8445,7 +11263,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  *             if self.dtype_is_object:
  */
-      __pyx_t_10 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_10)) __PYX_ERR(2, 176, __pyx_L1_error)
+      __pyx_t_10 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_10)) __PYX_ERR(2, 176, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_10);
       __Pyx_Raise(__pyx_t_10, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
@@ -8686,7 +11504,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array_2__getbuffer__(stru
  *         info.buf = self.data
  *         info.len = self.len
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 192, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 192, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -9402,7 +12220,7 @@ static PyObject *__pyx_pf___pyx_array___reduce_cython__(CYTHON_UNUSED struct __p
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -9455,7 +12273,7 @@ static PyObject *__pyx_pf___pyx_array_2__setstate_cython__(CYTHON_UNUSED struct
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -11099,7 +13917,7 @@ static int __pyx_memoryview___pyx_pf_15View_dot_MemoryView_10memoryview_6__setit
  * 
  *         have_slices, index = _unellipsify(index, self.view.ndim)
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 414, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 414, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -12126,7 +14944,7 @@ static PyObject *__pyx_memoryview_convert_item_to_object(struct __pyx_memoryview
  *         else:
  *             if len(self.view.format) == 1:
  */
-      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(2, 491, __pyx_L5_except_error)
+      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(2, 491, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_Raise(__pyx_t_6, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
@@ -12482,7 +15300,7 @@ static int __pyx_memoryview___pyx_pf_15View_dot_MemoryView_10memoryview_8__getbu
  * 
  *         if flags & PyBUF_ND:
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 516, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 516, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -13022,7 +15840,7 @@ static PyObject *__pyx_pf_15View_dot_MemoryView_10memoryview_7strides___get__(st
  * 
  *         return tuple([stride for stride in self.view.strides[:self.view.ndim]])
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 566, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__22, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 566, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -13136,7 +15954,7 @@ static PyObject *__pyx_pf_15View_dot_MemoryView_10memoryview_10suboffsets___get_
     __Pyx_XDECREF(__pyx_r);
     __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->view.ndim); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 573, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyNumber_Multiply(__pyx_tuple__22, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 573, __pyx_L1_error)
+    __pyx_t_3 = PyNumber_Multiply(__pyx_tuple__23, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 573, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_r = __pyx_t_3;
@@ -14137,7 +16955,7 @@ static PyObject *__pyx_pf___pyx_memoryview___reduce_cython__(CYTHON_UNUSED struc
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__23, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__24, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -14190,7 +17008,7 @@ static PyObject *__pyx_pf___pyx_memoryview_2__setstate_cython__(CYTHON_UNUSED st
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__24, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__25, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -14541,9 +17359,9 @@ static PyObject *_unellipsify(PyObject *__pyx_v_index, int __pyx_v_ndim) {
         __Pyx_GOTREF(__pyx_t_7);
         { Py_ssize_t __pyx_temp;
           for (__pyx_temp=0; __pyx_temp < ((__pyx_v_ndim - __pyx_t_8) + 1); __pyx_temp++) {
-            __Pyx_INCREF(__pyx_slice__25);
-            __Pyx_GIVEREF(__pyx_slice__25);
-            PyList_SET_ITEM(__pyx_t_7, __pyx_temp, __pyx_slice__25);
+            __Pyx_INCREF(__pyx_slice__26);
+            __Pyx_GIVEREF(__pyx_slice__26);
+            PyList_SET_ITEM(__pyx_t_7, __pyx_temp, __pyx_slice__26);
           }
         }
         __pyx_t_9 = __Pyx_PyList_Extend(__pyx_v_result, __pyx_t_7); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(2, 678, __pyx_L1_error)
@@ -14576,7 +17394,7 @@ static PyObject *_unellipsify(PyObject *__pyx_v_index, int __pyx_v_ndim) {
  *         else:
  */
       /*else*/ {
-        __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_result, __pyx_slice__25); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(2, 681, __pyx_L1_error)
+        __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_result, __pyx_slice__26); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(2, 681, __pyx_L1_error)
       }
       __pyx_L7:;
 
@@ -14716,9 +17534,9 @@ static PyObject *_unellipsify(PyObject *__pyx_v_index, int __pyx_v_ndim) {
     __Pyx_GOTREF(__pyx_t_3);
     { Py_ssize_t __pyx_temp;
       for (__pyx_temp=0; __pyx_temp < __pyx_v_nslices; __pyx_temp++) {
-        __Pyx_INCREF(__pyx_slice__25);
-        __Pyx_GIVEREF(__pyx_slice__25);
-        PyList_SET_ITEM(__pyx_t_3, __pyx_temp, __pyx_slice__25);
+        __Pyx_INCREF(__pyx_slice__26);
+        __Pyx_GIVEREF(__pyx_slice__26);
+        PyList_SET_ITEM(__pyx_t_3, __pyx_temp, __pyx_slice__26);
       }
     }
     __pyx_t_9 = __Pyx_PyList_Extend(__pyx_v_result, __pyx_t_3); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(2, 692, __pyx_L1_error)
@@ -14842,7 +17660,7 @@ static PyObject *assert_direct_dimensions(Py_ssize_t *__pyx_v_suboffsets, int __
  * 
  * 
  */
-      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__26, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 699, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__27, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 699, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_Raise(__pyx_t_5, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -17005,7 +19823,7 @@ static PyObject *__pyx_pf___pyx_memoryviewslice___reduce_cython__(CYTHON_UNUSED
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__27, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__28, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -17058,7 +19876,7 @@ static PyObject *__pyx_pf___pyx_memoryviewslice_2__setstate_cython__(CYTHON_UNUS
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__28, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__29, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -21307,12 +24125,18 @@ static struct PyModuleDef __pyx_moduledef = {
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_ASCII, __pyx_k_ASCII, sizeof(__pyx_k_ASCII), 0, 0, 1, 1},
+  {&__pyx_n_s_BASE, __pyx_k_BASE, sizeof(__pyx_k_BASE), 0, 0, 1, 1},
   {&__pyx_kp_s_Buffer_view_does_not_expose_stri, __pyx_k_Buffer_view_does_not_expose_stri, sizeof(__pyx_k_Buffer_view_does_not_expose_stri), 0, 0, 1, 0},
   {&__pyx_n_s_COL, __pyx_k_COL, sizeof(__pyx_k_COL), 0, 0, 1, 1},
+  {&__pyx_n_s_COL_A, __pyx_k_COL_A, sizeof(__pyx_k_COL_A), 0, 0, 1, 1},
+  {&__pyx_n_s_COL_B, __pyx_k_COL_B, sizeof(__pyx_k_COL_B), 0, 0, 1, 1},
+  {&__pyx_n_s_COL_n, __pyx_k_COL_n, sizeof(__pyx_k_COL_n), 0, 0, 1, 1},
   {&__pyx_kp_s_Can_only_create_a_buffer_that_is, __pyx_k_Can_only_create_a_buffer_that_is, sizeof(__pyx_k_Can_only_create_a_buffer_that_is), 0, 0, 1, 0},
   {&__pyx_kp_s_Cannot_assign_to_read_only_memor, __pyx_k_Cannot_assign_to_read_only_memor, sizeof(__pyx_k_Cannot_assign_to_read_only_memor), 0, 0, 1, 0},
   {&__pyx_kp_s_Cannot_create_writable_memory_vi, __pyx_k_Cannot_create_writable_memory_vi, sizeof(__pyx_k_Cannot_create_writable_memory_vi), 0, 0, 1, 0},
   {&__pyx_kp_s_Cannot_index_with_type_s, __pyx_k_Cannot_index_with_type_s, sizeof(__pyx_k_Cannot_index_with_type_s), 0, 0, 1, 0},
+  {&__pyx_n_s_D, __pyx_k_D, sizeof(__pyx_k_D), 0, 0, 1, 1},
+  {&__pyx_n_s_D_n, __pyx_k_D_n, sizeof(__pyx_k_D_n), 0, 0, 1, 1},
   {&__pyx_n_s_Ellipsis, __pyx_k_Ellipsis, sizeof(__pyx_k_Ellipsis), 0, 0, 1, 1},
   {&__pyx_kp_s_Empty_shape_tuple_for_cython_arr, __pyx_k_Empty_shape_tuple_for_cython_arr, sizeof(__pyx_k_Empty_shape_tuple_for_cython_arr), 0, 0, 1, 0},
   {&__pyx_n_s_FOLD_col, __pyx_k_FOLD_col, sizeof(__pyx_k_FOLD_col), 0, 0, 1, 1},
@@ -21320,26 +24144,43 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_FOLD_ptr, __pyx_k_FOLD_ptr, sizeof(__pyx_k_FOLD_ptr), 0, 0, 1, 1},
   {&__pyx_kp_u_Format_string_allocated_too_shor, __pyx_k_Format_string_allocated_too_shor, sizeof(__pyx_k_Format_string_allocated_too_shor), 0, 1, 0, 0},
   {&__pyx_kp_u_Format_string_allocated_too_shor_2, __pyx_k_Format_string_allocated_too_shor_2, sizeof(__pyx_k_Format_string_allocated_too_shor_2), 0, 1, 0, 0},
+  {&__pyx_n_s_IDX, __pyx_k_IDX, sizeof(__pyx_k_IDX), 0, 0, 1, 1},
+  {&__pyx_n_s_ISC_OFF, __pyx_k_ISC_OFF, sizeof(__pyx_k_ISC_OFF), 0, 0, 1, 1},
   {&__pyx_n_s_ImportError, __pyx_k_ImportError, sizeof(__pyx_k_ImportError), 0, 0, 1, 1},
   {&__pyx_kp_s_Incompatible_checksums_s_vs_0xb0, __pyx_k_Incompatible_checksums_s_vs_0xb0, sizeof(__pyx_k_Incompatible_checksums_s_vs_0xb0), 0, 0, 1, 0},
   {&__pyx_n_s_IndexError, __pyx_k_IndexError, sizeof(__pyx_k_IndexError), 0, 0, 1, 1},
   {&__pyx_kp_s_Indirect_dimensions_not_supporte, __pyx_k_Indirect_dimensions_not_supporte, sizeof(__pyx_k_Indirect_dimensions_not_supporte), 0, 0, 1, 0},
   {&__pyx_kp_s_Invalid_mode_expected_c_or_fortr, __pyx_k_Invalid_mode_expected_c_or_fortr, sizeof(__pyx_k_Invalid_mode_expected_c_or_fortr), 0, 0, 1, 0},
   {&__pyx_kp_s_Invalid_shape_in_axis_d_d, __pyx_k_Invalid_shape_in_axis_d_d, sizeof(__pyx_k_Invalid_shape_in_axis_d_d), 0, 0, 1, 0},
+  {&__pyx_n_s_M, __pyx_k_M, sizeof(__pyx_k_M), 0, 0, 1, 1},
+  {&__pyx_n_s_MULT, __pyx_k_MULT, sizeof(__pyx_k_MULT), 0, 0, 1, 1},
+  {&__pyx_n_s_M_2, __pyx_k_M_2, sizeof(__pyx_k_M_2), 0, 0, 1, 1},
   {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
   {&__pyx_kp_s_MemoryView_of_r_at_0x_x, __pyx_k_MemoryView_of_r_at_0x_x, sizeof(__pyx_k_MemoryView_of_r_at_0x_x), 0, 0, 1, 0},
   {&__pyx_kp_s_MemoryView_of_r_object, __pyx_k_MemoryView_of_r_object, sizeof(__pyx_k_MemoryView_of_r_object), 0, 0, 1, 0},
   {&__pyx_n_s_NCOL, __pyx_k_NCOL, sizeof(__pyx_k_NCOL), 0, 0, 1, 1},
+  {&__pyx_n_s_NCOL_A, __pyx_k_NCOL_A, sizeof(__pyx_k_NCOL_A), 0, 0, 1, 1},
+  {&__pyx_n_s_NCOL_B, __pyx_k_NCOL_B, sizeof(__pyx_k_NCOL_B), 0, 0, 1, 1},
+  {&__pyx_n_s_NCOL_n, __pyx_k_NCOL_n, sizeof(__pyx_k_NCOL_n), 0, 0, 1, 1},
   {&__pyx_kp_u_Non_native_byte_order_not_suppor, __pyx_k_Non_native_byte_order_not_suppor, sizeof(__pyx_k_Non_native_byte_order_not_suppor), 0, 1, 0, 0},
   {&__pyx_n_b_O, __pyx_k_O, sizeof(__pyx_k_O), 0, 0, 0, 1},
   {&__pyx_kp_s_Out_of_bounds_on_buffer_access_a, __pyx_k_Out_of_bounds_on_buffer_access_a, sizeof(__pyx_k_Out_of_bounds_on_buffer_access_a), 0, 0, 1, 0},
   {&__pyx_n_s_PTR, __pyx_k_PTR, sizeof(__pyx_k_PTR), 0, 0, 1, 1},
+  {&__pyx_n_s_PTR_A, __pyx_k_PTR_A, sizeof(__pyx_k_PTR_A), 0, 0, 1, 1},
+  {&__pyx_n_s_PTR_B, __pyx_k_PTR_B, sizeof(__pyx_k_PTR_B), 0, 0, 1, 1},
+  {&__pyx_n_s_PTR_n, __pyx_k_PTR_n, sizeof(__pyx_k_PTR_n), 0, 0, 1, 1},
   {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_Q, __pyx_k_Q, sizeof(__pyx_k_Q), 0, 0, 1, 1},
+  {&__pyx_n_s_Q_2, __pyx_k_Q_2, sizeof(__pyx_k_Q_2), 0, 0, 1, 1},
+  {&__pyx_n_s_REPS, __pyx_k_REPS, sizeof(__pyx_k_REPS), 0, 0, 1, 1},
   {&__pyx_n_s_RuntimeError, __pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 0, 0, 1, 1},
+  {&__pyx_n_s_SC_OFF, __pyx_k_SC_OFF, sizeof(__pyx_k_SC_OFF), 0, 0, 1, 1},
+  {&__pyx_n_s_STRIDES, __pyx_k_STRIDES, sizeof(__pyx_k_STRIDES), 0, 0, 1, 1},
   {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
   {&__pyx_kp_s_Unable_to_convert_item_to_object, __pyx_k_Unable_to_convert_item_to_object, sizeof(__pyx_k_Unable_to_convert_item_to_object), 0, 0, 1, 0},
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
   {&__pyx_n_s_View_MemoryView, __pyx_k_View_MemoryView, sizeof(__pyx_k_View_MemoryView), 0, 0, 1, 1},
+  {&__pyx_n_s_WORK, __pyx_k_WORK, sizeof(__pyx_k_WORK), 0, 0, 1, 1},
   {&__pyx_n_s_allocate_buffer, __pyx_k_allocate_buffer, sizeof(__pyx_k_allocate_buffer), 0, 0, 1, 1},
   {&__pyx_n_s_base, __pyx_k_base, sizeof(__pyx_k_base), 0, 0, 1, 1},
   {&__pyx_n_s_c, __pyx_k_c, sizeof(__pyx_k_c), 0, 0, 1, 1},
@@ -21347,9 +24188,16 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_class, __pyx_k_class, sizeof(__pyx_k_class), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
   {&__pyx_n_s_col, __pyx_k_col, sizeof(__pyx_k_col), 0, 0, 1, 1},
+  {&__pyx_n_s_col_a, __pyx_k_col_a, sizeof(__pyx_k_col_a), 0, 0, 1, 1},
+  {&__pyx_n_s_col_b, __pyx_k_col_b, sizeof(__pyx_k_col_b), 0, 0, 1, 1},
+  {&__pyx_n_s_col_n, __pyx_k_col_n, sizeof(__pyx_k_col_n), 0, 0, 1, 1},
   {&__pyx_kp_s_contiguous_and_direct, __pyx_k_contiguous_and_direct, sizeof(__pyx_k_contiguous_and_direct), 0, 0, 1, 0},
   {&__pyx_kp_s_contiguous_and_indirect, __pyx_k_contiguous_and_indirect, sizeof(__pyx_k_contiguous_and_indirect), 0, 0, 1, 0},
   {&__pyx_n_s_copy, __pyx_k_copy, sizeof(__pyx_k_copy), 0, 0, 1, 1},
+  {&__pyx_n_s_csr_index_map, __pyx_k_csr_index_map, sizeof(__pyx_k_csr_index_map), 0, 0, 1, 1},
+  {&__pyx_n_s_csr_tile, __pyx_k_csr_tile, sizeof(__pyx_k_csr_tile), 0, 0, 1, 1},
+  {&__pyx_kp_s_csr_tile_requesting_a_non_existi, __pyx_k_csr_tile_requesting_a_non_existi, sizeof(__pyx_k_csr_tile_requesting_a_non_existi), 0, 0, 1, 0},
+  {&__pyx_n_s_d_n, __pyx_k_d_n, sizeof(__pyx_k_d_n), 0, 0, 1, 1},
   {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
   {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
   {&__pyx_n_s_dtype_is_object, __pyx_k_dtype_is_object, sizeof(__pyx_k_dtype_is_object), 0, 0, 1, 1},
@@ -21367,35 +24215,58 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
   {&__pyx_n_s_fortran, __pyx_k_fortran, sizeof(__pyx_k_fortran), 0, 0, 1, 1},
   {&__pyx_n_u_fortran, __pyx_k_fortran, sizeof(__pyx_k_fortran), 0, 1, 0, 1},
+  {&__pyx_n_s_full, __pyx_k_full, sizeof(__pyx_k_full), 0, 0, 1, 1},
   {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
   {&__pyx_kp_s_got_differing_extents_in_dimensi, __pyx_k_got_differing_extents_in_dimensi, sizeof(__pyx_k_got_differing_extents_in_dimensi), 0, 0, 1, 0},
+  {&__pyx_n_s_hsc, __pyx_k_hsc, sizeof(__pyx_k_hsc), 0, 0, 1, 1},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
   {&__pyx_n_s_id, __pyx_k_id, sizeof(__pyx_k_id), 0, 0, 1, 1},
+  {&__pyx_n_s_idx, __pyx_k_idx, sizeof(__pyx_k_idx), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
   {&__pyx_n_s_ind, __pyx_k_ind, sizeof(__pyx_k_ind), 0, 0, 1, 1},
+  {&__pyx_n_s_ind_n, __pyx_k_ind_n, sizeof(__pyx_k_ind_n), 0, 0, 1, 1},
   {&__pyx_n_s_int32, __pyx_k_int32, sizeof(__pyx_k_int32), 0, 0, 1, 1},
+  {&__pyx_n_s_isc_off, __pyx_k_isc_off, sizeof(__pyx_k_isc_off), 0, 0, 1, 1},
   {&__pyx_n_s_itemsize, __pyx_k_itemsize, sizeof(__pyx_k_itemsize), 0, 0, 1, 1},
   {&__pyx_kp_s_itemsize_0_for_cython_array, __pyx_k_itemsize_0_for_cython_array, sizeof(__pyx_k_itemsize_0_for_cython_array), 0, 0, 1, 0},
+  {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
+  {&__pyx_n_s_lin, __pyx_k_lin, sizeof(__pyx_k_lin), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
   {&__pyx_n_s_memview, __pyx_k_memview, sizeof(__pyx_k_memview), 0, 0, 1, 1},
   {&__pyx_n_s_mode, __pyx_k_mode, sizeof(__pyx_k_mode), 0, 0, 1, 1},
+  {&__pyx_n_s_mult, __pyx_k_mult, sizeof(__pyx_k_mult), 0, 0, 1, 1},
+  {&__pyx_n_s_n, __pyx_k_n, sizeof(__pyx_k_n), 0, 0, 1, 1},
+  {&__pyx_n_s_n_n, __pyx_k_n_n, sizeof(__pyx_k_n_n), 0, 0, 1, 1},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_name_2, __pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 0, 1, 1},
+  {&__pyx_n_s_nbytes, __pyx_k_nbytes, sizeof(__pyx_k_nbytes), 0, 0, 1, 1},
+  {&__pyx_n_s_nc, __pyx_k_nc, sizeof(__pyx_k_nc), 0, 0, 1, 1},
   {&__pyx_n_s_ncol, __pyx_k_ncol, sizeof(__pyx_k_ncol), 0, 0, 1, 1},
+  {&__pyx_n_s_ncol_a, __pyx_k_ncol_a, sizeof(__pyx_k_ncol_a), 0, 0, 1, 1},
+  {&__pyx_n_s_ncol_b, __pyx_k_ncol_b, sizeof(__pyx_k_ncol_b), 0, 0, 1, 1},
+  {&__pyx_n_s_ncol_n, __pyx_k_ncol_n, sizeof(__pyx_k_ncol_n), 0, 0, 1, 1},
   {&__pyx_kp_u_ndarray_is_not_C_contiguous, __pyx_k_ndarray_is_not_C_contiguous, sizeof(__pyx_k_ndarray_is_not_C_contiguous), 0, 1, 0, 0},
   {&__pyx_kp_u_ndarray_is_not_Fortran_contiguou, __pyx_k_ndarray_is_not_Fortran_contiguou, sizeof(__pyx_k_ndarray_is_not_Fortran_contiguou), 0, 1, 0, 0},
   {&__pyx_n_s_ndim, __pyx_k_ndim, sizeof(__pyx_k_ndim), 0, 0, 1, 1},
   {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
   {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
   {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
+  {&__pyx_n_s_np_max, __pyx_k_np_max, sizeof(__pyx_k_np_max), 0, 0, 1, 1},
   {&__pyx_n_s_nr, __pyx_k_nr, sizeof(__pyx_k_nr), 0, 0, 1, 1},
   {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
   {&__pyx_kp_s_numpy_core_multiarray_failed_to, __pyx_k_numpy_core_multiarray_failed_to, sizeof(__pyx_k_numpy_core_multiarray_failed_to), 0, 0, 1, 0},
   {&__pyx_kp_s_numpy_core_umath_failed_to_impor, __pyx_k_numpy_core_umath_failed_to_impor, sizeof(__pyx_k_numpy_core_umath_failed_to_impor), 0, 0, 1, 0},
   {&__pyx_n_s_nz, __pyx_k_nz, sizeof(__pyx_k_nz), 0, 0, 1, 1},
   {&__pyx_n_s_obj, __pyx_k_obj, sizeof(__pyx_k_obj), 0, 0, 1, 1},
+  {&__pyx_n_s_p0, __pyx_k_p0, sizeof(__pyx_k_p0), 0, 0, 1, 1},
+  {&__pyx_n_s_p1, __pyx_k_p1, sizeof(__pyx_k_p1), 0, 0, 1, 1},
+  {&__pyx_n_s_p2, __pyx_k_p2, sizeof(__pyx_k_p2), 0, 0, 1, 1},
   {&__pyx_n_s_pack, __pyx_k_pack, sizeof(__pyx_k_pack), 0, 0, 1, 1},
   {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
   {&__pyx_n_s_ptr, __pyx_k_ptr, sizeof(__pyx_k_ptr), 0, 0, 1, 1},
+  {&__pyx_n_s_ptr_a, __pyx_k_ptr_a, sizeof(__pyx_k_ptr_a), 0, 0, 1, 1},
+  {&__pyx_n_s_ptr_b, __pyx_k_ptr_b, sizeof(__pyx_k_ptr_b), 0, 0, 1, 1},
+  {&__pyx_n_s_ptr_n, __pyx_k_ptr_n, sizeof(__pyx_k_ptr_n), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_getbuffer, __pyx_k_pyx_getbuffer, sizeof(__pyx_k_pyx_getbuffer), 0, 0, 1, 1},
@@ -21409,7 +24280,10 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_reps, __pyx_k_reps, sizeof(__pyx_k_reps), 0, 0, 1, 1},
   {&__pyx_n_s_rr, __pyx_k_rr, sizeof(__pyx_k_rr), 0, 0, 1, 1},
+  {&__pyx_n_s_s, __pyx_k_s, sizeof(__pyx_k_s), 0, 0, 1, 1},
+  {&__pyx_n_s_sc_off, __pyx_k_sc_off, sizeof(__pyx_k_sc_off), 0, 0, 1, 1},
   {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
   {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
   {&__pyx_n_s_shape, __pyx_k_shape, sizeof(__pyx_k_shape), 0, 0, 1, 1},
@@ -21426,20 +24300,26 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_strided_and_direct, __pyx_k_strided_and_direct, sizeof(__pyx_k_strided_and_direct), 0, 0, 1, 0},
   {&__pyx_kp_s_strided_and_direct_or_indirect, __pyx_k_strided_and_direct_or_indirect, sizeof(__pyx_k_strided_and_direct_or_indirect), 0, 0, 1, 0},
   {&__pyx_kp_s_strided_and_indirect, __pyx_k_strided_and_indirect, sizeof(__pyx_k_strided_and_indirect), 0, 0, 1, 0},
+  {&__pyx_n_s_strides, __pyx_k_strides, sizeof(__pyx_k_strides), 0, 0, 1, 1},
   {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
   {&__pyx_n_s_struct, __pyx_k_struct, sizeof(__pyx_k_struct), 0, 0, 1, 1},
+  {&__pyx_n_s_t0, __pyx_k_t0, sizeof(__pyx_k_t0), 0, 0, 1, 1},
+  {&__pyx_n_s_t1, __pyx_k_t1, sizeof(__pyx_k_t1), 0, 0, 1, 1},
+  {&__pyx_n_s_t2, __pyx_k_t2, sizeof(__pyx_k_t2), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_tmp, __pyx_k_tmp, sizeof(__pyx_k_tmp), 0, 0, 1, 1},
+  {&__pyx_n_s_uint8, __pyx_k_uint8, sizeof(__pyx_k_uint8), 0, 0, 1, 1},
   {&__pyx_kp_s_unable_to_allocate_array_data, __pyx_k_unable_to_allocate_array_data, sizeof(__pyx_k_unable_to_allocate_array_data), 0, 0, 1, 0},
   {&__pyx_kp_s_unable_to_allocate_shape_and_str, __pyx_k_unable_to_allocate_shape_and_str, sizeof(__pyx_k_unable_to_allocate_shape_and_str), 0, 0, 1, 0},
   {&__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_k_unknown_dtype_code_in_numpy_pxd, sizeof(__pyx_k_unknown_dtype_code_in_numpy_pxd), 0, 1, 0, 0},
   {&__pyx_n_s_unpack, __pyx_k_unpack, sizeof(__pyx_k_unpack), 0, 0, 1, 1},
   {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+  {&__pyx_n_s_work, __pyx_k_work, sizeof(__pyx_k_work), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 20, __pyx_L1_error)
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 74, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 21, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 75, __pyx_L1_error)
   __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(1, 856, __pyx_L1_error)
   __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(1, 1038, __pyx_L1_error)
   __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(2, 148, __pyx_L1_error)
@@ -21457,39 +24337,50 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "sisl/_sparse.pyx":74
+  /* "sisl/_sparse.pyx":75
  * 
  *     if nz > fold_col.shape[0]:
  *         raise ValueError('something went wrong')             # <<<<<<<<<<<<<<
  * 
  *     # Return objects
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_something_went_wrong); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_something_went_wrong); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 75, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
-  /* "sisl/_sparse.pyx":143
+  /* "sisl/_sparse.pyx":144
  * 
  *     if nz > fold_col.shape[0]:
  *         raise ValueError('something went wrong NC')             # <<<<<<<<<<<<<<
  * 
  *     # Return objects
  */
-  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_something_went_wrong_NC); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 143, __pyx_L1_error)
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_something_went_wrong_NC); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 144, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "sisl/_sparse.pyx":210
+  /* "sisl/_sparse.pyx":211
  * 
  *     if nz > fold_col.shape[0]:
  *         raise ValueError('something went wrong overlap NC')             # <<<<<<<<<<<<<<
  * 
  *     # Return objects
  */
-  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_something_went_wrong_overlap_NC); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_something_went_wrong_overlap_NC); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 211, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
 
+  /* "sisl/_sparse.pyx":356
+ *             for t0 in range(reps[i]):
+ *                 if Q[i, t0 + sc_off[s, i] + hsc] < 0:
+ *                     raise ValueError('csr_tile requesting a non-existing supercell index')             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.ndarray[np.int32_t, ndim=1, mode='c'] PTR_n = np.empty([n_n + 1], dtype=np.int32)
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_csr_tile_requesting_a_non_existi); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 356, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
   /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":272
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
@@ -21497,9 +24388,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 272, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
 
   /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":276
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
@@ -21508,9 +24399,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *             info.buf = PyArray_DATA(self)
  */
-  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 276, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
 
   /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":306
  *                 if ((descr.byteorder == c'>' and little_endian) or
@@ -21519,9 +24410,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 306, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__6);
-  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 306, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
 
   /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":856
  * 
@@ -21530,9 +24421,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 856, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 856, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
 
   /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":880
  *             t = child.type_num
@@ -21541,9 +24432,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 880, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__8);
-  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 880, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
 
   /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1038
  *         _import_array()
@@ -21552,9 +24443,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * cdef inline int import_umath() except -1:
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 1038, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 1038, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
 
   /* "../../../../opt/python/3.7.2/packages/cython/0.29.2/gnu-8.2.0/lib/python3.7/site-packages/Cython-0.29.2-py3.7-linux-x86_64.egg/Cython/Includes/numpy/__init__.pxd":1044
  *         _import_umath()
@@ -21563,9 +24454,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * cdef inline int import_ufunc() except -1:
  */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 1044, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__10);
-  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 1044, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
 
   /* "View.MemoryView":133
  * 
@@ -21574,9 +24465,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         if itemsize <= 0:
  */
-  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_Empty_shape_tuple_for_cython_arr); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(2, 133, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_Empty_shape_tuple_for_cython_arr); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(2, 133, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
 
   /* "View.MemoryView":136
  * 
@@ -21585,9 +24476,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         if not isinstance(format, bytes):
  */
-  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_itemsize_0_for_cython_array); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(2, 136, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_itemsize_0_for_cython_array); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(2, 136, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
 
   /* "View.MemoryView":148
  * 
@@ -21596,9 +24487,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_shape_and_str); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(2, 148, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__13);
-  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_shape_and_str); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(2, 148, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
 
   /* "View.MemoryView":176
  *             self.data = <char *>malloc(self.len)
@@ -21607,9 +24498,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *             if self.dtype_is_object:
  */
-  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_array_data); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(2, 176, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_array_data); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(2, 176, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
 
   /* "View.MemoryView":192
  *             bufmode = PyBUF_F_CONTIGUOUS | PyBUF_ANY_CONTIGUOUS
@@ -21618,9 +24509,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         info.buf = self.data
  *         info.len = self.len
  */
-  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_Can_only_create_a_buffer_that_is); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(2, 192, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_Can_only_create_a_buffer_that_is); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(2, 192, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
 
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
@@ -21628,18 +24519,18 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(2, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(2, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
 
   /* "(tree fragment)":4
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(2, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__17);
-  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
 
   /* "View.MemoryView":414
  *     def __setitem__(memoryview self, object index, object value):
@@ -21648,9 +24539,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         have_slices, index = _unellipsify(index, self.view.ndim)
  */
-  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_kp_s_Cannot_assign_to_read_only_memor); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(2, 414, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_s_Cannot_assign_to_read_only_memor); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(2, 414, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
 
   /* "View.MemoryView":491
  *             result = struct.unpack(self.view.format, bytesitem)
@@ -21659,9 +24550,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         else:
  *             if len(self.view.format) == 1:
  */
-  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_convert_item_to_object); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(2, 491, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__19);
-  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_convert_item_to_object); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(2, 491, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
 
   /* "View.MemoryView":516
  *     def __getbuffer__(self, Py_buffer *info, int flags):
@@ -21670,9 +24561,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         if flags & PyBUF_ND:
  */
-  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_s_Cannot_create_writable_memory_vi); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(2, 516, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
+  __pyx_tuple__21 = PyTuple_Pack(1, __pyx_kp_s_Cannot_create_writable_memory_vi); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(2, 516, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
 
   /* "View.MemoryView":566
  *         if self.view.strides == NULL:
@@ -21681,9 +24572,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         return tuple([stride for stride in self.view.strides[:self.view.ndim]])
  */
-  __pyx_tuple__21 = PyTuple_Pack(1, __pyx_kp_s_Buffer_view_does_not_expose_stri); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(2, 566, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__21);
-  __Pyx_GIVEREF(__pyx_tuple__21);
+  __pyx_tuple__22 = PyTuple_Pack(1, __pyx_kp_s_Buffer_view_does_not_expose_stri); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(2, 566, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
 
   /* "View.MemoryView":573
  *     def suboffsets(self):
@@ -21692,12 +24583,12 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  *         return tuple([suboffset for suboffset in self.view.suboffsets[:self.view.ndim]])
  */
-  __pyx_tuple__22 = PyTuple_New(1); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(2, 573, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__22);
+  __pyx_tuple__23 = PyTuple_New(1); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(2, 573, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
   __Pyx_INCREF(__pyx_int_neg_1);
   __Pyx_GIVEREF(__pyx_int_neg_1);
-  PyTuple_SET_ITEM(__pyx_tuple__22, 0, __pyx_int_neg_1);
-  __Pyx_GIVEREF(__pyx_tuple__22);
+  PyTuple_SET_ITEM(__pyx_tuple__23, 0, __pyx_int_neg_1);
+  __Pyx_GIVEREF(__pyx_tuple__23);
 
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
@@ -21705,18 +24596,18 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple__23 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(2, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__23);
-  __Pyx_GIVEREF(__pyx_tuple__23);
+  __pyx_tuple__24 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(2, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
 
   /* "(tree fragment)":4
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__24 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(2, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__24);
-  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_tuple__25 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
 
   /* "View.MemoryView":678
  *         if item is Ellipsis:
@@ -21725,9 +24616,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *                 seen_ellipsis = True
  *             else:
  */
-  __pyx_slice__25 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__25)) __PYX_ERR(2, 678, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_slice__25);
-  __Pyx_GIVEREF(__pyx_slice__25);
+  __pyx_slice__26 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__26)) __PYX_ERR(2, 678, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__26);
+  __Pyx_GIVEREF(__pyx_slice__26);
 
   /* "View.MemoryView":699
  *     for suboffset in suboffsets[:ndim]:
@@ -21736,9 +24627,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__26 = PyTuple_Pack(1, __pyx_kp_s_Indirect_dimensions_not_supporte); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(2, 699, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__26);
-  __Pyx_GIVEREF(__pyx_tuple__26);
+  __pyx_tuple__27 = PyTuple_Pack(1, __pyx_kp_s_Indirect_dimensions_not_supporte); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(2, 699, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
 
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
@@ -21746,54 +24637,78 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple__27 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(2, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__27);
-  __Pyx_GIVEREF(__pyx_tuple__27);
+  __pyx_tuple__28 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(2, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
 
   /* "(tree fragment)":4
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__28 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(2, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__28);
-  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_tuple__29 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
 
-  /* "sisl/_sparse.pyx":29
+  /* "sisl/_sparse.pyx":30
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
  *                     np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
  *                     np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  */
-  __pyx_tuple__29 = PyTuple_Pack(18, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_nr, __pyx_n_s_FOLD_ptr, __pyx_n_s_fold_ptr, __pyx_n_s_FOLD_ncol, __pyx_n_s_fold_ncol, __pyx_n_s_FOLD_col, __pyx_n_s_fold_col, __pyx_n_s_r, __pyx_n_s_ind, __pyx_n_s_nz, __pyx_n_s_c, __pyx_n_s_tmp); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 29, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__29);
-  __Pyx_GIVEREF(__pyx_tuple__29);
-  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(3, 0, 18, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_fold_csr_matrix, 29, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 29, __pyx_L1_error)
+  __pyx_tuple__30 = PyTuple_Pack(18, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_nr, __pyx_n_s_FOLD_ptr, __pyx_n_s_fold_ptr, __pyx_n_s_FOLD_ncol, __pyx_n_s_fold_ncol, __pyx_n_s_FOLD_col, __pyx_n_s_fold_col, __pyx_n_s_r, __pyx_n_s_ind, __pyx_n_s_nz, __pyx_n_s_c, __pyx_n_s_tmp); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(3, 0, 18, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_fold_csr_matrix, 30, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 30, __pyx_L1_error)
 
-  /* "sisl/_sparse.pyx":84
+  /* "sisl/_sparse.pyx":85
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
  *                        np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
  *                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  */
-  __pyx_tuple__31 = PyTuple_Pack(19, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_nr, __pyx_n_s_FOLD_ptr, __pyx_n_s_fold_ptr, __pyx_n_s_FOLD_ncol, __pyx_n_s_fold_ncol, __pyx_n_s_FOLD_col, __pyx_n_s_fold_col, __pyx_n_s_r, __pyx_n_s_rr, __pyx_n_s_ind, __pyx_n_s_nz, __pyx_n_s_c, __pyx_n_s_tmp); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 84, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__31);
-  __Pyx_GIVEREF(__pyx_tuple__31);
-  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(3, 0, 19, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_fold_csr_matrix_nc, 84, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 84, __pyx_L1_error)
+  __pyx_tuple__32 = PyTuple_Pack(19, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_nr, __pyx_n_s_FOLD_ptr, __pyx_n_s_fold_ptr, __pyx_n_s_FOLD_ncol, __pyx_n_s_fold_ncol, __pyx_n_s_FOLD_col, __pyx_n_s_fold_col, __pyx_n_s_r, __pyx_n_s_rr, __pyx_n_s_ind, __pyx_n_s_nz, __pyx_n_s_c, __pyx_n_s_tmp); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(3, 0, 19, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_fold_csr_matrix_nc, 85, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 85, __pyx_L1_error)
 
-  /* "sisl/_sparse.pyx":153
+  /* "sisl/_sparse.pyx":154
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_diagonal_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
  *                          np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
  *                          np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  */
-  __pyx_tuple__33 = PyTuple_Pack(19, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_nr, __pyx_n_s_FOLD_ptr, __pyx_n_s_fold_ptr, __pyx_n_s_FOLD_ncol, __pyx_n_s_fold_ncol, __pyx_n_s_FOLD_col, __pyx_n_s_fold_col, __pyx_n_s_r, __pyx_n_s_rr, __pyx_n_s_ind, __pyx_n_s_nz, __pyx_n_s_c, __pyx_n_s_tmp); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 153, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__33);
-  __Pyx_GIVEREF(__pyx_tuple__33);
-  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(3, 0, 19, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_fold_csr_diagonal_nc, 153, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 153, __pyx_L1_error)
+  __pyx_tuple__34 = PyTuple_Pack(19, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_nr, __pyx_n_s_FOLD_ptr, __pyx_n_s_fold_ptr, __pyx_n_s_FOLD_ncol, __pyx_n_s_fold_ncol, __pyx_n_s_FOLD_col, __pyx_n_s_fold_col, __pyx_n_s_r, __pyx_n_s_rr, __pyx_n_s_ind, __pyx_n_s_nz, __pyx_n_s_c, __pyx_n_s_tmp); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 154, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(3, 0, 19, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_fold_csr_diagonal_nc, 154, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 154, __pyx_L1_error)
+
+  /* "sisl/_sparse.pyx":220
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def csr_index_map(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR_A,             # <<<<<<<<<<<<<<
+ *                   np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL_A,
+ *                   np.ndarray[np.int32_t, ndim=1, mode='c'] COL_A,
+ */
+  __pyx_tuple__36 = PyTuple_Pack(22, __pyx_n_s_PTR_A, __pyx_n_s_NCOL_A, __pyx_n_s_COL_A, __pyx_n_s_PTR_B, __pyx_n_s_NCOL_B, __pyx_n_s_COL_B, __pyx_n_s_ptr_a, __pyx_n_s_ncol_a, __pyx_n_s_col_a, __pyx_n_s_ptr_b, __pyx_n_s_ncol_b, __pyx_n_s_col_b, __pyx_n_s_nr, __pyx_n_s_r, __pyx_n_s_ind, __pyx_n_s_c, __pyx_n_s_nc, __pyx_n_s_nz, __pyx_n_s_WORK, __pyx_n_s_work, __pyx_n_s_IDX, __pyx_n_s_idx); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(0, 220, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__36);
+  __Pyx_GIVEREF(__pyx_tuple__36);
+  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(6, 0, 22, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_csr_index_map, 220, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(0, 220, __pyx_L1_error)
+
+  /* "sisl/_sparse.pyx":281
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def csr_tile(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *              np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *              np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+  __pyx_tuple__38 = PyTuple_Pack(49, __pyx_n_s_PTR, __pyx_n_s_NCOL, __pyx_n_s_COL, __pyx_n_s_D, __pyx_n_s_BASE, __pyx_n_s_MULT, __pyx_n_s_SC_OFF, __pyx_n_s_ISC_OFF, __pyx_n_s_REPS, __pyx_n_s_STRIDES, __pyx_n_s_ptr, __pyx_n_s_ncol, __pyx_n_s_col, __pyx_n_s_base, __pyx_n_s_mult, __pyx_n_s_sc_off, __pyx_n_s_isc_off, __pyx_n_s_reps, __pyx_n_s_strides, __pyx_n_s_n, __pyx_n_s_n_n, __pyx_n_s_nbytes, __pyx_n_s_i, __pyx_n_s_t0, __pyx_n_s_t1, __pyx_n_s_t2, __pyx_n_s_lin, __pyx_n_s_r, __pyx_n_s_ind, __pyx_n_s_ind_n, __pyx_n_s_j, __pyx_n_s_s, __pyx_n_s_p0, __pyx_n_s_p1, __pyx_n_s_p2, __pyx_n_s_hsc, __pyx_n_s_np_max, __pyx_n_s_M, __pyx_n_s_M_2, __pyx_n_s_Q, __pyx_n_s_Q_2, __pyx_n_s_PTR_n, __pyx_n_s_ptr_n, __pyx_n_s_NCOL_n, __pyx_n_s_ncol_n, __pyx_n_s_COL_n, __pyx_n_s_col_n, __pyx_n_s_D_n, __pyx_n_s_d_n); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(0, 281, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__38);
+  __Pyx_GIVEREF(__pyx_tuple__38);
+  __pyx_codeobj__39 = (PyObject*)__Pyx_PyCode_New(10, 0, 49, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__38, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_sisl__sparse_pyx, __pyx_n_s_csr_tile, 281, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__39)) __PYX_ERR(0, 281, __pyx_L1_error)
 
   /* "View.MemoryView":286
  *         return self.name
@@ -21802,9 +24717,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_tuple__35 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(2, 286, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__35);
-  __Pyx_GIVEREF(__pyx_tuple__35);
+  __pyx_tuple__40 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(2, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__40);
+  __Pyx_GIVEREF(__pyx_tuple__40);
 
   /* "View.MemoryView":287
  * 
@@ -21813,9 +24728,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_tuple__36 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(2, 287, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__36);
-  __Pyx_GIVEREF(__pyx_tuple__36);
+  __pyx_tuple__41 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__41)) __PYX_ERR(2, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__41);
+  __Pyx_GIVEREF(__pyx_tuple__41);
 
   /* "View.MemoryView":288
  * cdef generic = Enum("<strided and direct or indirect>")
@@ -21824,9 +24739,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__37 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__37)) __PYX_ERR(2, 288, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__37);
-  __Pyx_GIVEREF(__pyx_tuple__37);
+  __pyx_tuple__42 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__42)) __PYX_ERR(2, 288, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__42);
+  __Pyx_GIVEREF(__pyx_tuple__42);
 
   /* "View.MemoryView":291
  * 
@@ -21835,9 +24750,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_tuple__38 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(2, 291, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__38);
-  __Pyx_GIVEREF(__pyx_tuple__38);
+  __pyx_tuple__43 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__43)) __PYX_ERR(2, 291, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__43);
+  __Pyx_GIVEREF(__pyx_tuple__43);
 
   /* "View.MemoryView":292
  * 
@@ -21846,19 +24761,19 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__39 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__39)) __PYX_ERR(2, 292, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__39);
-  __Pyx_GIVEREF(__pyx_tuple__39);
+  __pyx_tuple__44 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__44)) __PYX_ERR(2, 292, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__44);
+  __Pyx_GIVEREF(__pyx_tuple__44);
 
   /* "(tree fragment)":1
  * def __pyx_unpickle_Enum(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_tuple__40 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(2, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__40);
-  __Pyx_GIVEREF(__pyx_tuple__40);
-  __pyx_codeobj__41 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__40, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Enum, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__41)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_tuple__45 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__45)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__45);
+  __Pyx_GIVEREF(__pyx_tuple__45);
+  __pyx_codeobj__46 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__45, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Enum, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__46)) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -21870,6 +24785,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
   __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_184977713 = PyInt_FromLong(184977713L); if (unlikely(!__pyx_int_184977713)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
@@ -22228,52 +25144,76 @@ if (!__Pyx_RefNanny) {
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "sisl/_sparse.pyx":6
- * from libc.math cimport fabs
+  /* "sisl/_sparse.pyx":7
+ * from libc.string cimport memcpy
  * 
  * import numpy as np             # <<<<<<<<<<<<<<
  * # This enables Cython enhanced compatibilities
  * cimport numpy as np
  */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_numpy, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_numpy, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "sisl/_sparse.pyx":29
+  /* "sisl/_sparse.pyx":30
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
  *                     np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
  *                     np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_1fold_csr_matrix, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 29, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_1fold_csr_matrix, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 30, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_fold_csr_matrix, __pyx_t_1) < 0) __PYX_ERR(0, 29, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_fold_csr_matrix, __pyx_t_1) < 0) __PYX_ERR(0, 30, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "sisl/_sparse.pyx":84
+  /* "sisl/_sparse.pyx":85
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_matrix_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
  *                        np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
  *                        np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_3fold_csr_matrix_nc, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_3fold_csr_matrix_nc, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_fold_csr_matrix_nc, __pyx_t_1) < 0) __PYX_ERR(0, 84, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_fold_csr_matrix_nc, __pyx_t_1) < 0) __PYX_ERR(0, 85, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "sisl/_sparse.pyx":153
+  /* "sisl/_sparse.pyx":154
  * @cython.initializedcheck(False)
  * @cython.cdivision(True)
  * def fold_csr_diagonal_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
  *                          np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
  *                          np.ndarray[np.int32_t, ndim=1, mode='c'] COL):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_5fold_csr_diagonal_nc, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 153, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_5fold_csr_diagonal_nc, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 154, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_fold_csr_diagonal_nc, __pyx_t_1) < 0) __PYX_ERR(0, 154, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sisl/_sparse.pyx":220
+ * @cython.wraparound(False)
+ * @cython.initializedcheck(False)
+ * def csr_index_map(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR_A,             # <<<<<<<<<<<<<<
+ *                   np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL_A,
+ *                   np.ndarray[np.int32_t, ndim=1, mode='c'] COL_A,
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_7csr_index_map, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 220, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_csr_index_map, __pyx_t_1) < 0) __PYX_ERR(0, 220, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "sisl/_sparse.pyx":281
+ * @cython.initializedcheck(False)
+ * @cython.cdivision(True)
+ * def csr_tile(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,             # <<<<<<<<<<<<<<
+ *              np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+ *              np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4sisl_7_sparse_9csr_tile, NULL, __pyx_n_s_sisl__sparse); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 281, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_fold_csr_diagonal_nc, __pyx_t_1) < 0) __PYX_ERR(0, 153, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_csr_tile, __pyx_t_1) < 0) __PYX_ERR(0, 281, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "sisl/_sparse.pyx":1
@@ -22306,7 +25246,7 @@ if (!__Pyx_RefNanny) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__35, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 286, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__40, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 286, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(generic);
   __Pyx_DECREF_SET(generic, __pyx_t_1);
@@ -22320,7 +25260,7 @@ if (!__Pyx_RefNanny) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__36, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 287, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__41, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 287, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(strided);
   __Pyx_DECREF_SET(strided, __pyx_t_1);
@@ -22334,7 +25274,7 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__37, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 288, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__42, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 288, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(indirect);
   __Pyx_DECREF_SET(indirect, __pyx_t_1);
@@ -22348,7 +25288,7 @@ if (!__Pyx_RefNanny) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__38, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 291, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__43, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 291, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(contiguous);
   __Pyx_DECREF_SET(contiguous, __pyx_t_1);
@@ -22362,7 +25302,7 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__39, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 292, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__44, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 292, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(indirect_contiguous);
   __Pyx_DECREF_SET(indirect_contiguous, __pyx_t_1);
@@ -25271,54 +28211,300 @@ __pyx_memviewslice_is_contig(const __Pyx_memviewslice mvs, char order, int ndim)
     }
     return 1;
 }
-
-/* OverlappingSlices */
-  static void
-__pyx_get_array_memory_extents(__Pyx_memviewslice *slice,
-                               void **out_start, void **out_end,
-                               int ndim, size_t itemsize)
+
+/* OverlappingSlices */
+  static void
+__pyx_get_array_memory_extents(__Pyx_memviewslice *slice,
+                               void **out_start, void **out_end,
+                               int ndim, size_t itemsize)
+{
+    char *start, *end;
+    int i;
+    start = end = slice->data;
+    for (i = 0; i < ndim; i++) {
+        Py_ssize_t stride = slice->strides[i];
+        Py_ssize_t extent = slice->shape[i];
+        if (extent == 0) {
+            *out_start = *out_end = start;
+            return;
+        } else {
+            if (stride > 0)
+                end += stride * (extent - 1);
+            else
+                start += stride * (extent - 1);
+        }
+    }
+    *out_start = start;
+    *out_end = end + itemsize;
+}
+static int
+__pyx_slices_overlap(__Pyx_memviewslice *slice1,
+                     __Pyx_memviewslice *slice2,
+                     int ndim, size_t itemsize)
+{
+    void *start1, *end1, *start2, *end2;
+    __pyx_get_array_memory_extents(slice1, &start1, &end1, ndim, itemsize);
+    __pyx_get_array_memory_extents(slice2, &start2, &end2, ndim, itemsize);
+    return (start1 < end2) && (start2 < end1);
+}
+
+/* Capsule */
+  static CYTHON_INLINE PyObject *
+__pyx_capsule_create(void *p, CYTHON_UNUSED const char *sig)
+{
+    PyObject *cobj;
+#if PY_VERSION_HEX >= 0x02070000
+    cobj = PyCapsule_New(p, sig, NULL);
+#else
+    cobj = PyCObject_FromVoidPtr(p, NULL);
+#endif
+    return cobj;
+}
+
+/* TypeInfoCompare */
+  static int
+__pyx_typeinfo_cmp(__Pyx_TypeInfo *a, __Pyx_TypeInfo *b)
+{
+    int i;
+    if (!a || !b)
+        return 0;
+    if (a == b)
+        return 1;
+    if (a->size != b->size || a->typegroup != b->typegroup ||
+            a->is_unsigned != b->is_unsigned || a->ndim != b->ndim) {
+        if (a->typegroup == 'H' || b->typegroup == 'H') {
+            return a->size == b->size;
+        } else {
+            return 0;
+        }
+    }
+    if (a->ndim) {
+        for (i = 0; i < a->ndim; i++)
+            if (a->arraysize[i] != b->arraysize[i])
+                return 0;
+    }
+    if (a->typegroup == 'S') {
+        if (a->flags != b->flags)
+            return 0;
+        if (a->fields || b->fields) {
+            if (!(a->fields && b->fields))
+                return 0;
+            for (i = 0; a->fields[i].type && b->fields[i].type; i++) {
+                __Pyx_StructField *field_a = a->fields + i;
+                __Pyx_StructField *field_b = b->fields + i;
+                if (field_a->offset != field_b->offset ||
+                    !__pyx_typeinfo_cmp(field_a->type, field_b->type))
+                    return 0;
+            }
+            return !a->fields[i].type && !b->fields[i].type;
+        }
+    }
+    return 1;
+}
+
+/* MemviewSliceValidateAndInit */
+  static int
+__pyx_check_strides(Py_buffer *buf, int dim, int ndim, int spec)
+{
+    if (buf->shape[dim] <= 1)
+        return 1;
+    if (buf->strides) {
+        if (spec & __Pyx_MEMVIEW_CONTIG) {
+            if (spec & (__Pyx_MEMVIEW_PTR|__Pyx_MEMVIEW_FULL)) {
+                if (buf->strides[dim] != sizeof(void *)) {
+                    PyErr_Format(PyExc_ValueError,
+                                 "Buffer is not indirectly contiguous "
+                                 "in dimension %d.", dim);
+                    goto fail;
+                }
+            } else if (buf->strides[dim] != buf->itemsize) {
+                PyErr_SetString(PyExc_ValueError,
+                                "Buffer and memoryview are not contiguous "
+                                "in the same dimension.");
+                goto fail;
+            }
+        }
+        if (spec & __Pyx_MEMVIEW_FOLLOW) {
+            Py_ssize_t stride = buf->strides[dim];
+            if (stride < 0)
+                stride = -stride;
+            if (stride < buf->itemsize) {
+                PyErr_SetString(PyExc_ValueError,
+                                "Buffer and memoryview are not contiguous "
+                                "in the same dimension.");
+                goto fail;
+            }
+        }
+    } else {
+        if (spec & __Pyx_MEMVIEW_CONTIG && dim != ndim - 1) {
+            PyErr_Format(PyExc_ValueError,
+                         "C-contiguous buffer is not contiguous in "
+                         "dimension %d", dim);
+            goto fail;
+        } else if (spec & (__Pyx_MEMVIEW_PTR)) {
+            PyErr_Format(PyExc_ValueError,
+                         "C-contiguous buffer is not indirect in "
+                         "dimension %d", dim);
+            goto fail;
+        } else if (buf->suboffsets) {
+            PyErr_SetString(PyExc_ValueError,
+                            "Buffer exposes suboffsets but no strides");
+            goto fail;
+        }
+    }
+    return 1;
+fail:
+    return 0;
+}
+static int
+__pyx_check_suboffsets(Py_buffer *buf, int dim, CYTHON_UNUSED int ndim, int spec)
+{
+    if (spec & __Pyx_MEMVIEW_DIRECT) {
+        if (buf->suboffsets && buf->suboffsets[dim] >= 0) {
+            PyErr_Format(PyExc_ValueError,
+                         "Buffer not compatible with direct access "
+                         "in dimension %d.", dim);
+            goto fail;
+        }
+    }
+    if (spec & __Pyx_MEMVIEW_PTR) {
+        if (!buf->suboffsets || (buf->suboffsets && buf->suboffsets[dim] < 0)) {
+            PyErr_Format(PyExc_ValueError,
+                         "Buffer is not indirectly accessible "
+                         "in dimension %d.", dim);
+            goto fail;
+        }
+    }
+    return 1;
+fail:
+    return 0;
+}
+static int
+__pyx_verify_contig(Py_buffer *buf, int ndim, int c_or_f_flag)
+{
+    int i;
+    if (c_or_f_flag & __Pyx_IS_F_CONTIG) {
+        Py_ssize_t stride = 1;
+        for (i = 0; i < ndim; i++) {
+            if (stride * buf->itemsize != buf->strides[i] &&
+                    buf->shape[i] > 1)
+            {
+                PyErr_SetString(PyExc_ValueError,
+                    "Buffer not fortran contiguous.");
+                goto fail;
+            }
+            stride = stride * buf->shape[i];
+        }
+    } else if (c_or_f_flag & __Pyx_IS_C_CONTIG) {
+        Py_ssize_t stride = 1;
+        for (i = ndim - 1; i >- 1; i--) {
+            if (stride * buf->itemsize != buf->strides[i] &&
+                    buf->shape[i] > 1) {
+                PyErr_SetString(PyExc_ValueError,
+                    "Buffer not C contiguous.");
+                goto fail;
+            }
+            stride = stride * buf->shape[i];
+        }
+    }
+    return 1;
+fail:
+    return 0;
+}
+static int __Pyx_ValidateAndInit_memviewslice(
+                int *axes_specs,
+                int c_or_f_flag,
+                int buf_flags,
+                int ndim,
+                __Pyx_TypeInfo *dtype,
+                __Pyx_BufFmt_StackElem stack[],
+                __Pyx_memviewslice *memviewslice,
+                PyObject *original_obj)
 {
-    char *start, *end;
-    int i;
-    start = end = slice->data;
+    struct __pyx_memoryview_obj *memview, *new_memview;
+    __Pyx_RefNannyDeclarations
+    Py_buffer *buf;
+    int i, spec = 0, retval = -1;
+    __Pyx_BufFmt_Context ctx;
+    int from_memoryview = __pyx_memoryview_check(original_obj);
+    __Pyx_RefNannySetupContext("ValidateAndInit_memviewslice", 0);
+    if (from_memoryview && __pyx_typeinfo_cmp(dtype, ((struct __pyx_memoryview_obj *)
+                                                            original_obj)->typeinfo)) {
+        memview = (struct __pyx_memoryview_obj *) original_obj;
+        new_memview = NULL;
+    } else {
+        memview = (struct __pyx_memoryview_obj *) __pyx_memoryview_new(
+                                            original_obj, buf_flags, 0, dtype);
+        new_memview = memview;
+        if (unlikely(!memview))
+            goto fail;
+    }
+    buf = &memview->view;
+    if (buf->ndim != ndim) {
+        PyErr_Format(PyExc_ValueError,
+                "Buffer has wrong number of dimensions (expected %d, got %d)",
+                ndim, buf->ndim);
+        goto fail;
+    }
+    if (new_memview) {
+        __Pyx_BufFmt_Init(&ctx, stack, dtype);
+        if (!__Pyx_BufFmt_CheckString(&ctx, buf->format)) goto fail;
+    }
+    if ((unsigned) buf->itemsize != dtype->size) {
+        PyErr_Format(PyExc_ValueError,
+                     "Item size of buffer (%" CYTHON_FORMAT_SSIZE_T "u byte%s) "
+                     "does not match size of '%s' (%" CYTHON_FORMAT_SSIZE_T "u byte%s)",
+                     buf->itemsize,
+                     (buf->itemsize > 1) ? "s" : "",
+                     dtype->name,
+                     dtype->size,
+                     (dtype->size > 1) ? "s" : "");
+        goto fail;
+    }
     for (i = 0; i < ndim; i++) {
-        Py_ssize_t stride = slice->strides[i];
-        Py_ssize_t extent = slice->shape[i];
-        if (extent == 0) {
-            *out_start = *out_end = start;
-            return;
-        } else {
-            if (stride > 0)
-                end += stride * (extent - 1);
-            else
-                start += stride * (extent - 1);
-        }
+        spec = axes_specs[i];
+        if (!__pyx_check_strides(buf, i, ndim, spec))
+            goto fail;
+        if (!__pyx_check_suboffsets(buf, i, ndim, spec))
+            goto fail;
     }
-    *out_start = start;
-    *out_end = end + itemsize;
-}
-static int
-__pyx_slices_overlap(__Pyx_memviewslice *slice1,
-                     __Pyx_memviewslice *slice2,
-                     int ndim, size_t itemsize)
-{
-    void *start1, *end1, *start2, *end2;
-    __pyx_get_array_memory_extents(slice1, &start1, &end1, ndim, itemsize);
-    __pyx_get_array_memory_extents(slice2, &start2, &end2, ndim, itemsize);
-    return (start1 < end2) && (start2 < end1);
+    if (buf->strides && !__pyx_verify_contig(buf, ndim, c_or_f_flag))
+        goto fail;
+    if (unlikely(__Pyx_init_memviewslice(memview, ndim, memviewslice,
+                                         new_memview != NULL) == -1)) {
+        goto fail;
+    }
+    retval = 0;
+    goto no_fail;
+fail:
+    Py_XDECREF(new_memview);
+    retval = -1;
+no_fail:
+    __Pyx_RefNannyFinishContext();
+    return retval;
 }
 
-/* Capsule */
-  static CYTHON_INLINE PyObject *
-__pyx_capsule_create(void *p, CYTHON_UNUSED const char *sig)
-{
-    PyObject *cobj;
-#if PY_VERSION_HEX >= 0x02070000
-    cobj = PyCapsule_New(p, sig, NULL);
-#else
-    cobj = PyCObject_FromVoidPtr(p, NULL);
-#endif
-    return cobj;
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_char__const__(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
+                                                 &__Pyx_TypeInfo_unsigned_char__const__, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
 }
 
 /* CIntFromPyVerify */
@@ -26338,281 +29524,58 @@ raise_neg_overflow:
                     }
                     break;
             }
-#endif
-            if (sizeof(char) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(char, long, PyLong_AsLong(x))
-#ifdef HAVE_LONG_LONG
-            } else if (sizeof(char) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(char, PY_LONG_LONG, PyLong_AsLongLong(x))
-#endif
-            }
-        }
-        {
-#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
-            PyErr_SetString(PyExc_RuntimeError,
-                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
-#else
-            char val;
-            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
- #if PY_MAJOR_VERSION < 3
-            if (likely(v) && !PyLong_Check(v)) {
-                PyObject *tmp = v;
-                v = PyNumber_Long(tmp);
-                Py_DECREF(tmp);
-            }
- #endif
-            if (likely(v)) {
-                int one = 1; int is_little = (int)*(unsigned char *)&one;
-                unsigned char *bytes = (unsigned char *)&val;
-                int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                              bytes, sizeof(val),
-                                              is_little, !is_unsigned);
-                Py_DECREF(v);
-                if (likely(!ret))
-                    return val;
-            }
-#endif
-            return (char) -1;
-        }
-    } else {
-        char val;
-        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (char) -1;
-        val = __Pyx_PyInt_As_char(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to char");
-    return (char) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to char");
-    return (char) -1;
-}
-
-/* TypeInfoCompare */
-  static int
-__pyx_typeinfo_cmp(__Pyx_TypeInfo *a, __Pyx_TypeInfo *b)
-{
-    int i;
-    if (!a || !b)
-        return 0;
-    if (a == b)
-        return 1;
-    if (a->size != b->size || a->typegroup != b->typegroup ||
-            a->is_unsigned != b->is_unsigned || a->ndim != b->ndim) {
-        if (a->typegroup == 'H' || b->typegroup == 'H') {
-            return a->size == b->size;
-        } else {
-            return 0;
-        }
-    }
-    if (a->ndim) {
-        for (i = 0; i < a->ndim; i++)
-            if (a->arraysize[i] != b->arraysize[i])
-                return 0;
-    }
-    if (a->typegroup == 'S') {
-        if (a->flags != b->flags)
-            return 0;
-        if (a->fields || b->fields) {
-            if (!(a->fields && b->fields))
-                return 0;
-            for (i = 0; a->fields[i].type && b->fields[i].type; i++) {
-                __Pyx_StructField *field_a = a->fields + i;
-                __Pyx_StructField *field_b = b->fields + i;
-                if (field_a->offset != field_b->offset ||
-                    !__pyx_typeinfo_cmp(field_a->type, field_b->type))
-                    return 0;
-            }
-            return !a->fields[i].type && !b->fields[i].type;
-        }
-    }
-    return 1;
-}
-
-/* MemviewSliceValidateAndInit */
-  static int
-__pyx_check_strides(Py_buffer *buf, int dim, int ndim, int spec)
-{
-    if (buf->shape[dim] <= 1)
-        return 1;
-    if (buf->strides) {
-        if (spec & __Pyx_MEMVIEW_CONTIG) {
-            if (spec & (__Pyx_MEMVIEW_PTR|__Pyx_MEMVIEW_FULL)) {
-                if (buf->strides[dim] != sizeof(void *)) {
-                    PyErr_Format(PyExc_ValueError,
-                                 "Buffer is not indirectly contiguous "
-                                 "in dimension %d.", dim);
-                    goto fail;
-                }
-            } else if (buf->strides[dim] != buf->itemsize) {
-                PyErr_SetString(PyExc_ValueError,
-                                "Buffer and memoryview are not contiguous "
-                                "in the same dimension.");
-                goto fail;
-            }
-        }
-        if (spec & __Pyx_MEMVIEW_FOLLOW) {
-            Py_ssize_t stride = buf->strides[dim];
-            if (stride < 0)
-                stride = -stride;
-            if (stride < buf->itemsize) {
-                PyErr_SetString(PyExc_ValueError,
-                                "Buffer and memoryview are not contiguous "
-                                "in the same dimension.");
-                goto fail;
+#endif
+            if (sizeof(char) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(char, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(char) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(char, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
             }
         }
-    } else {
-        if (spec & __Pyx_MEMVIEW_CONTIG && dim != ndim - 1) {
-            PyErr_Format(PyExc_ValueError,
-                         "C-contiguous buffer is not contiguous in "
-                         "dimension %d", dim);
-            goto fail;
-        } else if (spec & (__Pyx_MEMVIEW_PTR)) {
-            PyErr_Format(PyExc_ValueError,
-                         "C-contiguous buffer is not indirect in "
-                         "dimension %d", dim);
-            goto fail;
-        } else if (buf->suboffsets) {
-            PyErr_SetString(PyExc_ValueError,
-                            "Buffer exposes suboffsets but no strides");
-            goto fail;
-        }
-    }
-    return 1;
-fail:
-    return 0;
-}
-static int
-__pyx_check_suboffsets(Py_buffer *buf, int dim, CYTHON_UNUSED int ndim, int spec)
-{
-    if (spec & __Pyx_MEMVIEW_DIRECT) {
-        if (buf->suboffsets && buf->suboffsets[dim] >= 0) {
-            PyErr_Format(PyExc_ValueError,
-                         "Buffer not compatible with direct access "
-                         "in dimension %d.", dim);
-            goto fail;
-        }
-    }
-    if (spec & __Pyx_MEMVIEW_PTR) {
-        if (!buf->suboffsets || (buf->suboffsets && buf->suboffsets[dim] < 0)) {
-            PyErr_Format(PyExc_ValueError,
-                         "Buffer is not indirectly accessible "
-                         "in dimension %d.", dim);
-            goto fail;
-        }
-    }
-    return 1;
-fail:
-    return 0;
-}
-static int
-__pyx_verify_contig(Py_buffer *buf, int ndim, int c_or_f_flag)
-{
-    int i;
-    if (c_or_f_flag & __Pyx_IS_F_CONTIG) {
-        Py_ssize_t stride = 1;
-        for (i = 0; i < ndim; i++) {
-            if (stride * buf->itemsize != buf->strides[i] &&
-                    buf->shape[i] > 1)
-            {
-                PyErr_SetString(PyExc_ValueError,
-                    "Buffer not fortran contiguous.");
-                goto fail;
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            char val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
             }
-            stride = stride * buf->shape[i];
-        }
-    } else if (c_or_f_flag & __Pyx_IS_C_CONTIG) {
-        Py_ssize_t stride = 1;
-        for (i = ndim - 1; i >- 1; i--) {
-            if (stride * buf->itemsize != buf->strides[i] &&
-                    buf->shape[i] > 1) {
-                PyErr_SetString(PyExc_ValueError,
-                    "Buffer not C contiguous.");
-                goto fail;
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
             }
-            stride = stride * buf->shape[i];
+#endif
+            return (char) -1;
         }
-    }
-    return 1;
-fail:
-    return 0;
-}
-static int __Pyx_ValidateAndInit_memviewslice(
-                int *axes_specs,
-                int c_or_f_flag,
-                int buf_flags,
-                int ndim,
-                __Pyx_TypeInfo *dtype,
-                __Pyx_BufFmt_StackElem stack[],
-                __Pyx_memviewslice *memviewslice,
-                PyObject *original_obj)
-{
-    struct __pyx_memoryview_obj *memview, *new_memview;
-    __Pyx_RefNannyDeclarations
-    Py_buffer *buf;
-    int i, spec = 0, retval = -1;
-    __Pyx_BufFmt_Context ctx;
-    int from_memoryview = __pyx_memoryview_check(original_obj);
-    __Pyx_RefNannySetupContext("ValidateAndInit_memviewslice", 0);
-    if (from_memoryview && __pyx_typeinfo_cmp(dtype, ((struct __pyx_memoryview_obj *)
-                                                            original_obj)->typeinfo)) {
-        memview = (struct __pyx_memoryview_obj *) original_obj;
-        new_memview = NULL;
     } else {
-        memview = (struct __pyx_memoryview_obj *) __pyx_memoryview_new(
-                                            original_obj, buf_flags, 0, dtype);
-        new_memview = memview;
-        if (unlikely(!memview))
-            goto fail;
-    }
-    buf = &memview->view;
-    if (buf->ndim != ndim) {
-        PyErr_Format(PyExc_ValueError,
-                "Buffer has wrong number of dimensions (expected %d, got %d)",
-                ndim, buf->ndim);
-        goto fail;
-    }
-    if (new_memview) {
-        __Pyx_BufFmt_Init(&ctx, stack, dtype);
-        if (!__Pyx_BufFmt_CheckString(&ctx, buf->format)) goto fail;
-    }
-    if ((unsigned) buf->itemsize != dtype->size) {
-        PyErr_Format(PyExc_ValueError,
-                     "Item size of buffer (%" CYTHON_FORMAT_SSIZE_T "u byte%s) "
-                     "does not match size of '%s' (%" CYTHON_FORMAT_SSIZE_T "u byte%s)",
-                     buf->itemsize,
-                     (buf->itemsize > 1) ? "s" : "",
-                     dtype->name,
-                     dtype->size,
-                     (dtype->size > 1) ? "s" : "");
-        goto fail;
-    }
-    for (i = 0; i < ndim; i++) {
-        spec = axes_specs[i];
-        if (!__pyx_check_strides(buf, i, ndim, spec))
-            goto fail;
-        if (!__pyx_check_suboffsets(buf, i, ndim, spec))
-            goto fail;
-    }
-    if (buf->strides && !__pyx_verify_contig(buf, ndim, c_or_f_flag))
-        goto fail;
-    if (unlikely(__Pyx_init_memviewslice(memview, ndim, memviewslice,
-                                         new_memview != NULL) == -1)) {
-        goto fail;
+        char val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (char) -1;
+        val = __Pyx_PyInt_As_char(tmp);
+        Py_DECREF(tmp);
+        return val;
     }
-    retval = 0;
-    goto no_fail;
-fail:
-    Py_XDECREF(new_memview);
-    retval = -1;
-no_fail:
-    __Pyx_RefNannyFinishContext();
-    return retval;
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to char");
+    return (char) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to char");
+    return (char) -1;
 }
 
 /* ObjectToMemviewSlice */
@@ -26638,6 +29601,75 @@ __pyx_fail:
     return result;
 }
 
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_int(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
+                                                 &__Pyx_TypeInfo_int, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_int(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 3,
+                                                 &__Pyx_TypeInfo_int, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_char(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
+                                                 &__Pyx_TypeInfo_unsigned_char, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
 /* CheckBinaryVersion */
   static int __Pyx_check_binary_version(void) {
     char ctversion[4], rtversion[4];
@@ -2,6 +2,7 @@
 #cython: language_level=2
 cimport cython
 from libc.math cimport fabs
+from libc.string cimport memcpy
 
 import numpy as np
 # This enables Cython enhanced compatibilities
@@ -211,3 +212,190 @@ def fold_csr_diagonal_nc(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
 
     # Return objects
     return FOLD_ptr, FOLD_ncol, FOLD_col[:nz].copy()
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+def csr_index_map(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR_A,
+                  np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL_A,
+                  np.ndarray[np.int32_t, ndim=1, mode='c'] COL_A,
+                  np.ndarray[np.int32_t, ndim=1, mode='c'] PTR_B,
+                  np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL_B,
+                  np.ndarray[np.int32_t, ndim=1, mode='c'] COL_B):
+    """ Indices of the non-zero elements of the CSR pattern B in the CSR pattern A
+
+    The column indices need not be sorted. The elements of B are
+    traversed row by row (i.e. as in a finalized matrix), and an index of ``-1``
+    signals that the element does not exist in A.
+    This is an O(nnz) operation using a work array of the number of columns.
+    """
+    cdef int[::1] ptr_a = PTR_A
+    cdef int[::1] ncol_a = NCOL_A
+    cdef int[::1] col_a = COL_A
+    cdef int[::1] ptr_b = PTR_B
+    cdef int[::1] ncol_b = NCOL_B
+    cdef int[::1] col_b = COL_B
+    # Number of rows
+    cdef int nr = ncol_a.shape[0]
+    cdef int r, ind, c, nc, nz
+
+    # Figure out the size of the work array
+    nc = 0
+    nz = 0
+    for r in range(nr):
+        for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):
+            if col_a[ind] >= nc:
+                nc = col_a[ind] + 1
+        for ind in range(ptr_b[r], ptr_b[r] + ncol_b[r]):
+            if col_b[ind] >= nc:
+                nc = col_b[ind] + 1
+        nz += ncol_b[r]
+
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] WORK = np.full([nc], -1, dtype=np.int32)
+    cdef int[::1] work = WORK
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] IDX = np.empty([nz], dtype=np.int32)
+    cdef int[::1] idx = IDX
+
+    nz = 0
+    for r in range(nr):
+        # Store the locations of the A elements
+        for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):
+            work[col_a[ind]] = ind
+
+        for ind in range(ptr_b[r], ptr_b[r] + ncol_b[r]):
+            idx[nz] = work[col_b[ind]]
+            nz += 1
+
+        # Reset the work array
+        for ind in range(ptr_a[r], ptr_a[r] + ncol_a[r]):
+            work[col_a[ind]] = -1
+
+    return IDX
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+def csr_tile(np.ndarray[np.int32_t, ndim=1, mode='c'] PTR,
+             np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL,
+             np.ndarray[np.int32_t, ndim=1, mode='c'] COL,
+             const unsigned char[:, ::1] D,
+             np.ndarray[np.int32_t, ndim=1, mode='c'] BASE,
+             np.ndarray[np.int32_t, ndim=1, mode='c'] MULT,
+             np.ndarray[np.int32_t, ndim=2, mode='c'] SC_OFF,
+             np.ndarray[np.int32_t, ndim=3, mode='c'] ISC_OFF,
+             np.ndarray[np.int32_t, ndim=1, mode='c'] REPS,
+             np.ndarray[np.int32_t, ndim=1, mode='c'] STRIDES):
+    """ Tile/repeat a sparse pattern of a geometry into a supercell in a single pass
+
+    The ``n`` rows of the original pattern are replicated ``R = prod(REPS)`` times.
+    The replica of row ``i`` in block ``t = (t0, t1, t2)`` becomes row::
+
+        BASE[i] + MULT[i] * dot(t, STRIDES)
+
+    which both describes tiling (``BASE[i] = i``, ``MULT[i] = n``) and repeating
+    (e.g. ``BASE[i] = R * i``, ``MULT[i] = 1``).
+    The column ``c`` (in supercell ``isc = SC_OFF[c // n]``) of block ``t`` is the
+    column (in the same way as rows) in block ``(t + isc) % REPS`` and supercell
+    ``(t + isc) // REPS`` which is looked up in ``ISC_OFF`` of the new supercell.
+
+    The data `D` is passed as bytes (one row per non-zero element) and copied
+    directly into the new data array.
+
+    Returns
+    -------
+    PTR, NCOL, COL, D of the new sparse pattern
+    """
+    cdef int[::1] ptr = PTR
+    cdef int[::1] ncol = NCOL
+    cdef int[::1] col = COL
+    cdef int[::1] base = BASE
+    cdef int[::1] mult = MULT
+    cdef int[:, ::1] sc_off = SC_OFF
+    cdef int[:, :, ::1] isc_off = ISC_OFF
+    cdef int[::1] reps = REPS
+    cdef int[::1] strides = STRIDES
+
+    cdef int n = ncol.shape[0]
+    cdef int n_n = n * reps[0] * reps[1] * reps[2]
+    cdef Py_ssize_t nbytes = D.shape[1]
+    cdef int i, t0, t1, t2, lin, r, ind, ind_n, j, s, p0, p1, p2
+
+    # Lookup tables for the block offset (M) and the supercell (Q) along
+    # each lattice vector for t + isc, with t + isc in [-hsc, reps + hsc[
+    cdef int hsc = 0
+    for s in range(sc_off.shape[0]):
+        for i in range(3):
+            if abs(sc_off[s, i]) > hsc:
+                hsc = abs(sc_off[s, i])
+    cdef int np_max = max(reps[0], max(reps[1], reps[2])) + 2 * hsc
+    cdef np.ndarray[np.int32_t, ndim=2, mode='c'] M_ = np.empty([3, np_max], dtype=np.int32)
+    cdef int[:, ::1] M = M_
+    cdef np.ndarray[np.int32_t, ndim=2, mode='c'] Q_ = np.empty([3, np_max], dtype=np.int32)
+    cdef int[:, ::1] Q = Q_
+    for i in range(3):
+        for p0 in range(- hsc, reps[i] + hsc):
+            # floor division
+            if p0 >= 0:
+                p1 = p0 / reps[i]
+            else:
+                p1 = - ((- p0 + reps[i] - 1) / reps[i])
+            M[i, p0 + hsc] = (p0 - p1 * reps[i]) * strides[i]
+            if p1 < 0:
+                p1 = p1 + isc_off.shape[i]
+            if p1 < 0 or p1 >= isc_off.shape[i]:
+                # flag non-existing supercells
+                p1 = -1
+            Q[i, p0 + hsc] = p1
+    for s in range(sc_off.shape[0]):
+        for i in range(3):
+            for t0 in range(reps[i]):
+                if Q[i, t0 + sc_off[s, i] + hsc] < 0:
+                    raise ValueError('csr_tile requesting a non-existing supercell index')
+
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] PTR_n = np.empty([n_n + 1], dtype=np.int32)
+    cdef int[::1] ptr_n = PTR_n
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] NCOL_n = np.empty([n_n], dtype=np.int32)
+    cdef int[::1] ncol_n = NCOL_n
+
+    # Number of elements per row
+    with nogil:
+        for i in range(n):
+            for t0 in range(reps[0]):
+                for t1 in range(reps[1]):
+                    for t2 in range(reps[2]):
+                        lin = t0 * strides[0] + t1 * strides[1] + t2 * strides[2]
+                        ncol_n[base[i] + mult[i] * lin] = ncol[i]
+        ptr_n[0] = 0
+        for r in range(n_n):
+            ptr_n[r + 1] = ptr_n[r] + ncol_n[r]
+
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] COL_n = np.empty([ptr_n[n_n]], dtype=np.int32)
+    cdef int[::1] col_n = COL_n
+    cdef np.ndarray[np.uint8_t, ndim=2, mode='c'] D_n = np.empty([ptr_n[n_n], nbytes], dtype=np.uint8)
+    cdef unsigned char[:, ::1] d_n = D_n
+
+    with nogil:
+        for i in range(n):
+            for t0 in range(reps[0]):
+                for t1 in range(reps[1]):
+                    for t2 in range(reps[2]):
+                        lin = t0 * strides[0] + t1 * strides[1] + t2 * strides[2]
+                        r = base[i] + mult[i] * lin
+                        ind_n = ptr_n[r]
+                        if ncol[i] > 0 and nbytes > 0:
+                            memcpy(&d_n[ind_n, 0], &D[ptr[i], 0], ncol[i] * nbytes)
+
+                        for ind in range(ptr[i], ptr[i] + ncol[i]):
+                            j = col[ind] % n
+                            s = col[ind] / n
+                            p0 = t0 + sc_off[s, 0] + hsc
+                            p1 = t1 + sc_off[s, 1] + hsc
+                            p2 = t2 + sc_off[s, 2] + hsc
+                            col_n[ind_n] = base[j] + mult[j] * (M[0, p0] + M[1, p1] + M[2, p2]) + \
+                                           isc_off[Q[0, p0], Q[1, p1], Q[2, p2]] * n_n
+                            ind_n += 1
+
+    return PTR_n, NCOL_n, COL_n, D_n
@@ -1966,6 +1966,61 @@ class Geometry(SuperCellChild):
         """ Returns geometry coordinates in fractional coordinates """
         return dot(self.xyz, self.icell.T)
 
+    def symmetry_operations(self, tol=1e-4, ret_trans=False):
+        r""" Point-group operations of the lattice which are compatible with the atomic basis
+
+        Each lattice operation, `SuperCell.symmetry_operations`, is retained if there exists
+        a fractional translation :math:`\mathbf t` such that all atoms are mapped onto an atom of
+        the same specie, i.e. ``fxyz.dot(W) + t`` reproduces the atomic structure (modulo lattice vectors).
+
+        Parameters
+        ----------
+        tol : float, optional
+           tolerance (in Ang) for two atomic positions to be equivalent
+        ret_trans : bool, optional
+           also return the fractional translations accompanying the operations
+
+        Returns
+        -------
+        numpy.ndarray
+            integer operations of shape ``(nop, 3, 3)``, the first being the identity
+        numpy.ndarray
+            fractional translations of shape ``(nop, 3)``, only if `ret_trans` is true
+        """
+        W = self.sc.symmetry_operations()
+        fxyz = self.fxyz % 1.
+        specie = self.atoms.specie
+        cell = self.cell
+
+        # Use the least abundant specie to create the trial translations
+        count = np.bincount(specie)
+        count[count == 0] = self.na + 1
+        ref = (specie == np.argmin(count)).nonzero()[0]
+        same = specie.reshape(-1, 1) == specie.reshape(1, -1)
+
+        def find_trans(w):
+            fw = dot(fxyz, w)
+            for ia in ref:
+                t = fxyz[ia] - fw[ref[0]]
+                d = fw.reshape(-1, 1, 3) + t.reshape(1, 1, 3) - fxyz.reshape(1, -1, 3)
+                d -= np.rint(d)
+                d = (dot(d, cell) ** 2).sum(-1) <= tol ** 2
+                if np.logical_and(d, same).any(1).all():
+                    return t % 1.
+            return None
+
+        ops = []
+        trans = []
+        for w in W:
+            t = find_trans(w)
+            if t is not None:
+                ops.append(w)
+                trans.append(t)
+        ops = np.array(ops, dtype=W.dtype).reshape(-1, 3, 3)
+        if ret_trans:
+            return ops, _a.arrayd(trans).reshape(-1, 3)
+        return ops
+
     def axyz(self, atom=None, isc=None):
         """ Return the atomic coordinates in the supercell of a given atom.
 
@@ -2,16 +2,18 @@ from __future__ import print_function, division
 
 from functools import partial
 from numbers import Integral, Real
-from math import pi
 
 import numpy as np
 from numpy import int32
-from numpy import floor, dot, add, cos, sin
-from numpy import ogrid, take
+from numpy import floor, dot, add
+from numpy import take
 from scipy.sparse import diags as sp_diags
 
 from . import _array as _a
 from ._help import dtype_complex_to_real
+from ._grid_interp import interp_grid
+from ._grid_poisson import poisson_fft
+from ._grid_partition import partition_grid
 from .shape import Shape
 from .utils import default_ArgumentParser, default_namespace
 from .utils import cmd, strseq, direction, str_spec
@@ -133,51 +135,43 @@ class Grid(SuperCellChild):
         self.grid.fill(val)
 
     def interp(self, shape, method='linear', **kwargs):
-        """ Interpolate grid values to a new grid
+        """ Interpolate grid values to a new grid of a different shape
+
+        The interpolation is separable along the lattice vectors and is performed
+        in slabs of the grid to reduce memory usage.
+        Directions with periodic boundary conditions are interpolated using
+        the periodic images (grid points are located at ``i / shape``), while
+        non-periodic directions have the first and last grid points located at the
+        cell boundaries.
 
         Parameters
         ----------
         shape : int, array_like
             the new shape of the grid
-        method : str
-            the method used to perform the interpolation,
-            see `scipy.interpolate.interpn` for further details.
+        method : {'linear', 'nearest', 'cubic', 'fft'}
+            the method used to perform the interpolation, 'cubic' uses cubic splines and
+            'fft' uses Fourier resampling along periodic directions (and cubic splines along
+            non-periodic directions).
+            Fourier resampling conserves the average value of the grid.
         **kwargs :
-            optional arguments passed to the interpolation algorithm
-            The interpolation routine is `scipy.interpolate.interpn`
-        """
-        # Interpolate function
-        from scipy.interpolate import RegularGridInterpolator
-
-        # Get current grid spacing
-        dold = (
-            _a.linspacef(0, 1, self.shape[0]),
-            _a.linspacef(0, 1, self.shape[1]),
-            _a.linspacef(0, 1, self.shape[2])
-        )
-
-        # Create new grid and clean-up to reduce memory
-        grid = self.copy()
-        del grid.grid
-
-        # Create the interpolator!
-        f = RegularGridInterpolator(dold, self.grid, method=method)
-        del dold
-
-        # Create new interpolation points
-        dnew = (
-            _a.linspacef(0, 1, shape[0]),
-            _a.linspacef(0, 1, shape[1]),
-            _a.linspacef(0, 1, shape[2])
-        )
-
-        grid.grid = np.empty(shape, dtype=self.dtype)
-        for iz, dz in enumerate(dnew[2]):
-            dnew = np.mgrid[0:1:shape[0] * 1j, 0:1:shape[1] * 1j, dz:dz*1.0001:1j].reshape(3, -1).T
-            grid.grid[:, :, iz] = f(dnew).reshape((shape[0], shape[1]))
-
-        del dnew
+            optional arguments passed to the interpolation algorithm,
+            `scipy.interpolate.CubicSpline` for 'cubic' and `scipy.signal.resample`
+            for 'fft' (only along periodic directions).
+            Keyword arguments are not allowed for 'linear' and 'nearest'.
 
+        See Also
+        --------
+        sisl._grid_interp.interp_grid : the underlying interpolation routine
+        """
+        shape = _a.asarrayi(shape).ravel()
+        if shape.size == 1:
+            shape = _a.fulli(3, shape[0])
+
+        # Create new grid (this is the only allocation of the full grid)
+        grid = self.__class__(shape, bc=np.copy(self.bc), dtype=self.dtype,
+                              **self.__sc_geometry_dict())
+        interp_grid(self.grid, shape, method=method,
+                    periodic=self.bc[:, 0] == self.PERIODIC, out=grid.grid, **kwargs)
         return grid
 
     @property
@@ -539,19 +533,9 @@ class Grid(SuperCellChild):
 
     def _index_shape(self, shape):
         """ Internal routine for shape-indices """
-        # First grab the sphere, subsequent indices will be reduced
-        # by the actual shape
-        cuboid = shape.toCuboid()
-        ellipsoid = shape.toEllipsoid()
-        if ellipsoid.volume() > cuboid.volume():
-            idx = self._index_shape_cuboid(cuboid)
-        else:
-            idx = self._index_shape_ellipsoid(ellipsoid)
-
-        # Get min/max
-        imin = idx.min(0)
-        imax = idx.max(0)
-        del idx
+        # First find the bounding box of the shape, subsequent indices
+        # will be reduced by the actual shape
+        imin, imax = self._index_shape_bounds(shape)
 
         dc = self.dcell
 
@@ -580,65 +564,27 @@ class Grid(SuperCellChild):
 
         return i
 
-    def _index_shape_cuboid(self, cuboid):
-        """ Internal routine for cuboid shape-indices """
-        # Construct all points on the outer rim of the cuboids
-        min_d = fnorm(self.dcell).min()
-
-        # Retrieve cuboids edge-lengths
-        v = cuboid.edge_length
-        # Create normalized cuboid vectors (because we expan via the lengths below
-        vn = cuboid._v / fnorm(cuboid._v).reshape(-1, 1)
-        LL = (cuboid.center - cuboid._v.sum(0) / 2).reshape(1, 3)
-        UR = (cuboid.center + cuboid._v.sum(0) / 2).reshape(1, 3)
-
-        # Create coordinates
-        a = vn[0, :].reshape(1, -1) * _a.aranged(0, v[0] + min_d, min_d).reshape(-1, 1)
-        b = vn[1, :].reshape(1, -1) * _a.aranged(0, v[1] + min_d, min_d).reshape(-1, 1)
-        c = vn[2, :].reshape(1, -1) * _a.aranged(0, v[2] + min_d, min_d).reshape(-1, 1)
-
-        # Now create all sides
-        sa = a.shape[0]
-        sb = b.shape[0]
-        sc = c.shape[0]
-
-        def plane(v1, v2):
-            return (v1.reshape(-1, 1, 3) + v2.reshape(1, -1, 3)).reshape(1, -1, 3)
-
-        # Allocate for the 6 faces of the cuboid
-        rxyz = _a.emptyd([2, sa * sb + sa * sc + sb * sc, 3])
-        # Define the LL and UR
-        rxyz[0, :, :] = LL
-        rxyz[1, :, :] = UR
-
-        i = 0
-        rxyz[:, i:i + sa * sb, :] += plane(a, b)
-        i += sa * sb
-        rxyz[:, i:i + sa * sc, :] += plane(a, c)
-        i += sa * sc
-        rxyz[:, i:i + sb * sc, :] += plane(b, c)
-        del a, b, c, sa, sb, sc
-        rxyz.shape = (-1, 3)
-
-        # Get all indices of the cuboid planes
-        return self.index(rxyz)
-
-    def _index_shape_ellipsoid(self, ellipsoid):
-        """ Internal routine for ellipsoid shape-indices """
-        # Figure out the points on the ellipsoid
-        rad1 = pi / 180
-        theta, phi = ogrid[-pi:pi:rad1, 0:pi:rad1]
-
-        rxyz = _a.emptyd([theta.size, phi.size, 3])
-        rxyz[..., 2] = cos(phi)
-        sin(phi, out=phi)
-        rxyz[..., 0] = cos(theta) * phi
-        rxyz[..., 1] = sin(theta) * phi
-        rxyz = dot(rxyz, ellipsoid._v) + ellipsoid.center.reshape(1, 3)
-        del theta, phi
-
-        # Get all indices of the ellipsoid circumference
-        return self.index(rxyz)
+    def _index_shape_bounds(self, shape):
+        """ Internal routine for the minimum/maximum indices of the box encompassing a shape
+
+        The extent along each lattice vector is calculated analytically for the encompassing
+        cuboid and ellipsoid, and the box is the intersection of the two.
+        """
+        icell = self.icell
+        cuboid = shape.toCuboid()
+        ellipsoid = shape.toEllipsoid()
+
+        # Fractional half-widths of the cuboid (full edge vectors)
+        c_center = dot(icell, cuboid.center)
+        c_half = np.abs(dot(cuboid._v, icell.T)).sum(0) / 2
+        # Fractional half-widths of the ellipsoid (semi-axes vectors)
+        e_center = dot(icell, ellipsoid.center)
+        e_half = fnorm(dot(ellipsoid._v, icell.T).T)
+
+        fmin = np.maximum(c_center - c_half, e_center - e_half)
+        fmax = np.minimum(c_center + c_half, e_center + e_half)
+        n = _a.asarrayd(self.shape)
+        return floor(fmin * n).astype(int32), floor(fmax * n).astype(int32)
 
     def index(self, coord, axis=None):
         """ Find the grid index for a given coordinate (possibly only along a given lattice vector `axis`)
@@ -689,6 +635,98 @@ class Grid(SuperCellChild):
         else:
             return floor(dot(icell[axis, :], coord.reshape(-1, 3).T) * shape[axis]).T.astype(int32, copy=False)
 
+    def partition(self, geometry=None, method='voronoi', R=None):
+        """ Partition the grid points into atomic regions, one label per grid point
+
+        The returned labels may be re-used for integrating several grids with the same
+        shape (e.g. the charge density, spin density and potential), see `integrate`.
+
+        Parameters
+        ----------
+        geometry : Geometry, optional
+           the atoms to partition the grid into, defaults to the geometry associated
+           with the grid
+        method : {'voronoi', 'sphere'}
+           'voronoi' assigns all grid points to the closest atom.
+           'sphere' assigns a grid point to the closest atom which has the grid point
+           within its radius, grid points outside all atomic spheres are labelled -1.
+        R : float or array_like, optional
+           the radius of the atoms (per atom) for the 'sphere' method, defaults to the
+           maximum orbital range of each atom
+
+        Examples
+        --------
+        >>> labels = rho.partition()
+        >>> Q = rho.integrate(labels, minlength=rho.geometry.na)
+
+        Returns
+        -------
+        numpy.ndarray
+            atomic index of each grid point (same shape as the grid), as an integer array
+        """
+        if geometry is None:
+            geometry = self.geometry
+        if geometry is None:
+            raise ValueError(self.__class__.__name__ + '.partition requires a geometry')
+
+        if method == 'voronoi':
+            R = None
+        elif method == 'sphere':
+            if R is None:
+                R = geometry.atoms.maxR(all=True)
+        else:
+            raise ValueError(self.__class__.__name__ + ".partition method must be one of ['voronoi', 'sphere']")
+
+        periodic = self.bc[:, 0] == self.PERIODIC
+        return partition_grid(self.shape, self.dcell, geometry.xyz - self.origo.reshape(1, 3), periodic, R)
+
+    def integrate(self, partition=None, minlength=0):
+        """ Integrate the grid values, possibly within several regions
+
+        Parameters
+        ----------
+        partition : Shape or list of Shape or numpy.ndarray, optional
+           the regions to integrate within.
+           If ``None``, the integral of the full grid is returned.
+           If a Shape (or a list of Shape), the integral of the grid points within each shape
+           is returned (indices outside the grid are folded back into the grid).
+           If an integer array with the same shape as the grid (see `partition`), the
+           integral of each label is returned, negative labels are not integrated.
+        minlength : int, optional
+           minimum number of returned integrals for an integer array `partition`
+
+        Returns
+        -------
+        float or numpy.ndarray
+            the integral(s) of the grid values
+        """
+        dV = self.dvolume
+        if partition is None:
+            return self.grid.sum() * dV
+
+        elif isinstance(partition, Shape):
+            idx = self.index_fold(self.index(partition))
+            return self.grid[idx[:, 0], idx[:, 1], idx[:, 2]].sum() * dV
+
+        elif isinstance(partition, (list, tuple)):
+            return np.array([self.integrate(p) for p in partition])
+
+        labels = np.asarray(partition)
+        if labels.shape != self.shape:
+            raise ValueError(self.__class__.__name__ + '.integrate requires the partition to have '
+                             'the same shape as the grid')
+        labels = labels.ravel()
+        idx = (labels >= 0).nonzero()[0]
+        labels = labels[idx]
+        grid = self.grid.ravel()[idx]
+        minlength = max(minlength, labels.max() + 1 if len(labels) > 0 else 0)
+        if np.iscomplexobj(grid):
+            I = np.bincount(labels, weights=grid.real, minlength=minlength) + \
+                1j * np.bincount(labels, weights=grid.imag, minlength=minlength)
+        else:
+            I = np.bincount(labels, weights=grid, minlength=minlength)
+        return I * dV
+
     def append(self, other, axis):
         """ Appends other `Grid` to this grid along axis """
         shape = list(self.shape)
@@ -925,6 +963,53 @@ class Grid(SuperCellChild):
         del g
         return indices
 
+    def poisson(self):
+        r""" Solve the Poisson equation, :math:`\nabla^2 V = -\rho`, with the grid values as the source, :math:`\rho`
+
+        The Poisson equation is solved using spectral (FFT) methods which
+        handle arbitrary (non-orthogonal) cells.
+        For periodic grids the average of the source is removed (a compensating homogeneous
+        background) and the average of the solution is 0.
+
+        At most one lattice direction may be non-periodic (`DIRICHLET`/`NEUMANN`, also mixed).
+        Along this direction a finite difference stencil is used with the boundaries located
+        one grid spacing outside the grid. At `DIRICHLET` boundaries the potential is 0 and at
+        `NEUMANN` boundaries the normal derivative is 0.
+
+        Scaling the source appropriately yields the electrostatic potential, e.g.
+        for the Hartree potential (in atomic units) the source should be :math:`4\pi n`.
+
+        For fixing the potential in arbitrary regions (such as electrodes) one has to use
+        the `pyamg` methods.
+
+        Returns
+        -------
+        Grid
+            the solution, :math:`V`, with the same boundary conditions, super cell and geometry
+
+        Raises
+        ------
+        NotImplementedError : if more than one direction is non-periodic or `OPEN` boundary conditions are used
+
+        See Also
+        --------
+        topyamg : create the stencil for an algebraic multigrid solution (for arbitrary constraints)
+        """
+        periodic = self.bc[:, 0] == self.PERIODIC
+        neumann = (False, False)
+        for i in (~periodic).nonzero()[0]:
+            if np.any(self.bc[i] == self.OPEN):
+                raise NotImplementedError(self.__class__.__name__ + '.poisson does not implement OPEN boundary conditions')
+            neumann = tuple(self.bc[i] == self.NEUMANN)
+        if periodic.sum() < 2:
+            raise NotImplementedError(self.__class__.__name__ + '.poisson requires at least 2 periodic directions, '
+                                      'use topyamg for other boundary conditions')
+
+        grid = self.__class__(self.shape, bc=np.copy(self.bc), dtype=self.dtype,
+                              **self.__sc_geometry_dict())
+        grid.grid[...] = poisson_fft(self.grid, self.icell, periodic, neumann)
+        return grid
+
     def pyamg_index(self, index):
         r""" Calculate `pyamg` matrix indices from a list of grid indices
 
@@ -0,0 +1,30 @@
+# This file is automatically generated from sisl setup.py
+released = False
+
+# Git information (specific commit, etc.)
+git_revision = '485660e3c33c9d07dd305f5f39312859ef7c3042'
+git_revision_short = git_revision[:7]
+git_count = 1
+
+# Version information
+major   = 0
+minor   = 9
+micro   = 5
+version = '.'.join(map(str,[major, minor, micro]))
+release = version
+
+if git_count > 2 and not released:
+    # Add git-revision to the version string
+    version += '+' + str(git_count)
+
+# BibTeX information if people wish to cite
+bibtex = '''@misc{{zerothi_sisl,
+    author = {{Papior, Nick R.}},
+    title  = {{sisl: v{0}}},
+    year   = {{2026}},
+    doi    = {{10.5281/zenodo.597181}},
+    url    = {{https://doi.org/10.5281/zenodo.597181}},
+}}'''.format(version)
+
+def cite():
+    return bibtex
@@ -266,24 +266,43 @@ its generic use in all routines etc.
    wannier90
 
 """
-from .sile import *
+import sys
+from importlib import import_module
 
-# Import the different Sile objects
-# enabling the actual print-out
-from .bigdft import *
-from .cube import *
-from .gulp import *
-from .ham import *
-from .molden import *
-from .openmx import *
-from .pdb import *
-from .scaleup import *
-from .siesta import *
-from .tbtrans import *
-from .table import *
-from .vasp import *
-from .wannier90 import *
-from .xsf import *
-from .xyz import *
+from .sile import *
+from .sile import _import_backends
+from ._registry import _backends, _objects
 
+# The different backends (and their Sile objects) are imported on first
+# use, i.e. sisl.io.siesta or sisl.io.xyzSile imports the respective backend.
+# This greatly reduces the time for importing sisl.
 __all__ = [s for s in dir() if not s.startswith('_')]
+__all__.remove('sys')
+__all__.remove('import_module')
+__all__ += [backend for backend, _, _ in _backends]
+__all__ += list(_objects.keys())
+
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        """ Import the backend of `name` on first access """
+        if name in _objects:
+            _import_backends([_objects[name]])
+            obj = getattr(import_module('sisl.io.' + _objects[name]), name)
+            globals()[name] = obj
+            return obj
+        for backend, _, _ in _backends:
+            if name == backend:
+                _import_backends([backend])
+                return import_module('sisl.io.' + backend)
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+    def __dir__():
+        return sorted(set(globals().keys()) | set(__all__))
+
+else:
+    # Module level __getattr__ is not supported, import everything
+    _import_backends()
+    for _name in _objects:
+        globals()[_name] = getattr(import_module('sisl.io.' + _objects[_name]), _name)
+    del _name
@@ -0,0 +1,232 @@
+""" Memory-mapped reading of Fortran unformatted (sequential access) files
+
+A sequential Fortran record is stored as::
+
+   <n (int32)> <n bytes of data> <n (int32)>
+
+The file is memory-mapped and records are returned as views of the mapped memory.
+Hence opening a file is (almost) instantaneous regardless of the file size, and only
+the accessed records are read from disk.
+
+Consecutive records of equal data-type (e.g. a sparse matrix written row by row)
+are handled as a single `FortranRecords` block where the location of all records
+is calculated from the number of elements per record. Any subset of the records may then
+be read with a single (vectorized) gather.
+"""
+from __future__ import print_function, division
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+from sisl.utils.ranges import array_arange
+from .sile import SileError
+
+__all__ = ['FortranFile', 'FortranRecords']
+
+
+class FortranRecords(object):
+    """ A block of consecutive Fortran records of the same data-type
+
+    The records are not read until requested through `read`.
+
+    Parameters
+    ----------
+    fortran : FortranFile
+       the file containing the records
+    offset : int
+       the byte offset of the first record (its leading record marker)
+    count : array_like of int
+       number of elements in each of the records
+    dtype : numpy.dtype
+       data-type of the elements
+    """
+
+    def __init__(self, fortran, offset, count, dtype):
+        self._fortran = fortran
+        self._dtype = fortran._dtype(dtype)
+        isize = self._dtype.itemsize
+        if isize not in (4, 8):
+            raise SileError(self.__class__.__name__ + ' requires the data-type size to be 4 or 8 bytes')
+
+        self.count = np.asarray(count, dtype=np.int64).ravel()
+        nbytes = self.count * isize
+        # Byte offset of the data of each record
+        self._start = np.empty(len(self.count), np.int64)
+        if len(self.count) > 0:
+            self._start[0] = offset + 4
+            np.cumsum(nbytes[:-1] + 8, out=self._start[1:])
+            self._start[1:] += offset + 4
+        self.offset = offset
+        self.end = offset + (nbytes + 8).sum()
+        if self.end > fortran.size:
+            raise SileError(self.__class__.__name__ + ' the records extend beyond the end of the file', fortran)
+
+    def __len__(self):
+        return len(self.count)
+
+    def _rows(self, rows):
+        """ Convert a row specification to an index array """
+        if rows is None:
+            return np.arange(len(self))
+        elif isinstance(rows, slice):
+            return np.arange(len(self))[rows]
+        return np.asarray(rows, dtype=np.int64).ravel()
+
+    def _check(self, rows):
+        """ Assert the record markers of the records `rows` """
+        if len(rows) == 0:
+            return
+        mm = self._fortran._mm
+        # The block is always a multiple of 4 bytes
+        marker = np.frombuffer(mm, self._fortran._dtype(np.int32), (self.end - self.offset) // 4, self.offset)
+        nbytes = self.count[rows] * self._dtype.itemsize
+        i = (self._start[rows] - self.offset) // 4
+        if not (np.all(marker[i - 1] == nbytes) and np.all(marker[i + nbytes // 4] == nbytes)):
+            raise SileError(self.__class__.__name__ + '.read found inconsistent record markers', self._fortran)
+
+    def read(self, rows=None):
+        """ Read the elements of the records `rows` as a single concatenated array
+
+        Parameters
+        ----------
+        rows : int or array_like or slice, optional
+           the records to read (in the given order), defaults to all records
+
+        Returns
+        -------
+        numpy.ndarray
+            a copy of the elements of the records
+        """
+        rows = self._rows(rows)
+        self._check(rows)
+        count = self.count[rows]
+        dtype = self._dtype
+        isize = dtype.itemsize
+        mm = self._fortran._mm
+        if len(rows) == 0 or count.sum() == 0:
+            return np.empty(0, dtype.newbyteorder('='))
+
+        if np.all(self.count == self.count[0]):
+            # Equally sized records are a strided 2D array
+            n = self.count[0]
+            period = n * isize + 8
+            arr = np.frombuffer(mm, dtype, ((len(self) - 1) * period) // isize + n, self._start[0])
+            arr = as_strided(arr, shape=(len(self), n), strides=(period, isize), writeable=False)
+            return arr[rows].astype(dtype.newbyteorder('='), copy=False).ravel()
+
+        # Gather all elements (the distance between two elements is a multiple of the data-type size)
+        arr = np.frombuffer(mm, dtype, (self.end - 4 - self._start[0]) // isize, self._start[0])
+        idx = array_arange((self._start[rows] - self._start[0]) // isize, n=count)
+        return arr[idx].astype(dtype.newbyteorder('='), copy=False)
+
+
+class FortranFile(object):
+    """ Sequential reader of a memory-mapped Fortran unformatted file
+
+    Only 4-byte record markers are supported (the default for all common compilers).
+    The byte-order of the file is automatically detected from the first record.
+
+    Parameters
+    ----------
+    filename : str
+       the file to read
+
+    Examples
+    --------
+    >>> f = FortranFile('siesta.DM')
+    >>> no_u, nspin = f.read_record(np.int32)[:2]
+    >>> ncol = f.read_record(np.int32)
+    >>> list_col = f.read_records(ncol, np.int32)
+    >>> col = list_col.read(slice(0, 10)) # only read the first 10 rows
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        try:
+            self._mm = np.memmap(filename, dtype=np.uint8, mode='r')
+        except ValueError:
+            # empty files can not be memory-mapped
+            raise SileError(self.__class__.__name__ + ' could not memory-map the file (empty file?)', self)
+        self.size = self._mm.size
+        self.pos = 0
+
+        # Figure out the byte-order
+        self._endian = '<'
+        for endian in ['<', '>']:
+            self._endian = endian
+            try:
+                self._marker(0)
+                break
+            except SileError:
+                pass
+        else:
+            raise SileError(self.__class__.__name__ + ' could not determine the byte-order of the file, '
+                            'it does not seem to be a Fortran unformatted file', self)
+
+    def __str__(self):
+        return self.filename
+
+    def _dtype(self, dtype):
+        """ The data-type in the byte-order of the file """
+        return np.dtype(dtype).newbyteorder(self._endian)
+
+    def _marker(self, pos):
+        """ Return the record length at `pos` (and check the trailing marker) """
+        if pos + 4 > self.size:
+            raise SileError(self.__class__.__name__ + ' reached the end of the file', self)
+        dt = self._dtype(np.int32)
+        n = int(np.frombuffer(self._mm, dt, 1, pos)[0])
+        if n < 0 or pos + n + 8 > self.size or int(np.frombuffer(self._mm, dt, 1, pos + 4 + n)[0]) != n:
+            raise SileError(self.__class__.__name__ + ' found an inconsistent record marker at byte {}'.format(pos), self)
+        return n
+
+    def skip_record(self, n=1):
+        """ Skip the next `n` records """
+        for _ in range(n):
+            self.pos += self._marker(self.pos) + 8
+
+    def read_record(self, dtype=np.float64):
+        """ Read the next record as an array of type `dtype`
+
+        Parameters
+        ----------
+        dtype : numpy.dtype
+           the data-type of the record, if the record contains different data-types
+           one should read the record as bytes (``np.uint8``) and convert manually
+        """
+        n = self._marker(self.pos)
+        dtype = self._dtype(dtype)
+        if n % dtype.itemsize != 0:
+            raise SileError(self.__class__.__name__ + '.read_record record length is not a multiple of '
+                            'the data-type size', self)
+        arr = np.frombuffer(self._mm, dtype, n // dtype.itemsize, self.pos + 4)
+        self.pos += n + 8
+        return arr.astype(dtype.newbyteorder('='))
+
+    def record_size(self):
+        """ Size (in bytes) of the next record """
+        return self._marker(self.pos)
+
+    def read_records(self, count, dtype=np.float64):
+        """ Return a lazy block of the next ``len(count)`` records with `count` elements each
+
+        The position is moved past the records without reading them.
+
+        Parameters
+        ----------
+        count : array_like of int
+           number of elements in each record
+        dtype : numpy.dtype
+           the data-type of the records
+
+        Returns
+        -------
+        FortranRecords
+        """
+        records = FortranRecords(self, self.pos, count, dtype)
+        if len(records) > 0:
+            # Quick check of the first record
+            if self._marker(self.pos) != records.count[0] * records._dtype.itemsize:
+                raise SileError(self.__class__.__name__ + '.read_records inconsistent record size', self)
+        self.pos = records.end
+        return records
@@ -1,6 +1,12 @@
 from __future__ import print_function, division
 
-__all__ = ['starts_with_list']
+import re
+from numbers import Integral
+
+import numpy as np
+
+__all__ = ['starts_with_list', 'read_text_array', 'write_text_array']
+__all__ += ['index_lines', 'index_pattern', 'read_columns', 'frame_indices']
 
 
 def starts_with_list(l, comments):
@@ -8,3 +14,275 @@ def starts_with_list(l, comments):
         if l.startswith(comment):
             return True
     return False
+
+
+def read_text_array(fh, n, dtype=np.float64, out=None, chunksize=1048576):
+    """ Read `n` white-space separated values from the (text) file-handle `fh`
+
+    The values are parsed in chunks of lines directly into a pre-allocated
+    array using the C-parser in `numpy.fromstring`.
+    Only whole lines are read, and never more lines than needed to read `n` values.
+    This enables the file-handle to be used subsequently for reading additional data.
+
+    Parameters
+    ----------
+    fh : file-handle
+       the file-handle to read from, the values should start at the next line
+    n : int
+       number of values to read
+    dtype : numpy.dtype, optional
+       data-type of the returned array
+    out : numpy.ndarray, optional
+       C-contiguous array to store the values in (in C-order), has precedence over `dtype`
+    chunksize : int, optional
+       approximate number of values parsed per chunk, this limits the temporary
+       memory usage to ``chunksize`` values
+
+    Returns
+    -------
+    numpy.ndarray : the flattened values of length `n`
+    """
+    if out is None:
+        out = np.empty(n, dtype)
+    elif not out.flags.c_contiguous:
+        raise ValueError('read_text_array: output array must be C-contiguous')
+    else:
+        out = out.reshape(-1)
+    if out.size < n:
+        raise ValueError('read_text_array: output array is too small to hold all values')
+    # The C-parser only handles real values
+    if np.iscomplexobj(out):
+        parse_dtype = np.float64
+    else:
+        parse_dtype = out.dtype
+
+    rl = fh.readline
+    # Maximum number of values per line (decides the number of lines to read)
+    nper = 0
+    i = 0
+    while i < n:
+        if nper == 0:
+            lines = [rl()]
+        else:
+            nl = min((n - i + nper - 1) // nper, max(1, chunksize // nper))
+            lines = [rl() for _ in range(nl)]
+
+        if len(lines[0]) == 0:
+            raise ValueError('read_text_array: premature end of file, read {} of {} values'.format(i, n))
+        if isinstance(lines[0], bytes):
+            # gzipped files are opened in binary mode
+            lines = b''.join(lines).decode()
+        else:
+            lines = ''.join(lines)
+
+        vals = np.fromstring(lines, dtype=parse_dtype, sep=' ')
+        if nper == 0:
+            nper = len(vals)
+        nv = min(len(vals), n - i)
+        out[i:i+nv] = vals[:nv]
+        i += nv
+
+    return out[:n]
+
+
+def write_text_array(fh, values, fmt='.5e', ncol=6, chunksize=1048576):
+    """ Write the values of an array to the (text) file-handle `fh` with `ncol` values per line
+
+    The values are written in large chunks, each chunk formatted in a single ``%``
+    operation (similar to `numpy.savetxt`) to reduce the overhead of formatting each line.
+
+    Parameters
+    ----------
+    fh : file-handle
+       the file-handle to write to
+    values : array_like
+       the values to write, will be flattened in C-order
+    fmt : str or list of str, optional
+       format specification of each value, or of each column (in which case
+       `ncol` is the number of formats)
+    ncol : int, optional
+       number of values per line, a possibly remaining line contains fewer values
+    chunksize : int, optional
+       approximate number of values written per chunk
+    """
+    values = np.asarray(values).reshape(-1)
+    n = values.size
+    if isinstance(fmt, (list, tuple)):
+        ncol = len(fmt)
+        fmt = ['%' + f for f in fmt]
+    else:
+        fmt = ['%' + fmt] * ncol
+    line_fmt = ' '.join(fmt) + '\n'
+
+    # Number of lines per chunk
+    nl = max(1, chunksize // ncol)
+    chunk_fmt = line_fmt * nl
+
+    # Write all full lines
+    nfull = (n // ncol) * ncol
+    step = nl * ncol
+    for i in range(0, nfull, step):
+        chunk = values[i:min(i + step, nfull)]
+        if chunk.size != step:
+            chunk_fmt = line_fmt * (chunk.size // ncol)
+        fh.write(chunk_fmt % tuple(chunk.tolist()))
+
+    # Write remaining line
+    if nfull < n:
+        fh.write(' '.join(fmt[:n - nfull]) % tuple(values[nfull:].tolist()) + '\n')
+
+
+def index_lines(fh, nlines, chunksize=16777216):
+    """ Byte offsets of the blocks of `nlines` lines in the binary file-handle `fh`
+
+    The file is read (from the beginning) in chunks and the line-endings
+    are located with numpy, i.e. the lines are never split in Python.
+    Only complete blocks are indexed, a trailing incomplete block is ignored.
+
+    Parameters
+    ----------
+    fh : file-handle
+       binary file-handle
+    nlines : int
+       number of lines in each block
+    chunksize : int, optional
+       number of bytes read per chunk
+
+    Returns
+    -------
+    numpy.ndarray : byte offsets of the beginning of each block, and the end of the last block
+    """
+    fh.seek(0)
+    offsets = [np.zeros(1, np.int64)]
+    pos = 0
+    # Number of lines read
+    iline = 0
+    last = b'\n'
+    while True:
+        buf = fh.read(chunksize)
+        if len(buf) == 0:
+            break
+        nl = np.flatnonzero(np.frombuffer(buf, np.uint8) == 10)
+        # The line numbers following each of the new-lines
+        line = np.arange(iline + 1, iline + 1 + len(nl))
+        offsets.append(nl[line % nlines == 0] + (pos + 1))
+        iline += len(nl)
+        pos += len(buf)
+        last = buf[-1:]
+    # A final line without a line-ending
+    if last != b'\n':
+        iline += 1
+    nblocks = iline // nlines
+    offsets = np.concatenate(offsets)[:nblocks + 1]
+    if len(offsets) < nblocks + 1:
+        offsets = np.append(offsets, pos)
+    return offsets
+
+
+def index_pattern(fh, pattern, chunksize=16777216):
+    """ Byte offsets of the lines matching `pattern` in the binary file-handle `fh`
+
+    The file is read (from the beginning) in chunks of complete lines which
+    are searched with the regular expression in a single call per chunk.
+
+    Parameters
+    ----------
+    fh : file-handle
+       binary file-handle
+    pattern : bytes or list of bytes
+       regular expression (multi-line mode, i.e. ``^`` and ``$`` match at the line boundaries).
+       For a list of patterns the file is only read once.
+    chunksize : int, optional
+       number of bytes read per chunk
+
+    Returns
+    -------
+    numpy.ndarray : byte offsets of the beginning of the lines matching `pattern`,
+        and the size of the file (the end of the last block). A list of arrays for a list
+        of patterns.
+    """
+    single = not isinstance(pattern, (list, tuple))
+    if single:
+        pattern = [pattern]
+    regex = [re.compile(p, re.M) for p in pattern]
+    offsets = [[] for _ in regex]
+
+    fh.seek(0)
+    pos = 0
+    tail = b''
+    while True:
+        buf = fh.read(chunksize)
+        if len(buf) == 0:
+            buf, tail = tail, b''
+        else:
+            # only search complete lines
+            buf = tail + buf
+            i = buf.rfind(b'\n') + 1
+            buf, tail = buf[:i], buf[i:]
+        if len(buf) == 0 and len(tail) == 0:
+            break
+        rfind = buf.rfind
+        for r, off in zip(regex, offsets):
+            off.extend(pos + rfind(b'\n', 0, m.start()) + 1 for m in r.finditer(buf))
+        pos += len(buf)
+
+    offsets = [np.array(off + [pos], np.int64) for off in offsets]
+    if single:
+        return offsets[0]
+    return offsets
+
+
+def read_columns(text, columns, dtype=np.float64):
+    """ Parse columns of white-space separated values from all lines in `text`
+
+    The lines are reduced to the requested columns with a single regular expression
+    substitution and subsequently parsed by the C-parser in `numpy.fromstring`.
+    Blank lines are ignored, all other lines must contain (at least) ``max(columns) + 1`` columns.
+
+    Parameters
+    ----------
+    text : bytes
+       the lines
+    columns : list of int
+       the (increasing) column indices to extract
+    dtype : numpy.dtype, optional
+       data-type of the returned array
+
+    Returns
+    -------
+    numpy.ndarray : array with shape ``(nlines, len(columns))``
+    """
+    # Consecutive columns are captured in a single group (faster substitution)
+    pattern = br'^[ \t]*'
+    ngroup = 0
+    for i in range(max(columns) + 1):
+        if i > 0:
+            pattern += br'[ \t]+'
+        if i in columns and i - 1 not in columns:
+            pattern += b'('
+            ngroup += 1
+        pattern += br'\S+'
+        if i in columns and i + 1 not in columns:
+            pattern += b')'
+    pattern += br'[^\n]*'
+    repl = ' '.join(r'\{}'.format(i + 1) for i in range(ngroup)).encode()
+    text = re.sub(pattern, repl, text, flags=re.M)
+    return np.fromstring(text.decode(), dtype=dtype, sep=' ').reshape(-1, len(columns))
+
+
+def frame_indices(nframes, frames):
+    """ Indices of the requested `frames` out of `nframes` frames
+
+    Parameters
+    ----------
+    nframes : int
+       total number of frames
+    frames : bool or int or slice or array_like
+       ``True`` for all frames, otherwise an index specification of the frames
+    """
+    idx = np.arange(nframes)
+    if frames is True:
+        return idx
+    elif isinstance(frames, Integral):
+        return idx[[frames]]
+    return idx[frames]
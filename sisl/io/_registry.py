@@ -0,0 +1,105 @@
+""" Static table of the io backends
+
+The backends of `sisl.io` are imported on first use, i.e. when one of their
+objects is accessed, or when `get_sile_class` is queried for a file with a
+suffix handled by the backend.
+This table lists the public objects and the (lower-case) file suffixes
+registered (through `add_sile`) by each backend.
+
+The test-suite checks that the table is consistent with the backends, if
+a backend adds or removes a sile the table should be updated accordingly.
+"""
+from __future__ import print_function, division
+
+__all__ = []
+
+
+# Each entry is (backend, public objects, file suffixes)
+_backends = [
+    ('bigdft',
+     ['SileBigDFT', 'SileBinBigDFT', 'SileCDFBigDFT', 'asciiSileBigDFT'],
+     ['ascii']),
+    ('cube',
+     ['cubeSile'],
+     ['cube']),
+    ('gulp',
+     ['SileCDFGULP', 'SileGULP', 'fcSileGULP', 'gotSileGULP'],
+     ['force_constants_2nd', 'got', 'gout']),
+    ('ham',
+     ['hamiltonianSile'],
+     ['ham']),
+    ('molden',
+     ['moldenSile'],
+     ['molf']),
+    ('openmx',
+     ['SileBinOpenMX', 'SileCDFOpenMX', 'SileOpenMX', 'omxSileOpenMX'],
+     ['omx']),
+    ('pdb',
+     ['pdbSile'],
+     ['pdb']),
+    ('scaleup',
+     ['SileBinScaleUp', 'SileCDFScaleUp', 'SileScaleUp', 'orboccSileScaleUp', 'refSileScaleUp',
+      'restartSileScaleUp', 'rhamSileScaleUp'],
+     ['orbocc', 'ref', 'restart', 'rham']),
+    ('siesta',
+     ['SileBinSiesta', 'SileCDFSiesta', 'SileSiesta', 'bandsSileSiesta', 'dmSileSiesta',
+      'eigSileSiesta', 'faSileSiesta', 'fcSileSiesta', 'fdfSileSiesta', 'gridSileSiesta',
+      'gridncSileSiesta', 'hsxSileSiesta', 'ionncSileSiesta', 'ionxmlSileSiesta', 'kpSileSiesta',
+      'ncSileSiesta', 'onlysSileSiesta', 'orbindxSileSiesta', 'outSileSiesta', 'pdosSileSiesta',
+      'rkpSileSiesta', 'tsdeSileSiesta', 'tsgfSileSiesta', 'tshsSileSiesta', 'tsvncSileSiesta',
+      'xvSileSiesta'],
+     ['bader', 'bands', 'dm', 'drho', 'eig', 'fa', 'fac', 'fc', 'fcc', 'fdf', 'grid.nc', 'hsx',
+      'ioch', 'ion.nc', 'ion.xml', 'kp', 'nc', 'onlys', 'orb_indx', 'out', 'pdos', 'pdos.xml',
+      'rho', 'rhoinit', 'rhoxc', 'rkp', 'toch', 'tsde', 'tsgf', 'tshs', 'tsv.nc', 'vh', 'vna', 'vt',
+      'xv']),
+    ('tbtrans',
+     ['SileBinTBtrans', 'SileCDFTBtrans', 'SileTBtrans', 'TBTGFSileTBtrans', 'deltancSileTBtrans',
+      'phtavncSileTBtrans', 'phtncSileTBtrans', 'phtprojncSileTBtrans', 'phtsencSileTBtrans',
+      'tbtavncSileTBtrans', 'tbtgfSileTBtrans', 'tbtncSileTBtrans', 'tbtprojncSileTBtrans',
+      'tbtsencSileTBtrans'],
+     ['delta.nc', 'dh.nc', 'dse.nc', 'pht.av.nc', 'pht.nc', 'pht.proj.nc', 'pht.se.nc', 'tbt.av.nc',
+      'tbt.nc', 'tbt.proj.nc', 'tbt.se.nc', 'tbt_dn.av.nc', 'tbt_dn.nc', 'tbt_dn.proj.nc',
+      'tbt_dn.se.nc', 'tbt_up.av.nc', 'tbt_up.nc', 'tbt_up.proj.nc', 'tbt_up.se.nc', 'tbtgf']),
+    ('table',
+     ['TableSile', 'tableSile'],
+     ['dat', 'table']),
+    ('vasp',
+     ['SileBinVASP', 'SileCDFVASP', 'SileVASP', 'carSileVASP', 'chgSileVASP', 'doscarSileVASP',
+      'eigenvalSileVASP', 'locpotSileVASP'],
+     ['car', 'chg', 'chgcar', 'contcar', 'doscar', 'eigenval', 'locpot', 'poscar']),
+    ('wannier90',
+     ['SileWannier90', 'winSileWannier90'],
+     ['win']),
+    ('xsf',
+     ['axsfSile', 'xsfSile'],
+     ['axsf', 'xsf']),
+    ('xyz',
+     ['xyzSile'],
+     ['xyz']),
+]
+
+# Public objects -> backend
+_objects = dict((name, backend) for backend, names, _ in _backends for name in names)
+
+# File suffix -> backends
+_suffixes = {}
+for backend, _, suffixes in _backends:
+    for suffix in suffixes:
+        _suffixes.setdefault(suffix, []).append(backend)
+del backend, suffixes, suffix
+
+
+def backends_suffix(suffix):
+    """ List of backends registering siles with the file suffix `suffix`
+
+    Parameters
+    ----------
+    suffix : str
+       the file suffix (without leading ``.``), compressed files (``.gz``)
+       are also looked up without the compression suffix.
+    """
+    suffix = suffix.lower()
+    backends = _suffixes.get(suffix, [])
+    if suffix.endswith('.gz'):
+        backends = backends + _suffixes.get(suffix[:-3], [])
+    return backends
@@ -4,6 +4,7 @@ import numpy as np
 
 # Import sile objects
 from sisl.io.sile import *
+from sisl.io._help import read_text_array, write_text_array
 
 # Import the geometry object
 from sisl import Geometry, Atom, SuperCell, Grid, SislError
@@ -115,7 +116,7 @@ class cubeSile(Sile):
            write only imaginary part of the grid, default to only writing the
            real part.
         buffersize : int, optional
-           size of the buffer while writing the data, (6144)
+           number of values formatted per write statement, (1048576)
         """
         # Check that we can write to the file
         sile_raise_write(self)
@@ -125,32 +126,17 @@ class cubeSile(Sile):
         else:
             self.write_geometry(grid.geometry, size=grid.shape, *args, **kwargs)
 
-        buffersize = kwargs.get('buffersize', min(6144, grid.grid.size))
-        buffersize += buffersize % 6 # ensure multiple of 6
+        buffersize = kwargs.get('buffersize', 1048576)
 
         # A CUBE file contains grid-points aligned like this:
         # for x
         #   for y
         #     for z
         #       write...
-        _fmt1 = '{:' + fmt + '} '
-        _fmt6 = (_fmt1 * 6)[:-1] + '\n'
-        __fmt = _fmt6 * (buffersize // 6)
-
         if imag:
-            for z in np.nditer(np.asarray(grid.grid.imag, order='C').reshape(-1), flags=['external_loop', 'buffered'],
-                               op_flags=[['readonly']], order='C', buffersize=buffersize):
-                if z.shape[0] != buffersize:
-                    s = z.shape[0]
-                    __fmt = _fmt6 * (s // 6) + _fmt1 * (s % 6) + '\n'
-                self._write(__fmt.format(*z.tolist()))
+            write_text_array(self.fh, grid.grid.imag, fmt=fmt, ncol=6, chunksize=buffersize)
         else:
-            for z in np.nditer(np.asarray(grid.grid.real, order='C').reshape(-1), flags=['external_loop', 'buffered'],
-                               op_flags=[['readonly']], order='C', buffersize=buffersize):
-                if z.shape[0] != buffersize:
-                    s = z.shape[0]
-                    __fmt = _fmt6 * (s // 6) + _fmt1 * (s % 6) + '\n'
-                self._write(__fmt.format(*z.tolist()))
+            write_text_array(self.fh, grid.grid.real, fmt=fmt, ncol=6, chunksize=buffersize)
 
         # Add a finishing line to ensure empty ending
         self._write('\n')
@@ -246,14 +232,10 @@ class cubeSile(Sile):
             grid = Grid(ngrid, dtype=np.float64, sc=sc)
         else:
             grid = Grid(ngrid, dtype=np.float64, geometry=geom)
-        grid.grid.shape = (-1,)
-
-        # TODO check performance of this
-        # We are currently doing this to enable reading
-        #  1-column data and 6-column data.
-        lines = [item for sublist in self.fh.readlines() for item in sublist.split()]
-        grid.grid[:] = np.array(lines).astype(grid.dtype)
-        grid.grid.shape = ngrid
+
+        # We are reading directly into the grid to enable reading
+        # 1-column data and 6-column data.
+        read_text_array(self.fh, grid.grid.size, out=grid.grid)
 
         if imag is None:
             return grid
@@ -1,33 +1,35 @@
+import weakref
 import numpy as np
 
-from sisl import SislError
 import sisl._array as _a
-try:
-    from . import _siesta
-    found_module = True
-except Exception as e:
-    found_module = False
 
-__all__ = ['_csr_from_siesta', '_csr_from_sc_off']
+__all__ = ['_siesta_sc_off']
+__all__ += ['_csr_from_siesta', '_csr_from_sc_off']
 __all__ += ['_csr_to_siesta', '_csr_to_sc_off']
+__all__ += ['_csr_share_pattern']
+
+
+def _siesta_sc_off(nsc):
+    """ Internal routine to create the supercell offsets in the Siesta ordering, shape ``(n_s, 3)`` """
+    def linear2pm(n):
+        i = _a.arangei(n)
+        return np.where(i > n // 2, i - n, i)
+    x, y, z = [linear2pm(n) for n in nsc]
+    isc = _a.emptyi([len(z), len(y), len(x), 3])
+    isc[..., 0] = x.reshape(1, 1, -1)
+    isc[..., 1] = y.reshape(1, -1, 1)
+    isc[..., 2] = z.reshape(-1, 1, 1)
+    return isc.reshape(-1, 3)
 
 
 def _csr_from_siesta(geom, csr):
     """ Internal routine to convert *any* SparseCSR matrix from sisl nsc to siesta nsc """
-    _csr_from_sc_off(geom, _siesta.siesta_sc_off(*geom.nsc).T, csr)
+    _csr_from_sc_off(geom, _siesta_sc_off(geom.nsc), csr)
 
 
 def _csr_to_siesta(geom, csr):
     """ Internal routine to convert *any* SparseCSR matrix from sisl nsc to siesta nsc """
-    _csr_to_sc_off(geom, _siesta.siesta_sc_off(*geom.nsc).T, csr)
-
-
-if not found_module:
-    def _csr_from_siesta(geom, csr):
-        raise SislError('sisl cannot convert the sparse matrix from a Siesta conforming sparsity pattern! Please install with fortran support!')
-
-    def _csr_to_siesta(geom, csr):
-        raise SislError('sisl cannot convert the sparse matrix into a Siesta conforming sparsity pattern! Please install with fortran support!')
+    _csr_to_sc_off(geom, _siesta_sc_off(geom.nsc), csr)
 
 
 def _csr_from_sc_off(geom, sc_off, csr):
@@ -55,3 +57,18 @@ def _csr_from(col_from, csr):
     # local csr matrix ordering
     col_to = _a.arangei(csr.shape[1])
     csr.translate_columns(col_from, col_to)
+
+
+def _csr_share_pattern(sile, csr):
+    """ Internal routine to share the sparsity pattern with the sparse matrix previously read from `sile`
+
+    Siesta stores H, S, DM and EDM with the same sparsity pattern. If `csr` has the same
+    non-zero elements as the previously read (and still alive) sparse matrix, the two
+    will share the sparsity pattern (copy-on-write).
+    """
+    ref = getattr(sile, '_csr_pattern', None)
+    prev = None if ref is None else ref()
+    if prev is not None and prev is not csr and csr.spsame(prev):
+        csr.share_pattern(prev)
+    else:
+        sile._csr_pattern = weakref.ref(csr)
@@ -11,6 +11,7 @@ except Exception as e:
 
 from sisl.messages import warn, SislError
 from ..sile import add_sile, SileError
+from .._fortran import FortranFile
 from .sile import SileBinSiesta
 
 import sisl._array as _a
@@ -37,39 +38,109 @@ def _bin_check(obj, method, message):
         raise SileError('{}.{} {}'.format(str(obj), method, message))
 
 
+def _bin_write_check(obj, method):
+    if not found_module:
+        raise SileError('{}.{} requires sisl to be installed with Fortran support for writing.'.format(str(obj), method))
+
+
+def _rows(orbitals):
+    """ Internal routine to convert the `orbitals` argument to (sorted) rows of the sparse matrix """
+    if orbitals is None:
+        return None
+    return np.unique(_a.asarrayi(orbitals).ravel())
+
+
+def _set_csr(csr, ncol, rows, col, D):
+    """ Internal routine to set the sparse matrix from the Siesta sparse rows
+
+    Parameters
+    ----------
+    csr : SparseCSR
+       the sparse matrix to be overwritten
+    ncol : numpy.ndarray
+       number of non-zero elements per row (for all rows)
+    rows : numpy.ndarray or None
+       only these rows are read, the remaining rows will not have any elements
+    col : numpy.ndarray
+       the (Fortran) column indices (only for `rows`)
+    D : numpy.ndarray
+       the data (only for `rows`)
+    """
+    if rows is not None:
+        n = np.zeros_like(ncol)
+        n[rows] = ncol[rows]
+        ncol = n
+    csr.ncol = ncol.astype(np.int32, copy=False)
+    csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
+    # Correct fortran indices
+    csr.col = col.astype(np.int32, copy=False) - 1
+    csr._nnz = len(csr.col)
+    csr._D = D
+
+
 class onlysSileSiesta(SileBinSiesta):
-    """ Geometry and overlap matrix """
+    """ Geometry and overlap matrix
+
+    The file is memory-mapped and only the requested parts are read from the file.
+    All sparse matrix readers accept the ``orbitals`` keyword which only reads the
+    rows of the requested orbitals (e.g. ``orbitals=geometry.a2o(ia, all=True)`` for
+    the rows of atom ``ia``), all other rows will be empty.
+    """
+
+    def _read_header(self):
+        """ Internal routine to read the sizes and locate all matrices in the TSHS file """
+        f = FortranFile(self.file)
+        if f.record_size() != 4:
+            raise SileError(str(self) + ' is an old TSHS file (version 0) which is not supported.')
+        version = f.read_record(np.int32)[0]
+        if version != 1:
+            raise SileError(str(self) + ' has an unsupported TSHS version {}.'.format(version))
+
+        h = {}
+        h['na_u'], h['no_u'], no_s, h['nspin'], h['nnz'] = f.read_record(np.int32)
+        h['n_s'] = no_s // h['no_u']
+        h['nsc'] = f.read_record(np.int32)
+        cell_xa = f.read_record(np.float64) * Bohr2Ang
+        h['cell'] = cell_xa[:9].reshape(3, 3)
+        h['xa'] = cell_xa[9:].reshape(-1, 3)
+        Gamma, TSGamma, onlyS = f.read_record(np.int32) != 0
+        f.skip_record() # kscell, kdispl
+        # Ef, Qtot, Temp
+        h['Ef'] = f.read_record(np.float64)[0]
+        f.skip_record() # istep, ia1
+        h['lasto'] = f.read_record(np.int32)
+
+        # Sparse pattern and matrices (these are not read)
+        h['ncol'] = f.read_record(np.int32)
+        h['list_col'] = f.read_records(h['ncol'], np.int32)
+        h['S'] = f.read_records(h['ncol'], np.float64)
+        if onlyS:
+            h['H'] = []
+        else:
+            h['H'] = [f.read_records(h['ncol'], np.float64) for _ in range(h['nspin'])]
+        if Gamma:
+            h['isc'] = _a.zerosi([1, 3])
+        else:
+            h['isc'] = f.read_record(np.int32).reshape(-1, 3)
+        return h
 
     def read_supercell(self):
         """ Returns a SuperCell object from a siesta.TSHS file """
-        n_s = _siesta.read_tshs_sizes(self.file)[3]
-        _bin_check(self, 'read_supercell', 'could not read sizes.')
-        arr = _siesta.read_tshs_cell(self.file, n_s)
-        _bin_check(self, 'read_supercell', 'could not read cell.')
-        nsc = np.array(arr[0], np.int32)
-        cell = np.array(arr[1].T, np.float64)
-        cell.shape = (3, 3)
-        return SuperCell(cell, nsc=nsc)
+        h = self._read_header()
+        return SuperCell(h['cell'], nsc=h['nsc'])
 
     def read_geometry(self):
         """ Returns Geometry object from a siesta.TSHS file """
+        h = self._read_header()
 
         # Read supercell
-        sc = self.read_supercell()
-
-        na = _siesta.read_tshs_sizes(self.file)[1]
-        _bin_check(self, 'read_geometry', 'could not read sizes.')
-        arr = _siesta.read_tshs_geom(self.file, na)
-        _bin_check(self, 'read_geometry', 'could not read geometry.')
-        xyz = np.array(arr[0].T, np.float64)
-        xyz.shape = (-1, 3)
-        lasto = np.array(arr[1], np.int32)
+        sc = SuperCell(h['cell'], nsc=h['nsc'])
 
         # Create all different atoms...
         # The TSHS file does not contain the
         # atomic numbers, so we will just
         # create them individually
-        orbs = np.diff(lasto)
+        orbs = np.diff(h['lasto'])
 
         # Get unique orbitals
         uorb = np.unique(orbs)
@@ -88,102 +159,106 @@ class onlysSileSiesta(SileBinSiesta):
             atom.append(get_atom(atoms, orb))
 
         # Create and return geometry object
-        geom = Geometry(xyz, atom, sc=sc)
+        geom = Geometry(h['xa'], atom, sc=sc)
 
         return geom
 
-    def read_overlap(self, **kwargs):
-        """ Returns the overlap matrix from the siesta.TSHS file """
+    def _read_geometry_check(self, method, **kwargs):
+        """ Internal routine to retrieve (and check) the geometry for a sparse matrix """
         tshs_g = self.read_geometry()
         geom = kwargs.get('geometry', tshs_g)
         if geom.na != tshs_g.na or geom.no != tshs_g.no:
-            raise SileError(self.__class__.__name__ + '.read_overlap could not use the '
+            raise SileError(self.__class__.__name__ + '.' + method + ' could not use the '
                             'passed geometry as the number of atoms or orbitals is '
                             'inconsistent with TSHS file.')
 
         # Ensure that the number of supercells is correct
         if np.any(geom.nsc != tshs_g.nsc):
             geom.set_nsc(tshs_g.nsc)
+        return geom
 
-        # read the sizes used...
-        sizes = _siesta.read_tshs_sizes(self.file)
-        _bin_check(self, 'read_overlap', 'could not read sizes.')
-        isc = _siesta.read_tshs_cell(self.file, sizes[3])[2].T
-        _bin_check(self, 'read_overlap', 'could not read cell.')
-        no = sizes[2]
-        nnz = sizes[4]
-        ncol, col, dS = _siesta.read_tshs_s(self.file, no, nnz)
-        _bin_check(self, 'read_overlap', 'could not read overlap matrix.')
+    def read_overlap(self, **kwargs):
+        """ Returns the overlap matrix from the siesta.TSHS file
+
+        Parameters
+        ----------
+        geometry : Geometry, optional
+           the geometry associated with the overlap matrix
+        orbitals : array_like of int, optional
+           only read the rows of these orbitals
+        """
+        geom = self._read_geometry_check('read_overlap', **kwargs)
+        h = self._read_header()
+        rows = _rows(kwargs.get('orbitals', None))
 
         # Create the Hamiltonian container
         S = SparseOrbitalBZ(geom, nnzpr=1)
 
         # Create the new sparse matrix
-        S._csr.ncol = ncol.astype(np.int32, copy=False)
-        S._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        S._csr.col = col.astype(np.int32, copy=False) - 1
-        S._csr._nnz = len(col)
-
-        S._csr._D = np.empty([nnz, 1], np.float64)
-        S._csr._D[:, 0] = dS[:]
+        dS = h['S'].read(rows)
+        _set_csr(S._csr, h['ncol'], rows, h['list_col'].read(rows), dS.reshape(-1, 1))
 
         # Convert to sisl supercell
-        _csr_from_sc_off(S.geometry, isc, S._csr)
+        _csr_from_sc_off(S.geometry, h['isc'], S._csr)
+        _csr_share_pattern(self, S._csr)
 
         return S
 
 
 class tshsSileSiesta(onlysSileSiesta):
-    """ Geometry, Hamiltonian and overlap matrix file """
+    """ Geometry, Hamiltonian and overlap matrix file
+
+    The file is memory-mapped and only the requested parts are read from the file.
+    All sparse matrix readers accept the ``orbitals`` keyword which only reads the
+    rows of the requested orbitals (e.g. ``orbitals=geometry.a2o(ia, all=True)`` for
+    the rows of atom ``ia``), all other rows will be empty.
+    """
 
     def read_hamiltonian(self, **kwargs):
-        """ Returns the electronic structure from the siesta.TSHS file """
-        tshs_g = self.read_geometry()
-        geom = kwargs.get('geometry', tshs_g)
-        if geom.na != tshs_g.na or geom.no != tshs_g.no:
-            raise SileError(self.__class__.__name__ + '.read_hamiltonian could not use the '
-                            'passed geometry as the number of atoms or orbitals is inconsistent '
-                            'with TSHS file.')
+        """ Returns the electronic structure from the siesta.TSHS file
 
-        # Ensure that the number of supercells is correct
-        if np.any(geom.nsc != tshs_g.nsc):
-            geom.set_nsc(tshs_g.nsc)
+        Parameters
+        ----------
+        geometry : Geometry, optional
+           the geometry associated with the Hamiltonian
+        orbitals : array_like of int, optional
+           only read the rows of these orbitals
+        """
+        geom = self._read_geometry_check('read_hamiltonian', **kwargs)
+        h = self._read_header()
+        rows = _rows(kwargs.get('orbitals', None))
+        spin = h['nspin']
+        no = h['no_u']
 
-        # read the sizes used...
-        sizes = _siesta.read_tshs_sizes(self.file)
-        _bin_check(self, 'read_hamiltonian', 'could not read sizes.')
-        isc = _siesta.read_tshs_cell(self.file, sizes[3])[2].T
-        _bin_check(self, 'read_hamiltonian', 'could not read cell.')
-        spin = sizes[0]
-        no = sizes[2]
-        nnz = sizes[4]
-        ncol, col, dH, dS = _siesta.read_tshs_hs(self.file, spin, no, nnz)
-        _bin_check(self, 'read_hamiltonian', 'could not read Hamiltonian and overlap matrix.')
+        dS = h['S'].read(rows)
+        col = h['list_col'].read(rows)
 
         # Check whether it is an orthogonal basis set
-        orthogonal = np.abs(dS).sum() == geom.no
+        if rows is None:
+            orthogonal = np.abs(dS).sum() == geom.no
+        else:
+            orthogonal = np.abs(dS).sum() == len(rows)
 
         # Create the Hamiltonian container
         H = Hamiltonian(geom, spin, nnzpr=1, orthogonal=orthogonal)
 
-        # Create the new sparse matrix
-        H._csr.ncol = ncol.astype(np.int32, copy=False)
-        H._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        H._csr.col = col.astype(np.int32, copy=False) - 1
-        H._csr._nnz = len(col)
-
         if orthogonal:
-            H._csr._D = np.empty([nnz, spin], np.float64)
-            H._csr._D[:, :] = dH[:, :]
+            D = np.zeros([len(dS), spin], np.float64)
         else:
-            H._csr._D = np.empty([nnz, spin+1], np.float64)
-            H._csr._D[:, :spin] = dH[:, :]
-            H._csr._D[:, spin] = dS[:]
+            D = np.zeros([len(dS), spin+1], np.float64)
+            D[:, spin] = dS
+        for i, dH in enumerate(h['H']):
+            D[:, i] = dH.read(rows)
+            # Move to Ef = 0
+            if i < 2:
+                D[:, i] -= h['Ef'] * dS
+        D[:, :spin] *= Ry2eV
+
+        # Create the new sparse matrix
+        _set_csr(H._csr, h['ncol'], rows, col, D)
 
         # Convert to sisl supercell
-        _csr_from_sc_off(H.geometry, isc, H._csr)
+        _csr_from_sc_off(H.geometry, h['isc'], H._csr)
 
         # Find all indices where dS == 1 (remember col is in fortran indices)
         idx = col[np.isclose(dS, 1.).nonzero()[0]]
@@ -192,11 +267,13 @@ class tshsSileSiesta(onlysSileSiesta):
             print(idx)
             raise SileError(str(self) + '.read_hamiltonian could not assert '
                             'the supercell connections in the primary unit-cell.')
+        _csr_share_pattern(self, H._csr)
 
         return H
 
     def write_hamiltonian(self, H, **kwargs):
         """ Writes the Hamiltonian to a siesta.TSHS file """
+        _bin_write_check(self, 'write_hamiltonian')
         H.finalize()
         csr = H._csr.copy()
         if csr.nnz == 0:
@@ -243,17 +320,35 @@ class tshsSileSiesta(onlysSileSiesta):
 
 
 class dmSileSiesta(SileBinSiesta):
-    """ Density matrix file """
+    """ Density matrix file
 
-    def read_density_matrix(self, **kwargs):
-        """ Returns the density matrix from the siesta.DM file """
-
-        # Now read the sizes used...
-        spin, no, nsc, nnz = _siesta.read_dm_sizes(self.file)
-        _bin_check(self, 'read_density_matrix', 'could not read density matrix sizes.')
+    The file is memory-mapped and only the requested parts are read from the file.
+    The sparse matrix readers accept the ``orbitals`` keyword which only reads the
+    rows of the requested orbitals, all other rows will be empty.
+    """
 
-        ncol, col, dDM = _siesta.read_dm(self.file, spin, no, nsc, nnz)
-        _bin_check(self, 'read_density_matrix', 'could not read density matrix.')
+    def _read_header(self):
+        """ Internal routine to read the sizes and locate the density matrix in the DM file """
+        f = FortranFile(self.file)
+        h = {}
+        # Older files does not contain the number of supercells
+        sizes = f.read_record(np.int32)
+        h['no_u'], h['nspin'] = sizes[:2]
+        if len(sizes) == 5:
+            h['nsc'] = sizes[2:]
+        else:
+            h['nsc'] = _a.zerosi(3)
+        h['ncol'] = f.read_record(np.int32)
+        h['list_col'] = f.read_records(h['ncol'], np.int32)
+        h['DM'] = [f.read_records(h['ncol'], np.float64) for _ in range(h['nspin'])]
+        # Subsequent data starts here
+        h['fortran'] = f
+        return h
+
+    def _read_geometry(self, method, h, **kwargs):
+        """ Internal routine to retrieve (or create) the geometry for the sparse matrix """
+        no = h['no_u']
+        nsc = h['nsc']
 
         # Try and immediately attach a geometry
         geom = kwargs.get('geometry', kwargs.get('geom', None))
@@ -269,35 +364,56 @@ class dmSileSiesta(SileBinSiesta):
             geom.set_nsc(nsc)
 
         if geom.no != no:
-            raise SileError(str(self) + '.read_density_matrix could not use the '
+            raise SileError(str(self) + '.' + method + ' could not use the '
                             'passed geometry as the number of atoms or orbitals is '
                             'inconsistent with DM file.')
+        return geom
+
+    def _read_sparse(self, method, cls, h, D, rows, **kwargs):
+        """ Internal routine to create the sparse matrix """
+        geom = self._read_geometry(method, h, **kwargs)
+        spin = h['nspin']
 
         # Create the density matrix container
-        DM = DensityMatrix(geom, spin, nnzpr=1, dtype=np.float64, orthogonal=False)
+        M = cls(geom, spin, nnzpr=1, dtype=np.float64, orthogonal=False)
 
         # Create the new sparse matrix
-        DM._csr.ncol = ncol.astype(np.int32, copy=False)
-        DM._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        DM._csr.col = col.astype(np.int32, copy=False) - 1
-        DM._csr._nnz = len(col)
-
-        DM._csr._D = np.empty([nnz, spin+1], np.float64)
-        DM._csr._D[:, :spin] = dDM[:, :]
-        # DM file does not contain overlap matrix... so neglect it for now.
-        DM._csr._D[:, spin] = 0.
+        _set_csr(M._csr, h['ncol'], rows, h['list_col'].read(rows), D)
 
         # Convert the supercells to sisl supercells
-        if nsc[0] != 0 or geom.no_s >= col.max():
-            _csr_from_siesta(geom, DM._csr)
+        if h['nsc'][0] != 0 or M._csr.nnz == 0 or geom.no_s > M._csr.col.max():
+            _csr_from_siesta(geom, M._csr)
         else:
-            warn(str(self) + '.read_density_matrix may result in a wrong sparse pattern!')
+            warn(str(self) + '.' + method + ' may result in a wrong sparse pattern!')
+        _csr_share_pattern(self, M._csr)
+
+        return M
 
-        return DM
+    def read_density_matrix(self, **kwargs):
+        """ Returns the density matrix from the siesta.DM file
+
+        Parameters
+        ----------
+        geometry : Geometry, optional
+           the geometry associated with the density matrix
+        orbitals : array_like of int, optional
+           only read the rows of these orbitals
+        """
+        h = self._read_header()
+        rows = _rows(kwargs.get('orbitals', None))
+        spin = h['nspin']
+
+        D = np.empty([h['list_col'].count[rows].sum() if rows is not None else h['ncol'].sum(), spin+1], np.float64)
+        for i, dDM in enumerate(h['DM']):
+            D[:, i] = dDM.read(rows)
+        # DM file does not contain overlap matrix... so neglect it for now.
+        D[:, spin] = 0.
+
+        return self._read_sparse('read_density_matrix', DensityMatrix, h, D, rows, **kwargs)
 
     def write_density_matrix(self, DM, **kwargs):
         """ Writes the density matrix to a siesta.DM file """
+        _bin_write_check(self, 'write_density_matrix')
         DM.finalize()
         csr = DM._csr.copy()
         if csr.nnz == 0:
@@ -323,77 +439,92 @@ class dmSileSiesta(SileBinSiesta):
 
 
 class tsdeSileSiesta(dmSileSiesta):
-    """ Non-equilibrium density matrix and energy density matrix file """
-
-    def read_energy_density_matrix(self, **kwargs):
-        """ Returns the energy density matrix from the siesta.DM file """
-
-        # Now read the sizes used...
-        spin, no, nsc, nnz = _siesta.read_tsde_sizes(self.file)
-        _bin_check(self, 'read_energy_density_matrix', 'could not read energy density matrix sizes.')
-        ncol, col, dEDM = _siesta.read_tsde_edm(self.file, spin, no, nsc, nnz)
-        _bin_check(self, 'read_energy_density_matrix', 'could not read energy density matrix.')
+    """ Non-equilibrium density matrix and energy density matrix file
 
-        # Try and immediately attach a geometry
-        geom = kwargs.get('geometry', kwargs.get('geom', None))
-        if geom is None:
-            # We truly, have no clue,
-            # Just generate a boxed system
-            xyz = [[x, 0, 0] for x in range(no)]
-            sc = SuperCell([no, 1, 1], nsc=nsc)
-            geom = Geometry(xyz, Atom(1), sc=sc)
-
-        if nsc[0] != 0 and np.any(geom.nsc != nsc):
-            # We have to update the number of supercells!
-            geom.set_nsc(nsc)
+    The file is memory-mapped and only the requested parts are read from the file.
+    The sparse matrix readers accept the ``orbitals`` keyword which only reads the
+    rows of the requested orbitals, all other rows will be empty.
+    """
 
-        if geom.no != no:
-            raise SileError(str(self) + '.read_energy_density_matrix could '
-                            'not use the passed geometry as the number of atoms or orbitals '
-                            'is inconsistent with DM file.')
+    def _read_header_edm(self):
+        """ Internal routine to read the sizes and locate the matrices in the TSDE file """
+        h = self._read_header()
+        f = h.pop('fortran')
+        h['EDM'] = [f.read_records(h['ncol'], np.float64) for _ in range(h['nspin'])]
+        h['Ef'] = f.read_record(np.float64)[0]
+        return h
 
-        # Create the energy density matrix container
-        EDM = EnergyDensityMatrix(geom, spin, nnzpr=1, dtype=np.float64, orthogonal=False)
+    def read_energy_density_matrix(self, **kwargs):
+        """ Returns the energy density matrix from the siesta.DM file
 
-        # Create the new sparse matrix
-        EDM._csr.ncol = ncol.astype(np.int32, copy=False)
-        EDM._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        EDM._csr.col = col.astype(np.int32, copy=False) - 1
-        EDM._csr._nnz = len(col)
-
-        EDM._csr._D = np.empty([nnz, spin+1], np.float64)
-        EDM._csr._D[:, :spin] = dEDM[:, :]
+        Parameters
+        ----------
+        geometry : Geometry, optional
+           the geometry associated with the energy density matrix
+        orbitals : array_like of int, optional
+           only read the rows of these orbitals
+        """
+        h = self._read_header_edm()
+        rows = _rows(kwargs.get('orbitals', None))
+        spin = h['nspin']
+
+        D = np.empty([h['list_col'].count[rows].sum() if rows is not None else h['ncol'].sum(), spin+1], np.float64)
+        for i, (dDM, dEDM) in enumerate(zip(h['DM'], h['EDM'])):
+            # Move to Ef = 0
+            D[:, i] = (dEDM.read(rows) - h['Ef'] * dDM.read(rows)) * Ry2eV
         # EDM file does not contain overlap matrix... so neglect it for now.
-        EDM._csr._D[:, spin] = 0.
-
-        # Convert the supercells to sisl supercells
-        if nsc[0] != 0 or geom.no_s >= col.max():
-            _csr_from_siesta(geom, EDM._csr)
-        else:
-            warn(str(self) + '.read_energy_density_matrix may '
-                 'result in a wrong sparse pattern!')
+        D[:, spin] = 0.
 
-        return EDM
+        return self._read_sparse('read_energy_density_matrix', EnergyDensityMatrix, h, D, rows, **kwargs)
 
 
 class hsxSileSiesta(SileBinSiesta):
-    """ Hamiltonian and overlap matrix file """
+    """ Hamiltonian and overlap matrix file
+
+    The file is memory-mapped and only the requested parts are read from the file.
+    The sparse matrix readers accept the ``orbitals`` keyword which only reads the
+    rows of the requested orbitals, all other rows will be empty.
+    """
+
+    def _read_header(self):
+        """ Internal routine to read the sizes and locate all matrices in the HSX file """
+        f = FortranFile(self.file)
+        h = {}
+        h['no_u'], h['no_s'], h['nspin'], h['nnz'] = f.read_record(np.int32)
+        h['Gamma'] = f.read_record(np.int32)[0] != 0
+        if not h['Gamma']:
+            f.skip_record() # indxuo
+        h['ncol'] = f.read_record(np.int32)
+        h['list_col'] = f.read_records(h['ncol'], np.int32)
+        h['H'] = [f.read_records(h['ncol'], np.float32) for _ in range(h['nspin'])]
+        h['S'] = f.read_records(h['ncol'], np.float32)
+        f.skip_record() # Qtot, temp
+        if h['Gamma']:
+            h['xij'] = None
+        else:
+            h['xij'] = f.read_records(h['ncol'] * 3, np.float32)
+        return h
 
     def read_hamiltonian(self, **kwargs):
-        """ Returns the electronic structure from the siesta.TSHS file """
+        """ Returns the electronic structure from the siesta.HSX file
 
-        # Now read the sizes used...
-        Gamma, spin, no, no_s, nnz = _siesta.read_hsx_sizes(self.file)
-        _bin_check(self, 'read_hamiltonian', 'could not read Hamiltonian sizes.')
-        ncol, col, dH, dS, dxij = _siesta.read_hsx_hsx(self.file, Gamma, spin, no, no_s, nnz)
-        _bin_check(self, 'read_hamiltonian', 'could not read Hamiltonian.')
+        Parameters
+        ----------
+        geometry : Geometry, optional
+           the geometry associated with the Hamiltonian
+        orbitals : array_like of int, optional
+           only read the rows of these orbitals
+        """
+        h = self._read_header()
+        rows = _rows(kwargs.get('orbitals', None))
+        no = h['no_u']
+        spin = h['nspin']
 
         # Try and immediately attach a geometry
         geom = kwargs.get('geometry', kwargs.get('geom', None))
         if geom is None:
             # We have *no* clue about the
-            if np.allclose(dxij, 0.):
+            if h['xij'] is None or np.allclose(h['xij'].read(rows), 0.):
                 # We truly, have no clue,
                 # Just generate a boxed system
                 xyz = [[x, 0, 0] for x in range(no)]
@@ -410,34 +541,39 @@ class hsxSileSiesta(SileBinSiesta):
         # Create the Hamiltonian container
         H = Hamiltonian(geom, spin, nnzpr=1, dtype=np.float32, orthogonal=False)
 
-        # Create the new sparse matrix
-        H._csr.ncol = ncol.astype(np.int32, copy=False)
-        H._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        H._csr.col = col.astype(np.int32, copy=False) - 1
-        H._csr._nnz = len(col)
+        dS = h['S'].read(rows)
+        D = np.empty([len(dS), spin+1], np.float32)
+        for i, dH in enumerate(h['H']):
+            D[:, i] = dH.read(rows) * Ry2eV
+        D[:, spin] = dS
 
-        H._csr._D = np.empty([nnz, spin+1], np.float32)
-        H._csr._D[:, :spin] = dH[:, :]
-        H._csr._D[:, spin] = dS[:]
+        # Create the new sparse matrix
+        _set_csr(H._csr, h['ncol'], rows, h['list_col'].read(rows), D)
 
         # Convert the supercells to sisl supercells
-        if no_s // no == np.product(geom.nsc):
+        if h['no_s'] // no == np.product(geom.nsc):
             _csr_from_siesta(geom, H._csr)
+        _csr_share_pattern(self, H._csr)
 
         return H
 
     def read_overlap(self, **kwargs):
-        """ Returns the overlap matrix from the siesta.HSX file """
-        # Now read the sizes used...
-        Gamma, spin, no, no_s, nnz = _siesta.read_hsx_sizes(self.file)
-        _bin_check(self, 'read_overlap', 'could not read overlap matrix sizes.')
-        ncol, col, dS = _siesta.read_hsx_s(self.file, Gamma, spin, no, no_s, nnz)
-        _bin_check(self, 'read_overlap', 'could not read overlap matrix.')
+        """ Returns the overlap matrix from the siesta.HSX file
+
+        Parameters
+        ----------
+        geometry : Geometry
+           the geometry associated with the overlap matrix
+        orbitals : array_like of int, optional
+           only read the rows of these orbitals
+        """
+        h = self._read_header()
+        rows = _rows(kwargs.get('orbitals', None))
+        no = h['no_u']
 
         geom = kwargs.get('geometry', kwargs.get('geom', None))
         if geom is None:
-            warn(self.__class__.__name__ + ".read_overlap requires input geometry to assign S")
+            raise SileError(self.__class__.__name__ + '.read_overlap requires input geometry to assign S')
         if geom.no != no:
             raise SileError(str(self) + '.read_overlap could not use the '
                             'passed geometry as the number of atoms or orbitals is '
@@ -447,18 +583,13 @@ class hsxSileSiesta(SileBinSiesta):
         S = SparseOrbitalBZ(geom, nnzpr=1)
 
         # Create the new sparse matrix
-        S._csr.ncol = ncol.astype(np.int32, copy=False)
-        S._csr.ptr = np.insert(np.cumsum(ncol, dtype=np.int32), 0, 0)
-        # Correct fortran indices
-        S._csr.col = col.astype(np.int32, copy=False) - 1
-        S._csr._nnz = len(col)
-
-        S._csr._D = np.empty([nnz, 1], np.float32)
-        S._csr._D[:, 0] = dS[:]
+        dS = h['S'].read(rows)
+        _set_csr(S._csr, h['ncol'], rows, h['list_col'].read(rows), dS.reshape(-1, 1))
 
         # Convert the supercells to sisl supercells
-        if no_s // no == np.product(geom.nsc):
+        if h['no_s'] // no == np.product(geom.nsc):
             _csr_from_siesta(geom, S._csr)
+        _csr_share_pattern(self, S._csr)
 
         return S
 
@@ -468,16 +599,24 @@ class _gridSileSiesta(SileBinSiesta):
 
     The Siesta binary grid sile will automatically convert the units from Siesta
     units (Bohr, Ry) to sisl units (Ang, eV) provided the correct extension is present.
-    """
 
-    def read_supercell(self, *args, **kwargs):
+    The file is memory-mapped and only the requested spin-components are read from the file.
+    """
 
-        cell = _siesta.read_grid_cell(self.file)
-        _bin_check(self, 'read_supercell', 'could not read cell.')
-        cell = np.array(cell.T, np.float64)
-        cell.shape = (3, 3)
+    def _read_header(self):
+        """ Internal routine to read the cell, sizes and locate the grid in the file """
+        f = FortranFile(self.file)
+        h = {}
+        h['cell'] = f.read_record(np.float64).reshape(3, 3) * Bohr2Ang
+        sizes = f.read_record(np.int32)
+        h['mesh'] = sizes[:3]
+        h['nspin'] = sizes[3]
+        h['grid'] = f.read_records(np.full(h['mesh'][1] * h['mesh'][2] * h['nspin'], h['mesh'][0]), np.float32)
+        return h
 
-        return SuperCell(cell)
+    def read_supercell(self, *args, **kwargs):
+        h = self._read_header()
+        return SuperCell(h['cell'])
 
     def read_grid(self, index=0, *args, **kwargs):
         """ Read grid contained in the Grid file
@@ -490,35 +629,30 @@ class _gridSileSiesta(SileBinSiesta):
            ``[0.5, 0.5]`` will return sum of half the first two components.
            Default to the first component.
         """
-        # Read the sizes
-        nspin, mesh = _siesta.read_grid_sizes(self.file)
-        _bin_check(self, 'read_grid', 'could not read grid sizes.')
-        # Read the cell and grid
-        cell = _siesta.read_grid_cell(self.file)
-        _bin_check(self, 'read_grid', 'could not read grid cell.')
-        grid = _siesta.read_grid(self.file, nspin, mesh[0], mesh[1], mesh[2])
-        _bin_check(self, 'read_grid', 'could not read grid.')
+        h = self._read_header()
+        mesh = h['mesh']
+        nspin = h['nspin']
+        # Number of records per spin-component
+        n = mesh[1] * mesh[2]
+
+        def read_spin(i):
+            # The first axis is the fastest (Fortran order)
+            g = h['grid'].read(slice(i * n, (i + 1) * n)).reshape(mesh[2], mesh[1], mesh[0])
+            return g.transpose(2, 1, 0)
 
         if isinstance(index, Integral):
-            grid = grid[:, :, :, index]
+            grid = read_spin(index)
         else:
-            if len(index) > grid.shape[0]:
+            if len(index) > nspin:
                 raise ValueError(self.__class__.__name__ + '.read_grid requires spin to be an integer or '
                                  'an array of length equal to the number of spin components.')
-            # It is F-contiguous, hence the last index
-            g = grid[:, :, :, 0] * index[0]
+            grid = read_spin(0) * index[0]
             for i, scale in enumerate(index[1:]):
-                g += grid[:, :, :, 1+i] * scale
-            grid = g
-
-        cell = np.array(cell.T, np.float64)
-        cell.shape = (3, 3)
+                grid += read_spin(1 + i) * scale
 
         # Simply create the grid (with no information)
         # We will overwrite the actual grid
-        g = Grid([1, 1, 1], sc=SuperCell(cell))
-        # NOTE: there is no need to swap-axes since the returned array is in F ordering
-        #       and thus the first axis is the fast (x, y, z) is retained
+        g = Grid([1, 1, 1], sc=SuperCell(h['cell']))
         g.grid = (grid * self.grid_unit).astype(dtype=np.float32, order='C', copy=False)
         return g
 
@@ -836,22 +970,22 @@ def _type(name, obj, dic=None):
 tsgfSileSiesta = _type("tsgfSileSiesta", _gfSileSiesta)
 gridSileSiesta = _type("gridSileSiesta", _gridSileSiesta, {'grid_unit': 1.})
 
+add_sile('TSHS', tshsSileSiesta)
+add_sile('onlyS', onlysSileSiesta)
+add_sile('TSDE', tsdeSileSiesta)
+add_sile('DM', dmSileSiesta)
+add_sile('HSX', hsxSileSiesta)
 if found_module:
-    add_sile('TSHS', tshsSileSiesta)
-    add_sile('onlyS', onlysSileSiesta)
-    add_sile('TSDE', tsdeSileSiesta)
-    add_sile('DM', dmSileSiesta)
-    add_sile('HSX', hsxSileSiesta)
     add_sile('TSGF', tsgfSileSiesta)
-    # These have unit-conversions
-    BohrC2AngC = Bohr2Ang ** 3
-    add_sile('RHO', _type("rhoSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
-    add_sile('RHOINIT', _type("rhoinitSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
-    add_sile('RHOXC', _type("rhoxcSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
-    add_sile('DRHO', _type("drhoSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
-    add_sile('BADER', _type("baderSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
-    add_sile('IOCH', _type("iorhoSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
-    add_sile('TOCH', _type("totalrhoSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
-    add_sile('VH', _type("hartreeSileSiesta", _gridSileSiesta, {'grid_unit': Ry2eV}))
-    add_sile('VNA', _type("neutralatomhartreeSileSiesta", _gridSileSiesta, {'grid_unit': Ry2eV}))
-    add_sile('VT', _type("totalhartreeSileSiesta", _gridSileSiesta, {'grid_unit': Ry2eV}))
+# These have unit-conversions
+BohrC2AngC = Bohr2Ang ** 3
+add_sile('RHO', _type("rhoSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
+add_sile('RHOINIT', _type("rhoinitSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
+add_sile('RHOXC', _type("rhoxcSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
+add_sile('DRHO', _type("drhoSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
+add_sile('BADER', _type("baderSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
+add_sile('IOCH', _type("iorhoSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
+add_sile('TOCH', _type("totalrhoSileSiesta", _gridSileSiesta, {'grid_unit': 1./BohrC2AngC}))
+add_sile('VH', _type("hartreeSileSiesta", _gridSileSiesta, {'grid_unit': Ry2eV}))
+add_sile('VNA', _type("neutralatomhartreeSileSiesta", _gridSileSiesta, {'grid_unit': Ry2eV}))
+add_sile('VT', _type("totalhartreeSileSiesta", _gridSileSiesta, {'grid_unit': Ry2eV}))
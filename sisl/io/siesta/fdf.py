@@ -1,6 +1,8 @@
 from __future__ import print_function, division
 
+import os
 import warnings
+from collections import OrderedDict
 from datetime import datetime
 import numpy as np
 
@@ -42,6 +44,92 @@ _LOGICAL = _LOGICAL_FALSE + _LOGICAL_TRUE
 
 Bohr2Ang = unit_convert('Bohr', 'Ang')
 
+# Parsed fdf files, path -> (file status, entries)
+_FDF_CACHE = OrderedDict()
+_FDF_CACHE_SIZE = 256
+
+
+def _tolabel(label):
+    """ The fdf equivalent label (case-insensitive and ignoring `-`, `_` and `.`) """
+    return label.lower().replace('_', '').replace('-', '').replace('.', '')
+
+
+def _fdf_path(path):
+    """ The absolute path of an fdf file, used as the key of the cached fdf files """
+    return os.path.abspath(path)
+
+
+def _fdf_stat(path):
+    """ File status used to invalidate the cached fdf files """
+    st = os.stat(path)
+    return (getattr(st, 'st_mtime_ns', st.st_mtime), st.st_size)
+
+
+def _fdf_parse(path, comment):
+    """ Parse a single fdf file into a list of entries
+
+    The entries are (in order of appearance):
+
+    - ``('v', label, value)``, a label with its value (a `str`, or a `list` for blocks)
+    - ``('%include', file)``
+    - ``('%block<', label, file)``, a block read from another file
+    - ``('<', labels, file)``, labels read from another fdf file
+
+    The parsed file is cached until the file is changed.
+    """
+    path = _fdf_path(path)
+    stat = _fdf_stat(path)
+    cached = _FDF_CACHE.get(path, None)
+    if cached is not None and cached[0] == stat:
+        return cached[1]
+
+    entries = []
+    with open(path, 'r') as fh:
+        lines = iter(fh.readlines())
+
+    for line in lines:
+        if starts_with_list(line, comment):
+            continue
+        ls = line.split('#')[0].split()
+        if len(ls) == 0:
+            continue
+        lsl = [_tolabel(l) for l in ls]
+
+        if '<' in lsl:
+            idx = lsl.index('<')
+            if idx + 1 == len(ls):
+                continue
+            if lsl[0] == '%block':
+                if idx > 1:
+                    entries.append(('%block<', lsl[1], ls[idx+1]))
+            else:
+                entries.append(('<', lsl[:idx], ls[idx+1]))
+
+        elif lsl[0] == '%block':
+            block = []
+            for l in lines:
+                if starts_with_list(l, comment):
+                    continue
+                l = l.strip()
+                if _tolabel(l).startswith('%endblock'):
+                    break
+                if len(l) > 0:
+                    block.append(l)
+            if len(lsl) > 1:
+                entries.append(('v', lsl[1], block))
+
+        elif lsl[0] == '%include':
+            if len(ls) > 1:
+                entries.append(('%include', ls[1]))
+
+        else:
+            entries.append(('v', lsl[0], ' '.join(ls[1:]).strip()))
+
+    _FDF_CACHE[path] = (stat, entries)
+    while len(_FDF_CACHE) > _FDF_CACHE_SIZE:
+        _FDF_CACHE.popitem(last=False)
+    return entries
+
 
 class fdfSileSiesta(SileSiesta):
     """ FDF-input file
@@ -74,68 +162,99 @@ class fdfSileSiesta(SileSiesta):
 
     def _setup(self, *args, **kwargs):
         """ Setup the `fdfSileSiesta` after initialization """
+        # The parsed index of all labels (see _index)
+        self._fdf_index = None
 
-        # List of parent file-handles used while reading
-        # This is because fdf enables inclusion of other files
-        self._parent_fh = []
+    def _index(self):
+        """ Return the index of all labels in the fdf file (and all included/piped files)
 
-    def _pushfile(self, f):
-        if isfile(self.dir_file(f)):
-            self._parent_fh.append(self.fh)
-            self.fh = open(self.dir_file(f), self._mode)
-        else:
-            warn(str(self) + ' is trying to include file: {} but the file seems not to exist? Will disregard file!'.format(f))
-
-    def _popfile(self):
-        if len(self._parent_fh) > 0:
-            self.fh.close()
-            self.fh = self._parent_fh.pop()
-            return True
-        return False
+        The index is built once and re-used until any of the files
+        it depends on are changed (modification time and size).
 
-    def _seek(self):
-        """ Closes all files, and starts over from beginning """
-        try:
-            while self._popfile():
+        Returns
+        -------
+        index : dict
+           for each label (see `_tolabel`), a tuple of the value and the file containing the label
+        includes : list of str
+           files that are included or piped (in order of appearance)
+        deps : dict
+           the file status for all files the index depends on
+        """
+        if self._fdf_index is not None:
+            deps = self._fdf_index[2]
+            try:
+                if all(_fdf_stat(f) == stat for f, stat in deps.items()):
+                    return self._fdf_index
+            except OSError:
                 pass
-            self.fh.seek(0)
-        except:
-            pass
 
-    @sile_fh_open()
-    def includes(self):
-        """ Return a list of all files that are *included* or otherwise necessary for reading the fdf file """
-        self._seek()
-        # In FDF files, %include marks files that progress
-        # down in a tree structure
+        index = {}
+        includes = []
+        deps = {}
+
         def add(f):
-            f = self.dir_file(f)
             if f not in includes:
                 includes.append(f)
-        # List of includes
-        includes = []
 
-        l = self.readline()
-        while l != '':
-            ls = l.split()
-            if '%include' == ls[0].lower():
-                add(ls[1])
-                self._pushfile(ls[1])
-            elif '<' in ls:
-                # TODO, in principle the < could contain
-                # include if this line is not a %block.
-                add(ls[ls.index('<')+1])
-            l = self.readline()
-            while l == '':
-                # last line of file
-                if self._popfile():
-                    l = self.readline()
-                else:
-                    break
+        def exists(f):
+            if isfile(f):
+                return True
+            warn(str(self) + ' is trying to include file: {} but the file seems not to exist? Will disregard file!'.format(f))
+            return False
+
+        def walk(path, parents):
+            deps[path] = _fdf_stat(path)
+            for entry in _fdf_parse(path, self._comment):
+                kind = entry[0]
+                if kind == 'v':
+                    # The first occurrence has precedence
+                    if entry[1] not in index:
+                        index[entry[1]] = (entry[2], path)
+                    continue
+
+                f = self.dir_file(entry[-1])
+                add(f)
+                if kind == '%include':
+                    if exists(f) and f not in parents:
+                        walk(f, parents + [f])
+
+                elif kind == '%block<':
+                    # %block Label < file
+                    if entry[1] not in index and exists(f):
+                        deps[f] = _fdf_stat(f)
+                        with open(f, 'r') as fh:
+                            lines = [l.strip() for l in fh]
+                        index[entry[1]] = ([l for l in lines if len(l) > 0 and l[0] not in self._comment], path)
+
+                elif exists(f):
+                    # Label1 Label2 < other.fdf
+                    other = None
+                    for key in entry[1]:
+                        if key in index:
+                            continue
+                        if other is None:
+                            other = fdfSileSiesta(f, base=self._directory)._index()
+                            deps.update(other[2])
+                        if key in other[0]:
+                            index[key] = (other[0][key][0], path)
+
+        path = _fdf_path(self.file)
+        walk(path, [path])
+        self._fdf_index = (index, includes, deps)
+        return self._fdf_index
+
+    def _lookup(self, label):
+        """ Return the value of `label` and the file containing it, ``(None, None)`` if not found """
+        value, f = self._index()[0].get(_tolabel(label), (None, None))
+        if isinstance(value, list):
+            # Do not expose the cached block
+            value = list(value)
+        return value, f
 
-        return includes
+    def includes(self):
+        """ Return a list of all files that are *included* or otherwise necessary for reading the fdf file """
+        return list(self._index()[1])
 
-    @sile_fh_open()
     def _read_label(self, label):
         """ Try and read the first occurence of a key
 
@@ -146,88 +265,7 @@ class fdfSileSiesta(SileSiesta):
         label : str
            label to find in the fdf file
         """
-        self._seek()
-        def tolabel(label):
-            return label.lower().replace('_', '').replace('-', '').replace('.', '')
-        labell = tolabel(label)
-
-        def valid_line(line):
-            ls = line.strip()
-            if len(ls) == 0:
-                return False
-            return not (ls[0] in self._comment)
-
-        def process_line(line):
-            # Split line by spaces
-            ls = line.split()
-            if len(ls) == 0:
-                return None
-
-            # Make a lower equivalent of ls
-            lsl = list(map(tolabel, ls))
-
-            # Check if there is a pipe in the line
-            if '<' in lsl:
-                idx = lsl.index('<')
-                # Now there are two cases
-
-                # 1. It is a block, in which case
-                #    the full block is piped into the label
-                #    %block Label < file
-                if lsl[0] == '%block' and lsl[1] == labell:
-                    # Correct line found
-                    # Read the file content, removing any empty and/or comment lines
-                    lines = open(self.dir_file(ls[3]), 'r').readlines()
-                    return [l.strip() for l in lines if valid_line(l)]
-
-                # 2. There are labels that should be read from a subsequent file
-                #    Label1 Label2 < other.fdf
-                if labell in lsl[:idx]:
-                    # Valid line, read key from other.fdf
-                    return fdfSileSiesta(self.dir_file(ls[idx+1]), base=self._directory)._read_label(label)
-
-                # It is not in this line, either key is
-                # on the RHS of <, or the key could be "block". Say.
-                return None
-
-            # The last case is if the label is the first word on the line
-            # In that case we have found what we are looking for
-            if lsl[0] == labell:
-                return (' '.join(ls[1:])).strip()
-
-            elif lsl[0] == '%block':
-                if lsl[1] == labell:
-                    # Read in the block content
-                    lines = []
-
-                    # Now read lines
-                    l = self.readline().strip()
-                    while not tolabel(l).startswith('%endblock'):
-                        if len(l) > 0:
-                            lines.append(l)
-                        l = self.readline().strip()
-                    return lines
-
-            elif lsl[0] == '%include':
-
-                # We have to open a new file
-                self._pushfile(ls[1])
-
-            return None
-
-        # Perform actual reading of line
-        l = self.readline().split('#')[0]
-        if len(l) == 0:
-            return None
-        l = process_line(l)
-        while l is None:
-            l = self.readline().split('#')[0]
-            if len(l) == 0:
-                if not self._popfile():
-                    return None
-            l = process_line(l)
-
-        return l
+        return self._lookup(label)[0]
 
     @classmethod
     def _type(cls, value):
@@ -277,7 +315,6 @@ class fdfSileSiesta(SileSiesta):
 
         return 'n'
 
-    @sile_fh_open()
     def type(self, label):
         """ Return the type of the fdf-keyword
 
@@ -286,10 +323,8 @@ class fdfSileSiesta(SileSiesta):
         label : str
             the label to look-up
         """
-        self._seek()
         return self._type(self._read_label(label))
 
-    @sile_fh_open()
     def get(self, label, default=None, unit=None, with_unit=False):
         """ Retrieve fdf-keyword from the file
 
@@ -395,16 +430,12 @@ class fdfSileSiesta(SileSiesta):
         top_file = self.file
 
         # 1. find the old value, and thus the file in which it is found
-        with self:
-            try:
-                self.get(key)
-                # Get the file of the containing data
-                top_file = self.fh.name
-            except:
-                pass
-
-        # Ensure that all files are closed
-        self._seek()
+        try:
+            f = self._lookup(key)[1]
+            if f is not None:
+                top_file = f
+        except Exception:
+            pass
 
         # Now we should re-read and edit the file
         lines = open(top_file, 'r').readlines()
@@ -433,6 +464,10 @@ class fdfSileSiesta(SileSiesta):
                 else:
                     fh.write(line)
 
+        # Force re-indexing of the changed file
+        self._fdf_index = None
+        _FDF_CACHE.pop(_fdf_path(top_file), None)
+
     @staticmethod
     def print(key, value):
         """ Return a string which is pretty-printing the key+value """
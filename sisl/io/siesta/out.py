@@ -1,12 +1,17 @@
 from __future__ import print_function, division
 
+import os
+import re
+from zipfile import BadZipfile
+
 import numpy as np
 
 from .sile import SileSiesta
 from ..sile import *
 from sisl.io._help import *
 
-from sisl import Geometry, Atom, SuperCell
+from sisl import Geometry, Atom, Atoms, SuperCell, Trajectory
+from sisl.messages import warn
 from sisl.utils.cmd import *
 from sisl.unit.siesta import unit_convert
 
@@ -15,6 +20,35 @@ __all__ = ['outSileSiesta']
 
 Bohr2Ang = unit_convert('Bohr', 'Ang')
 
+# The end of a data block
+_blank_line = re.compile(br'\n[ \t\r]*\n')
+# The end of a forces block
+_dash_line = re.compile(br'\n[ \t]*(?:siesta:)?[ \t]*--')
+
+# The indexed sections of the output file
+_sections = [('outcoor', br'outcoor:'),
+             ('outcell', br'outcell: Unit cell vectors'),
+             ('coord', br'siesta: Atomic coordinates'),
+             ('force', br'siesta: Atomic forces'),
+             ('moment', br'moments: Atomic'),
+             ('energy', br'siesta: Final energy')]
+
+
+def _read_block(fh, start, end, stop=_blank_line, size=65536):
+    """ Read from byte `start` until the first match of `stop` (or byte `end`) """
+    fh.seek(start)
+    block = b''
+    while True:
+        n = min(size, end - start - len(block))
+        buf = fh.read(n)
+        block += buf
+        m = stop.search(block)
+        if m is not None:
+            return block[:m.start() + 1]
+        if n <= 0 or len(buf) < n:
+            return block
+        size *= 2
+
 
 def _ensure_species(species):
     """ Ensures that the species list is a list with entries (converts `None` to a list). """
@@ -29,6 +63,53 @@ class outSileSiesta(SileSiesta):
     This enables reading the output quantities from the Siesta output.
     """
 
+    def _index_file(self):
+        """ Name of the file storing the index of the output file """
+        d, f = os.path.split(self.file)
+        return os.path.join(d, '.' + f + '.sisl_index.npz')
+
+    def _sections(self):
+        """ Byte offsets of the sections (coordinates, forces, moments, energies) in the file
+
+        The index is created in a single pass of the file and is stored next to the
+        output file (in a hidden file) for reuse. It is re-created if the output file
+        is modified.
+
+        Returns
+        -------
+        dict : the byte offsets of the beginning of each section for each section type,
+            the last element is the size of the file
+        """
+        return self._file_index('sections', self._read_sections)
+
+    def _read_sections(self):
+        """ Read the stored index, or create it """
+        st = os.stat(self.file)
+        stat = np.array([getattr(st, 'st_mtime_ns', st.st_mtime), st.st_size], np.int64)
+        keys = [key for key, _ in _sections]
+        index_file = self._index_file()
+        if os.path.isfile(index_file):
+            try:
+                with np.load(index_file) as index:
+                    if np.array_equal(index['stat'], stat):
+                        return dict((key, index[key]) for key in keys)
+            except (IOError, OSError, ValueError, KeyError, BadZipfile) as e:
+                warn(SileWarning(str(self) + ' could not read the stored index {} ({}), '
+                                 're-creating it.'.format(index_file, e)))
+
+        with self._open_binary() as fh:
+            offsets = index_pattern(fh, [pattern for _, pattern in _sections])
+        index = dict(zip(keys, offsets))
+        try:
+            np.savez(index_file, stat=stat, **index)
+        except (IOError, OSError) as e:
+            warn(SileWarning(str(self) + ' could not store the index {} ({}).'.format(index_file, e)))
+        return index
+
+    def _section_bound(self, offset):
+        """ The beginning of the first section after `offset` (or the end of the file) """
+        return min(off[np.searchsorted(off, offset, side='right')] for off in self._sections().values())
+
     @sile_fh_open()
     def read_species(self):
         """ Reads the species from the top of the output file.
@@ -81,7 +162,7 @@ class outSileSiesta(SileSiesta):
 
         return SuperCell(cell)
 
-    def _read_geometry_outcoor(self, line, last, all, species=None):
+    def _read_geometry_outcoor(self, line, species=None):
         """ Wrapper for reading the geometry as in the outcoor output """
         species = _ensure_species(species)
 
@@ -127,14 +208,64 @@ class outSileSiesta(SileSiesta):
         except:
             geom = Geometry(xyz, [species[int(i)-1] for i in spec], sc=cell)
 
-        if all:
-            tmp = self._read_geometry_outcoor(last, all, species)
-            if tmp is None:
-                return [geom]
-            return tmp.extend([geom])
-
         return geom
 
+    def _read_trajectory(self, frames, species=None):
+        """ Read (a subset of) all outcoor blocks as a `Trajectory` """
+        species = _ensure_species(species)
+
+        sections = self._sections()
+        coor, cell = sections['outcoor'][:-1], sections['outcell'][:-1]
+        size = sections['outcoor'][-1]
+        if len(coor) == 0:
+            return None
+        idx = frame_indices(len(coor), frames)
+
+        with self._open_binary() as fh:
+
+            xyz = None
+            cells = np.empty([len(idx), 3, 3], np.float64)
+            for i, frame in enumerate(idx):
+                head, block = _read_block(fh, coor[frame], size).split(b'\n', 1)
+                if xyz is None:
+                    # The atoms of the first frame
+                    lines = [l.split() for l in block.decode().splitlines() if len(l.strip()) > 0]
+                    try:
+                        atom = Atoms([l[5] for l in lines])
+                    except:
+                        atom = Atoms([species[int(l[3]) - 1] for l in lines])
+                    xyz = np.empty([len(idx), len(lines), 3], np.float64)
+                x = read_columns(block, [0, 1, 2])
+                if len(x) != xyz.shape[1]:
+                    raise SileError(str(self) + '.read_geometry could not read outcoor block {} (inconsistent '
+                                    'number of atoms?)'.format(frame))
+
+                # The cell following the coordinates, or the preceding cell
+                j = np.searchsorted(cell, coor[frame])
+                if j == len(cell):
+                    j -= 1
+                if j < 0:
+                    raise SileError(str(self) + '.read_geometry could not find the unit cell')
+                fh.seek(cell[j])
+                lines = [fh.readline() for _ in range(4)]
+                cells[i] = read_columns(b''.join(lines[1:]), [0, 1, 2])
+                if b'Ang' not in lines[0]:
+                    cells[i] *= Bohr2Ang
+
+                # Now convert the coordinates
+                if b'scaled' in head:
+                    # The output file for siesta does not
+                    # contain the lattice constant.
+                    # So... :(
+                    raise ValueError("Could not read the lattice-constant for the scaled geometry")
+                elif b'fractional' in head:
+                    x = np.dot(x, cells[i])
+                elif b'Ang' not in head:
+                    x *= Bohr2Ang
+                xyz[i] = x
+
+        return Trajectory(xyz, atom, cells)
+
     def _read_geometry_atomic(self, line, species=None):
         """ Wrapper for reading the geometry as in the outcoor output """
         species = _ensure_species(species)
@@ -170,127 +301,92 @@ class outSileSiesta(SileSiesta):
         Parameters
         ----------
         last: bool, True
-           only read the last geometry
-        all: bool, False
-           return a list of all geometries (like an MD)
-           If `True` `last` is ignored
+           only read the last geometry, else the first geometry
+        all: bool or slice or array_like, False
+           return all (``True``) or a subset (slice or indices) of the
+           geometries (like an MD) as a `Trajectory`.
+           If not `False` `last` is ignored
         """
 
         # The first thing we do is reading the species.
-        # Sadly, if this routine is called AFTER some other
-        # reading process, it may fail...
-        # Perhaps we should rewind to ensure this...
-        # But...
         species = self.read_species()
-
-        def type_coord(line):
-            if 'outcoor' in line:
-                return 1
-            elif 'siesta: Atomic coordinates' in line:
-                return 2
+        if all is not False:
+            return self._read_trajectory(all, species)
+
+        # Either the initial coordinates or the outcoor blocks
+        sections = self._sections()
+        coor = sections['outcoor'][:-1]
+        off = np.concatenate((coor, sections['coord'][:-1]))
+        if len(off) == 0:
             # Signal not found
-            return 0
+            return None
+        off = off.max() if last else off.min()
 
-        # Read until a coordinate block is found
-        line = self.readline()
-        while type_coord(line) == 0:
-            line = self.readline()
-            if line == '':
-                break
+        if off in coor:
+            return self._read_trajectory([-1 if last else 0], species)[0]
 
-        coord = type_coord(line)
+        self.fh.seek(off)
+        return self._read_geometry_atomic(self.readline(), species)
 
-        if coord == 1:
-            return self._read_geometry_outcoor(line, last, all, species)
-        elif coord == 2:
-            return self._read_geometry_atomic(line, species)
-
-        # Signal not found
-        return None
-
-    @sile_fh_open()
     def read_force(self, last=True, all=False):
         """ Reads the forces from the Siesta output file
 
         Parameters
         ----------
         last: bool, True
-           only read the last force
-        all: bool, False
-           return a list of all forces (like an MD)
-           If `True` `last` is ignored
+           only read the last force, else the first force
+        all: bool or slice or array_like, False
+           return all (``True``) or a subset (slice or indices) of the
+           forces (like an MD) with shape ``(nsteps, na, 3)``.
+           If not `False` `last` is ignored
         """
-
-        # Read until outcoor is found
-        line = self.readline()
-        while not 'siesta: Atomic forces' in line:
-            line = self.readline()
-            if line == '':
-                return None
+        force = self._sections()['force']
+        size = force[-1]
+        force = force[:-1]
+        if len(force) == 0:
+            return None
+        if all is False:
+            idx = [-1 if last else 0]
+        else:
+            idx = frame_indices(len(force), all)
 
         F = []
-        line = self.readline()
-        while not line.startswith('--'):
-            F.append([float(x) for x in line.split()[1:]])
-            line = self.readline()
-
-        F = np.array(F)
-
-        if all:
-            tmp = self.read_force(last, all)
-            if tmp is None:
-                return []
-            return tmp.extend([F])
-        return F
-
-    @sile_fh_open()
-    def read_moment(self, orbital=False, quantity='S', last=True, all=False):
-        """ Reads the moments from the Siesta output file
-        These will only be present in case of spin-orbit coupling.
-
-        Parameters
-        ----------
-        orbital: bool, False
-           return a table with orbitally resolved
-           moments.
-        quantity: str, 'S'
-           return the spin-moments or the L moments
-        last: bool, True
-           only read the last force
-        all: bool, False
-           return a list of all forces (like an MD)
-           If `True` `last` is ignored
-        """
-
-        # Read until outcoor is found
-        line = self.readline()
-        while not 'moments: Atomic' in line:
-            line = self.readline()
-            if line == '':
-                return None
-
-        # The moments are printed in SPECIES list
-        self.readline() # empty
+        with self._open_binary() as fh:
+            for i in idx:
+                block = _read_block(fh, force[i], size, _dash_line)
+                block = block.split(b'\n', 1)[1].replace(b'siesta:', b'')
+                F.append(read_columns(block, [1, 2, 3]))
+
+        if all is False:
+            return F[0]
+        return np.array(F)
+
+    @staticmethod
+    def _parse_moment(lines, orbital, quantity):
+        """ Parse the moments block (without the header) """
+        lines = iter(lines)
+        readline = lambda: next(lines, '')
+        readline() # empty
 
         na = 0
         # Loop the species
         tbl = []
         # Read the species label
-        self.readline() # currently discarded
+        readline() # currently discarded
         while True:
-            self.readline() # ""
-            self.readline() # Atom    Orb ...
+            readline() # ""
+            readline() # Atom    Orb ...
             # Loop atoms in this species list
             while True:
-                line = self.readline()
+                line = readline()
                 if line.startswith('Species') or \
-                   line.startswith('--'):
+                   line.startswith('--') or line == '':
                     break
                 line = ' '
                 atom = []
                 ia = 0
                 while not line.startswith('--'):
-                    line = self.readline().split()
+                    line = readline().split()
                     if ia == 0:
                         ia = int(line[0])
                     elif ia != int(line[0]):
@@ -301,7 +397,7 @@ class outSileSiesta(SileSiesta):
                         atom.append([float(x) for x in line[4:7]])
                     elif quantity == 'L':
                         atom.append([float(x) for x in line[7:10]])
-                line = self.readline().split() # Total ...
+                line = readline().split() # Total ...
                 if not orbital:
                     ia = int(line[0])
                     if quantity == 'S':
@@ -309,20 +405,96 @@ class outSileSiesta(SileSiesta):
                     elif quantity == 'L':
                         atom.append([float(x) for x in line[8:11]])
                 tbl.append((ia, atom))
-            if line.startswith('--'):
+            if line.startswith('--') or line == '':
                 break
 
         # Sort according to the atomic index
-        moments = [] * na
+        moments = [None] * na
 
         # Insert in the correct atomic
         for ia, atom in tbl:
             moments[ia-1] = atom
 
-        if not all:
-            return np.array(moments)
+        return np.array(moments)
+
+    def read_moment(self, orbital=False, quantity='S', last=True, all=False):
+        """ Reads the moments from the Siesta output file
+        These will only be present in case of spin-orbit coupling.
+
+        Parameters
+        ----------
+        orbital: bool, False
+           return a table with orbitally resolved
+           moments.
+        quantity: str, 'S'
+           return the spin-moments or the L moments
+        last: bool, True
+           only read the last moments, else the first moments
+        all: bool or slice or array_like, False
+           return a list of all (``True``) or a subset (slice or indices) of
+           the moments (like an MD). If not `False` `last` is ignored
+        """
+        moment = self._sections()['moment'][:-1]
+        if len(moment) == 0:
+            return None
+        if all is False:
+            idx = [-1 if last else 0]
+        else:
+            idx = frame_indices(len(moment), all)
+
+        moments = []
+        with self._open_binary() as fh:
+            for i in idx:
+                fh.seek(moment[i])
+                block = fh.read(self._section_bound(moment[i]) - moment[i]).decode()
+                moments.append(self._parse_moment(block.splitlines()[1:], orbital, quantity))
+
+        if all is False:
+            return moments[0]
         return moments
 
+    def read_energy(self, last=True, all=False):
+        """ Reads the final energies from the Siesta output file
+
+        Parameters
+        ----------
+        last: bool, True
+           only read the last energies, else the first energies
+        all: bool or slice or array_like, False
+           return a list of all (``True``) or a subset (slice or indices) of
+           the energies. If not `False` `last` is ignored
+
+        Returns
+        -------
+        dict : the energy contributions (in eV), e.g. ``'Total'`` and ``'Fermi'``
+        """
+        energy = self._sections()['energy']
+        size = energy[-1]
+        energy = energy[:-1]
+        if len(energy) == 0:
+            return None
+        if all is False:
+            idx = [-1 if last else 0]
+        else:
+            idx = frame_indices(len(energy), all)
+
+        E = []
+        with self._open_binary() as fh:
+            for i in idx:
+                lines = _read_block(fh, energy[i], size).decode().splitlines()[1:]
+                e = {}
+                for line in lines:
+                    key, _, value = line.replace('siesta:', '').partition('=')
+                    try:
+                        e[key.strip()] = float(value)
+                    except ValueError:
+                        pass
+                E.append(e)
+
+        if all is False:
+            return E[0]
+        return E
+
     def read_data(self, *args, **kwargs):
         """ Read specific content in the Siesta out file
 
@@ -344,6 +516,8 @@ class outSileSiesta(SileSiesta):
            return the last force in the `outSileSiesta`
         moment: bool
            return the last moments in the `outSileSiesta` (only for spin-orbit coupling calculations)
+        energy: bool
+           return the last (final) energies in the `outSileSiesta`
         """
         val = []
         for kw in kwargs:
@@ -360,6 +534,10 @@ class outSileSiesta(SileSiesta):
                 if kwargs[kw]:
                     val.append(self.read_moment())
 
+            if kw == 'energy':
+                if kwargs[kw]:
+                    val.append(self.read_energy())
+
         if len(val) == 0:
             val = None
         elif len(val) == 1:
@@ -217,6 +217,7 @@ class ncSileSiesta(SileCDFSiesta):
 
         sp = self._crt_grp(self, 'SPARSE')
         S._csr._D[:, 0] = sp.variables['S'][:]
+        _csr_share_pattern(self, S._csr)
 
         return S
 
@@ -234,6 +235,7 @@ class ncSileSiesta(SileCDFSiesta):
         # Shift to the Fermi-level
         Ef = - self._value('Ef')[:] * Ry2eV
         H.shift(Ef)
+        _csr_share_pattern(self, H._csr)
 
         return H
 
@@ -249,6 +251,7 @@ class ncSileSiesta(SileCDFSiesta):
         if sp.variables['H'].unit != 'Ry**2':
             raise SileError(self.__class__.__name__ + '.read_dynamical_matrix requires the stored matrix to be in Ry**2!')
         D._csr._D[:, 0] = sp.variables['H'][0, :] * Ry2eV ** 2
+        _csr_share_pattern(self, D._csr)
 
         return D
 
@@ -260,6 +263,7 @@ class ncSileSiesta(SileCDFSiesta):
         sp = self._crt_grp(self, 'SPARSE')
         for i in range(len(DM.spin)):
             DM._csr._D[:, i] = sp.variables['DM'][i, :]
+        _csr_share_pattern(self, DM._csr)
 
         return DM
 
@@ -277,6 +281,7 @@ class ncSileSiesta(SileCDFSiesta):
             EDM._csr._D[:, i] = sp.variables['EDM'][i, :] * Ry2eV
             if i < 2 and 'DM' in sp.variables:
                 EDM._csr._D[:, i] -= sp.variables['DM'][i, :] * Ef[i]
+        _csr_share_pattern(self, EDM._csr)
 
         return EDM
 
@@ -1,6 +1,7 @@
 from __future__ import print_function, division
 
 import pytest
+import os.path as osp
 
 from sisl import geom
 from sisl import Geometry, Atom
@@ -317,3 +318,46 @@ def test_geom_constraints(sisl_tmp):
     gfdf['CONSTRAIN-z'] = range(len(gfdf))
 
     gfdf.write(sisl_tmp('siesta.fdf', _dir))
+
+
+def test_fdf_index_cache(sisl_tmp):
+    f = sisl_tmp('file.fdf', _dir)
+    f2 = sisl_tmp('file2.fdf', _dir)
+    with open(f, 'w') as fh:
+        fh.write('Flag1 date\n%include file2.fdf\n')
+    with open(f2, 'w') as fh:
+        fh.write('Flag2 1\n%block Hello\n  line 1\n\n line2 # not a comment\n%endblock Hello\n')
+
+    fdf = fdfSileSiesta(f, base=sisl_tmp.getbase())
+    assert fdf.get('Flag2') == 1
+    index = fdf._index()
+    assert fdf._index() is index
+    block = fdf.get('Hello')
+    assert block == ['line 1', 'line2 # not a comment']
+    block.append('changed')
+    assert fdf.get('Hello') == ['line 1', 'line2 # not a comment']
+
+    # Changing an included file invalidates the index
+    with open(f2, 'w') as fh:
+        fh.write('Flag2 20\n')
+    assert fdf.get('Flag2') == 20
+    assert fdf.get('Hello') is None
+    assert fdf._index() is not index
+
+
+def test_fdf_index_relative(sisl_tmp, monkeypatch):
+    f = sisl_tmp('file.fdf', _dir)
+    with open(sisl_tmp('file2.fdf', _dir), 'w') as fh:
+        fh.write('Flag2 1\n')
+    with open(f, 'w') as fh:
+        fh.write('Flag1 date\n%include file2.fdf\n')
+    d = osp.dirname(f)
+    monkeypatch.chdir(osp.dirname(d))
+    fdf = fdfSileSiesta(osp.join(osp.basename(d), 'file.fdf'))
+    assert fdf.get('Flag1') == 'date'
+    assert fdf.get('Flag2') == 1
+    # set re-parses the changed file
+    fdf.set('Flag1', 'test')
+    assert fdf.get('Flag1') == 'test'
+    fdf.set('Flag2', '2')
+    assert fdf.get('Flag2') == 2
@@ -0,0 +1,117 @@
+from __future__ import print_function, division
+
+import os
+import pytest
+
+from sisl.geom import graphene
+from sisl.io.sile import SileWarning
+from sisl.io.siesta.out import *
+
+import numpy as np
+
+pytestmark = [pytest.mark.io, pytest.mark.siesta]
+_dir = 'sisl/io/siesta'
+
+
+def _outcoor(xyz, unit='Ang'):
+    s = 'outcoor: Atomic coordinates ({}):\n'.format(unit)
+    for i, x in enumerate(xyz):
+        s += '  {:12.8f} {:12.8f} {:12.8f}   1     {}  C\n'.format(x[0], x[1], x[2], i + 1)
+    return s + '\n'
+
+
+def _outcell(cell):
+    s = 'outcell: Unit cell vectors (Ang):\n'
+    for v in cell:
+        s += '   {:10.6f} {:10.6f} {:10.6f}\n'.format(*v)
+    return s + '\noutcell: Cell volume (Ang**3)        :    100.0\n\n'
+
+
+def _force(F, prefix=''):
+    s = 'siesta: Atomic forces (eV/Ang):\n'
+    for i, f in enumerate(F):
+        s += '{}{:6d} {:12.6f} {:12.6f} {:12.6f}\n'.format(prefix, i + 1, *f)
+    s += prefix + '----------------------------------------\n'
+    return s + prefix + '   Tot    0.0 0.0 0.0\n\n'
+
+
+def _energy(E):
+    s = 'siesta: Final energy (eV):\n'
+    s += 'siesta:  Band Struct. =    -104.397082\n'
+    s += 'siesta:         Total =    {:.6f}\n'.format(E)
+    return s + 'siesta:         Fermi =      -3.943327\n\n'
+
+
+def test_out_trajectory(sisl_tmp):
+    f = sisl_tmp('md.out', _dir)
+    g = graphene()
+    with open(f, 'w') as fh:
+        fh.write('Species number:   1 Atomic number:    6 Label: C\n\n')
+        fh.write(_outcell(g.cell))
+        for i in range(4):
+            fh.write('  Begin MD step = {}\n'.format(i + 1))
+            fh.write(_outcoor(g.xyz + i * 0.1))
+            fh.write(_outcell(g.cell * (1 + i * 0.01)))
+        fh.write(_outcoor(g.fxyz, 'fractional'))
+
+    traj = outSileSiesta(f).read_geometry(all=True)
+    assert len(traj) == 5
+    assert traj.na == 2
+    for i in range(4):
+        assert np.allclose(traj.xyz[i], g.xyz + i * 0.1)
+        assert np.allclose(traj.cell[i], g.cell * (1 + i * 0.01), atol=1e-5)
+    # The last block is in fractional coordinates (with the preceding cell)
+    assert np.allclose(traj.cell[4], traj.cell[3])
+    assert np.allclose(traj.xyz[4], np.dot(g.fxyz, traj.cell[4]))
+
+    traj = outSileSiesta(f).read_geometry(all=slice(-2, None))
+    assert len(traj) == 2
+    assert np.allclose(traj.xyz[0], g.xyz + 0.3)
+
+
+def test_out_sections(sisl_tmp):
+    f = sisl_tmp('sections.out', _dir)
+    g = graphene()
+    F = np.random.rand(3, 2, 3).round(6)
+    with open(f, 'w') as fh:
+        fh.write('Species number:   1 Atomic number:    6 Label: C\n\n')
+        fh.write('siesta: Atomic coordinates (Bohr) and species\n')
+        for x in g.xyz:
+            fh.write('siesta: {:12.8f} {:12.8f} {:12.8f}   1     1\n'.format(*(x / 0.529177)))
+        fh.write('\n')
+        fh.write(_outcell(g.cell))
+        for i in range(3):
+            fh.write(_force(F[i]))
+            fh.write(_outcoor(g.xyz + i * 0.1))
+            fh.write(_outcell(g.cell))
+        fh.write(_force(F[-1], 'siesta: '))
+        fh.write(_energy(-291.))
+
+    out = outSileSiesta(f)
+    assert np.allclose(out.read_geometry(last=False).xyz, g.xyz, atol=1e-5)
+    assert np.allclose(out.read_geometry().xyz, g.xyz + 0.2)
+    assert np.allclose(out.read_force(last=False), F[0])
+    assert np.allclose(out.read_force(), F[-1])
+    assert np.allclose(out.read_force(all=True), np.concatenate((F, F[-1:])))
+    assert np.allclose(out.read_force(all=slice(1, 3)), F[1:3])
+    E = out.read_energy()
+    assert E['Total'] == pytest.approx(-291.)
+    assert E['Fermi'] == pytest.approx(-3.943327)
+    assert out.read_moment() is None
+
+    # The index is stored next to the file, and re-used
+    idx = out._index_file()
+    assert os.path.isfile(idx)
+    assert np.allclose(outSileSiesta(f).read_force(), F[-1])
+
+    # Modifying the file invalidates the index
+    with open(f, 'a') as fh:
+        fh.write(_force(F[0]))
+    assert np.allclose(outSileSiesta(f).read_force(), F[0])
+
+    # A corrupt index is re-created
+    with open(idx, 'w') as fh:
+        fh.write('corrupt')
+    with pytest.warns(SileWarning):
+        assert np.allclose(outSileSiesta(f).read_force(), F[0])
+    assert np.allclose(outSileSiesta(f).read_force(), F[0])
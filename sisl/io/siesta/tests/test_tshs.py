@@ -31,3 +31,46 @@ def test_si_pdos_kgrid_tshs_overlap(sisl_files, sisl_tmp):
     HS.finalize()
     S.finalize()
     assert np.allclose(HS._csr._D[:, HS.S_idx], S._csr._D[:, 0])
+
+
+def test_tshs_orbitals(sisl_tmp):
+    pytest.importorskip("sisl.io.siesta._siesta")
+    g = sisl.geom.graphene(orthogonal=True).tile(2, 0)
+    H = sisl.Hamiltonian(g, spin=sisl.Spin('P'), orthogonal=False)
+    H.construct([[0.1, 1.5], [[0.3, -0.2, 1.], [-2.7, -2.6, 0.1]]])
+    f = sisl_tmp('tmp.TSHS', _dir)
+    H.write(f)
+
+    HS = sisl.get_sile(f).read_hamiltonian()
+    assert HS._csr.spsame(H._csr)
+    orbs = g.a2o([1, 3], all=True)
+    HS_sub = sisl.get_sile(f).read_hamiltonian(orbitals=orbs)
+    assert HS_sub.nnz == H.tocsr(0)[orbs].nnz
+    for io in range(g.no):
+        if io in orbs:
+            assert np.allclose(HS_sub.tocsr(1)[io].toarray(), HS.tocsr(1)[io].toarray())
+            assert np.allclose(HS_sub.tocsr(2)[io].toarray(), HS.tocsr(2)[io].toarray())
+        else:
+            assert HS_sub.tocsr(0)[io].nnz == 0
+    S_sub = sisl.get_sile(f).read_overlap(orbitals=orbs)
+    assert np.allclose(S_sub.tocsr(0).toarray(), HS_sub.tocsr(2).toarray())
+
+
+def test_tshs_shared_pattern(sisl_tmp):
+    pytest.importorskip("sisl.io.siesta._siesta")
+    g = sisl.geom.graphene(orthogonal=True)
+    H = sisl.Hamiltonian(g, orthogonal=False)
+    H.construct([[0.1, 1.5], [[0., 1.], [-2.7, 0.1]]])
+    f = sisl_tmp('tmp.TSHS', _dir)
+    H.write(f)
+
+    sile = sisl.get_sile(f)
+    HS = sile.read_hamiltonian()
+    S = sile.read_overlap()
+    assert HS._csr.is_pattern_shared(S._csr)
+    assert np.allclose(HS._csr._D[:, HS.S_idx], S._csr._D[:, 0])
+    # Copy-on-write
+    S[0, 0] = 2.
+    S[0, g.no * 3] = 0.5
+    assert not HS._csr.is_pattern_shared(S._csr)
+    assert HS.nnz + 1 == S.nnz
@@ -57,3 +57,26 @@ def test_xv_velocity(sisl_tmp, sisl_system):
     # Try to read in different ways
     v2 = xvSileSiesta(f).read_velocity()
     assert np.allclose(v, v2)
+
+
+def test_xv_trajectory(sisl_tmp, sisl_system):
+    f = sisl_tmp('traj.XV', _dir)
+    g = sisl_system.g.copy()
+    g.atoms[0] = Atom(1)
+    with open(f, 'w') as fh:
+        for i in range(3):
+            g.move([i, 0, 0]).write(xvSileSiesta(f + '.tmp', 'w'), velocity=np.ones([len(g), 3]) * i)
+            with open(f + '.tmp') as tmp:
+                fh.write(tmp.read())
+
+    traj, v = xvSileSiesta(f).read_geometry(velocity=True, all=True)
+    assert len(traj) == 3
+    assert g.atoms.equal(traj.atoms, R=False)
+    for i in range(3):
+        assert np.allclose(traj.xyz[i], g.xyz + [i, 0, 0])
+        assert np.allclose(traj.cell[i], g.cell)
+        assert np.allclose(v[i], i)
+
+    traj = xvSileSiesta(f).read_geometry(all=[2])
+    assert len(traj) == 1
+    assert np.allclose(traj.xyz[0], g.xyz + [2, 0, 0])
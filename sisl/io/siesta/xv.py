@@ -4,8 +4,9 @@ import numpy as np
 
 from .sile import SileSiesta
 from ..sile import *
+from .._help import index_lines, read_columns, frame_indices
 
-from sisl import Geometry, Atom, Atoms, SuperCell
+from sisl import Geometry, Atom, Atoms, SuperCell, Trajectory
 from sisl.unit.siesta import unit_convert
 
 Bohr2Ang = unit_convert('Bohr', 'Ang')
@@ -69,8 +70,20 @@ class xvSileSiesta(SileSiesta):
 
         return SuperCell(cell)
 
+    def _read_atoms(self, na):
+        """ Read the species, atomic numbers, coordinates and velocities of `na` atoms """
+        lines = ''.join([self.readline() for _ in range(na)])
+        if isinstance(lines, bytes):
+            # gzipped files are opened in binary mode
+            lines = lines.decode()
+        data = read_columns(lines.encode(), list(range(8)))
+        if len(data) != na:
+            raise SileError(str(self) + ' could not read all atoms in the file')
+        return data[:, 0].astype(np.int32), data[:, 1].astype(np.int32), \
+            data[:, 2:5] * Bohr2Ang, data[:, 5:8] * Bohr2Ang
+
     @sile_fh_open()
-    def read_geometry(self, velocity=False, species_Z=False):
+    def read_geometry(self, velocity=False, species_Z=False, all=False):
         """ Returns a `Geometry` object from the XV file
 
         Parameters
@@ -80,50 +93,68 @@ class xvSileSiesta(SileSiesta):
            reading the ChemicalSpeciesLabel block simultaneously).
         velocity : bool, optional
            also return the velocities in the file
+        all : bool or slice or array_like, optional
+           read all (``True``) or a subset (slice or indices) of the frames in a file with
+           concatenated XV files (e.g. from an MD simulation) and return a `Trajectory`.
+           The velocities are then returned with shape ``(nframes, na, 3)``.
 
         Returns
         -------
-        Geometry
+        Geometry or Trajectory
         velocity : only if `velocity` is true.
         """
         sc = self.read_supercell()
 
         # Read number of atoms
         na = int(self.readline())
-        xyz = np.empty([na, 3], np.float64)
-        vel = np.empty([na, 3], np.float64)
-        atms = [None] * na
-        sp = np.empty([na], np.int32)
-        for ia in range(na):
-            line = list(map(float, self.readline().split()[:8]))
-            sp[ia] = int(line[0])
-            if species_Z:
-                atms[ia] = Atom(sp[ia])
-            else:
-                atms[ia] = Atom(int(line[1]))
-            xyz[ia, :] = line[2:5]
-            vel[ia, :] = line[5:8]
-
-        xyz *= Bohr2Ang
-        vel *= Bohr2Ang
+        sp, Z, xyz, vel = self._read_atoms(na)
 
         # Ensure correct sorting
-        max_s = sp.max()
         sp -= 1
-        # Ensure we can remove the atom after having aligned them
-        atms2 = Atoms(Atom(-150), na=na)
-        for i in range(max_s):
-            idx = (sp[:] == i).nonzero()[0]
-            if len(idx) == 0:
-                # Always ensure we have "something" for the unoccupied places
-                atms2[idx] = Atom(-150 - i)
+        # Create a single atom per specie, (and fake atoms for
+        # unoccupied species) to retain the species ordering
+        atms = [Atom(-150 - i) for i in range(sp.max() + 1)]
+        for i, ia in zip(*np.unique(sp, return_index=True)):
+            if species_Z:
+                atms[i] = Atom(i + 1)
             else:
-                atms2[idx] = atms[idx[0]]
-
-        geom = Geometry(xyz, atms2.reduce(), sc=sc)
+                atms[i] = Atom(Z[ia])
+        atms = Atoms(atms).sub(sp).reduce()
+
+        if all is False:
+            geom = Geometry(xyz, atms, sc=sc)
+            if velocity:
+                return geom, vel
+            return geom
+
+        # Each frame has na + 4 lines
+        with self._open_binary() as fh:
+            offsets = self._file_index('frames', lambda: index_lines(fh, na + 4))
+            idx = frame_indices(len(offsets) - 1, all)
+
+            xyz = np.empty([len(idx), na, 3], np.float64)
+            vel = np.empty([len(idx), na, 3], np.float64)
+            cell = np.empty([len(idx), 3, 3], np.float64)
+            for i, frame in enumerate(idx):
+                fh.seek(offsets[frame])
+                block = fh.read(offsets[frame + 1] - offsets[frame])
+                # The atoms start after the cell and the number of atoms
+                i0 = 0
+                for _ in range(3):
+                    i0 = block.index(b'\n', i0) + 1
+                cell[i] = read_columns(block[:i0], [0, 1, 2]) * Bohr2Ang
+                i0 = block.index(b'\n', i0) + 1
+                data = read_columns(block[i0:], [2, 3, 4, 5, 6, 7])
+                if len(data) != na:
+                    raise SileError(str(self) + '.read_geometry could not read frame {} (inconsistent '
+                                    'number of atoms?)'.format(frame))
+                xyz[i] = data[:, :3]
+                vel[i] = data[:, 3:]
+
+        traj = Trajectory(xyz * Bohr2Ang, atms, cell, sc.nsc)
         if velocity:
-            return geom, vel
-        return geom
+            return traj, vel * Bohr2Ang
+        return traj
 
     @sile_fh_open()
     def read_velocity(self):
@@ -135,13 +166,7 @@ class xvSileSiesta(SileSiesta):
         """
         self.read_supercell()
         na = int(self.readline())
-        vel = np.empty([na, 3], np.float64)
-        for ia in range(na):
-            line = list(map(float, self.readline().split()[:8]))
-            vel[ia, :] = line[5:8]
-
-        vel *= Bohr2Ang
-        return vel
+        return self._read_atoms(na)[3]
 
     read_data = read_velocity
 
@@ -1,6 +1,9 @@
 from __future__ import print_function, division
 
 from functools import wraps
+from importlib import import_module
+import os
+import re
 from os.path import splitext, isfile, dirname, join, abspath, basename
 import gzip
 try:
@@ -14,6 +17,7 @@ import numpy as np
 from sisl.messages import SislWarning, SislInfo
 from sisl.utils.misc import str_spec
 from ._help import *
+from ._registry import backends_suffix
 
 
 # Public used objects
@@ -51,6 +55,31 @@ __all__ += [
 # same extension and query it based on a sub-class
 __sile_rules = []
 __siles = []
+# Lookup tables for the rules (updated in add_sile)
+#  suffix (lower-case) -> rules with this suffix (in the order they are added)
+__sile_suffix = {}
+#  class specification (lower-case) -> matching class (or None)
+__sile_spec = {}
+# The io backends that have been imported (and thus have added their siles)
+__backends = set()
+
+
+def _import_backends(backends=None):
+    """ Import the io backends `backends` (all if None) such that their siles are added to the lookup table
+
+    Parameters
+    ----------
+    backends : list of str, optional
+       the names of the backends (``siesta``, ``vasp``, etc.)
+    """
+    global __backends
+    if backends is None:
+        from ._registry import _backends
+        backends = [backend for backend, _, _ in _backends]
+    for backend in backends:
+        if backend not in __backends:
+            import_module('sisl.io.' + backend)
+            __backends.add(backend)
 
 
 class _sile_rule(object):
@@ -141,6 +170,52 @@ class _sile_rule(object):
         return issubclass(self.cls, cls)
 
 
+# Signatures of file contents used to determine the file type when the
+# file name does not match any sile.
+# Each entry is (signature, suffix) where the signature is matched against
+# the beginning of the file and the suffix is used to find the sile.
+_sile_signatures = [
+    (re.compile(br'\A(CDF[\x01\x02\x05]|\x89HDF\r\n\x1a\n)'), 'nc'),
+    (re.compile(br'\A\s*(<\?xml[^>]*>\s*)?<ion\b'), 'ion.xml'),
+    (re.compile(br'\A\s*(<\?xml[^>]*>\s*)?<pdos\b'), 'pdos.xml'),
+    (re.compile(br'\A\s*\[Molden Format\]', re.I), 'molf'),
+    (re.compile(br'^\s*Siesta Version\s*:', re.M), 'out'),
+    (re.compile(br'^\s*\*\s*GENERAL UTILITY LATTICE PROGRAM', re.M), 'gout'),
+    (re.compile(br'^[ \t]*(CRYSTAL|SLAB|POLYMER|MOLECULE|ANIMSTEPS\s+\d+)[ \t]*\r?$', re.M), 'xsf'),
+    (re.compile(br'^\s*begin\s+(unit_cell_cart|atoms_cart|atoms_frac|projections)\b', re.M | re.I), 'win'),
+    (re.compile(br'^\s*%block\s+\w+', re.M | re.I), 'fdf'),
+    (re.compile(br'\A(HEADER|TITLE |CRYST1|ATOM  |HETATM)'), 'pdb'),
+    (re.compile(br'\A\s*\d+[ \t]*\r?\n[^\n]*\n\s*[A-Za-z]+([ \t]+[-+]?[\d.]+([eE][-+]?\d+)?){3}'), 'xyz'),
+    (re.compile(br'\A[^\n]*\n[^\n]*\n(\s*-?\d+([ \t]+[-+]?[\d.]+([eE][-+]?\d+)?){3}[ \t]*\r?\n){4}'), 'cube'),
+]
+
+
+def _sile_content_suffix(filename, size=4096):
+    """ Determine the file type from the first `size` bytes of the file `filename`
+
+    Gzipped files are decompressed.
+
+    Returns
+    -------
+    str or None : the suffix of the matching sile (with ``.gz`` for gzipped files)
+    """
+    try:
+        with open(filename, 'rb') as fh:
+            head = fh.read(size)
+        is_gz = head.startswith(b'\x1f\x8b')
+        if is_gz:
+            with gzip.open(filename, 'rb') as fh:
+                head = fh.read(size)
+    except (IOError, OSError, EOFError):
+        return None
+    for signature, suffix in _sile_signatures:
+        if signature.search(head) is not None:
+            if is_gz:
+                return suffix + '.gz'
+            return suffix
+    return None
+
+
 def add_sile(suffix, cls, case=True, gzip=False):
     """ Add files to the global lookup table
 
@@ -173,7 +248,16 @@ def add_sile(suffix, cls, case=True, gzip=False):
         __siles.append(cls)
 
     # Add the rule of the sile to the list of rules.
-    __sile_rules.append(_sile_rule(cls, suffix, case=case, gzip=gzip))
+    rule = _sile_rule(cls, suffix, case=case, gzip=gzip)
+    __sile_rules.append(rule)
+
+    # Update the lookup tables
+    suffix = suffix.lower()
+    __sile_suffix.setdefault(suffix, []).append(rule)
+    if gzip:
+        __sile_suffix.setdefault(suffix + '.gz', []).append(rule)
+    # Class specifications may now match a different class
+    __sile_spec.clear()
 
 
 def get_sile_class(filename, *args, **kwargs):
@@ -195,6 +279,12 @@ def get_sile_class(filename, *args, **kwargs):
        you may query the exact base-class that should be chosen.
        If there are several files with similar file-endings this
        function returns a random one.
+
+    Notes
+    -----
+    If no sile matches the file name and the file exists, the file type is
+    determined from the content of the file (NetCDF/HDF5 files are regarded as
+    ``.nc`` files, and some of the text file formats are recognized).
     """
     global __sile_rules, __siles
 
@@ -210,49 +300,60 @@ def get_sile_class(filename, *args, **kwargs):
         # Figure out if fcls is a valid sile, if not
         # do nothing (it may be part of the file name)
         # Which is REALLY obscure... but....)
+        # The specification may match any sile, so all backends are required
+        _import_backends()
         fclsl = fcls.lower()
-        for sr in __sile_rules:
-            if sr.in_class(fclsl):
-                cls = sr.cls
-            else:
-                cls = sr.get_base(fclsl)
-            if cls is not None:
-                filename = tmp_file
-                break
-
-    try:
-        # Create list of endings on this file
-        f = basename(filename)
-        end_list = []
-        end = ''
-
-        # Check for files without ending, or that they are directly zipped
-        lext = splitext(f)
-        while len(lext[1]) > 0:
-            end = lext[1] + end
-            if end[0] == '.':
-                end_list.append(end[1:])
-            else:
-                end_list.append(end)
-            lext = splitext(lext[0])
-
-        # We also check the entire file name
-        #  (mainly for VASP)
-        end_list.append(f)
-        # Reverse to start by the longest extension
-        # (allows grid.nc extensions, etc.)
-        end_list = list(reversed(end_list))
-
-        # First we check for class AND file ending
+        if fclsl not in __sile_spec:
+            spec_cls = None
+            for sr in __sile_rules:
+                if sr.in_class(fclsl):
+                    spec_cls = sr.cls
+                else:
+                    spec_cls = sr.get_base(fclsl)
+                if spec_cls is not None:
+                    break
+            __sile_spec[fclsl] = spec_cls
+        cls = __sile_spec[fclsl]
+        if cls is not None:
+            filename = tmp_file
+
+    # Create list of endings on this file
+    f = basename(filename)
+    end_list = []
+    end = ''
+
+    # Check for files without ending, or that they are directly zipped
+    lext = splitext(f)
+    while len(lext[1]) > 0:
+        end = lext[1] + end
+        if end[0] == '.':
+            end_list.append(end[1:])
+        else:
+            end_list.append(end)
+        lext = splitext(lext[0])
+
+    # We also check the entire file name
+    #  (mainly for VASP)
+    end_list.append(f)
+    # Reverse to start by the longest extension
+    # (allows grid.nc extensions, etc.)
+    end_list = list(reversed(end_list))
+
+    # Only import the backends handling any of the endings
+    _import_backends([backend for end in end_list for backend in backends_suffix(end)])
+
+    def find(end_list):
+        if cls in __siles:
+            # class-specification has precedence
+            # This should only occur when the
+            # class-specification is exact (i.e. xyzSile)
+            return cls
+
+        # Check for class AND file ending
         clss = None
         for end in end_list:
-            for sr in __sile_rules:
-                if sr.is_class(cls):
-                    # class-specification has precedence
-                    # This should only occur when the
-                    # class-specification is exact (i.e. xyzSile)
-                    return sr.cls
-                elif sr.is_suffix(end):
+            for sr in __sile_suffix.get(end.lower(), []):
+                if sr.is_suffix(end):
                     if cls is None:
                         return sr.cls
                     elif sr.is_subclass(cls):
@@ -260,14 +361,22 @@ def get_sile_class(filename, *args, **kwargs):
                     clss = sr.cls
             if clss is not None:
                 return clss
+        return None
 
-        if clss is None:
-            raise NotImplementedError("Sile for file '{}' could not be found, "
-                                      "possibly the file has not been implemented.".format(filename))
-        return clss
-
-    except Exception as e:
-        raise e
+    clss = find(end_list)
+    if clss is None:
+        # The sile may be found in any of the remaining backends
+        _import_backends()
+        clss = find(end_list)
+    if clss is None and isfile(filename):
+        # Try and determine the file type from its content
+        end = _sile_content_suffix(filename)
+        if end is not None:
+            clss = find([end])
+    if clss is None:
+        raise NotImplementedError("Sile for file '{}' could not be found, "
+                                  "possibly the file has not been implemented.".format(filename))
+    return clss
 
 
 def get_sile(file, *args, **kwargs):
@@ -307,6 +416,9 @@ def get_siles(attrs=None):
     """
     global __siles
 
+    # All backends should be present
+    _import_backends()
+
     if attrs is None:
         attrs = [None]
 
@@ -519,6 +631,29 @@ class Sile(BaseSile):
             self.fh = open(self.file, self._mode)
         self._line = 0
 
+    def _open_binary(self):
+        """ A new binary file-handle of the file (for reading), regardless of the mode of the `Sile` """
+        if self.file.endswith('gz'):
+            return gzip.open(self.file, 'rb')
+        return open(self.file, 'rb')
+
+    def _file_index(self, key, func):
+        """ Return the index ``func()`` of the file, cached until the file is modified
+
+        Parameters
+        ----------
+        key : str
+           name of the index
+        func : callable
+           function creating the index (e.g. byte offsets of data blocks in the file)
+        """
+        st = os.stat(self.file)
+        stat = (getattr(st, 'st_mtime_ns', st.st_mtime), st.st_size)
+        cache = self.__dict__.setdefault('_file_index_cache', {})
+        if key not in cache or cache[key][0] != stat:
+            cache[key] = (stat, func())
+        return cache[key][1]
+
     def __enter__(self):
         """ Opens the output file and returns it self """
         self._open()
@@ -34,6 +34,15 @@ def test_default_size(sisl_tmp):
     assert len(read.geometry) == 1
 
 
+def test_buffersize(sisl_tmp):
+    f = sisl_tmp('GRID.cube', _dir)
+    grid = Grid([9, 10, 11], sc=2.0)
+    grid.grid = np.random.rand(*grid.shape)
+    grid.write(f, buffersize=25)
+    read = grid.read(f)
+    assert np.allclose(grid.grid, read.grid)
+
+
 def test_geometry(sisl_tmp):
     f = sisl_tmp('GRID.cube', _dir)
     geom = Geometry(np.random.rand(10, 3), np.random.randint(1, 70, 10), sc=[10, 10, 10, 45, 60, 90])
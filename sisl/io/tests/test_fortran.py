@@ -0,0 +1,78 @@
+from __future__ import print_function, division
+
+import pytest
+
+import numpy as np
+
+from sisl.io.sile import SileError
+from sisl.io._fortran import FortranFile
+
+
+pytestmark = pytest.mark.io
+_dir = 'sisl/io'
+
+
+def _write_records(f, records, endian='<'):
+    with open(f, 'wb') as fh:
+        for rec in records:
+            rec = np.asarray(rec)
+            rec = rec.astype(rec.dtype.newbyteorder(endian))
+            n = np.array([rec.nbytes], np.dtype(np.int32).newbyteorder(endian))
+            fh.write(n.tobytes())
+            fh.write(rec.tobytes())
+            fh.write(n.tobytes())
+
+
+@pytest.mark.parametrize("endian", ['<', '>'])
+@pytest.mark.parametrize("dtype", [np.int32, np.float32, np.float64])
+def test_fortran_records(sisl_tmp, endian, dtype):
+    f = sisl_tmp('fortran.bin', _dir)
+    count = np.array([3, 0, 5, 1, 2])
+    rows = [np.arange(n, dtype=dtype) + i * 10 for i, n in enumerate(count)]
+    _write_records(f, [np.array([1, 2], np.int32), count.astype(np.int32)] + rows + [np.array([3.], np.float64)], endian)
+
+    ff = FortranFile(f)
+    assert np.all(ff.read_record(np.int32) == [1, 2])
+    c = ff.read_record(np.int32)
+    assert np.all(c == count)
+    records = ff.read_records(c, dtype)
+    assert len(records) == len(count)
+    assert np.allclose(ff.read_record(np.float64), 3.)
+
+    assert np.allclose(records.read(), np.concatenate(rows))
+    assert np.allclose(records.read([3, 0]), np.concatenate([rows[3], rows[0]]))
+    assert np.allclose(records.read(slice(1, 3)), rows[2])
+    assert records.read([1]).size == 0
+
+
+def test_fortran_records_equal(sisl_tmp):
+    f = sisl_tmp('fortran.bin', _dir)
+    rows = np.random.rand(6, 4)
+    _write_records(f, list(rows))
+    records = FortranFile(f).read_records(np.full(6, 4), np.float64)
+    assert np.allclose(records.read(), rows.ravel())
+    assert np.allclose(records.read([4, 1]), rows[[4, 1]].ravel())
+
+
+def test_fortran_skip(sisl_tmp):
+    f = sisl_tmp('fortran.bin', _dir)
+    _write_records(f, [np.arange(3), np.arange(2.), np.arange(4, dtype=np.int32)])
+    ff = FortranFile(f)
+    ff.skip_record(2)
+    assert ff.record_size() == 16
+    assert np.all(ff.read_record(np.int32) == np.arange(4))
+
+
+@pytest.mark.xfail(raises=SileError)
+def test_fortran_fail_marker(sisl_tmp):
+    f = sisl_tmp('fortran.bin', _dir)
+    with open(f, 'wb') as fh:
+        fh.write(np.array([8, 1, 2, 4], np.int32).tobytes())
+    FortranFile(f)
+
+
+@pytest.mark.xfail(raises=SileError)
+def test_fortran_fail_records(sisl_tmp):
+    f = sisl_tmp('fortran.bin', _dir)
+    _write_records(f, [np.arange(3, dtype=np.int32), np.arange(2, dtype=np.int32)])
+    FortranFile(f).read_records([3, 3], np.int32)
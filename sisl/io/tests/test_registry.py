@@ -0,0 +1,105 @@
+from __future__ import print_function, division
+
+import pytest
+
+import gzip
+import sys
+import subprocess
+import types
+from importlib import import_module
+
+import sisl
+import sisl.io
+from sisl.io import get_sile_class, get_siles
+from sisl.io._registry import _backends
+
+
+pytestmark = pytest.mark.io
+_dir = 'sisl/io'
+
+
+def test_registry_objects():
+    for backend, names, _ in _backends:
+        mod = import_module('sisl.io.' + backend)
+        public = [name for name in mod.__all__
+                  if not isinstance(getattr(mod, name), types.ModuleType) and
+                  name not in sisl.io.sile.__all__]
+        assert sorted(public) == sorted(names)
+        for name in names:
+            assert getattr(sisl.io, name) is getattr(mod, name)
+
+
+def test_registry_suffixes():
+    suffixes = dict((backend, set(suffixes)) for backend, _, suffixes in _backends)
+    # All the siles added must be in the table
+    for sile in get_siles():
+        backend = sile.__module__.split('.')[2]
+        assert backend in suffixes
+    rules = getattr(sys.modules['sisl.io.sile'], '__sile_rules')
+    for rule in rules:
+        backend = rule.cls.__module__.split('.')[2]
+        assert rule.suffix.lower() in suffixes[backend]
+
+
+@pytest.mark.parametrize("filename", ['hello.xyz', 'hello.XV', 'RUN.fdf', 'siesta.TBT.nc',
+                                      'CONTCAR', 'hello.xyz.gz', 'hello.dat{xyzSile}'])
+def test_registry_get_sile_class(filename):
+    cls = get_sile_class(filename)
+    assert cls.__module__.startswith('sisl.io.')
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="lazy imports requires python 3.7")
+def test_import_lazy():
+    # Importing sisl should not import any of the io backends
+    code = ("import sys, sisl; "
+            "print(' '.join(m for m in sys.modules if m.startswith('sisl.io.')))")
+    out = subprocess.check_output([sys.executable, '-c', code]).decode().split()
+    assert sorted(out) == ['sisl.io._help', 'sisl.io._registry', 'sisl.io.sile']
+
+    # Accessing a sile imports the backend
+    code = ("import sys, sisl; sisl.io.xyzSile; "
+            "print(' '.join(m for m in sys.modules if m.startswith('sisl.io.')))")
+    out = subprocess.check_output([sys.executable, '-c', code]).decode().split()
+    assert 'sisl.io.xyz' in out
+    assert 'sisl.io.siesta' not in out
+
+
+@pytest.mark.parametrize("suffix", ['xyz', 'xsf', 'pdb', 'cube', 'molf', 'fdf', 'win'])
+def test_get_sile_class_content(sisl_tmp, suffix):
+    gr = sisl.geom.graphene()
+    f = sisl_tmp('gr.' + suffix, _dir)
+    gr.write(f)
+    cls = get_sile_class(f)
+    # Copy to a file without a suffix
+    fnone = sisl_tmp('gr_' + suffix, _dir)
+    with open(f, 'rb') as fh:
+        content = fh.read()
+    with open(fnone, 'wb') as fh:
+        fh.write(content)
+    assert get_sile_class(fnone) is cls
+
+
+def test_get_sile_class_content_gz(sisl_tmp):
+    f = sisl_tmp('gr.xyz', _dir)
+    sisl.geom.graphene().write(f)
+    fnone = sisl_tmp('gr_xyz', _dir)
+    with open(f, 'rb') as fh:
+        content = fh.read()
+    with gzip.open(fnone, 'wb') as fh:
+        fh.write(content)
+    assert get_sile_class(fnone) is get_sile_class('gr.xyz')
+
+
+def test_get_sile_class_content_netcdf(sisl_tmp):
+    fnone = sisl_tmp('netcdf', _dir)
+    with open(fnone, 'wb') as fh:
+        fh.write(b'CDF\x01' + b'\x00' * 28)
+    assert get_sile_class(fnone) is get_sile_class('siesta.nc')
+
+
+def test_get_sile_class_content_unknown(sisl_tmp):
+    fnone = sisl_tmp('unknown', _dir)
+    with open(fnone, 'w') as fh:
+        fh.write('hello world\n')
+    with pytest.raises(NotImplementedError):
+        get_sile_class(fnone)
@@ -18,6 +18,9 @@ def test_default(sisl_tmp):
     grid.grid = np.random.rand(*grid.shape)
     grid.write(f)
     assert grid.geometry is None
+    read = grid.read(f)
+    assert np.allclose(grid.grid, read.grid)
+    assert read.geometry is None
 
 
 def test_default_size(sisl_tmp):
@@ -35,6 +38,10 @@ def test_geometry(sisl_tmp):
     grid.grid = np.random.rand(*grid.shape)
     grid.write(f)
     assert not grid.geometry is None
+    read = grid.read(f)
+    assert np.allclose(grid.grid, read.grid)
+    assert np.allclose(grid.cell, read.cell)
+    assert len(read.geometry) == len(geom)
 
 
 def test_imaginary(sisl_tmp):
@@ -44,3 +51,18 @@ def test_imaginary(sisl_tmp):
     grid.grid = np.random.rand(*grid.shape) + 1j*np.random.rand(*grid.shape)
     grid.write(f)
     assert not grid.geometry is None
+    read = xsfSile(f).read_grid(dtype=np.complex128)
+    assert np.allclose(grid.grid, read.grid)
+    read = xsfSile(f).read_grid()
+    assert np.allclose(grid.grid.real, read.grid)
+
+
+def test_multiple(sisl_tmp):
+    f = sisl_tmp('GRID.xsf', _dir)
+    g1 = Grid(0.2, sc=2.0)
+    g1.grid = np.random.rand(*g1.shape)
+    g2 = Grid(0.25, sc=2.0)
+    g2.grid = np.random.rand(*g2.shape)
+    xsfSile(f, 'w').write_grid(g1, g2)
+    read = xsfSile(f).read_grid(1)
+    assert np.allclose(g2.grid, read.grid)
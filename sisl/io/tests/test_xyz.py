@@ -20,3 +20,26 @@ def test_xyz1(sisl_tmp, sisl_system):
     assert np.allclose(g.cell, sisl_system.g.cell)
     assert np.allclose(g.xyz, sisl_system.g.xyz)
     assert sisl_system.g.atom.equal(g.atom, R=False)
+
+
+def test_xyz_trajectory(sisl_tmp, sisl_system):
+    f = sisl_tmp('traj.xyz', _dir)
+    g = sisl_system.g
+    with open(f, 'w') as fh:
+        for i in range(4):
+            g.move([i, 0, 0]).write(xyzSile(f + '.tmp', 'w'))
+            with open(f + '.tmp') as tmp:
+                fh.write(tmp.read())
+
+    traj = xyzSile(f).read_geometry(all=True)
+    assert len(traj) == 4
+    assert traj.na == g.na
+    for i in range(4):
+        assert np.allclose(traj.xyz[i], g.xyz + [i, 0, 0])
+        assert np.allclose(traj.cell[i], g.cell)
+    assert g.atoms.equal(traj.atoms, R=False)
+
+    traj = xyzSile(f).read_geometry(all=slice(None, None, -2))
+    assert len(traj) == 2
+    assert np.allclose(traj.xyz[0], g.xyz + [3, 0, 0])
+    assert np.allclose(traj.xyz[1], g.xyz + [1, 0, 0])
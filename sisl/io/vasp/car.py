@@ -1,14 +1,17 @@
 from __future__ import print_function
 
+import re
+
 import numpy as np
 
 # Import sile objects
 from .sile import SileVASP
 from ..sile import *
+from .._help import index_pattern, read_columns, frame_indices
 
 # Import the geometry object
 from sisl.messages import warn
-from sisl import Geometry, PeriodicTable, Atom, SuperCell
+from sisl import Geometry, PeriodicTable, Atom, Atoms, SuperCell, Trajectory
 
 __all__ = ['carSileVASP']
 
@@ -87,9 +90,22 @@ class carSileVASP(SileVASP):
         return SuperCell(cell)
 
     @sile_fh_open()
-    def read_geometry(self):
+    def read_geometry(self, all=False):
         """ Returns Geometry object from the CONTCAR/POSCAR file
+
+        Parameters
+        ----------
+        all : bool or slice or array_like, optional
+           read all (``True``) or a subset (slice or indices) of the configurations in an
+           XDATCAR file and return a `Trajectory`. Variable cell XDATCAR files (with the
+           header repeated before each configuration) are also handled.
+
+        Returns
+        -------
+        Geometry or Trajectory
         """
+        label = self.readline()
+        self.fh.seek(0)
         sc = self.read_supercell()
 
         # The species labels are not always included in *CAR
@@ -112,9 +128,8 @@ class carSileVASP(SileVASP):
             warn(err)
 
         # Create list of atoms to be used subsequently
-        atom = [Atom[spec]
-                for spec, nsp in zip(species, species_count)
-                for i in range(nsp)]
+        atom = Atoms([Atom[spec] for spec in species]).sub(
+            np.repeat(np.arange(len(species_count)), species_count))
 
         # Read whether this is selective or direct
         # Currently direct is not used
@@ -133,17 +148,75 @@ class carSileVASP(SileVASP):
         # Number of atoms
         na = len(atom)
 
-        xyz = np.empty([na, 3], np.float64)
-        for ia in range(na):
-            xyz[ia, :] = list(map(float, self.readline().split()))
+        lines = ''.join([self.readline() for _ in range(na)])
+        if isinstance(lines, bytes):
+            # gzipped files are opened in binary mode
+            lines = lines.decode()
+        xyz = read_columns(lines.encode(), [0, 1, 2])
         if cart:
             # The unit of the coordinates are cartesian
             xyz *= self._scale
         else:
             xyz = np.dot(xyz, sc.cell)
 
-        # The POT/CONT-CAR does not contain information on the atomic species
-        return Geometry(xyz=xyz, atom=atom, sc=sc)
+        if all is False:
+            # The POT/CONT-CAR does not contain information on the atomic species
+            return Geometry(xyz=xyz, atom=atom, sc=sc)
+
+        return self._read_trajectory(all, label, atom, sc, xyz)
+
+    def _read_trajectory(self, frames, label, atom, sc, xyz):
+        """ Read the configurations of an XDATCAR file as a `Trajectory` """
+        na = len(atom)
+        if isinstance(label, bytes):
+            label = label.decode()
+        label = label.rstrip('\r\n')
+        patterns = [br'configuration=']
+        if len(label.strip()) > 0:
+            # Variable cell files repeat the header (starting with the label)
+            patterns.append(br'^' + re.escape(label.encode()) + br'\r?$')
+
+        with self._open_binary() as fh:
+            offsets = self._file_index('frames', lambda: index_pattern(fh, patterns))
+            config = offsets[0]
+            if len(config) == 1:
+                # A POSCAR/CONTCAR file (without configurations)
+                idx = frame_indices(1, frames)
+                return Trajectory(np.tile(xyz.reshape(1, na, 3), (len(idx), 1, 1)), atom, sc.cell, sc.nsc)
+            if len(offsets) == 1:
+                header = np.zeros(1, np.int64)
+            else:
+                header = offsets[1][:-1]
+
+            idx = frame_indices(len(config) - 1, frames)
+            xyz = np.empty([len(idx), na, 3], np.float64)
+            cell = np.empty([len(idx), 3, 3], np.float64)
+            # The header preceding each configuration
+            ihead = np.searchsorted(header, config[idx], side='right') - 1
+            scale_cell = {}
+            for i, frame in enumerate(idx):
+                h = ihead[i]
+                if h not in scale_cell:
+                    fh.seek(header[h])
+                    lines = [fh.readline() for _ in range(5)]
+                    scale = float(lines[1])
+                    scale_cell[h] = scale, read_columns(b''.join(lines[2:]), [0, 1, 2]) * scale
+                scale, cell[i] = scale_cell[h]
+
+                fh.seek(config[frame])
+                block = fh.read(config[frame + 1] - config[frame])
+                nl = np.flatnonzero(np.frombuffer(block, np.uint8) == 10)
+                end = nl[na] + 1 if len(nl) > na else len(block)
+                frac = read_columns(block[nl[0] + 1:end], [0, 1, 2])
+                if len(frac) != na:
+                    raise SileError(str(self) + '.read_geometry could not read configuration {} (inconsistent '
+                                    'number of atoms?)'.format(frame))
+                if block.lstrip()[:1] in b'CcKk':
+                    xyz[i] = frac * scale
+                else:
+                    xyz[i] = np.dot(frac, cell[i])
+
+        return Trajectory(xyz, atom, cell, sc.nsc)
 
     def ArgumentParser(self, p=None, *args, **kwargs):
         """ Returns the arguments that is available for this Sile """
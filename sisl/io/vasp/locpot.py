@@ -5,6 +5,7 @@ import numpy as np
 
 from .sile import SileVASP
 from ..sile import *
+from .._help import read_text_array
 from .car import carSileVASP
 
 from sisl import Grid
@@ -55,16 +56,21 @@ class locpotSileVASP(carSileVASP):
             max_index = len(index)
 
         rl = self.readline
-        vals = []
-        vapp = vals.append
-
-        i = 0
-        while i < n * max_index:
-            dat = [l for l in rl().split()]
-            vapp(dat)
-            i += len(dat)
-
-            if i % n == 0 and i < n * max_index:
+        # Values are parsed directly into a buffer with at most
+        # two grids in memory at any time.
+        buf = np.empty(n, dtype)
+        for i in range(max_index):
+            read_text_array(self.fh, n, out=buf)
+
+            if is_index:
+                if i == index:
+                    val = buf
+            elif i == 0:
+                val = buf * index[0]
+            else:
+                val += buf * index[i]
+
+            if i + 1 < max_index:
                 # Each time a new spin-index is present, we need to read the coordinates
                 j = 0
                 while j < geom.na:
@@ -72,17 +78,8 @@ class locpotSileVASP(carSileVASP):
 
                 # one line of nx, ny, nz
                 rl()
-
-        # Cut size before proceeding (otherwise it *may* fail)
-        vals = np.array(vals).astype(dtype).ravel()
-        if is_index:
-            val = vals[n * index:n * (index + 1)].reshape(nz, ny, nx)
-        else:
-            vals = vals[:n * max_index].reshape(-1, nz, ny, nx)
-            val = vals[0] * index[0]
-            for i, scale in enumerate(index[1:]):
-                val += vals[i + 1] * scale
-        del vals
+        del buf
+        val = val.reshape(nz, ny, nx)
 
         # Make it C-ordered with nx, ny, nz
         val = np.swapaxes(val, 0, 2) / V
@@ -39,3 +39,38 @@ def test_geometry_car_allsame(sisl_tmp):
     geom.write(carSileVASP(f, 'w'))
 
     assert carSileVASP(f).read_geometry() == geom
+
+
+@pytest.mark.parametrize("variable_cell", [True, False])
+def test_geometry_car_xdatcar(sisl_tmp, variable_cell):
+    f = sisl_tmp('XDATCAR', _dir)
+    cell = np.diag([4., 5., 6.])
+    fxyz = np.random.rand(3, 3)
+
+    def header(scale):
+        s = 'xdatcar test\n 1.0\n'
+        for v in cell * scale:
+            s += ' {:.8f} {:.8f} {:.8f}\n'.format(*v)
+        return s + ' H He\n 2 1\n'
+
+    with open(f, 'w') as fh:
+        for i in range(4):
+            scale = 1. + i * 0.1 if variable_cell else 1.
+            if i == 0 or variable_cell:
+                fh.write(header(scale))
+            fh.write('Direct configuration= {:5d}\n'.format(i + 1))
+            for x in fxyz:
+                fh.write('  {:.8f} {:.8f} {:.8f}\n'.format(*x))
+
+    geom = carSileVASP(f).read_geometry()
+    assert len(geom) == 3
+    assert np.allclose(geom.xyz, np.dot(fxyz, cell))
+
+    traj = carSileVASP(f).read_geometry(all=True)
+    assert len(traj) == 4
+    assert traj.atoms == geom.atoms
+    for i in range(4):
+        scale = 1. + i * 0.1 if variable_cell else 1.
+        assert np.allclose(traj.cell[i], cell * scale)
+        assert np.allclose(traj.xyz[i], np.dot(fxyz, cell * scale))
+    assert len(carSileVASP(f).read_geometry(all=slice(2, None))) == 2
@@ -3,15 +3,18 @@ Sile object for reading/writing Wannier90 in/output
 """
 from __future__ import print_function
 
+from datetime import datetime
 import numpy as np
-from scipy.sparse import lil_matrix
+from scipy.sparse import csr_matrix
 
 # Import sile objects
 from .sile import SileWannier90
 from ..sile import *
+from .._help import read_text_array, write_text_array
 
 # Import the geometry object
 from sisl import Geometry, SuperCell
+import sisl._array as _a
 from sisl.physics import Hamiltonian
 from sisl.unit import unit_convert
 
@@ -265,83 +268,40 @@ class winSileWannier90(SileWannier90):
 
         # First read across the Wigner-Seitz degeneracy
         # This is formatted with 15 per-line.
-        if nrpts % 15 == 0:
-            nlines = nrpts
-        else:
-            nlines = nrpts + 15 - nrpts % 15
-
-        ws = []
-        for _ in range(nlines // 15):
-            ws.extend(list(map(int, self.readline().split())))
-
-        # Convert to numpy array and invert (for weights)
-        ws = 1. / np.array(ws, np.float64).flatten()
-
-        # Figure out the number of supercells
-        # and maintain the Hamiltonian in the ham list
-        nsc = [0, 0, 0]
-
-        # List for holding the Hamiltonian
-        ham = []
-        iws = -1
-
-        while True:
-            l = self.readline()
-            if l == '':
-                break
-
-            # Split here...
-            l = l.split()
-
-            # Get super-cell, row and column
-            iA, iB, iC, r, c = map(int, l[:5])
-
-            nsc[0] = max(nsc[0], abs(iA))
-            nsc[1] = max(nsc[1], abs(iB))
-            nsc[2] = max(nsc[2], abs(iC))
-
-            # Update index for degeneracy, if required
-            if r + c == 2:
-                iws += 1
-
-            # Get degeneracy of this element
-            f = ws[iws]
-
-            # Store in the Hamiltonian array:
-            #   isc
-            #   row
-            #   column
-            #   Hr
-            #   Hi
-            ham.append(([iA, iB, iC], r-1, c-1, float(l[5]) * f, float(l[6]) * f))
+        # Invert (for weights)
+        ws = 1. / read_text_array(self.fh, nrpts, dtype=np.float64)
+
+        # Read all elements:
+        #   isc (3), row, column, Hr, Hi
+        ham = read_text_array(self.fh, nrpts * no * no * 7).reshape(-1, 7)
+        isc = ham[:, :3].astype(np.int32)
+        r = ham[:, 3].astype(np.int32) - 1
+        c = ham[:, 4].astype(np.int32) - 1
+
+        # Degeneracy of each element, a new degeneracy point
+        # starts at the first element (r == c == 0)
+        f = ws[np.cumsum((r == 0) & (c == 0)) - 1]
+        hr = ham[:, 5] * f
+        hi = ham[:, 6] * f
+        del ham, f
 
         # Update number of super-cells
-        geom.set_nsc([i * 2 + 1 for i in nsc])
+        geom.set_nsc(np.abs(isc).max(0) * 2 + 1)
 
-        # With the geometry in place we can read in the entire matrix
-        # Create a new sparse matrix
-        Hr = lil_matrix((geom.no, geom.no_s), dtype=dtype)
-        Hi = lil_matrix((geom.no, geom.no_s), dtype=dtype)
+        # Calculate the column corresponding to the
+        # correct super-cell
+        c += geom.sc_index(isc) * geom.no
+        del isc
 
         # populate the Hamiltonian by examining the cutoff value
-        for isc, r, c, hr, hi in ham:
-
-            # Calculate the column corresponding to the
-            # correct super-cell
-            c = c + geom.sc_index(isc) * geom.no
-
-            if abs(hr) > cutoff:
-                Hr[r, c] = hr
-            if abs(hi) > cutoff:
-                Hi[r, c] = hi
-        del ham
-
+        keep = np.abs(hr) > cutoff
         if np.dtype(dtype).kind == 'c':
-            Hr = Hr.tocsr()
-            Hi = Hi.tocsr()
-            Hr = Hr + 1j*Hi
+            keep_i = np.abs(hi) > cutoff
+            hr = np.where(keep, hr, 0.) + 1j * np.where(keep_i, hi, 0.)
+            keep |= keep_i
+        H = csr_matrix((hr[keep], (r[keep], c[keep])), shape=(geom.no, geom.no_s), dtype=dtype)
 
-        return Hamiltonian.fromsp(geom, Hr)
+        return Hamiltonian.fromsp(geom, H)
 
     def read_hamiltonian(self, *args, **kwargs):
         """ Read the electronic structure of the Wannier90 output
@@ -362,6 +322,56 @@ class winSileWannier90(SileWannier90):
         self._set_file()
         return H
 
+    @sile_fh_open()
+    def _write_hamiltonian(self, H, spin=0, fmt='11.6f', **kwargs):
+        """ Writes the Hamiltonian model to the contained file """
+        # Check that we can write to the file
+        sile_raise_write(self)
+
+        geom = H.geometry
+        no = geom.no
+        n_s = geom.n_s
+
+        self._write(' written on {} by sisl\n'.format(datetime.now().strftime('%d%b%Y at %H:%M:%S')))
+        self._write('{:12d}\n{:12d}\n'.format(no, n_s))
+
+        # All Wigner-Seitz degeneracies are 1 (sisl supercells are not degenerate)
+        write_text_array(self.fh, np.ones(n_s), fmt='4d', ncol=15)
+
+        # Wannier90 writes the rows fastest
+        csr = H.tocsr(spin)
+        ham = np.empty([no, no, 7], np.float64)
+        ham[:, :, 3] = _a.arangei(1, no + 1).reshape(1, -1)
+        ham[:, :, 4] = _a.arangei(1, no + 1).reshape(-1, 1)
+        fmt = ['4d'] * 5 + [fmt] * 2
+        for isc, sc_off in enumerate(geom.sc_off):
+            ham[:, :, :3] = sc_off.reshape(1, 1, 3)
+            # Transposed dense matrix
+            Hsc = csr[:, isc * no:(isc + 1) * no].toarray().T
+            ham[:, :, 5] = Hsc.real
+            ham[:, :, 6] = Hsc.imag
+            write_text_array(self.fh, ham, fmt=fmt)
+
+    def write_hamiltonian(self, H, **kwargs):
+        """ Writes the Hamiltonian model to the seedname_hr.dat file
+
+        The geometry of the Hamiltonian is written to the seedname.win file
+        (see `write_geometry`).
+
+        Parameters
+        ----------
+        H : Hamiltonian
+           the Hamiltonian model
+        spin : int, optional
+           the spin-component that is written (Wannier90 is spin-less)
+        fmt : str, optional
+           format of the real and imaginary parts of the Hamiltonian elements
+        """
+        self.write_geometry(H.geometry)
+        self._set_file('_hr.dat')
+        self._write_hamiltonian(H, **kwargs)
+        self._set_file()
+
     def ArgumentParser(self, p=None, *args, **kwargs):
         """ Returns the arguments that is available for this Sile """
         newkw = Geometry._ArgumentParser_args_single()
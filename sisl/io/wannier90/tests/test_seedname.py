@@ -76,3 +76,19 @@ def test_seedname_write_read(sisl_tmp, sisl_system, frac):
     g = winSileWannier90(f).read_geometry()
     assert np.allclose(g.cell, sisl_system.g.cell)
     assert np.allclose(g.xyz, sisl_system.g.xyz)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+def test_seedname_hamiltonian_write_read(sisl_tmp, sisl_system, dtype):
+    f = sisl_tmp('ham_write_read.win', _dir)
+    H = sisl_system.ham.copy(dtype=dtype)
+    if dtype == np.complex128:
+        # add an imaginary hopping
+        H[0, 1] = -2.71 + 0.5j
+        H[1, 0] = -2.71 - 0.5j
+
+    winSileWannier90(f, 'w').write_hamiltonian(H)
+
+    h = winSileWannier90(f).read_hamiltonian(dtype=dtype)
+    assert h.spsame(H)
+    assert np.allclose(h.tocsr().toarray(), H.tocsr().toarray())
@@ -5,9 +5,10 @@ import numpy as np
 
 # Import sile objects
 from .sile import *
+from ._help import read_text_array, write_text_array
 
 # Import the geometry object
-from sisl import Geometry, Atom, SuperCell
+from sisl import Geometry, Atom, SuperCell, Grid
 from sisl.utils import str_spec
 
 
@@ -109,12 +110,12 @@ class xsfSile(Sile):
             self._write('PRIMCOORD\n')
         else:
             self._write('PRIMCOORD {}\n'.format(self._md_index))
-        self._write('{} {}\n'.format(len(geometry), 1))
-
         non_valid_Z = (geometry.atoms.Z <= 0).nonzero()[0]
         if len(non_valid_Z) > 0:
             geometry = geometry.remove(non_valid_Z)
 
+        self._write('{} {}\n'.format(len(geometry), 1))
+
         if has_data:
             fmt_str = '{{0:3d}}  {{1:{0}}}  {{2:{0}}}  {{3:{0}}}   {{4:{0}}}  {{5:{0}}}  {{6:{0}}}\n'.format(fmt)
             for ia in geometry:
@@ -172,13 +173,14 @@ class xsfSile(Sile):
         xyz = np.array(xyz, np.float64)
         if data:
             dat = None
-        if xyz.shape[1] == 6:
+        if xyz.ndim == 2 and xyz.shape[1] == 6:
             dat = xyz[:, 3:]
             xyz = xyz[:, :3]
 
         if len(atom) == 0:
-            geom = Geometry(xyz, sc=SuperCell(cell))
-        elif len(atom) == 1 and atom[0].Z == -999:
+            # No atoms are stored (only a cell)
+            geom = None
+        elif len(atom) == 1 and atom[0] == -999:
             geom = None
         else:
             geom = Geometry(xyz, atom=atom, sc=SuperCell(cell))
@@ -209,7 +211,7 @@ class xsfSile(Sile):
         fmt : str, optional
             floating point format for data (.5e)
         buffersize : int, optional
-            size of the buffer while writing the data, (6144)
+            number of values formatted per write statement, (1048576)
         """
         sile_raise_write(self)
 
@@ -219,7 +221,7 @@ class xsfSile(Sile):
         self.write_geometry(geom)
 
         # Buffer size for writing
-        buffersize = kwargs.get('buffersize', min(6144, args[0].grid.size))
+        buffersize = kwargs.get('buffersize', 1048576)
 
         # Format for precision
         fmt = kwargs.get('fmt', '.5e')
@@ -253,10 +255,7 @@ class xsfSile(Sile):
             #   for y
             #     for x
             #       write...
-            _fmt = '{:' + fmt + '}\n'
-            for x in np.nditer(np.asarray(grid.grid.real.T, order='C').reshape(-1), flags=['external_loop', 'buffered'],
-                               op_flags=[['readonly']], order='C', buffersize=buffersize):
-                self._write((_fmt * x.shape[0]).format(*x.tolist()))
+            write_text_array(self.fh, grid.grid.real.T, fmt=fmt, ncol=1, chunksize=buffersize)
 
             self._write(' END_DATAGRID_3D\n')
 
@@ -265,14 +264,79 @@ class xsfSile(Sile):
                 continue
             self._write(' BEGIN_DATAGRID_3D_imag_{}\n'.format(name))
             write_cell(grid)
-            for x in np.nditer(np.asarray(grid.grid.imag.T, order='C').reshape(-1), flags=['external_loop', 'buffered'],
-                               op_flags=[['readonly']], order='C', buffersize=buffersize):
-                self._write((_fmt * x.shape[0]).format(*x.tolist()))
+            write_text_array(self.fh, grid.grid.imag.T, fmt=fmt, ncol=1, chunksize=buffersize)
 
             self._write(' END_DATAGRID_3D\n')
 
         self._write('END_BLOCK_DATAGRID_3D\n')
 
+    @sile_fh_open()
+    def read_grid(self, index=0, dtype=np.float64):
+        """ Returns `Grid` object from the XSF file
+
+        Parameters
+        ----------
+        index : int, optional
+           the index of the data-grid in the file (imaginary parts of
+           complex grids are not counted as separate data-grids)
+        dtype : numpy.dtype, optional
+           data-type of the returned grid. For complex data-types the imaginary
+           part is read as well (if present in the file)
+        """
+        geom = self.read_geometry()
+        self.fh.seek(0)
+        is_complex = np.iscomplexobj(np.empty(0, dtype))
+
+        def read_grid_values(grid):
+            # The data is stored with the x-direction being the fastest index
+            nx, ny, nz = grid.shape
+            return read_text_array(self.fh, nx * ny * nz).reshape(nz, ny, nx).T
+
+        grid = None
+        i = -1
+        line = ' '
+        while line != '':
+            line = self.readline()
+            l = line.strip()
+            if not l.startswith('BEGIN_DATAGRID_3D'):
+                continue
+
+            if '_imag_' in l:
+                # the imaginary part of the previous data-grid
+                if grid is None:
+                    continue
+                # skip grid size, origo and cell vectors
+                for _ in range(5):
+                    self.readline()
+                if is_complex:
+                    grid.grid.imag = read_grid_values(grid)
+                break
+
+            elif grid is not None:
+                # A new data-grid without an imaginary part
+                break
+
+            i += 1
+            if i != index:
+                continue
+
+            shape = list(map(int, self.readline().split()[:3]))
+            origo = np.array(self.readline().split()[:3], np.float64)
+            cell = np.empty([3, 3], np.float64)
+            for j in [0, 1, 2]:
+                cell[j, :] = np.array(self.readline().split()[:3], np.float64)
+
+            sc = SuperCell(cell, origo=origo)
+            if geom is None:
+                grid = Grid(shape, sc=sc, dtype=dtype)
+            else:
+                grid = Grid(shape, sc=sc, dtype=dtype, geometry=geom)
+            grid.grid.real = read_grid_values(grid)
+
+        if grid is None:
+            raise SileError(str(self) + '.read_grid could not find data-grid {}'.format(index))
+        return grid
+
     def ArgumentParser(self, p=None, *args, **kwargs):
         """ Returns the arguments that is available for this Sile """
         newkw = Geometry._ArgumentParser_args_single()
@@ -3,18 +3,31 @@ Sile object for reading/writing XYZ files
 """
 from __future__ import print_function
 
+import re
+
 import numpy as np
 
 # Import sile objects
 from .sile import *
+from ._help import index_pattern, read_columns, frame_indices
 
 # Import the geometry object
-from sisl import Geometry, SuperCell
+from sisl import Geometry, Atom, Atoms, SuperCell, Trajectory
 
 
 __all__ = ['xyzSile']
 
 
+def _atoms(symbols):
+    """ `Atoms` from a list of atomic symbols (without creating an `Atom` per symbol) """
+    sym, first, specie = np.unique(symbols, return_index=True, return_inverse=True)
+    # Species are ordered by their first appearance
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return Atoms([Atom(s) for s in sym[order]]).sub(rank[specie])
+
+
 class xyzSile(Sile):
     """ XYZ file object """
 
@@ -48,52 +61,93 @@ class xyzSile(Sile):
         # Add a single new line
         self._write('\n')
 
+    @staticmethod
+    def _parse_comment(line):
+        """ The cell and number of supercells stored in the comment line (if any) """
+        l = line.split()
+        cell = None
+        nsc = [1, 1, 1]
+        try:
+            if len(l) == 9:
+                # we possibly have the cell as a comment
+                cell = np.array(l, np.float64).reshape(3, 3)
+            elif len(l) > 9:
+                # We may have the latest version of sisl xyz coordinates
+                cell = np.array(l[1:10], np.float64).reshape(3, 3)
+                # Try and read the nsc
+                nsc = [int(il) for il in l[11:14]]
+        except ValueError:
+            pass
+        return cell, nsc
+
+    def read_geometry(self, all=False):
+        """ Returns Geometry object from the XYZ file
+
+        Parameters
+        ----------
+        all : bool or slice or array_like, optional
+           read all (``True``) or a subset (slice or indices) of the frames in the
+           file and return them as a `Trajectory`.
+           Defaults to only read the first frame.
+
+        Returns
+        -------
+        Geometry or Trajectory
+        """
+        if all is False:
+            return self._read_geometry()
+        return self._read_trajectory(all)
+
     @sile_fh_open()
-    def read_geometry(self):
+    def _read_geometry(self):
         """ Returns Geometry object from the XYZ file """
+        na = int(self.readline())
+        cell, nsc = self._parse_comment(self.readline())
 
-        cell = np.asarray(np.diagflat([1] * 3), np.float64)
-        nsc = [1, 1, 1]
-        l = self.readline()
-        na = int(l)
-        l = self.readline()
-        l = l.split()
-        cell_set = False
-        if len(l) == 9:
-            # we possibly have the cell as a comment
-            try:
-                cell.shape = (9,)
-                for i, il in enumerate(l):
-                    cell[i] = float(il)
-                cell_set = True
-            finally:
-                cell.shape = (3, 3)
-        elif len(l) > 9:
-            # We may have the latest version of sisl xyz coordinates
-            try:
-                cell.shape = (9,)
-                for i, il in enumerate(l[1:10]):
-                    cell[i] = float(il)
-                # Try and read the nsc
-                for i, il in enumerate(l[11:14]):
-                    nsc[i] = int(il)
-                cell_set = True
-            finally:
-                cell.shape = (3, 3)
-
-        sp = [None] * na
-        xyz = np.empty([na, 3], np.float64)
-        for ia in range(na):
-            l = self.readline().split()
-            sp[ia] = l.pop(0)
-            xyz[ia, :] = [float(k) for k in l[:3]]
+        lines = ''.join([self.readline() for _ in range(na)])
+        if isinstance(lines, bytes):
+            # gzipped files are opened in binary mode
+            lines = lines.decode()
+        atom = _atoms(re.findall(r'^[ \t]*(\S+)', lines, re.M))
+        xyz = read_columns(lines.encode(), [1, 2, 3])
 
         # Fix the maximum size of the supercell
         # by adding 10 A vacuum
-        if not cell_set:
+        if cell is None:
             cell = xyz.max(0) - xyz.min(0) + 10.
 
-        return Geometry(xyz, atom=sp, sc=SuperCell(cell, nsc=nsc))
+        return Geometry(xyz, atom=atom, sc=SuperCell(cell, nsc=nsc))
+
+    def _read_trajectory(self, frames):
+        """ Read (a subset of) all frames in the XYZ file as a `Trajectory` """
+        geom = self._read_geometry()
+        na = geom.na
+
+        # Each frame starts with a line containing only the number of atoms
+        with self._open_binary() as fh:
+            offsets = self._file_index('frames', lambda: index_pattern(
+                fh, br'^[ \t]*' + str(na).encode() + br'[ \t\r]*$'))
+            idx = frame_indices(len(offsets) - 1, frames)
+
+            xyz = np.empty([len(idx), na, 3], np.float64)
+            cell = np.empty([len(idx), 3, 3], np.float64)
+            for i, frame in enumerate(idx):
+                fh.seek(offsets[frame])
+                block = fh.read(offsets[frame + 1] - offsets[frame])
+                # Skip the number of atoms and the comment line
+                i0 = block.index(b'\n') + 1
+                i1 = block.index(b'\n', i0) + 1
+                c, _ = self._parse_comment(block[i0:i1].decode())
+                if c is None:
+                    c = geom.cell
+                cell[i] = c
+                try:
+                    xyz[i] = read_columns(block[i1:], [1, 2, 3])
+                except ValueError:
+                    raise SileError(str(self) + '.read_geometry could not read frame {} (inconsistent '
+                                    'number of atoms?)'.format(frame))
+
+        return Trajectory(xyz, geom.atoms, cell, geom.nsc)
 
     def ArgumentParser(self, p=None, *args, **kwargs):
         """ Returns the arguments that is available for this Sile """
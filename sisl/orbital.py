@@ -11,7 +11,6 @@ import numpy as np
 from numpy import cos, sin
 from numpy import take, sqrt, square
 from scipy.special import lpmv
-from scipy.interpolate import UnivariateSpline
 
 
 from . import _plot as plt
@@ -499,6 +498,7 @@ class SphericalOrbital(Orbital):
             # s, smoothing factor. If 0, smooth through all points
             # I can see that this function is *much* faster than
             # interp1d, AND it yields same results with these arguments.
+            from scipy.interpolate import UnivariateSpline
             interp = partial(UnivariateSpline, k=3, s=0, ext=1, check_finite=False)
             interp = kwargs.get('interp', interp)
 
@@ -60,7 +60,10 @@ Electrons (:mod:`~sisl.physics.electron`)
    ~electron.PDOS
    ~electron.velocity
    ~electron.velocity_matrix
+   ~electron.velocity_batch
+   ~electron.velocity_matrix_batch
    ~electron.berry_phase
+   ~electron.wilson_loop
    ~electron.wavefunction
    ~electron.spin_moment
    ~electron.spin_squared
@@ -93,6 +96,42 @@ Bloch's theorem (:mod:`~sisl.physics.bloch`)
    Bloch
 
 
+Matrix-free tiled operators (:mod:`~sisl.physics.tiled`)
+========================================================
+
+.. autosummary::
+   :toctree:
+
+   TiledOperator
+
+
+Tetrahedron integration (:mod:`~sisl.physics.tetrahedron`)
+==========================================================
+
+.. autosummary::
+   :toctree:
+
+   Tetrahedron
+
+
+Boltzmann transport (:mod:`~sisl.physics.boltzmann`)
+====================================================
+
+.. autosummary::
+   :toctree:
+
+   Boltzmann
+
+
+Band interpolation (:mod:`~sisl.physics.interpolation`)
+=======================================================
+
+.. autosummary::
+   :toctree:
+
+   BandInterpolation
+
+
 Distribution functions (:mod:`~sisl.physics.distribution`)
 ==========================================================
 
@@ -172,5 +211,9 @@ from .densitymatrix import *
 from .hamiltonian import *
 from .dynamicalmatrix import *
 from .self_energy import *
+from .tiled import *
+from .tetrahedron import *
+from .boltzmann import *
+from .interpolation import *
 
 __all__ = [s for s in dir() if not s.startswith('_')]
@@ -0,0 +1,344 @@
+r"""Boltzmann transport
+===================
+
+.. module:: sisl.physics.boltzmann
+   :noindex:
+
+Semi-classical transport coefficients in the constant relaxation-time approximation [1]_.
+The band velocities are accumulated in an energy-binned transport distribution function (TDF)
+
+.. math::
+
+   \Sigma_{\alpha\beta}(\epsilon) = \sum_{n\mathbf k} w_{\mathbf k}
+        v_{n\mathbf k,\alpha} v_{n\mathbf k,\beta} \delta(\epsilon - \epsilon_{n\mathbf k})
+
+while streaming through the k-points of a `BrillouinZone`, i.e. no eigenstates are stored.
+The electrical conductivity, Seebeck coefficient and electronic thermal conductivity
+tensors are then calculated for any chemical potential and temperature from the moments
+of the TDF
+
+.. math::
+
+   \mathcal L^{(n)}_{\alpha\beta}(\mu, T) = \frac{\tau}{V}\int\mathrm d\epsilon\,
+        \Sigma_{\alpha\beta}(\epsilon)(\epsilon-\mu)^n\Big(-\frac{\partial f}{\partial\epsilon}\Big)
+
+>>> H = Hamiltonian(...)
+>>> bz = MonkhorstPack(H, [50, 50, 50])
+>>> bt = Boltzmann(H, np.linspace(-3, 3, 601))
+>>> bt.add(bz, processes=4)
+>>> sigma = bt.conductivity(mu=np.linspace(-1, 1, 21), kT=0.025)
+
+.. autosummary::
+   :toctree:
+
+   Boltzmann
+
+References
+----------
+.. [1] G. K. H. Madsen and D. J. Singh, "BoltzTraP. A code for calculating band-structure dependent quantities", Comput. Phys. Commun. 175, 67 (2006)
+"""
+from __future__ import print_function, division
+
+import numpy as np
+from numpy import dot
+
+import sisl._array as _a
+from sisl._help import _pool_map
+from sisl.unit import units
+from sisl.messages import SislError
+from .brillouinzone import BrillouinZone
+from .electron import velocity, _batch_dk
+
+
+__all__ = ['Boltzmann']
+
+
+# Conversion factors to SI units
+# velocities are in Ang/ps
+_v2_SI = 1e4
+_Ang3_SI = 1e-30
+_eV_SI = units('eV', 'J')
+_eV_K = units('eV', 'K')
+# Number of k-points for which the Hamiltonian derivatives are constructed simultaneously
+_BATCH = 64
+
+
+def _tdf_accumulate(parent, E0, dE, nE, k, w, eps, spin):
+    r""" Calculate the TDF and DOS contributions from a set of k-points
+
+    This is a module function such that it may be executed in separate processes.
+    The k derivatives of the Hamiltonian are constructed in batches of k-points
+    (as in `~sisl.physics.electron.velocity_batch`).
+    """
+    tdf = _a.zerosd([nE, 9])
+    dos = _a.zerosd(nE)
+    for s, fac in spin:
+        opt = {} if s is None else {'spin': s}
+        eigenstates = (parent.eigenstate(kk, **opt) for kk in k)
+        for ww, (es, dHk, dSk) in zip(w, _batch_dk(eigenstates, _BATCH)):
+            # velocities with decoupled degenerate states
+            v = velocity(es.state, dHk, es.c, dSk, degenerate=es.degenerate(eps))
+            idx = np.floor((es.eig - E0) / dE + 0.5).astype(np.int64)
+            idx_in = np.logical_and(0 <= idx, idx < nE).nonzero()[0]
+            if len(idx_in) == 0:
+                continue
+            idx = idx[idx_in]
+            v = v[idx_in]
+            ww_s = ww * fac
+            dos += np.bincount(idx, minlength=nE) * ww_s
+            vv = (v[:, :, None] * v[:, None, :]).reshape(-1, 9)
+            for j in range(9):
+                tdf[:, j] += np.bincount(idx, weights=vv[:, j], minlength=nE) * ww_s
+    return tdf, dos
+
+
+def _tdf_accumulate_star(args):
+    return _tdf_accumulate(*args)
+
+
+class Boltzmann(object):
+    r""" Boltzmann transport coefficients in the constant relaxation-time approximation
+
+    The transport distribution function (TDF) is accumulated in energy bins centered at `E`,
+    k-point by k-point. Hence the memory requirement is independent of the number of k-points
+    and the accumulation may be split in several calls to `add` (e.g. in batches of k-points
+    or distributed over several processes and subsequently summed with ``+``).
+
+    The velocities are calculated with `~sisl.physics.electron.StateCElectron.velocity` which
+    decouples degenerate states. For unpolarized Hamiltonians the spin-degeneracy is included
+    (a factor of 2), polarized Hamiltonians sum both spin channels.
+
+    Parameters
+    ----------
+    parent : Hamiltonian
+       the Hamiltonian used to calculate the eigenstates
+    E : array_like
+       equi-spaced energy bin centers for the TDF, the bins should extend at least
+       :math:`10 k_BT` beyond the chemical potentials of interest
+    eps : float, optional
+       precision used to find degenerate states for the velocities
+
+    Examples
+    --------
+    >>> bt = Boltzmann(H, np.linspace(-2, 2, 401))
+    >>> bt.add(MonkhorstPack(H, [100, 100, 1]))
+    >>> sigma = bt.conductivity(0., kT=0.025, tau=1e-14)
+    >>> S = bt.seebeck(0., kT=0.025)
+
+    Parallel accumulation is done by splitting the k-points in chunks:
+
+    >>> bt.add(MonkhorstPack(H, [100, 100, 100]), processes=8)
+    """
+
+    def __init__(self, parent, E, eps=1e-4):
+        self.parent = parent
+        E = _a.asarrayd(E).ravel()
+        if len(E) < 2:
+            raise ValueError(self.__class__.__name__ + ' requires at least 2 energy bins')
+        dE = np.diff(E)
+        if not np.allclose(dE, dE[0]) or dE[0] <= 0.:
+            raise ValueError(self.__class__.__name__ + ' requires equi-spaced and increasing energies')
+        self._E = E
+        self._dE = dE[0]
+        self.eps = eps
+        self.reset()
+
+    def reset(self):
+        """ Remove all accumulated contributions """
+        self._tdf = _a.zerosd([len(self._E), 9])
+        self._dos = _a.zerosd(len(self._E))
+        self._weight = 0.
+
+    @property
+    def E(self):
+        """ Energy bin centers [eV] """
+        return self._E
+
+    @property
+    def weight(self):
+        """ Sum of the k-point weights accumulated """
+        return self._weight
+
+    @property
+    def tdf(self):
+        r""" Transport distribution function :math:`\Sigma_{\alpha\beta}(\epsilon)` per unit-cell [Ang^2/ps^2/eV], shape ``(len(E), 3, 3)`` """
+        if self._weight == 0.:
+            raise SislError(self.__class__.__name__ + '.tdf no k-points have been added')
+        return self._tdf.reshape(-1, 3, 3) / (self._dE * self._weight)
+
+    @property
+    def DOS(self):
+        """ Density of states per unit-cell [1/eV] (histogram with the same bins as the TDF) """
+        if self._weight == 0.:
+            raise SislError(self.__class__.__name__ + '.DOS no k-points have been added')
+        return self._dos / (self._dE * self._weight)
+
+    def _spin(self):
+        """ List of (spin, degeneracy) for the eigenstate calculations """
+        spin = getattr(self.parent, 'spin', None)
+        if spin is None:
+            return [(None, 1.)]
+        elif spin.is_unpolarized:
+            return [(None, 2.)]
+        elif spin.is_polarized:
+            return [(0, 1.), (1, 1.)]
+        return [(None, 1.)]
+
+    def add(self, bz, processes=None, chunks=None):
+        """ Accumulate the contributions from the k-points in `bz`
+
+        The weights of `bz` are used for the summation, and the result is normalized by
+        the total weight of all added k-points. Hence several `BrillouinZone` objects (of equal
+        k-point density) may be added sequentially.
+
+        Parameters
+        ----------
+        bz : BrillouinZone
+           the k-points and weights to accumulate
+        processes : int, optional
+           number of processes used to distribute the k-points. Requires the parent to be
+           pickable. Defaults to a serial calculation.
+        chunks : int, optional
+           number of k-point chunks distributed to the processes (defaults to 4 times `processes`)
+        """
+        if not isinstance(bz, BrillouinZone):
+            raise ValueError(self.__class__.__name__ + '.add requires a BrillouinZone object')
+        k = bz.k
+        w = bz.weight
+        nE = len(self._E)
+        spin = self._spin()
+        if processes is None or processes <= 1:
+            tdf, dos = _tdf_accumulate(self.parent, self._E[0], self._dE, nE, k, w, self.eps, spin)
+            self._tdf += tdf
+            self._dos += dos
+        else:
+            if chunks is None:
+                chunks = processes * 4
+            chunks = max(1, min(chunks, len(k)))
+            idx = np.array_split(_a.arangei(len(k)), chunks)
+            args = [(self.parent, self._E[0], self._dE, nE, k[i], w[i], self.eps, spin) for i in idx]
+            for tdf, dos in _pool_map(_tdf_accumulate_star, args, processes):
+                self._tdf += tdf
+                self._dos += dos
+        self._weight += w.sum()
+        return self
+
+    def _check_compatible(self, other):
+        if not isinstance(other, Boltzmann):
+            raise ValueError(self.__class__.__name__ + ' can only be combined with another ' + self.__class__.__name__)
+        if len(self._E) != len(other._E) or not np.allclose(self._E, other._E):
+            raise ValueError(self.__class__.__name__ + ' can only be combined with equal energy bins')
+
+    def __iadd__(self, other):
+        """ Merge accumulated contributions from `other` (e.g. from another process) """
+        self._check_compatible(other)
+        self._tdf += other._tdf
+        self._dos += other._dos
+        self._weight += other._weight
+        return self
+
+    def __add__(self, other):
+        self._check_compatible(other)
+        bt = self.__class__(self.parent, self._E, self.eps)
+        bt += self
+        bt += other
+        return bt
+
+    def _moments(self, mu, kT, n):
+        r""" Calculate the moments :math:`\int\Sigma(\epsilon)(\epsilon-\mu)^n(-\partial f/\partial\epsilon)`
+
+        Returns an array of shape ``(n + 1, len(mu), 3, 3)`` in units of eV^(n) Ang^2/ps^2/eV.
+        """
+        if kT <= 0.:
+            raise ValueError(self.__class__.__name__ + ' requires a positive temperature (kT)')
+        mu = _a.asarrayd(mu).ravel()
+        # -df/dE of the Fermi-Dirac distribution, evaluated in a stable manner
+        x = (self._E.reshape(1, -1) - mu.reshape(-1, 1)) / kT
+        ex = np.exp(-np.fabs(x))
+        dfd = ex / (kT * (1 + ex) ** 2)
+        # the TDF is per unit energy, so the bin-width cancels in the integral
+        tdf = self._tdf / self._weight
+        M = _a.emptyd([n + 1, len(mu), 9])
+        for i in range(n + 1):
+            M[i] = dot(dfd, tdf)
+            dfd *= x * kT
+        return M.reshape(n + 1, len(mu), 3, 3)
+
+    def _prefactor(self, tau):
+        r""" Conversion from :math:`\tau/V\,\Sigma` to SI units (m^2/s^2 * s / m^3) """
+        return tau * _v2_SI / (self.parent.geometry.volume * _Ang3_SI)
+
+    @staticmethod
+    def _reduce(arr, mu):
+        if np.asarray(mu).ndim == 0:
+            return arr[0]
+        return arr
+
+    def conductivity(self, mu=0., kT=0.025852, tau=1e-14):
+        r""" Electrical conductivity tensor :math:`\sigma = e^2\mathcal L^{(0)}` [S/m]
+
+        Note that the unit-cell volume is used, i.e. for low dimensional systems the vacuum region
+        is included.
+
+        Parameters
+        ----------
+        mu : float or array_like, optional
+           chemical potential(s) [eV]
+        kT : float, optional
+           temperature [eV]
+        tau : float, optional
+           constant relaxation time [s]
+
+        Returns
+        -------
+        numpy.ndarray
+            conductivity tensor(s) with shape ``(3, 3)`` (or ``(len(mu), 3, 3)`` for an array of `mu`)
+        """
+        L0 = self._moments(mu, kT, 0)[0]
+        # e^2 / eV == e [C]
+        return self._reduce(L0 * self._prefactor(tau) * _eV_SI, mu)
+
+    def seebeck(self, mu=0., kT=0.025852):
+        r""" Seebeck coefficient tensor :math:`S = -\frac{1}{eT}(\mathcal L^{(0)})^{-1}\mathcal L^{(1)}` [V/K]
+
+        Here :math:`e>0` is the elementary charge, i.e. electron-like carriers yield a negative Seebeck coefficient.
+        The Seebeck coefficient is independent of the relaxation time.
+        Only the periodic directions with non-zero conductivity are inverted (through a pseudo-inverse).
+
+        Parameters
+        ----------
+        mu : float or array_like, optional
+           chemical potential(s) [eV]
+        kT : float, optional
+           temperature [eV]
+
+        Returns
+        -------
+        numpy.ndarray
+            Seebeck tensor(s) with shape ``(3, 3)`` (or ``(len(mu), 3, 3)`` for an array of `mu`)
+        """
+        L0, L1 = self._moments(mu, kT, 1)
+        S = np.array([dot(np.linalg.pinv(l0), l1) for l0, l1 in zip(L0, L1)])
+        # (eV / e) / K == V/K
+        return self._reduce(- S / (kT * _eV_K), mu)
+
+    def thermal_conductivity(self, mu=0., kT=0.025852, tau=1e-14):
+        r""" Electronic thermal conductivity tensor :math:`\kappa = \frac1T[\mathcal L^{(2)} - \mathcal L^{(1)}(\mathcal L^{(0)})^{-1}\mathcal L^{(1)}]` [W/m/K]
+
+        Parameters
+        ----------
+        mu : float or array_like, optional
+           chemical potential(s) [eV]
+        kT : float, optional
+           temperature [eV]
+        tau : float, optional
+           constant relaxation time [s]
+
+        Returns
+        -------
+        numpy.ndarray
+            thermal conductivity tensor(s) with shape ``(3, 3)`` (or ``(len(mu), 3, 3)`` for an array of `mu`)
+        """
+        L0, L1, L2 = self._moments(mu, kT, 2)
+        K = np.array([l2 - dot(l1, dot(np.linalg.pinv(l0), l1)) for l0, l1, l2 in zip(L0, L1, L2)])
+        return self._reduce(K * self._prefactor(tau) * _eV_SI / (kT * _eV_K), mu)
@@ -887,6 +887,15 @@ class MonkhorstPack(BrillouinZone):
        whether the k-points are :math:`\Gamma`-centered (for zero displacement)
     trs : bool, optional
        whether time-reversal symmetry exists in the Brillouin zone.
+    symmetry : bool or array_like, optional
+       reduce the k-points to the irreducible wedge of the Brillouin zone. If true the point-group
+       operations are found using ``parent.symmetry_operations()`` (the `Geometry` for Hamiltonians,
+       else the lattice), otherwise an array of integer operations ``(nop, 3, 3)`` as returned
+       by `SuperCell.symmetry_operations`. Operations that does not map the k-point grid onto itself
+       are discarded. Time-reversal symmetry is added as the inversion of all operations if `trs` is true.
+       The weights are summed for all equivalent k-points, hence any k-averaged quantity which
+       is invariant under the operations (eigenvalues, DOS, Fermi-level, etc.) is unchanged.
+       Orbital resolved quantities (PDOS, etc.) are *not* invariant.
 
     Examples
     --------
@@ -894,9 +903,10 @@ class MonkhorstPack(BrillouinZone):
     >>> MonkhorstPack(sc, 10) # 10 x 10 x 10 (with TRS)
     >>> MonkhorstPack(sc, [10, 5, 5]) # 10 x 5 x 5 (with TRS)
     >>> MonkhorstPack(sc, [10, 5, 5], trs=False) # 10 x 5 x 5 (without TRS)
+    >>> MonkhorstPack(geom.graphene(), [12, 12, 1], symmetry=True) # irreducible wedge
     """
 
-    def __init__(self, parent, nkpt, displacement=None, size=None, centered=True, trs=True):
+    def __init__(self, parent, nkpt, displacement=None, size=None, centered=True, trs=True, symmetry=False):
         super(MonkhorstPack, self).__init__(parent)
 
         if isinstance(nkpt, Integral):
@@ -927,7 +937,15 @@ class MonkhorstPack(BrillouinZone):
                              'diagonal elements different from 0.')
 
         i_trs = -1
-        if trs:
+        if symmetry is not False and symmetry is not None:
+            # The full grid is reduced below
+            if symmetry is True:
+                symmetry = self.parent.symmetry_operations()
+            symmetry = _a.asarrayi(symmetry).reshape(-1, 3, 3)
+            if trs:
+                symmetry = np.concatenate((symmetry, -symmetry), axis=0)
+        elif trs:
+            symmetry = None
             # Figure out which direction to TRS
             nmax = 0
             for i in [0, 1, 2]:
@@ -940,6 +958,8 @@ class MonkhorstPack(BrillouinZone):
                 # If we still haven't decided (say for weird displacements)
                 # simply take the one with the maximum number of k-points.
                 i_trs = np.argmax(Dn)
+        else:
+            symmetry = None
 
         # Calculate k-points and weights along all directions
         kw = [self.grid(Dn[i], displacement[i], size[i], centered, i == i_trs) for i in (0, 1, 2)]
@@ -952,7 +972,6 @@ class MonkhorstPack(BrillouinZone):
             self._k[..., i] = np.rollaxis(k, 0, i + 1)
             self._w[...] *= np.rollaxis(w, 0, i + 1)
 
-        del kw
         self._k.shape = (-1, 3)
         self._k = np.where(self._k > .5, self._k - 1, self._k)
         self._w.shape = (-1,)
@@ -965,10 +984,130 @@ class MonkhorstPack(BrillouinZone):
         self._size = size # vector
         self._centered = centered
         self._trs = i_trs
+        self._sym = None
+        self._sym_map = None
+        if symmetry is not None:
+            self._reduce_symmetry(kw, symmetry)
+        del kw
+
+    def _reduce_symmetry(self, kw, ops):
+        """ Reduce the full k-point grid to the irreducible points using the operations `ops` """
+        if not np.allclose(self._size, 1.):
+            raise SislError(self.__class__.__name__ + ' cannot apply symmetry operations for a reduced size '
+                            'Brillouin zone.')
+        k = self._k
+        n = self._diag
+        # The first k-point along each direction (grid is sorted)
+        k0 = _a.arrayd([kw[i][0][0] for i in (0, 1, 2)])
+
+        def k2idx(k):
+            # Grid index of k-points (-1 if not on the grid)
+            idx = (k - k0.reshape(1, 3)) * n.reshape(1, 3)
+            iidx = np.rint(idx)
+            on_grid = (np.abs(idx - iidx) < 1e-6).all(1)
+            iidx = iidx.astype(np.int64) % n.reshape(1, 3)
+            return np.where(on_grid, np.ravel_multi_index(iidx.T, n), -1)
+
+        # Images of all k-points (the k-points are ordered as the grid indices)
+        # For a group of operations the set of k.W^-T equals k.W^T
+        used = []
+        images = []
+        for op in ops:
+            j = k2idx(dot(k, op.T))
+            if (j < 0).any():
+                # Not a symmetry of the grid
+                continue
+            used.append(op)
+            images.append(j)
+
+        # Representative (smallest index) of each k-point orbit
+        rep = _a.arangei(len(k))
+        changed = True
+        while changed:
+            old = rep.copy()
+            for j in images:
+                rep = np.minimum(rep, rep[j])
+                np.minimum.at(rep, j, rep)
+            changed = (old != rep).any()
+        uniq, rep = np.unique(rep, return_inverse=True)
+        w = np.bincount(rep, weights=self._w, minlength=len(uniq))
+
+        self._k = k[uniq]
+        self._w = w
+        self._sym = np.array(used, dtype=np.int32).reshape(-1, 3, 3)
+        self._sym_map = rep
+
+    def unfold(self, data, axis=0):
+        """ Unfold data calculated for the irreducible k-points onto the full k-point grid
+
+        The full grid is ordered as ``MonkhorstPack(..., trs=False)``. Only quantities that are
+        invariant under the symmetry operations (such as eigenvalues) may be unfolded.
+
+        Parameters
+        ----------
+        data : array_like
+           data with one entry per (irreducible) k-point along `axis`
+        axis : int, optional
+           the k-point axis of `data`
+
+        Returns
+        -------
+        numpy.ndarray
+            the data for all k-points in the full grid
+        """
+        if self._sym_map is None:
+            return np.asarray(data)
+        return np.take(data, self._sym_map, axis=axis)
+
+    def _grid_map(self):
+        """ Find the k-point in `k` equivalent to each point of the full grid
+
+        The full grid is ordered as ``MonkhorstPack(..., trs=False)`` and the equivalent k-points
+        are found through the symmetry operations (or time-reversal symmetry).
+
+        Returns
+        -------
+        numpy.ndarray
+            the first point of the full grid, all other points are ``k0 + idx / self._diag``
+        numpy.ndarray
+            index into `k` for each grid point, -1 if the grid point could not be mapped
+        """
+        n = self._diag
+        kw = [self.grid(n[i], self._displ[i], 1., self._centered, False)[0] for i in (0, 1, 2)]
+        k0 = _a.arrayd([kw[i][0] for i in (0, 1, 2)])
+        nk = n.prod()
+
+        def k2idx(k):
+            # Grid index of k-points (-1 if not on the grid)
+            idx = (k - k0.reshape(1, 3)) * n.reshape(1, 3)
+            iidx = np.rint(idx)
+            on_grid = (np.abs(idx - iidx) < 1e-6).all(1)
+            iidx = iidx.astype(np.int64) % n.reshape(1, 3)
+            return np.where(on_grid, np.ravel_multi_index(iidx.T, n), -1)
+
+        if self._sym_map is not None and len(self._sym_map) == nk:
+            return k0, self._sym_map
+
+        ops = np.eye(3, dtype=np.int32).reshape(1, 3, 3)
+        if self._trs >= 0:
+            ops = np.concatenate((ops, -ops), axis=0)
+        full = np.full(nk, -1, np.int64)
+        ik = np.arange(len(self))
+        # Reverse to prefer the k-point it self (identity)
+        for op in ops[::-1]:
+            j = k2idx(dot(self.k, op.T))
+            valid = j >= 0
+            full[j[valid]] = ik[valid]
+        return k0, full
 
     def copy(self):
         """ Create a copy of this object """
-        bz = self.__class__(self.parent, self._diag, self._displ, self._size, self._centered, self._trs >= 0)
+        if self._sym is None:
+            bz = self.__class__(self.parent, self._diag, self._displ, self._size, self._centered, self._trs >= 0)
+        else:
+            # The operations already contain TRS
+            bz = self.__class__(self.parent, self._diag, self._displ, self._size, self._centered, False,
+                                symmetry=self._sym)
         bz._k = self._k.copy()
         bz._w = self._w.copy()
         return bz
@@ -1026,6 +1165,8 @@ class MonkhorstPack(BrillouinZone):
             # Extract information from the MP grid, these values
             # define the Grid size, etc.
             diag = self._diag.copy()
+            if self._sym is not None:
+                raise SislError(self.__class__.__name__ + '.{} requires the full k-point grid (use symmetry=False).'.format(self._bz_attr))
             if not np.all(self._displ == 0):
                 raise SislError(self.__class__.__name__ + '.{} requires the displacement to be 0 for all k-points.'.format(self._bz_attr))
             displ = self._displ.copy()
@@ -1321,6 +1462,174 @@ class MonkhorstPack(BrillouinZone):
         # Append the new k-points and weights
         self._k = np.concatenate((self._k, mp._k), axis=0)
         self._w = np.concatenate((self._w, mp._w * weight_factor))
+        # The k-points are no longer the irreducible points of the full grid
+        self._sym_map = None
+
+    def refine(self, func, tol=1e-4, n=3, max_nk=None, max_level=6):
+        r""" Adaptively refine the k-points where the integrand `func` varies the most
+
+        The k-points are iteratively replaced by a finer :math:`n\times n\times n` sub-mesh
+        (only along directions with more than one k-point) covering the same volume of the
+        Brillouin zone, with the weight of the k-point distributed evenly.
+        For odd `n` the center k-point is retained and not re-calculated.
+
+        The error estimate of a k-point is its weight times the largest (absolute) change of `func`
+        to the neighbouring k-points (at the same spacing), i.e. the variation of the integrand
+        within the volume of the k-point. For metals the integrand should be a
+        (smeared) quantity at the Fermi level, e.g. the occupations or the DOS, such that
+        the k-points where bands cross the Fermi level are refined.
+
+        The k-points and weights of this object are updated in-place such that subsequent
+        calls (e.g. `asaverage`) use the refined k-points.
+
+        Examples
+        --------
+        >>> H = Hamiltonian(...)
+        >>> mp = MonkhorstPack(H, [20, 20, 1])
+        >>> dist = get_distribution('gaussian', smearing=0.05)
+        >>> E = np.linspace(-0.5, 0.5, 11)
+        >>> DOS, err = mp.refine(lambda k: H.eigenstate(k).DOS(E, dist), tol=1e-4, max_nk=5000)
+
+        Parameters
+        ----------
+        func : callable
+           integrand, ``func(k)`` returns a float or an array for a single k-point (in reduced coordinates)
+        tol : float, optional
+           refine all k-points with an error estimate above `tol`
+        n : int, optional
+           number of sub-divisions of the refined k-points along each direction
+        max_nk : int, optional
+           maximum total number of k-points, the k-points with the largest error estimates
+           are refined first. Defaults to no limit.
+        max_level : int, optional
+           maximum number of recursive refinements
+
+        Returns
+        -------
+        numpy.ndarray or float
+            the k-averaged `func` (weighted sum) using the refined k-points
+        float
+            the estimated error of the k-averaged value
+        """
+        n = int(n)
+        if n < 2:
+            raise ValueError(self.__class__.__name__ + '.refine requires n > 1.')
+
+        # Directions that are refined
+        ref = self._diag > 1
+        nsub = np.where(ref, n, 1)
+        nnew = nsub.prod()
+
+        # Operations to figure out equivalent k-points
+        if self._sym is None:
+            ops = np.eye(3, dtype=np.int32).reshape(1, 3, 3)
+            if self._trs >= 0:
+                ops = np.concatenate((ops, -ops), axis=0)
+        else:
+            ops = self._sym
+
+        def key(k):
+            # k-point key for look-up of equivalent k-points
+            return tuple(np.rint(self.in_primitive(k) * 1e8).astype(np.int64).ravel())
+
+        # Offsets of sub-mesh k-points in units of the k-point size
+        offset = [(_a.aranged(nsub[i]) - (nsub[i] - 1) / 2) / nsub[i] for i in (0, 1, 2)]
+        offset = _a.arrayd(np.meshgrid(*offset, indexing='ij')).reshape(3, -1).T
+        # For odd n, the center point is the first one
+        icenter = np.argmin((offset ** 2).sum(1))
+        offset = np.concatenate((offset[icenter:icenter+1], np.delete(offset, icenter, axis=0)), axis=0)
+        center = n % 2 == 1
+
+        k = self.k.copy()
+        w = self.weight.copy()
+        size = np.tile(self._size / self._diag, (len(k), 1))
+        f = [np.asarray(func(kk), dtype=np.float64) for kk in k]
+        shape = f[0].shape
+        f = _a.arrayd([ff.ravel() for ff in f])
+
+        def estimate():
+            # Look-up table of k-points
+            lookup = {}
+            for op in ops:
+                for i, kk in enumerate(dot(k, op.T)):
+                    lookup.setdefault(key(kk), i)
+            err = np.zeros(len(k))
+            for d in (0, 1, 2):
+                if not ref[d]:
+                    continue
+                for i in range(len(k)):
+                    dk = np.zeros(3)
+                    dk[d] = size[i, d]
+                    for j in (lookup.get(key(k[i] + dk), i), lookup.get(key(k[i] - dk), i)):
+                        if j != i:
+                            err[i] = max(err[i], np.abs(f[j] - f[i]).max())
+            return err * w
+
+        level = np.zeros(len(k), np.int32)
+        err = estimate()
+        while True:
+            idx = np.logical_and(err > tol, level < max_level).nonzero()[0]
+            idx = idx[np.argsort(-err[idx], kind='mergesort')]
+            if max_nk is not None:
+                idx = idx[:max(0, (max_nk - len(k)) // max(1, nnew - 1))]
+            if len(idx) == 0:
+                break
+
+            # Create the sub-meshes
+            sub_size = size[idx] / nsub.reshape(1, 3)
+            sub_k = (k[idx].reshape(-1, 1, 3) + offset.reshape(1, -1, 3) * size[idx].reshape(-1, 1, 3)).reshape(-1, 3)
+            sub_w = np.repeat(w[idx] / nnew, nnew)
+            sub_f = np.empty([len(idx), nnew, f.shape[1]])
+            if center:
+                sub_f[:, 0, :] = f[idx]
+                calc = slice(1, None)
+            else:
+                calc = slice(None)
+            sub_f[:, calc, :] = _a.arrayd([np.asarray(func(kk), dtype=np.float64).ravel()
+                                          for kk in sub_k.reshape(len(idx), nnew, 3)[:, calc].reshape(-1, 3)]) \
+                                          .reshape(len(idx), -1, f.shape[1])
+
+            sub_level = np.repeat(level[idx] + 1, nnew)
+            k = np.concatenate((np.delete(k, idx, axis=0), self.in_primitive(sub_k)), axis=0)
+            w = np.concatenate((np.delete(w, idx), sub_w))
+            f = np.concatenate((np.delete(f, idx, axis=0), sub_f.reshape(-1, f.shape[1])), axis=0)
+            size = np.concatenate((np.delete(size, idx, axis=0), np.repeat(sub_size, nnew, axis=0)), axis=0)
+            level = np.concatenate((np.delete(level, idx), sub_level))
+            err = estimate()
+
+        self._k = k
+        self._w = w
+        self._sym_map = None
+        v = dot(w, f).reshape(shape)
+        if v.ndim == 0:
+            return v.item(), err.sum()
+        return v, err.sum()
+
+
+def _mp_grid_map(mp, name):
+    """ Check that `mp` is a full `MonkhorstPack` grid and return `MonkhorstPack._grid_map`
+
+    Parameters
+    ----------
+    mp : MonkhorstPack
+       the k-point grid, it must span the entire Brillouin zone
+    name : str
+       name of the calling class (used in error messages)
+
+    Raises
+    ------
+    ValueError : if `mp` is not a `MonkhorstPack` object
+    SislError : if the grid does not span the Brillouin zone, or the grid points could not be mapped
+    """
+    if not isinstance(mp, MonkhorstPack):
+        raise ValueError(name + ' requires a MonkhorstPack object')
+    if not np.allclose(mp._size, 1.):
+        raise SislError(name + ' requires the MonkhorstPack grid to span the entire Brillouin zone')
+    k0, full = mp._grid_map()
+    if (full < 0).any():
+        raise SislError(name + ' could not map the full grid onto the k-points of the MonkhorstPack '
+                        'object, replaced/refined k-points are not allowed.')
+    return k0, full
 
 
 class BandStructure(BrillouinZone):
@@ -17,9 +17,13 @@ One may also plot real-space wavefunctions.
 
    DOS
    PDOS
+   fermi_level
    velocity
    velocity_matrix
+   velocity_batch
+   velocity_matrix_batch
    berry_phase
+   wilson_loop
    wavefunction
    spin_moment
    spin_squared
@@ -50,6 +54,7 @@ automatically passes the correct ``S`` because it knows the states :math:`k`-poi
 from __future__ import print_function, division
 
 from functools import reduce
+from itertools import islice
 import numpy as np
 from numpy import find_common_type
 from numpy import zeros, empty
@@ -69,21 +74,38 @@ import sisl._array as _a
 from sisl.linalg import svd_destroy, eigvals_destroy
 from sisl.linalg import eigh_destroy, det_destroy
 from sisl.messages import info, warn, SislError, tqdm_eta
-from sisl._help import dtype_complex_to_real, _range as range
+from sisl._help import dtype_complex_to_real, _range as range, _CHUNK_SIZE, _pool_map
 from .distribution import get_distribution
 from .spin import Spin
 from .sparse import SparseOrbitalBZSpin
 from .state import Coefficient, State, StateC
 
 
-__all__ = ['DOS', 'PDOS']
-__all__ += ['velocity', 'velocity_matrix']
-__all__ += ['spin_moment', 'inv_eff_mass_tensor', 'berry_phase']
+__all__ = ['DOS', 'PDOS', 'fermi_level']
+__all__ += ['velocity', 'velocity_matrix', 'velocity_batch', 'velocity_matrix_batch']
+__all__ += ['spin_moment', 'inv_eff_mass_tensor', 'berry_phase', 'wilson_loop']
 __all__ += ['wavefunction']
 __all__ += ['CoefficientElectron', 'StateElectron', 'StateCElectron']
 __all__ += ['EigenvalueElectron', 'EigenvectorElectron', 'EigenstateElectron']
 
 
+def _distribution_chunks(E, eig, distribution):
+    """ Yield the distribution matrix ``distribution(E - eig)`` in chunks of energies
+
+    Yields
+    ------
+    slice : the energies of the chunk
+    numpy.ndarray : the distribution with shape ``(len(eig), len(E[slice]))``
+    """
+    E = E.ravel()
+    eig = eig.reshape(-1, 1)
+    nE = max(1, _CHUNK_SIZE // max(1, len(eig)))
+    for i in range(0, len(E), nE):
+        sl = slice(i, min(i + nE, len(E)))
+        dE = (E[sl].reshape(1, -1) - eig).ravel()
+        yield sl, distribution(dE).reshape(len(eig), -1)
+
+
 def DOS(E, eig, distribution='gaussian'):
     r""" Calculate the density of states (DOS) for a set of energies, `E`, with a distribution function
 
@@ -120,7 +142,16 @@ def DOS(E, eig, distribution='gaussian'):
     if isinstance(distribution, str):
         distribution = get_distribution(distribution)
 
-    return reduce(lambda DOS, eig: DOS + distribution(E - eig), eig, 0.)
+    E = _a.asarray(E)
+    eig = _a.asarray(eig).ravel()
+    if E.ndim != 1 or eig.size == 0:
+        # Fall-back for scalar energies and no eigenvalues
+        return reduce(lambda DOS, eig: DOS + distribution(E - eig), eig, 0.)
+
+    DOS = _a.emptyd(len(E))
+    for sl, d in _distribution_chunks(E, eig, distribution):
+        DOS[sl] = d.sum(0)
+    return DOS
 
 
 def PDOS(E, eig, state, S=None, distribution='gaussian', spin=None):
@@ -215,6 +246,10 @@ def PDOS(E, eig, state, S=None, distribution='gaussian', spin=None):
         else:
             spin = Spin()
 
+    eig = _a.asarray(eig).ravel()
+    state = state.reshape(len(eig), -1)
+    n = len(eig)
+
     # check for non-collinear (or SO)
     if spin.kind > Spin.POLARIZED:
         # Non colinear eigenvectors
@@ -222,36 +257,137 @@ def PDOS(E, eig, state, S=None, distribution='gaussian', spin=None):
             # Since we are going to reshape the eigen-vectors
             # to more easily get the mixed states, we can reduce the overlap matrix
             S = S[::2, ::2]
-
-        # Initialize data
-        PDOS = np.empty([4, state.shape[1] // 2, len(E)], dtype=dtype_complex_to_real(state.dtype))
-
-        d = distribution(E - eig[0]).reshape(1, -1)
-        v = S.dot(state[0].reshape(-1, 2))
-        D = (conj(state[0]) * v.ravel()).real.reshape(-1, 2) # diagonal PDOS
-        PDOS[0, :, :] = D.sum(1).reshape(-1, 1) * d # total DOS
-        PDOS[3, :, :] = (D[:, 0] - D[:, 1]).reshape(-1, 1) * d # z-dos
-        D = (conj(state[0, 1::2]) * 2 * v[:, 0]).reshape(-1, 1) # psi_down * psi_up * 2
-        PDOS[1, :, :] = D.real * d # x-dos
-        PDOS[2, :, :] = D.imag * d # y-dos
-        for i in range(1, len(eig)):
-            d = distribution(E - eig[i]).reshape(1, -1)
-            v = S.dot(state[i].reshape(-1, 2))
-            D = (conj(state[i]) * v.ravel()).real.reshape(-1, 2)
-            PDOS[0, :, :] += D.sum(1).reshape(-1, 1) * d
-            PDOS[3, :, :] += (D[:, 0] - D[:, 1]).reshape(-1, 1) * d
-            D = (conj(state[i, 1::2]) * 2 * v[:, 0]).reshape(-1, 1)
-            PDOS[1, :, :] += D.real * d
-            PDOS[2, :, :] += D.imag * d
+        no = state.shape[1] // 2
+
+        # S | psi > for all states at once, shape (n, no, 2)
+        v = S.dot(state.reshape(n, no, 2).transpose(1, 0, 2).reshape(no, -1))
+        v = _a.asarray(v).reshape(no, n, 2).transpose(1, 0, 2)
+
+        # The projected weights of all states, shape (4, n, no)
+        w = np.empty([4, n, no], dtype=dtype_complex_to_real(state.dtype))
+        D = (conj(state) * v.reshape(n, -1)).real.reshape(n, no, 2) # diagonal PDOS
+        w[0] = D.sum(2) # total DOS
+        w[3] = D[:, :, 0] - D[:, :, 1] # z-dos
+        D = conj(state[:, 1::2]) * 2 * v[:, :, 0] # psi_down * psi_up * 2
+        w[1] = D.real # x-dos
+        w[2] = D.imag # y-dos
+        del D, v
 
     else:
-        PDOS = (conj(state[0]) * S.dot(state[0])).real.reshape(-1, 1) \
-               * distribution(E - eig[0]).reshape(1, -1)
-        for i in range(1, len(eig)):
-            PDOS[:, :] += (conj(state[i]) * S.dot(state[i])).real.reshape(-1, 1) \
-                          * distribution(E - eig[i]).reshape(1, -1)
+        # <psi | S | psi > for all states at once, shape (1, n, no)
+        v = _a.asarray(S.dot(state.T)).T
+        w = (conj(state) * v).real.reshape(1, n, -1)
+        del v
+
+    # Contract the weights with the distribution (one matrix product per chunk of energies)
+    E = _a.asarray(E).ravel()
+    PDOS = np.empty([w.shape[0], w.shape[2], len(E)], dtype=w.dtype)
+    for sl, d in _distribution_chunks(E, eig, distribution):
+        for i in range(w.shape[0]):
+            PDOS[i, :, sl] = dot(w[i].T, d)
+
+    if spin.kind > Spin.POLARIZED:
+        return PDOS
+    return PDOS[0]
+
+
+def fermi_level(eig, q, weight=None, distribution='fermi_dirac', q_tol=1e-12):
+    r""" Calculate the Fermi-level from eigenvalues and a target charge
+
+    The Fermi-level, :math:`E_F`, is found such that
+
+    .. math::
+       \sum_{\mathbf k} w_{\mathbf k} \sum_i D(\epsilon_{i\mathbf k} - E_F) = q
+
+    where :math:`D` is the distribution function. The charge is a monotone function of
+    :math:`E_F` and the root is found with a bracketed Brent method, each evaluation is
+    vectorized over all k-points and bands.
+
+    Since the eigenvalues are only needed once, many charges and distributions (temperatures)
+    may be scanned cheaply:
+
+    >>> bz = MonkhorstPack(H, [10, 10, 10])
+    >>> eig = bz.asarray().eigh()
+    >>> Ef = fermi_level(eig, np.linspace(0.9, 1.1, 21), bz.weight)
+    >>> Ef_kT = [fermi_level(eig, 1., bz.weight, get_distribution('fermi_dirac', smearing=kT))
+    ...          for kT in [0.01, 0.025, 0.1]]
+
+    Parameters
+    ----------
+    eig : array_like
+       eigenvalues with shape ``(..., nk, nbands)``, e.g. from ``bz.asarray().eigh()``.
+       Spin-polarized eigenvalues with shape ``(2, nk, nbands)`` are solved for the total charge
+    q : float or array_like
+       charge(s) to calculate the Fermi-level for
+    weight : array_like, optional
+       weights of the k-points (length ``nk``), defaults to equal weights
+    distribution : str or func, optional
+       used distribution, must accept the keyword ``mu`` as parameter for the Fermi-level
+    q_tol : float, optional
+       tolerance of the charge, the Fermi-level is converged until the charge is
+       within `q_tol` of `q` (or to machine precision)
+
+    Returns
+    -------
+    float or numpy.ndarray
+        the Fermi-level(s), same shape as `q`
+    """
+    from scipy.optimize import brentq
+
+    if isinstance(distribution, str):
+        distribution = get_distribution(distribution)
+
+    eig = _a.asarrayd(eig)
+    if eig.ndim == 1:
+        eig = eig.reshape(1, -1)
+    nk = eig.shape[-2]
+    if weight is None:
+        weight = _a.fulld(nk, 1. / nk)
+    weight = _a.asarrayd(weight).reshape(-1, 1)
+    # Flatten the eigenvalues and weights to simple vectors
+    w = np.broadcast_to(weight, eig.shape).ravel()
+    eig = eig.ravel()
+
+    def charge(Ef):
+        with np.errstate(over='ignore'):
+            return dot(distribution(eig, mu=Ef), w)
+
+    eig_min, eig_max = eig.min(), eig.max()
+    step = max(eig_max - eig_min, 1.)
+
+    def bracket(q):
+        # Find the bracket of the Fermi-level
+        lo, hi = eig_min, eig_max
+        for expand in range(100):
+            if charge(lo) < q:
+                break
+            lo -= step * 2 ** expand
+        else:
+            raise ValueError('fermi_level could not bracket the Fermi-level, is the charge positive?')
+        for expand in range(100):
+            if charge(hi) > q:
+                break
+            hi += step * 2 ** expand
+        else:
+            raise ValueError('fermi_level could not bracket the Fermi-level, is the charge larger than the number of states?')
+        return lo, hi
+
+    def dq(Ef, q):
+        # Charges within the tolerance are roots (brentq stops at exact zeros)
+        d = charge(Ef) - q
+        if abs(d) <= q_tol:
+            return 0.
+        return d
+
+    def solve(q):
+        lo, hi = bracket(q)
+        return brentq(dq, lo, hi, args=(q,), maxiter=500)
 
-    return PDOS
+    q = _a.asarrayd(q)
+    Ef = _a.arrayd([solve(iq) for iq in q.ravel()])
+    if q.ndim == 0:
+        return Ef[0]
+    return Ef.reshape(q.shape)
 
 
 def spin_moment(state, S=None):
@@ -490,14 +626,12 @@ def _velocity_non_ortho(state, dHk, energy, dSk, degenerate):
             vv = conj(S).dot((dHk[2] - e * dSk[2]).dot(S.T))
             state[deg, :] = eigh_destroy(vv)[1].T.dot(S)
 
-    # Since they depend on the state energies and dSk we have to loop them individually.
-    for s, e in enumerate(energy):
-
-        # Since dHk *may* be a csr_matrix or sparse, we have to do it like
-        # this. A sparse matrix cannot be re-shaped with an extra dimension.
-        v[s, 0] = (conj(state[s]) * (dHk[0] - e * dSk[0]).dot(state[s])).sum().real
-        v[s, 1] = (conj(state[s]) * (dHk[1] - e * dSk[1]).dot(state[s])).sum().real
-        v[s, 2] = (conj(state[s]) * (dHk[2] - e * dSk[2]).dot(state[s])).sum().real
+    # The energy dependent term is applied after the (stacked) products
+    # Since dHk *may* be a csr_matrix or sparse, we have to do it like
+    # this. A sparse matrix cannot be re-shaped with an extra dimension.
+    cstate = conj(state.T)
+    for i in range(3):
+        v[:, i] = ((cstate * dHk[i].dot(state.T)).sum(0) - energy * (cstate * dSk[i].dot(state.T)).sum(0)).real
 
     return v * _velocity_const
 
@@ -607,14 +741,11 @@ def _velocity_matrix_non_ortho(state, dHk, energy, dSk, degenerate, dtype):
             vv = conj(S).dot((dHk[2] - e * dSk[2]).dot(S.T))
             state[deg, :] = eigh_destroy(vv)[1].T.dot(S)
 
-    # Since they depend on the state energies and dSk we have to loop them individually.
-    for s, e in enumerate(energy):
-
-        # Since dHk *may* be a csr_matrix or sparse, we have to do it like
-        # this. A sparse matrix cannot be re-shaped with an extra dimension.
-        v[s, :, 0] = conj(state).dot((dHk[0] - e * dSk[0]).dot(state[s]))
-        v[s, :, 1] = conj(state).dot((dHk[1] - e * dSk[1]).dot(state[s]))
-        v[s, :, 2] = conj(state).dot((dHk[2] - e * dSk[2]).dot(state[s]))
+    # The energy dependent term is applied after the (stacked) products
+    cstate = conj(state)
+    energy = energy.reshape(1, -1)
+    for i in range(3):
+        v[:, :, i] = (cstate.dot(dHk[i].dot(state.T)) - energy * cstate.dot(dSk[i].dot(state.T))).T
 
     return v * _velocity_const
 
@@ -639,14 +770,110 @@ def _velocity_matrix_ortho(state, dHk, degenerate, dtype):
             vv = conj(S).dot((dHk[2]).dot(S.T))
             state[deg, :] = eigh_destroy(vv)[1].T.dot(S)
 
-    for s in range(n):
-        v[s, :, 0] = conj(state).dot(dHk[0].dot(state[s, :]))
-        v[s, :, 1] = conj(state).dot(dHk[1].dot(state[s, :]))
-        v[s, :, 2] = conj(state).dot(dHk[2].dot(state[s, :]))
+    cstate = conj(state)
+    for i in range(3):
+        v[:, :, i] = cstate.dot(dHk[i].dot(state.T)).T
 
     return v * _velocity_const
 
 
+def _batch_dk(eigenstates, batch):
+    """ Yield eigenstates together with ``dHk`` and ``dSk`` constructed in batches of k-points """
+    eigenstates = iter(eigenstates)
+    while True:
+        states = list(islice(eigenstates, batch))
+        if len(states) == 0:
+            return
+        parent = states[0].parent
+        gauge = states[0].info.get('gauge', 'R')
+        spin = states[0].info.get('spin', 0)
+        for es in states:
+            if es.parent is not parent or es.info.get('gauge', 'R') != gauge or es.info.get('spin', 0) != spin:
+                raise ValueError('velocity_batch: requires all eigenstates to have the same parent, gauge and spin')
+        k = [es.info.get('k', (0, 0, 0)) for es in states]
+
+        if parent.spin.is_noncolinear or parent.spin.is_spinorbit:
+            # The spin-box matrices are constructed individually
+            for es, kk in zip(states, k):
+                dSk = None if parent.orthogonal else parent.dSk(k=kk, gauge=gauge)
+                yield es, parent.dHk(k=kk, gauge=gauge), dSk
+            continue
+
+        dim = spin if parent.spin.is_polarized else 0
+        dHk = parent._dPk_batch(k, gauge, _dim=dim)
+        if parent.orthogonal:
+            for es in states:
+                yield es, next(dHk), None
+        else:
+            dSk = parent._dPk_batch(k, gauge, _dim=parent.S_idx)
+            for es in states:
+                yield es, next(dHk), next(dSk)
+
+
+def velocity_batch(eigenstates, eps=1e-4, batch=64):
+    r""" Calculate the velocities of eigenstates at many k-points
+
+    This is equivalent to calling `EigenstateElectron.velocity` for each of the eigenstates.
+    The :math:`\mathbf k` derivatives of the Hamiltonian are constructed in batches of k-points
+    using a cached folded sparsity pattern of the Hamiltonian (a single sparse-dense product
+    per batch), and the velocities of all states at a k-point are calculated with stacked
+    sparse-dense products.
+
+    Parameters
+    ----------
+    eigenstates : iterable of EigenstateElectron
+       eigenstates (with the same parent, gauge and spin), e.g. ``bz.asyield().eigenstate()``
+    eps : float, optional
+       precision used to find degenerate states.
+    batch : int, optional
+       number of k-points for which the derivatives are constructed simultaneously
+
+    Returns
+    -------
+    numpy.ndarray
+        velocities with shape ``(nk, nstate, 3)``, the velocity unit is Ang/ps.
+
+    Examples
+    --------
+    >>> bz = MonkhorstPack(H, [100, 100, 1])
+    >>> v = velocity_batch(bz.asyield().eigenstate())
+
+    See Also
+    --------
+    velocity : the underlying velocity calculation
+    """
+    return np.array([velocity(es.state, dHk, es.c, dSk, degenerate=es.degenerate(eps))
+                     for es, dHk, dSk in _batch_dk(eigenstates, batch)])
+
+
+def velocity_matrix_batch(eigenstates, eps=1e-4, batch=64):
+    r""" Calculate the velocity matrices of eigenstates at many k-points
+
+    This is equivalent to calling `EigenstateElectron.velocity_matrix` for each of the eigenstates,
+    see `velocity_batch` for details on the batched construction of the derivatives.
+
+    Parameters
+    ----------
+    eigenstates : iterable of EigenstateElectron
+       eigenstates (with the same parent, gauge and spin), e.g. ``bz.asyield().eigenstate()``
+    eps : float, optional
+       precision used to find degenerate states.
+    batch : int, optional
+       number of k-points for which the derivatives are constructed simultaneously
+
+    Returns
+    -------
+    numpy.ndarray
+        velocity matrices with shape ``(nk, nstate, nstate, 3)``, the velocity unit is Ang/ps.
+
+    See Also
+    --------
+    velocity_matrix : the underlying velocity matrix calculation
+    """
+    return np.array([velocity_matrix(es.state, dHk, es.c, dSk, degenerate=es.degenerate(eps))
+                     for es, dHk, dSk in _batch_dk(eigenstates, batch)])
+
+
 def inv_eff_mass_tensor(state, ddHk, energy=None, ddSk=None, degenerate=None, as_matrix=False):
     r""" Calculate the effective mass tensor for a set of states (missing off-diagonal terms)
 
@@ -956,6 +1183,130 @@ def berry_phase(contour, sub=None, eigvals=False, closed=True, method='berry'):
     return ret
 
 
+def wilson_loop(parent, k, sub=None, closed=True, processes=None, **kwargs):
+    r""" Calculate the Wilson loop spectra for a family of k-point loops
+
+    For each loop the Wilson loop matrix is the product of the overlap matrices of the
+    (periodic part of the) Bloch states at consecutive k-points
+
+    .. math::
+       \mathbf W = \prod_i^{N-1} \mathbf M_{i,i+1},\quad
+       M^{mn}_{i,i+1} = \langle u_{m\mathbf k_i} | u_{n\mathbf k_{i+1}} \rangle
+
+    The overlap matrices of a loop are calculated in one batch and each of them is replaced
+    by its closest unitary matrix (through an SVD) before the product is formed, which keeps
+    the product numerically stable for many k-points.
+    The returned phases are :math:`-\arg\lambda` of the eigenvalues of :math:`\mathbf W`
+    (equivalent to ``berry_phase(..., eigvals=True)`` for a subset of the bands). For loops
+    spanning a reciprocal lattice vector these are the Wannier charge centres (in units of
+    :math:`2\pi`). For a closed loop including all bands the product is the identity matrix
+    and all phases are zero.
+
+    Parameters
+    ----------
+    parent : Hamiltonian
+       the Hamiltonian (orthogonal basis) used to calculate the eigenstates
+    k : array_like
+       k-points (in reduced coordinates) of the loops, shape ``(nloop, nk, 3)`` (or ``(nk, 3)``
+       for a single loop). A loop may end on the first k-point shifted by a reciprocal lattice
+       vector (e.g. ``[0, 0, 0]`` to ``[1, 0, 0]``), in which case the last point is replaced
+       by the periodic image of the first state.
+    sub : None or list of int, optional
+       selected bands to calculate the Wilson loop of
+    closed : bool, optional
+       whether or not to include the connection of the last and first points in the loops
+    processes : int, optional
+       number of processes the loops are distributed on. Requires the parent to be pickable.
+       Defaults to a serial calculation.
+    **kwargs : dict, optional
+       passed to the ``eigenstate`` method of the parent (e.g. ``spin``)
+
+    Returns
+    -------
+    numpy.ndarray
+        sorted phases for each loop, shape ``(nloop, nband)``
+
+    Examples
+    --------
+
+    Wannier charge centres as a function of :math:`k_y` for the lowest two bands
+
+    >>> kx = np.linspace(0, 1, 51)
+    >>> ky = np.linspace(0, 0.5, 26)
+    >>> k = np.zeros([len(ky), len(kx), 3])
+    >>> k[:, :, 0] = kx.reshape(1, -1)
+    >>> k[:, :, 1] = ky.reshape(-1, 1)
+    >>> wcc = wilson_loop(H, k, sub=[0, 1]) / (2 * np.pi)
+
+    See Also
+    --------
+    berry_phase : Berry phase of a single contour
+    """
+    from .hamiltonian import Hamiltonian
+    if not isinstance(parent, Hamiltonian):
+        raise SislError('wilson_loop: requires a Hamiltonian!')
+    if not parent.orthogonal:
+        raise SislError('wilson_loop: requires the Hamiltonian to use an orthogonal basis!')
+
+    k = _a.asarrayd(k)
+    if k.ndim == 2:
+        k = k.reshape(1, -1, 3)
+    if k.ndim != 3 or k.shape[1] < 2:
+        raise ValueError('wilson_loop: requires k to have shape (nloop, nk, 3) with nk > 1')
+
+    # The gauge transformation phases are exp(i k.r) with r the orbital positions,
+    # these are calculated once for the geometry (and shared among all loops).
+    g = parent.geometry
+    r = dot(g.xyz[g.o2a(_a.arangei(g.no)), :], g.rcell.T)
+
+    if processes is None or processes <= 1:
+        return _a.arrayd([_wilson_loop(parent, kk, sub, closed, r, kwargs) for kk in k])
+
+    return _a.arrayd(_pool_map(_wilson_loop_star, [(parent, kk, sub, closed, r, kwargs) for kk in k], processes))
+
+
+def _wilson_loop(parent, k, sub, closed, r, kwargs):
+    r""" Phases of the Wilson loop of a single loop with gauge phases ``exp(i k.r)`` """
+    G = _a.zerosd(3)
+    if closed:
+        dk = k[-1] - k[0]
+        if np.allclose(dk, np.rint(dk)):
+            # last k-point is a periodic image of the first k-point
+            G = np.rint(dk)
+            k = k[:-1]
+        else:
+            # the k-point following the last k-point
+            G = np.rint(2 * k[-1] - k[-2] - k[0])
+
+    U = []
+    for kk in k:
+        es = parent.eigenstate(kk, **kwargs)
+        if not sub is None:
+            es = es.sub(sub)
+        state = es.state
+        if state.shape[1] != r.shape[0]:
+            # spinors
+            r = np.repeat(r, state.shape[1] // r.shape[0], axis=0)
+        # change to the 'r' gauge
+        U.append(state * np.exp(1j * dot(r, kk)).reshape(1, -1))
+    if closed:
+        # periodic image of the first state
+        U.append(U[0] * np.exp(1j * dot(r, G)).reshape(1, -1))
+    U = np.array(U)
+
+    # All overlap matrices in one batch
+    M = np.matmul(conj(U[:-1]), U[1:].transpose(0, 2, 1))
+    del U
+    u, _, vh = np.linalg.svd(M)
+    M = np.matmul(u, vh)
+    W = reduce(dot, M)
+    return sort(-angle(eigvals_destroy(W)))
+
+
+def _wilson_loop_star(args):
+    return _wilson_loop(*args)
+
+
 def wavefunction(v, grid, geometry=None, k=None, spinor=0, spin=None, eta=False):
     r""" Add the wave-function (`Orbital.psi`) component of each orbital to the grid
 
@@ -253,8 +253,12 @@ class EnergyDensityMatrix(_realspace_DensityMatrix):
             # When the energy is zero, there is no shift
             return
 
+        # Location of the DM elements in this object (trivial for shared sparsity patterns)
+        idx = self._csr._index_map(DM._csr)
+        DM_idx = DM._csr._data_index()
         for i in range(min(self.spin.spins, 2)):
-            self._csr._D[:, i] += DM._csr._D[:, i] * E[i]
+            self._csr._D[idx, i] += DM._csr._D[DM_idx, i] * E[i]
+        self._csr._modified()
 
     def energy_charge(self, method='mulliken'):
         """ Calculate orbital energy charges based on the energy density matrix
@@ -1,12 +1,11 @@
 from __future__ import print_function, division
 
 import numpy as np
-from scipy.interpolate import CubicSpline
 
 from sisl._help import _range as range
 import sisl._array as _a
-from .distribution import get_distribution
 from .electron import EigenvalueElectron, EigenstateElectron, spin_squared
+from .electron import fermi_level as electron_fermi_level
 from .sparse import SparseOrbitalBZSpin
 
 __all__ = ['Hamiltonian']
@@ -261,6 +260,7 @@ class Hamiltonian(SparseOrbitalBZSpin):
             # should be shifted.
             for i in range(min(self.spin.spins, 2)):
                 self._csr._D[:, i] += self._csr._D[:, self.S_idx] * E[i]
+            self._csr._modified()
 
     def eigenvalue(self, k=(0, 0, 0), gauge='R', **kwargs):
         """ Calculate the eigenvalues at `k` and return an `EigenvalueElectron` object containing all eigenvalues for a given `k`
@@ -456,8 +456,10 @@ class Hamiltonian(SparseOrbitalBZSpin):
     def fermi_level(self, bz=None, q=None, distribution='fermi_dirac', q_tol=1e-12):
         """ Calculate the Fermi-level using a Brillouinzone sampling and a target charge
 
-        The Fermi-level will be calculated using an iterative approach by first calculating all eigenvalues
-        and subsequently fitting the Fermi level to the final charge (`q`).
+        The eigenvalues are calculated once (per spin-channel) and the Fermi-level is found
+        with a bracketed root search, see `~sisl.physics.electron.fermi_level`.
+        To scan many charges or distributions (temperatures) calculate the eigenvalues
+        once, e.g. ``bz.asarray().eigh()`` and use `~sisl.physics.electron.fermi_level` directly.
 
         Parameters
         ----------
@@ -471,7 +473,12 @@ class Hamiltonian(SparseOrbitalBZSpin):
         distribution : str, func, optional
             used distribution, must accept the keyword ``mu`` as parameter for the Fermi-level
         q_tol : float, optional
-            tolerance of charge for finding the Fermi-level
+            tolerance of the charge, the Fermi-level is converged until the charge is
+            within `q_tol` of `q` (or to machine precision)
+
+        See Also
+        --------
+        ~sisl.physics.electron.fermi_level : the underlying routine for precomputed eigenvalues
 
         Returns
         -------
@@ -492,64 +499,16 @@ class Hamiltonian(SparseOrbitalBZSpin):
         # Ensure we have an "array" in case of spin-polarized calculations
         q = np.asarray(q)
 
-        if isinstance(distribution, str):
-            distribution = get_distribution(distribution)
-
-        # B-cast for easier weights
-        w = bz.weight.reshape(-1, 1)
-
-        # Internal class to calculate the Fermi-level
-        def _Ef(q, eig):
-            # We could reduce it depending on the temperature,
-            # however the distribution does not have the kT
-            # parameter available.
-            Ef = np.average(eig[:, int(q)])
-
-            l_Ef = []
-            l_q = []
-            def list_append(q, Ef):
-                l_q.append(q)
-                l_Ef.append(Ef)
-
-            # Calculate guessed charge
-            qt = (distribution(eig, mu=Ef) * w).sum()
-
-            while abs(qt - q) > q_tol:
-                # Add to cubic-spline
-                list_append(qt, Ef)
-
-                # Estimate new Fermi-level
-                if len(l_q) > 1:
-                    # We can do a spline interpolation
-                    lq = np.array(l_q)
-                    idx = np.argsort(lq)
-                    lEf = np.array(l_Ef)
-                    Ef = CubicSpline(lq[idx], lEf[idx], extrapolate=True)(q)
-                else:
-                    # Update limits
-                    if qt > q:
-                        Ef = Ef - 0.5
-                    elif qt < q:
-                        Ef = Ef + 0.5
-
-                # Calculate new guessed charge
-                qt = (distribution(eig, mu=Ef) * w).sum()
-
-            return Ef
-
-        if self.spin.is_polarized and q.size == 2:
-            # We need to do Fermi-level separately since the user requests
-            # separate fillings
-            Ef = _a.emptyd(2)
-            Ef[0] = _Ef(q[0], bz.eigh(spin=0))
-            Ef[1] = _Ef(q[1], bz.eigh(spin=1))
-        else:
-            # Ensure a single charge
-            q = q.sum()
-            if self.spin.is_polarized:
-                Ef = _Ef(q, np.concatenate([bz.eigh(spin=0),
-                                            bz.eigh(spin=1)], axis=1))
-            else:
-                Ef = _Ef(q, bz.eigh())
-
-        return Ef
+        w = bz.weight
+        if self.spin.is_polarized:
+            eig = np.stack((bz.eigh(spin=0), bz.eigh(spin=1)))
+            if q.size == 2:
+                # We need to do Fermi-level separately since the user requests
+                # separate fillings
+                Ef = _a.emptyd(2)
+                Ef[0] = electron_fermi_level(eig[0], q[0], w, distribution, q_tol)
+                Ef[1] = electron_fermi_level(eig[1], q[1], w, distribution, q_tol)
+                return Ef
+            # Both spin-channels are solved together
+            return electron_fermi_level(eig, q.sum(), w, distribution, q_tol)
+        return electron_fermi_level(bz.eigh(), q.sum(), w, distribution, q_tol)
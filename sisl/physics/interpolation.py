@@ -0,0 +1,229 @@
+r"""Band interpolation
+==================
+
+.. module:: sisl.physics.interpolation
+   :noindex:
+
+Fourier interpolation of band energies calculated on a coarse `MonkhorstPack` grid.
+The eigenvalues of each band are expanded in a Fourier series on the lattice vectors
+conjugate to the k-point grid
+
+.. math::
+
+   \epsilon_n(\mathbf k) = \sum_{\mathbf R} c_{n\mathbf R} e^{i\mathbf k\cdot\mathbf R}
+
+which is subsequently evaluated at arbitrary k-points (band structure paths, fine meshes)
+without any diagonalizations. Band velocities are the analytic derivatives of the series.
+
+Bands that cross are only smooth if the band indices are tracked through the
+eigenvector overlaps of neighbouring k-points (``track=True``), otherwise the sorted
+eigenvalues are interpolated.
+
+>>> H = Hamiltonian(...)
+>>> bi = BandInterpolation(MonkhorstPack(H, [12, 12, 12], trs=False), track=True)
+>>> bs = BandStructure(H, [[0] * 3, [0.5, 0, 0]], 2000)
+>>> eig = bi.eigh(bs)
+
+.. autosummary::
+   :toctree:
+
+   BandInterpolation
+
+"""
+from __future__ import print_function, division
+
+import numpy as np
+from numpy import dot, conj
+from scipy.optimize import linear_sum_assignment
+
+import sisl._array as _a
+from sisl._help import _CHUNK_SIZE
+from sisl.messages import SislError
+from sisl import constant
+from .brillouinzone import BrillouinZone, _mp_grid_map
+
+
+__all__ = ['BandInterpolation']
+
+
+# dE/dk is in [Ang eV], velocities are in [Ang/ps]
+_velocity_const = 1 / constant.hbar('eV ps')
+
+
+def _snake(n):
+    """ Grid indices traversing all points with nearest neighbour steps """
+    idx = []
+    for a in range(n[2]):
+        for b_ in range(n[1]):
+            b = b_ if a % 2 == 0 else n[1] - 1 - b_
+            if (a * n[1] + b_) % 2 == 0:
+                line = range(n[0])
+            else:
+                line = range(n[0] - 1, -1, -1)
+            for c in line:
+                idx.append((c, b, a))
+    return np.ravel_multi_index(_a.arrayi(idx).T, n)
+
+
+def _group_overlap(O, deg_row, deg_col):
+    """ Sum overlaps within degenerate groups (which are equivalent) """
+    for deg in deg_row:
+        O[deg, :] = O[deg, :].sum(0).reshape(1, -1)
+    for deg in deg_col:
+        O[:, deg] = O[:, deg].sum(1).reshape(-1, 1)
+    return O
+
+
+class BandInterpolation(object):
+    r""" Fourier interpolation of the eigenvalues calculated on a `MonkhorstPack` grid
+
+    The eigenvalues are calculated on the k-points of `mp` and unfolded to the full grid.
+    The Fourier coefficients are calculated by an FFT of the band energies, for even
+    grid divisions the Nyquist components are split equally between :math:`\pm N/2`.
+
+    If the band energies are contained in the Fourier series (e.g. a tight-binding model
+    with interactions within half the grid size) the interpolation is exact.
+
+    Parameters
+    ----------
+    mp : MonkhorstPack
+       the coarse k-point grid, it must span the entire Brillouin zone.
+    track : bool, optional
+       track the bands through the eigenvector overlaps of neighbouring k-points,
+       the states at consecutive grid points are matched with the largest overlap
+       (degenerate states are treated as one group). Requires the full grid (``trs=False``).
+       Otherwise the sorted eigenvalues are interpolated.
+    eps : float, optional
+       precision used to find degenerate states when tracking bands
+    **kwargs : dict, optional
+       passed to the ``eigh``/``eigenstate`` methods of the parent (e.g. ``spin``)
+
+    Examples
+    --------
+    >>> bi = BandInterpolation(MonkhorstPack(H, [10, 10, 10]))
+    >>> eig = bi.eigh([[0, 0, 0], [0.1, 0.2, 0.3]])
+    >>> v = bi.velocity(MonkhorstPack(H, [100, 100, 100], trs=False))
+    """
+
+    def __init__(self, mp, track=False, eps=1e-4, **kwargs):
+        k0, full = _mp_grid_map(mp, self.__class__.__name__)
+        self.parent = mp.parent
+        n = mp._diag.copy()
+
+        if track:
+            if len(mp) != len(full):
+                raise SislError(self.__class__.__name__ + ' requires the full k-point grid to track bands '
+                                '(use trs=False and symmetry=False).')
+            eig = self._track(n, mp.k[full], eps, kwargs)
+        else:
+            eig = mp.asarray().eigh(**kwargs)[full]
+
+        self._fourier(n, k0, eig)
+
+    def _track(self, n, k, eps, kwargs):
+        """ Calculate eigenvalues on the full grid `k` with the bands tracked through overlaps """
+        parent = self.parent
+        eig = None
+        prev = None
+        deg_prev = None
+        for ik in _snake(n):
+            es = parent.eigenstate(k[ik], **kwargs)
+            state = es.state
+            if parent.orthogonal:
+                Sv = state.T
+            else:
+                Sv = parent.Sk(k=k[ik], format='array').dot(state.T)
+            if eig is None:
+                eig = _a.emptyd([len(k), len(es)])
+            else:
+                O = np.absolute(dot(conj(prev), Sv)) ** 2
+                O = _group_overlap(O, deg_prev, es.degenerate(eps))
+                # prev band i is matched with state col[i]
+                col = linear_sum_assignment(-O)[1]
+                es = es.sub(col)
+                state = es.state
+            eig[ik, :] = es.eig
+            prev = state
+            deg_prev = es.degenerate(eps)
+        return eig
+
+    def _fourier(self, n, k0, eig):
+        """ Calculate the Fourier coefficients of the band energies on the grid """
+        nb = eig.shape[1]
+        F = np.fft.fftn(eig.reshape(n[0], n[1], n[2], nb), axes=(0, 1, 2)) / n.prod()
+
+        # Lattice vectors (in units of the lattice vectors) and their weights
+        R = []
+        w = []
+        for N in n:
+            r = _a.arangei(-(N // 2), N // 2 + 1)
+            ww = _a.onesd(len(r))
+            if N % 2 == 0:
+                ww[0] = ww[-1] = 0.5
+            R.append(r)
+            w.append(ww)
+        R = np.array(np.meshgrid(*R, indexing='ij')).reshape(3, -1).T
+        w = np.prod(np.meshgrid(*w, indexing='ij'), axis=0).ravel()
+        idx = R % n.reshape(1, 3)
+        # account for the grid displacement: k = k0 + j / n
+        phase = w * np.exp(-2j * np.pi * dot(R, k0))
+        self._R = R
+        self._c = F[idx[:, 0], idx[:, 1], idx[:, 2], :] * phase.reshape(-1, 1)
+
+    def __len__(self):
+        """ Number of bands """
+        return self._c.shape[1]
+
+    def _k(self, k):
+        if isinstance(k, BrillouinZone):
+            k = k.k
+        return _a.asarrayd(k).reshape(-1, 3)
+
+    def _chunks(self, k):
+        """ Yield slices and phase factors of the k-points in chunks """
+        nk = max(1, _CHUNK_SIZE // len(self._R))
+        for i in range(0, len(k), nk):
+            sl = slice(i, min(i + nk, len(k)))
+            yield sl, np.exp(2j * np.pi * dot(k[sl], self._R.T))
+
+    def eigh(self, k):
+        """ Interpolated eigenvalues at the k-points
+
+        Parameters
+        ----------
+        k : array_like or BrillouinZone
+           k-points in reduced coordinates, or a `BrillouinZone` object
+
+        Returns
+        -------
+        numpy.ndarray
+            eigenvalues with shape ``(len(k), len(self))``, for tracked bands the
+            eigenvalues are ordered by band and *not* sorted
+        """
+        k = self._k(k)
+        eig = _a.emptyd([len(k), len(self)])
+        for sl, p in self._chunks(k):
+            eig[sl] = dot(p, self._c).real
+        return eig
+
+    def velocity(self, k):
+        """ Interpolated band velocities at the k-points
+
+        Parameters
+        ----------
+        k : array_like or BrillouinZone
+           k-points in reduced coordinates, or a `BrillouinZone` object
+
+        Returns
+        -------
+        numpy.ndarray
+            velocities with shape ``(len(k), len(self), 3)``, the velocity unit is Ang/ps.
+        """
+        k = self._k(k)
+        # Cartesian lattice vectors
+        Rc = dot(self._R, self.parent.cell)
+        v = _a.emptyd([len(k), len(self), 3])
+        for sl, p in self._chunks(k):
+            for i in (0, 1, 2):
+                v[sl, :, i] = - dot(p, self._c * Rc[:, i].reshape(-1, 1)).imag
+        return v * _velocity_const
@@ -1,13 +1,16 @@
 from __future__ import print_function, division
 
 import warnings
+from collections import OrderedDict
 
 import numpy as np
 from scipy.sparse import csr_matrix, SparseEfficiencyWarning
 
 import sisl.linalg as lin
-from sisl._help import _range as range
+import sisl._array as _a
+from sisl._help import _range as range, _CHUNK_SIZE
 from sisl.sparse import isspmatrix
+from sisl.utils.ranges import array_arange
 from sisl.sparse_geometry import SparseOrbital
 from .spin import Spin
 from ._matrix_k import matrix_k, matrix_k_nc, matrix_k_so, matrix_k_nc_diag
@@ -22,6 +25,65 @@ __all__ = ['SparseOrbitalBZ', 'SparseOrbitalBZSpin']
 warnings.filterwarnings("ignore", category=SparseEfficiencyWarning)
 
 
+class _EighCache(object):
+    """ Least-recently-used cache of eigen-solutions with a memory limit
+
+    The cache is tied to a version of the matrix data, once the version
+    changes all cached solutions are discarded.
+    """
+    __slots__ = ('max_bytes', 'nbytes', 'version', 'data')
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.clear()
+
+    def clear(self):
+        self.nbytes = 0
+        self.version = None
+        self.data = OrderedDict()
+
+    def __len__(self):
+        return len(self.data)
+
+    def __call__(self, version, key, eigvals_only, func):
+        """ Return the (cached) solution of ``func(eigvals_only)`` """
+        if version != self.version:
+            self.clear()
+            self.version = version
+
+        value = self.data.pop(key, None)
+        if value is not None and (eigvals_only or isinstance(value, tuple)):
+            # Re-insert as the most recently used
+            self.data[key] = value
+            if eigvals_only:
+                if isinstance(value, tuple):
+                    return value[0].copy()
+                return value.copy()
+            return value[0].copy(), value[1].copy()
+
+        if value is not None:
+            self.nbytes -= value.nbytes
+        ret = func(eigvals_only)
+        if eigvals_only:
+            value = ret.copy()
+            nbytes = value.nbytes
+        else:
+            value = (ret[0].copy(), ret[1].copy())
+            nbytes = value[0].nbytes + value[1].nbytes
+
+        # Remove least recently used solutions
+        while len(self.data) > 0 and self.nbytes + nbytes > self.max_bytes:
+            _, old = self.data.popitem(last=False)
+            if isinstance(old, tuple):
+                self.nbytes -= old[0].nbytes + old[1].nbytes
+            else:
+                self.nbytes -= old.nbytes
+        if nbytes <= self.max_bytes:
+            self.data[key] = value
+            self.nbytes += nbytes
+        return ret
+
+
 class SparseOrbitalBZ(SparseOrbital):
     """ Sparse object containing the orbital connections in a Brillouin zone
 
@@ -67,6 +129,11 @@ class SparseOrbitalBZ(SparseOrbital):
         self.reset(dim, dtype, nnzpr)
         self._reset()
 
+    # Cache of eigen-solutions (disabled by default)
+    _eigh_cache = None
+    # Cache of the folded sparsity pattern for k-derivatives
+    _dk_cache = None
+
     def _reset(self):
         """ Reset object according to the options, please refer to `SparseOrbital.reset` for details """
         if self.orthogonal:
@@ -451,6 +518,138 @@ class SparseOrbitalBZ(SparseOrbital):
         """
         return self._ddPk(k, dtype=dtype, gauge=gauge, format=format, _dim=self.S_idx)
 
+    def _dk_pattern(self, gauge='R'):
+        """ Folded sparsity pattern used to construct the k-derivatives for many k-points
+
+        The pattern is cached until the sparse matrix changes. Note that for the ``'r'`` gauge
+        changes of the atomic coordinates are *not* tracked.
+
+        Parameters
+        ----------
+        gauge : {'R', 'r'}
+           chosen gauge
+
+        Returns
+        -------
+        ptr : numpy.ndarray
+            row pointers of the folded (unit-cell) sparsity pattern
+        col : numpy.ndarray
+            column indices of the folded sparsity pattern
+        fold : scipy.sparse.csr_matrix
+            sums the elements of the supercell matrix into the folded elements
+        idx : numpy.ndarray
+            indices of the non-zero elements in the sparse data
+        R : numpy.ndarray
+            vector associated with each element (lattice vector for gauge ``'R'``, orbital distance
+            for gauge ``'r'``)
+        """
+        cache = self._dk_cache
+        version = self._csr._version
+        if cache is not None and cache[0] == version and cache[1] == gauge:
+            return cache[2]
+
+        csr = self._csr
+        no = self.no
+        idx = array_arange(csr.ptr[:-1], n=csr.ncol)
+        row = np.repeat(_a.arangei(no), csr.ncol)
+        col = csr.col[idx]
+        nnz = len(idx)
+
+        # Fold the supercell columns into the unit-cell
+        uniq, ifold = np.unique(row.astype(np.int64) * no + col % no, return_inverse=True)
+        v_ptr = _a.zerosi(no + 1)
+        v_ptr[1:] = np.cumsum(np.bincount(uniq // no, minlength=no))
+        v_col = (uniq % no).astype(np.int32)
+        fold = csr_matrix((_a.onesd(nnz), (ifold, _a.arangei(nnz))), shape=(len(uniq), nnz))
+
+        g = self.geometry
+        if gauge == 'R':
+            R = np.dot(g.sc.sc_off, g.cell)[col // no]
+        elif gauge == 'r':
+            R = g.axyz(g.o2a(col)) - g.axyz(g.o2a(row))
+        else:
+            raise ValueError(self.__class__.__name__ + '._dk_pattern requires gauge to be one of [R, r]')
+
+        pattern = (v_ptr, v_col, fold, idx, R)
+        self._dk_cache = (version, gauge, pattern)
+        return pattern
+
+    def _dPk_batch(self, k, gauge='R', _dim=0):
+        """ Tuples of sparse matrices differentiated with respect to `k` for many k-points
+
+        The folded sparsity pattern is cached (see `_dk_pattern`) and the matrix elements for a batch of
+        k-points (and all 3 directions) are folded with a single sparse-dense product.
+
+        Parameters
+        ----------
+        k : array_like
+           k-points, shape ``(nk, 3)``
+        gauge : {'R', 'r'}
+           chosen gauge
+
+        Yields
+        ------
+        tuple of scipy.sparse.csr_matrix
+            the matrix differentiated along the 3 Cartesian directions for each k-point
+        """
+        ptr, col, fold, idx, R = self._dk_pattern(gauge)
+        D = self._csr._D[idx, _dim]
+        k = np.asarray(k, np.float64).reshape(-1, 3)
+        kc = np.dot(k, self.geometry.rcell)
+        no = self.no
+        nnz = len(idx)
+        nk = max(1, _CHUNK_SIZE // max(1, 3 * nnz))
+        for i in range(0, len(k), nk):
+            # -i R exp(-i k.R) for all elements and k-points
+            X = np.exp(-1j * np.dot(R, kc[i:i+nk].T)) * D.reshape(-1, 1)
+            X = (-1j * X.reshape(nnz, -1, 1) * R.reshape(nnz, 1, 3)).reshape(nnz, -1)
+            V = fold.dot(X).reshape(fold.shape[0], -1, 3)
+            for j in range(V.shape[1]):
+                yield tuple(csr_matrix((V[:, j, d].copy(), col, ptr), shape=(no, no)) for d in (0, 1, 2))
+
+    def set_eigh_cache(self, memory=256):
+        """ Enable (or disable) caching of the solutions from `eigh`
+
+        The eigenvalues (and eigenvectors) are stored per ``(k, gauge, spin, dtype)`` such that
+        subsequent analysis at the same k-points (e.g. `fermi_level` followed by ``bz.asaverage().DOS``)
+        does not re-diagonalize the matrix. The least recently used solutions are
+        discarded when the memory limit is reached.
+
+        The cache is automatically invalidated when the matrix elements are changed (through
+        the sparse matrix methods). Note that changes of the geometry (e.g. the atomic coordinates
+        in the ``'r'`` gauge) are *not* tracked.
+
+        Calls to `eigh` with additional keyword arguments (passed to the solver) are not cached.
+
+        Parameters
+        ----------
+        memory : float, optional
+           maximum memory (in MB) of the cached solutions, a value of 0 (or None) disables the cache
+
+        Examples
+        --------
+        >>> H.set_eigh_cache(512)
+        >>> bz = MonkhorstPack(H, [10, 10, 10])
+        >>> Ef = H.fermi_level(bz)
+        >>> DOS = bz.asaverage().DOS(E) # re-uses the eigenvalues
+        """
+        if memory is None or memory <= 0:
+            self._eigh_cache = None
+        else:
+            self._eigh_cache = _EighCache(int(memory * 1024 ** 2))
+
+    def _eigh(self, k, gauge, eigvals_only, spin, dtype, kwargs, func):
+        """ Call ``func(eigvals_only)`` through the eigen-solution cache (if enabled) """
+        cache = self._eigh_cache
+        if cache is None or len(kwargs) > 0:
+            return func(eigvals_only)
+        if dtype is not None:
+            dtype = np.dtype(dtype).str
+        key = (tuple(np.asarray(k, np.float64).ravel()), gauge, spin, dtype)
+        # Setting up the matrices finalizes the sparse matrix (which changes the version)
+        self._csr.finalize()
+        return cache(self._csr._version, key, eigvals_only, func)
+
     def eig(self, k=(0, 0, 0), gauge='R', eigvals_only=True, **kwargs):
         """ Returns the eigenvalues of the physical quantity (using the non-Hermitian solver)
 
@@ -478,14 +677,22 @@ class SparseOrbitalBZ(SparseOrbital):
         the given k-point and calculate the eigenvalues.
 
         All subsequent arguments gets passed directly to :code:`scipy.linalg.eigh`
+
+        See Also
+        --------
+        set_eigh_cache : enable caching of the solutions
         """
         dtype = kwargs.pop('dtype', None)
-        P = self.Pk(k=k, dtype=dtype, gauge=gauge, format='array')
-        if self.orthogonal:
-            return lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs)
 
-        S = self.Sk(k=k, dtype=dtype, gauge=gauge, format='array')
-        return lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs)
+        def func(eigvals_only):
+            P = self.Pk(k=k, dtype=dtype, gauge=gauge, format='array')
+            if self.orthogonal:
+                return lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs)
+
+            S = self.Sk(k=k, dtype=dtype, gauge=gauge, format='array')
+            return lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs)
+
+        return self._eigh(k, gauge, eigvals_only, 0, dtype, kwargs, func)
 
     def eigsh(self, k=(0, 0, 0), n=10, gauge='R', eigvals_only=True, **kwargs):
         """ Calculates a subset of eigenvalues of the physical quantity  (default 10)
@@ -817,20 +1024,29 @@ class SparseOrbitalBZSpin(SparseOrbitalBZ):
         spin : int, optional
            the spin-component to calculate the eigenvalue spectrum of, note that
            this parameter is only valid for `Spin.POLARIZED` matrices.
+
+        See Also
+        --------
+        set_eigh_cache : enable caching of the solutions
         """
         spin = kwargs.pop('spin', 0)
         dtype = kwargs.pop('dtype', None)
+        if self.spin.kind != Spin.POLARIZED:
+            spin = 0
 
-        if self.spin.kind == Spin.POLARIZED:
-            P = self.Pk(k=k, dtype=dtype, gauge=gauge, spin=spin, format='array')
-        else:
-            P = self.Pk(k=k, dtype=dtype, gauge=gauge, format='array')
+        def func(eigvals_only):
+            if self.spin.kind == Spin.POLARIZED:
+                P = self.Pk(k=k, dtype=dtype, gauge=gauge, spin=spin, format='array')
+            else:
+                P = self.Pk(k=k, dtype=dtype, gauge=gauge, format='array')
 
-        if self.orthogonal:
-            return lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs)
+            if self.orthogonal:
+                return lin.eigh_destroy(P, eigvals_only=eigvals_only, **kwargs)
 
-        S = self.Sk(k=k, dtype=dtype, gauge=gauge, format='array')
-        return lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs)
+            S = self.Sk(k=k, dtype=dtype, gauge=gauge, format='array')
+            return lin.eigh_destroy(P, S, eigvals_only=eigvals_only, **kwargs)
+
+        return self._eigh(k, gauge, eigvals_only, spin, dtype, kwargs, func)
 
     def eigsh(self, k=(0, 0, 0), n=10, gauge='R', eigvals_only=True, **kwargs):
         """ Calculates a subset of eigenvalues of the physical quantity  (default 10)
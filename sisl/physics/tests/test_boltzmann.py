@@ -0,0 +1,124 @@
+from __future__ import print_function, division
+
+import pytest
+import numpy as np
+
+from sisl import Geometry, Atom, SuperCell, Hamiltonian, BrillouinZone, MonkhorstPack
+from sisl import SislError, Boltzmann
+from sisl import constant, units
+
+pytestmark = pytest.mark.boltzmann
+
+
+def get_H():
+    g = Geometry([[0] * 3], Atom(1, R=1.01), sc=SuperCell(1, nsc=[3, 3, 3]))
+    H = Hamiltonian(g)
+    H.construct([(0.1, 1.01), (0., -1.)])
+    return H
+
+
+def test_boltzmann_dos_tdf():
+    H = get_H()
+    E = np.linspace(-7, 7, 141)
+    bt = Boltzmann(H, E).add(MonkhorstPack(H, [6, 6, 6]))
+    assert bt.weight == pytest.approx(1.)
+    # spin-degeneracy
+    assert bt.DOS.sum() * (E[1] - E[0]) == pytest.approx(2.)
+    tdf = bt.tdf
+    assert tdf.shape == (len(E), 3, 3)
+    assert np.allclose(tdf, np.transpose(tdf, (0, 2, 1)))
+    assert np.all(tdf[:, 0, 0] >= 0.)
+
+
+def test_boltzmann_cubic():
+    H = get_H()
+    bt = Boltzmann(H, np.linspace(-7, 7, 281)).add(MonkhorstPack(H, [8, 8, 8]))
+    mu = np.linspace(-1, 1, 5)
+    sigma = bt.conductivity(mu, kT=0.1)
+    assert sigma.shape == (5, 3, 3)
+    for s in sigma:
+        assert np.allclose(s, np.diag(np.diag(s)), atol=1e-8 * s.max())
+        assert s[0, 0] > 0.
+        assert s[0, 0] == pytest.approx(s[1, 1])
+        assert s[0, 0] == pytest.approx(s[2, 2])
+    # particle-hole symmetric band
+    S = bt.seebeck(mu, kT=0.1)
+    assert np.allclose(S[:, 0, 0], -S[::-1, 0, 0])
+    kappa = bt.thermal_conductivity(0., kT=0.1)
+    assert kappa.shape == (3, 3)
+    assert kappa[0, 0] > 0.
+    # linear in the relaxation time
+    assert np.allclose(bt.conductivity(0.5, tau=2e-14), 2 * bt.conductivity(0.5, tau=1e-14))
+
+
+def test_boltzmann_chain():
+    # Analytic TDF of a chain: 4 a^2 / (pi hbar^2) sqrt(1 - E^2 / 4)
+    g = Geometry([[0] * 3], Atom(1, R=1.01), sc=SuperCell([1, 10, 10], nsc=[3, 1, 1]))
+    H = Hamiltonian(g)
+    H.construct([(0.1, 1.01), (0., -1.)])
+    dE = 0.05
+    E = np.arange(-3, 3 + dE / 2, dE)
+    bt = Boltzmann(H, E).add(MonkhorstPack(H, [2000, 1, 1]))
+    c = 4 / (np.pi * constant.hbar('eV ps') ** 2)
+
+    def F(x):
+        # integral of the analytic TDF from the band bottom
+        x = np.clip(x, -2, 2)
+        return c * (x / 2 * np.sqrt(1 - x ** 2 / 4) + np.arcsin(x / 2) + np.pi / 2)
+
+    tdf = bt.tdf
+    assert np.allclose(tdf[:, 1:, :], 0.)
+    assert np.allclose(tdf[:, 0, 1:], 0.)
+    # the histogram is compared through its integral
+    assert np.allclose(np.cumsum(tdf[:, 0, 0]) * dE, F(E + dE / 2), atol=2e-3 * F(2.))
+
+    # conductivity compared to the analytic TDF moment
+    kT = 0.1
+    mu = np.linspace(-1, 1, 5)
+    x = np.linspace(-2, 2, 20001)
+    dfd = np.exp(-np.abs(x.reshape(1, -1) - mu.reshape(-1, 1)) / kT)
+    dfd = dfd / (kT * (1 + dfd) ** 2)
+    L0 = np.trapz(dfd * c * np.sqrt(1 - x ** 2 / 4), x)
+    sigma = bt.conductivity(mu, kT=kT, tau=1e-14)
+    assert np.allclose(sigma[:, 0, 0], L0 * 1e-14 * 1e4 / (H.geometry.volume * 1e-30) * units('eV', 'J'), rtol=2e-2)
+    # electron-like carriers in the lower half of the band
+    S = bt.seebeck(mu, kT=kT)[:, 0, 0]
+    assert np.allclose(S, -S[::-1])
+    assert np.all(S[:2] < 0.)
+
+
+def test_boltzmann_merge():
+    H = get_H()
+    E = np.linspace(-7, 7, 141)
+    mp = MonkhorstPack(H, [4, 4, 4])
+    bt = Boltzmann(H, E).add(mp)
+    bt1 = Boltzmann(H, E).add(BrillouinZone(H, mp.k[::2], mp.weight[::2]))
+    bt2 = Boltzmann(H, E).add(BrillouinZone(H, mp.k[1::2], mp.weight[1::2]))
+    assert np.allclose(bt.tdf, (bt1 + bt2).tdf)
+    bt1 += bt2
+    assert np.allclose(bt.conductivity(0.2), bt1.conductivity(0.2))
+
+
+def test_boltzmann_processes():
+    H = get_H()
+    E = np.linspace(-7, 7, 141)
+    mp = MonkhorstPack(H, [4, 4, 4])
+    bt = Boltzmann(H, E).add(mp)
+    btp = Boltzmann(H, E).add(mp, processes=2)
+    assert np.allclose(bt.tdf, btp.tdf)
+    assert np.allclose(bt.DOS, btp.DOS)
+
+
+def test_boltzmann_fail():
+    H = get_H()
+    with pytest.raises(ValueError):
+        Boltzmann(H, [0.])
+    with pytest.raises(ValueError):
+        Boltzmann(H, [0., 1., 3.])
+    bt = Boltzmann(H, np.linspace(-1, 1, 11))
+    with pytest.raises(SislError):
+        bt.tdf
+    with pytest.raises(ValueError):
+        bt.add(H)
+    with pytest.raises(ValueError):
+        bt += Boltzmann(H, np.linspace(-1, 1, 21))
@@ -213,6 +213,38 @@ class TestBrillouinZone(object):
             else:
                 assert ((k == 0.).sum(1).astype(np.int32) == 3).sum() == 0
 
+    def test_mp_symmetry(self, setup):
+        bz = MonkhorstPack(setup.s1, [6, 6, 1], symmetry=True)
+        bz_full = MonkhorstPack(setup.s1, [6, 6, 1], trs=False)
+        # square lattice, irreducible wedge
+        assert len(bz) == 10
+        assert bz.weight.sum() == pytest.approx(1.)
+        assert bz.unfold(bz.k).shape == bz_full.k.shape
+        assert len(bz.copy()) == len(bz)
+
+    def test_mp_symmetry_fail(self, setup):
+        with pytest.raises(SislError):
+            MonkhorstPack(setup.s1, [6, 6, 1], size=0.5, symmetry=True)
+
+    @pytest.mark.parametrize("trs", [True, False])
+    def test_mp_refine(self, setup, trs):
+        def func(k):
+            return np.exp(-(k[0] ** 2 + k[1] ** 2) / 0.001)
+        bz = MonkhorstPack(setup.s1, [5, 5, 1], trs=trs)
+        v, err = bz.refine(func, tol=1e-6, max_nk=5000)
+        assert len(bz) <= 5000
+        assert len(bz) > 25
+        assert bz.weight.sum() == pytest.approx(1.)
+        assert v == pytest.approx(m.pi * 0.001, rel=1e-2)
+        assert v == pytest.approx((bz.weight * np.array([func(k) for k in bz.k])).sum())
+
+    def test_mp_refine_budget(self, setup):
+        bz = MonkhorstPack(setup.s1, [5, 5, 1], trs=False)
+        v, err = bz.refine(lambda k: [np.exp(-(k ** 2).sum() / 0.001)] * 2, max_nk=100)
+        assert v.shape == (2,)
+        assert len(bz) <= 100
+        assert err > 0.
+
     def test_pbz1(self, setup):
         bz = BandStructure(setup.s1, [[0]*3, [.5]*3], 300)
         assert len(bz) == 300
@@ -9,7 +9,8 @@ from sisl import Geometry, Atom, SuperCell, Hamiltonian, Spin, BandStructure, Mo
 from sisl import get_distribution
 from sisl import oplist
 from sisl import Grid, SphericalOrbital, SislError
-from sisl.physics.electron import berry_phase, spin_squared
+from sisl.physics.electron import berry_phase, wilson_loop, spin_squared
+from sisl.physics.electron import velocity_batch, velocity_matrix_batch
 
 
 pytestmark = pytest.mark.hamiltonian
@@ -625,6 +626,43 @@ class TestHamiltonian(object):
         # Just to do the other branch
         berry_phase(bz, method='zak')
 
+    def test_wilson_loop(self, setup):
+        R, param = [0.1, 1.5], [1., 0.1]
+        g = setup.g.tile(2, 0).tile(2, 1).tile(2, 2)
+        H = Hamiltonian(g)
+        H.construct((R, param))
+        bz = BandStructure.param_circle(H, 20, 0.01, [0, 0, 1], [1/3] * 3)
+        w = wilson_loop(H, bz.k)
+        assert w.shape == (1, H.no)
+        # the product over all bands is the identity
+        assert np.allclose(w, 0.)
+        assert np.allclose(wilson_loop(H, bz.k, sub=0)[0], berry_phase(bz, eigvals=True, sub=0))
+        assert np.allclose(wilson_loop(H, bz.k, sub=[0, 1])[0], berry_phase(bz, eigvals=True, sub=[0, 1]))
+        # A family of loops
+        bz2 = BandStructure.param_circle(H, 20, 0.02, [0, 0, 1], [1/3] * 3)
+        w = wilson_loop(H, [bz.k, bz2.k], sub=0)
+        assert w.shape == (2, 1)
+        assert np.allclose(w[1], berry_phase(bz2, eigvals=True, sub=0))
+
+    def test_wilson_loop_zak(self):
+        # SSH model, topological cell
+        g = Geometry([[-.6, 0, 0], [0.6, 0, 0]], Atom(1, 1.001), sc=[2, 10, 10])
+        g.set_nsc([3, 1, 1])
+        H = Hamiltonian(g)
+        H.construct([(0.1, 1.0, 1.5), (0, 1., 0.5)])
+        k = np.zeros([2, 51, 3])
+        k[:, :, 0] = np.linspace(0.0, 1.0, 51).reshape(1, -1)
+        k[1, :, 1] = 0.25
+        w = wilson_loop(H, k, sub=0)
+        assert np.allclose(np.abs(w), np.pi)
+        # the end-point is not needed
+        assert np.allclose(np.abs(wilson_loop(H, k[:, :-1], sub=0)), np.pi)
+        assert np.allclose(wilson_loop(H, k, sub=0, processes=2), w)
+
+    @pytest.mark.xfail(raises=SislError)
+    def test_wilson_loop_fail(self, setup):
+        wilson_loop(setup.g, [[0] * 3, [0.1, 0, 0]])
+
     @pytest.mark.xfail(raises=SislError)
     def test_berry_phase_method_fail(self):
         g = Geometry([[-.6, 0, 0], [0.6, 0, 0]], Atom(1, 1.001), sc=[2, 10, 10])
@@ -725,6 +763,52 @@ class TestHamiltonian(object):
             vsub = es.sub([0, 1]).velocity_matrix()
             assert np.allclose(v[:2, :2, :], vsub)
 
+    @pytest.mark.parametrize("gauge", ['R', 'r'])
+    def test_dPk_batch(self, setup, gauge):
+        HS = setup.HS.copy()
+        HS.construct([(0.1, 1.5), ((1., 1.), (0.1, 0.1))])
+        k = np.random.rand(5, 3)
+        for kk, dHk, dSk in zip(k, HS._dPk_batch(k, gauge), HS._dPk_batch(k, gauge, _dim=HS.S_idx)):
+            for d, D in zip(dHk, HS.dHk(kk, gauge=gauge)):
+                assert np.allclose(d.toarray(), D.toarray())
+            for d, D in zip(dSk, HS.dSk(kk, gauge=gauge)):
+                assert np.allclose(d.toarray(), D.toarray())
+        # the pattern is cached until the matrix changes
+        pattern = HS._dk_pattern(gauge)
+        assert HS._dk_pattern(gauge) is pattern
+        HS[0, 0] = 0.5
+        assert HS._dk_pattern(gauge) is not pattern
+
+    @pytest.mark.parametrize("orthogonal", [True, False])
+    def test_velocity_batch(self, setup, orthogonal):
+        if orthogonal:
+            H = setup.H.copy()
+            H.construct([(0.1, 1.5), ((1., 1.))])
+        else:
+            H = setup.HS.copy()
+            H.construct([(0.1, 1.5), ((1., 1.), (0.1, 0.1))])
+        bz = MonkhorstPack(H, [4, 4, 1])
+        v = velocity_batch(bz.asyield().eigenstate(), batch=3)
+        assert v.shape == (len(bz), H.no, 3)
+        assert np.allclose(v, [H.eigenstate(k).velocity() for k in bz.k])
+        vm = velocity_matrix_batch(bz.asyield().eigenstate(), batch=3)
+        assert vm.shape == (len(bz), H.no, H.no, 3)
+        assert np.allclose(vm, [H.eigenstate(k).velocity_matrix() for k in bz.k])
+
+    def test_velocity_batch_polarized(self, setup):
+        H = Hamiltonian(setup.g, spin=Spin('P'))
+        H.construct([(0.1, 1.5), ([0.1, -0.1], [1., 0.5])])
+        k = np.random.rand(4, 3)
+        for spin in (0, 1):
+            v = velocity_batch([H.eigenstate(kk, spin=spin) for kk in k])
+            assert np.allclose(v, [H.eigenstate(kk, spin=spin).velocity() for kk in k])
+
+    def test_velocity_batch_fail(self, setup):
+        H = setup.H.copy()
+        H.construct([(0.1, 1.5), ((1., 1.))])
+        with pytest.raises(ValueError):
+            velocity_batch([H.eigenstate(), H.eigenstate(gauge='r')])
+
     def test_inv_eff_mass_tensor_orthogonal(self, setup):
         H = setup.H.copy()
         H.construct([(0.1, 1.5), ((1., 1.))])
@@ -821,6 +905,85 @@ class TestHamiltonian(object):
         assert PDOS.dtype.kind == 'f'
         assert np.allclose(PDOS.sum(0), DOS)
 
+    def test_pdos_chunk(self, setup, monkeypatch):
+        # the energies are calculated in chunks
+        import sisl.physics.electron as electron
+        HS = setup.HS.copy()
+        HS.construct([(0.1, 1.5), ((0., 1.), (1., 0.1))])
+        E = np.linspace(-4, 4, 1000)
+        es = HS.eigenstate([0.2] * 3)
+        DOS = es.DOS(E)
+        PDOS = es.PDOS(E)
+        monkeypatch.setattr(electron, '_CHUNK_SIZE', 7)
+        assert np.allclose(DOS, es.DOS(E))
+        assert np.allclose(PDOS, es.PDOS(E))
+
+        H = Hamiltonian(setup.g, spin=Spin('non-collinear'))
+        H.construct([(0.1, 1.5), ([0., 0., 0.1, 0.2], [1., 1., 0., 0.])])
+        es = H.eigenstate([0.2] * 3)
+        PDOS = es.PDOS(E)
+        monkeypatch.setattr(electron, '_CHUNK_SIZE', 2 ** 21)
+        assert np.allclose(PDOS, es.PDOS(E))
+        assert np.allclose(PDOS[0].sum(0), es.DOS(E))
+
+    def test_eigh_cache(self, setup, monkeypatch):
+        import sisl.linalg as lin
+        calls = []
+        eigh_destroy = lin.eigh_destroy
+        def count(*args, **kwargs):
+            calls.append(kwargs.get('eigvals_only', False))
+            return eigh_destroy(*args, **kwargs)
+        monkeypatch.setattr(lin, 'eigh_destroy', count)
+
+        H = setup.HS.copy()
+        H.construct([(0.1, 1.5), ((0., 1.), (1., 0.1))])
+        H.set_eigh_cache()
+        bz = MonkhorstPack(H, [4, 4, 1])
+        Ef = H.fermi_level(bz, q=1.)
+        assert len(calls) == len(bz)
+        E = np.linspace(-2, 2, 20)
+        DOS = bz.asaverage().DOS(E)
+        assert len(calls) == len(bz)
+        # Eigenstates require the vectors (once)
+        es = H.eigenstate(bz.k[0])
+        assert len(calls) == len(bz) + 1
+        assert np.allclose(es.eig, H.eigh(bz.k[0]))
+        assert len(calls) == len(bz) + 1
+        # The returned arrays are copies
+        es.state[:, :] = 0.
+        assert not np.allclose(H.eigenstate(bz.k[0]).state, 0.)
+
+        # Changing the matrix invalidates the cache
+        H.shift(0.5)
+        assert np.allclose(H.eigh(bz.k[0]), es.eig + 0.5)
+        assert len(calls) == len(bz) + 2
+        H[0, 0] = 0.2
+        H.eigh(bz.k[0])
+        assert len(calls) == len(bz) + 3
+
+        # Finalizing an already finalized matrix does not invalidate the cache
+        eig = H.eigh(bz.k[1], gauge='r')
+        n = len(calls)
+        for _ in range(3):
+            assert np.allclose(H.eigh(bz.k[1], gauge='r'), eig)
+        assert len(calls) == n
+
+        # Disable cache
+        H.set_eigh_cache(0)
+        H.eigh(bz.k[0])
+        H.eigh(bz.k[0])
+        assert len(calls) == n + 2
+
+    def test_eigh_cache_memory(self, setup):
+        H = setup.H.copy()
+        H.construct([(0.1, 1.5), (0., 1.)])
+        # only room for a couple of solutions
+        H.set_eigh_cache(3 * 2 * 16 / 1024 ** 2)
+        for k in np.linspace(0, 0.5, 10):
+            H.eigenstate([k, 0, 0])
+        assert len(H._eigh_cache) == 1
+        assert H._eigh_cache.nbytes <= H._eigh_cache.max_bytes
+
     def test_spin1(self, setup):
         g = Geometry([[i, 0, 0] for i in range(10)], Atom(6, R=1.01), sc=SuperCell(100, nsc=[3, 3, 1]))
         H = Hamiltonian(g, dtype=np.int32, spin=Spin.POLARIZED)
@@ -1309,6 +1472,42 @@ class TestHamiltonian(object):
         H.shift(-Ef)
         assert H.fermi_level(bz, q=q) == pytest.approx(0., abs=1e-6)
 
+    def test_fermi_level_symmetry(self, setup):
+        R, param = [0.1, 1.5], [(1., 1.), (2.1, 0.1)]
+        H = Hamiltonian(setup.g.copy(), orthogonal=False)
+        H.construct([R, param])
+        bz = MonkhorstPack(H, [12, 12, 1], trs=False)
+        bz_sym = MonkhorstPack(H, [12, 12, 1], symmetry=True)
+        assert len(bz_sym) < len(bz) // 6
+        assert bz_sym.weight.sum() == pytest.approx(1.)
+        assert H.fermi_level(bz_sym, q=0.9) == pytest.approx(H.fermi_level(bz, q=0.9))
+        E = np.linspace(-4, 4, 200)
+        DOS = bz.asaverage().DOS(E)
+        assert np.allclose(bz_sym.asaverage().DOS(E), DOS)
+        assert np.allclose(bz_sym.unfold(bz_sym.asarray().eigh()), bz.asarray().eigh())
+
+    def test_fermi_level_eig(self, setup):
+        from sisl.physics.electron import fermi_level
+        R, param = [0.1, 1.5], [(1., 1.), (2.1, 0.1)]
+        H = Hamiltonian(setup.g.copy(), orthogonal=False)
+        H.construct([R, param])
+        bz = MonkhorstPack(H, [10, 10, 1])
+        eig = bz.asarray().eigh()
+        q = np.linspace(0.5, 1.5, 5)
+        Ef = fermi_level(eig, q, bz.weight)
+        assert Ef.shape == q.shape
+        assert np.all(np.diff(Ef) > 0)
+        assert Ef[2] == pytest.approx(H.fermi_level(bz, q=1.))
+        for kT in [0.01, 0.1]:
+            dist = get_distribution('fermi_dirac', smearing=kT)
+            Ef = fermi_level(eig, 1.2, bz.weight, dist)
+            assert (dist(eig, mu=Ef) * bz.weight.reshape(-1, 1)).sum() == pytest.approx(1.2)
+            # q_tol is the tolerance of the charge
+            Ef = fermi_level(eig, 1.2, bz.weight, dist, q_tol=1e-2)
+            assert (dist(eig, mu=Ef) * bz.weight.reshape(-1, 1)).sum() == pytest.approx(1.2, abs=1e-2)
+        with pytest.raises(ValueError):
+            fermi_level(eig, 3., bz.weight)
+
     def test_fermi_level_spin(self, setup):
         R, param = [0.1, 1.5], [(1., 1.), (2.1, 0.1)]
         H = Hamiltonian(setup.g.copy(), spin=Spin('P'))
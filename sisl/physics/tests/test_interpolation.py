@@ -0,0 +1,76 @@
+from __future__ import print_function, division
+
+import pytest
+import numpy as np
+
+from sisl import Geometry, Atom, SuperCell, Hamiltonian, BrillouinZone, MonkhorstPack, BandStructure
+from sisl import SislError, BandInterpolation
+
+pytestmark = pytest.mark.interpolation
+
+
+def get_H():
+    g = Geometry([[0] * 3], Atom(1, R=1.01), sc=SuperCell(1, nsc=[3, 3, 3]))
+    H = Hamiltonian(g)
+    H.construct([(0.1, 1.01), (0., -1.)])
+    return H
+
+
+def get_H_crossing():
+    # Two decoupled chains with crossing bands
+    sc = SuperCell([1, 10, 10], nsc=[3, 1, 1])
+    g = Geometry([[0] * 3, [0, 5, 0]], Atom(1, R=1.01), sc=sc)
+    H = Hamiltonian(g)
+    H[0, 0] = 0.5
+    H[1, 1] = -0.5
+    for isc in [(1, 0, 0), (-1, 0, 0)]:
+        H[0, 0, isc] = -1.
+        H[1, 1, isc] = 1.
+    return H
+
+
+@pytest.mark.parametrize("trs", [True, False])
+def test_interpolation_exact(trs):
+    H = get_H()
+    bi = BandInterpolation(MonkhorstPack(H, [4, 4, 4], trs=trs))
+    assert len(bi) == 1
+    k = np.random.rand(10, 3) - 0.5
+    eig = np.array([H.eigh(kk) for kk in k])
+    assert np.allclose(bi.eigh(k), eig)
+    v = np.array([H.velocity(kk) for kk in k])
+    assert np.allclose(bi.velocity(k), v)
+
+
+def test_interpolation_bz():
+    H = get_H()
+    bi = BandInterpolation(MonkhorstPack(H, [3, 3, 3], displacement=[0.1] * 3, trs=False))
+    bs = BandStructure(H, [[0] * 3, [0.5, 0, 0], [0.5] * 3], 50)
+    assert np.allclose(bi.eigh(bs), bs.asarray().eigh())
+
+
+def test_interpolation_track():
+    H = get_H_crossing()
+    mp = MonkhorstPack(H, [6, 1, 1], trs=False)
+    k = np.zeros([31, 3])
+    k[:, 0] = np.linspace(-0.5, 0.5, 31)
+    eig = np.array([H.eigh(kk) for kk in k])
+
+    bi = BandInterpolation(mp, track=True)
+    assert np.allclose(np.sort(bi.eigh(k), axis=1), eig)
+    # bands are smooth through the crossing
+    e = bi.eigh(k)
+    assert np.allclose(e[:, 0], 0.5 - 2 * np.cos(2 * np.pi * k[:, 0])) or \
+        np.allclose(e[:, 1], 0.5 - 2 * np.cos(2 * np.pi * k[:, 0]))
+
+    bi = BandInterpolation(mp)
+    assert not np.allclose(bi.eigh(k), eig, atol=1e-2)
+
+
+def test_interpolation_fail():
+    H = get_H()
+    with pytest.raises(ValueError):
+        BandInterpolation(BrillouinZone(H))
+    with pytest.raises(SislError):
+        BandInterpolation(MonkhorstPack(H, [4, 4, 4], size=0.5))
+    with pytest.raises(SislError):
+        BandInterpolation(MonkhorstPack(H, [4, 4, 4]), track=True)
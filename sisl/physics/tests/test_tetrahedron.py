@@ -0,0 +1,85 @@
+from __future__ import print_function, division
+
+import pytest
+import numpy as np
+
+from sisl import Geometry, Atom, SuperCell, Hamiltonian, BrillouinZone, MonkhorstPack
+from sisl import SislError, Tetrahedron
+
+pytestmark = pytest.mark.tetrahedron
+
+
+def get_H():
+    g = Geometry([[0] * 3], Atom(1, R=1.01), sc=SuperCell(1, nsc=[3, 3, 3]))
+    H = Hamiltonian(g)
+    H.construct([(0.1, 1.01), (0., -1.)])
+    return H
+
+
+def test_tetrahedron_len():
+    mp = MonkhorstPack(get_H(), [4, 4, 4], trs=False)
+    assert len(Tetrahedron(mp)) == 6 * 4 ** 3
+
+
+@pytest.mark.parametrize("trs", [True, False])
+def test_tetrahedron_dos(trs):
+    H = get_H()
+    mp = MonkhorstPack(H, [8, 8, 8], trs=trs)
+    eig = mp.asarray().eigh()
+    tetra = Tetrahedron(mp)
+    E = np.linspace(-7, 7, 1401)
+    DOS = tetra.DOS(E, eig)
+    assert np.all(DOS >= 0.)
+    assert np.trapz(DOS, E) == pytest.approx(1., abs=1e-3)
+    IDOS = tetra.IDOS(E, eig)
+    assert IDOS[0] == pytest.approx(0.)
+    assert IDOS[-1] == pytest.approx(1.)
+    assert np.all(np.diff(IDOS) >= -1e-12)
+
+
+def test_tetrahedron_trs_symmetry():
+    H = get_H()
+    E = np.linspace(-6, 6, 101)
+    DOS = []
+    for kwargs in [{'trs': False}, {'trs': True}, {'symmetry': True}]:
+        mp = MonkhorstPack(H, [6, 6, 6], **kwargs)
+        DOS.append(Tetrahedron(mp).DOS(E, mp.asarray().eigh()))
+    assert np.allclose(DOS[0], DOS[1])
+    assert np.allclose(DOS[0], DOS[2])
+
+
+def test_tetrahedron_fermi_level():
+    H = get_H()
+    mp = MonkhorstPack(H, [8, 8, 8])
+    eig = mp.asarray().eigh()
+    tetra = Tetrahedron(mp)
+    # particle-hole symmetric band
+    Ef = tetra.fermi_level(eig, 0.5)
+    assert Ef == pytest.approx(0., abs=1e-3)
+    Ef = tetra.fermi_level(eig, 0.3)
+    assert tetra.IDOS(Ef, eig) == pytest.approx(0.3)
+
+
+@pytest.mark.parametrize("bloechl", [True, False])
+def test_tetrahedron_weights(bloechl):
+    H = get_H()
+    mp = MonkhorstPack(H, [6, 6, 6])
+    eig = mp.asarray().eigh()
+    tetra = Tetrahedron(mp)
+    w = tetra.weights(-1.2, eig, bloechl)
+    assert w.shape == eig.shape
+    assert w.sum() == pytest.approx(tetra.IDOS(-1.2, eig))
+    w = tetra.weights(10., eig, bloechl)
+    assert np.allclose(w, mp.weight.reshape(-1, 1))
+
+
+def test_tetrahedron_fail():
+    H = get_H()
+    mp = MonkhorstPack(H, [4, 4, 4], trs=False)
+    mp.replace([0] * 3, MonkhorstPack(H, [2, 2, 2], size=0.25, trs=False))
+    with pytest.raises(SislError):
+        Tetrahedron(mp)
+    with pytest.raises(SislError):
+        Tetrahedron(MonkhorstPack(H, [4, 4, 4], size=0.5))
+    with pytest.raises(ValueError):
+        Tetrahedron(BrillouinZone(H))
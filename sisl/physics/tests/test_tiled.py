@@ -0,0 +1,64 @@
+from __future__ import print_function, division
+
+import pytest
+import numpy as np
+from scipy.sparse import random as sp_random
+from scipy.sparse.linalg import eigsh
+
+from sisl import geom, Hamiltonian, TiledOperator
+
+pytestmark = pytest.mark.tiled
+
+
+def get_H():
+    H = Hamiltonian(geom.graphene())
+    H.construct([(0.1, 1.44), (0., -2.7)])
+    return H
+
+
+def test_tiled_str():
+    op = TiledOperator(get_H(), [2, 3, 1])
+    assert 'TiledOperator' in str(op)
+    assert op.shape == (12, 12)
+    assert op.geometry.no == 12
+
+
+@pytest.mark.parametrize("reps", [[1, 1, 1], [3, 1, 1], [2, 4, 1], [3, 2, 2]])
+@pytest.mark.parametrize("k", [[0, 0, 0], [0.2, -0.3, 0.1]])
+def test_tiled_matvec(reps, k):
+    H = get_H()
+    op = TiledOperator(H, reps, k=k)
+    Ht = H.tile(reps[0], 0).tile(reps[1], 1).tile(reps[2], 2)
+    M = Ht.Hk(k, format='array')
+    x = np.random.rand(op.shape[0], 3) + 1j * np.random.rand(op.shape[0], 3)
+    assert np.allclose(op.matvec(x[:, 0]), M.dot(x[:, 0]))
+    assert np.allclose(op.matmat(x), M.dot(x))
+    assert np.allclose(op.rmatvec(x[:, 0]), M.T.conj().dot(x[:, 0]))
+    assert np.allclose(op.H.matmat(x), M.T.conj().dot(x))
+
+
+def test_tiled_perturbation():
+    H = get_H()
+    k = [0.1, 0.2, 0]
+    P = sp_random(16, 16, density=0.05, format='csr')
+    op = TiledOperator(H, [4, 2, 1], k=k, perturbation=P)
+    M = H.tile(4, 0).tile(2, 1).Hk(k, format='array') + P.toarray()
+    x = np.random.rand(op.shape[0], 2)
+    assert np.allclose(op.matmat(x), M.dot(x))
+    assert np.allclose(op.H.matmat(x), M.T.conj().dot(x))
+
+
+def test_tiled_eigsh():
+    H = get_H()
+    op = TiledOperator(H, [5, 4, 1], k=[0.1, 0, 0])
+    eig = np.sort(eigsh(op, k=4, which='SA', return_eigenvectors=False))
+    M = H.tile(5, 0).tile(4, 1)
+    assert np.allclose(eig, M.eigh([0.1, 0, 0])[:4])
+
+
+def test_tiled_fail():
+    H = get_H()
+    with pytest.raises(ValueError):
+        TiledOperator(H, [2, 2])
+    with pytest.raises(ValueError):
+        TiledOperator(H, [2, 2, 1], perturbation=sp_random(4, 4, format='csr'))
@@ -0,0 +1,321 @@
+r"""Linear tetrahedron integration
+==============================
+
+.. module:: sisl.physics.tetrahedron
+   :noindex:
+
+Brillouin zone integrations using the linear tetrahedron method with Blöchl corrections [1]_.
+The k-points of a `MonkhorstPack` grid are divided into tetrahedra in which the eigenvalues are
+linearly interpolated. Contrary to broadening the eigenvalues with a distribution function
+the DOS, integrated DOS and Fermi-level converge much faster with respect to the number of
+k-points.
+
+>>> H = Hamiltonian(...)
+>>> mp = MonkhorstPack(H, [20, 20, 20])
+>>> eig = mp.asarray().eigh()
+>>> tetra = Tetrahedron(mp)
+>>> DOS = tetra.DOS(np.linspace(-2, 2, 400), eig)
+>>> Ef = tetra.fermi_level(eig, H.geometry.q0)
+
+.. autosummary::
+   :toctree:
+
+   Tetrahedron
+
+References
+----------
+.. [1] P. E. Blöchl, O. Jepsen and O. K. Andersen, "Improved tetrahedron method for Brillouin-zone integrations", Phys. Rev. B 49, 16223 (1994)
+"""
+from __future__ import print_function, division
+
+from itertools import permutations
+
+import numpy as np
+from numpy import dot
+
+import sisl._array as _a
+from sisl._help import _CHUNK_SIZE
+from .brillouinzone import _mp_grid_map
+
+
+__all__ = ['Tetrahedron']
+
+
+class Tetrahedron(object):
+    r""" Linear tetrahedron integration on a `MonkhorstPack` grid
+
+    Each cube of k-points in the grid is divided into 6 tetrahedra sharing the shortest
+    diagonal of the cube. The eigenvalues are linearly interpolated in each tetrahedron
+    and the DOS, integrated DOS and integration weights are calculated analytically.
+
+    The `MonkhorstPack` object may be reduced by time-reversal symmetry (`trs`) or point-group
+    symmetry (`symmetry`), the equivalent k-points of the full grid are found through the
+    symmetry operations (as is done in `MonkhorstPack.asgrid`).
+
+    Parameters
+    ----------
+    mp : MonkhorstPack
+       the k-point grid, the eigenvalues passed to the methods *must* be calculated for ``mp.k``
+
+    Examples
+    --------
+    >>> mp = MonkhorstPack(H, [10, 10, 10])
+    >>> eig = mp.asarray().eigh()
+    >>> tetra = Tetrahedron(mp)
+    >>> E = np.linspace(-2, 2, 100)
+    >>> DOS = tetra.DOS(E, eig)
+    >>> IDOS = tetra.IDOS(E, eig)
+    """
+
+    def __init__(self, mp):
+        full = _mp_grid_map(mp, self.__class__.__name__)[1]
+        self._nk = len(mp)
+        self._tetra = self._tetrahedra(mp, full)
+
+    def __len__(self):
+        """ Number of tetrahedra """
+        return len(self._tetra)
+
+    @staticmethod
+    def _tetrahedra(mp, full):
+        """ Indices (into ``mp.k``) of the 4 corners of all tetrahedra
+
+        `full` is the index of the equivalent k-point in ``mp.k`` of each grid point.
+        """
+        n = mp._diag
+        nk = n.prod()
+
+        # Choose the shortest diagonal of the cubes
+        corner = _a.arrayi([[a, b, c] for c in (0, 1) for b in (0, 1) for a in (0, 1)])
+        dk = mp.rcell / n.reshape(3, 1)
+        length = [(dot(1 - 2 * corner[s], dk) ** 2).sum() for s in range(4)]
+        start = corner[np.argmin(length)]
+        step = 1 - 2 * start
+
+        # The 6 tetrahedra of a cube as offsets of the corners
+        offsets = []
+        for p in permutations(range(3)):
+            o = start.copy()
+            tet = [o.copy()]
+            for i in p:
+                o[i] += step[i]
+                tet.append(o.copy())
+            offsets.append(tet)
+        offsets = _a.arrayi(offsets) # (6, 4, 3)
+
+        # All cubes
+        cube = np.array(np.unravel_index(np.arange(nk), n)).T # (nk, 3)
+        tetra = (cube.reshape(-1, 1, 1, 3) + offsets.reshape(1, 6, 4, 3)) % n.reshape(1, 1, 1, 3)
+        tetra = np.ravel_multi_index(tetra.reshape(-1, 3).T, n).reshape(-1, 4)
+        return full[tetra]
+
+    def _chunks(self, eig):
+        """ Yield sorted corner eigenvalues of the tetrahedra
+
+        Yields
+        ------
+        slice : the tetrahedra in the chunk
+        numpy.ndarray : the corner indices of the tetrahedra, shape ``(ntet, 4)``
+        numpy.ndarray : the sorted corner eigenvalues, shape ``(ntet, nb, 4)``
+        numpy.ndarray : the sorting indices of the corners, shape ``(ntet, nb, 4)``
+        """
+        eig = _a.asarrayd(eig)
+        if eig.ndim == 1:
+            eig = eig.reshape(-1, 1)
+        if eig.shape[0] != self._nk:
+            raise ValueError(self.__class__.__name__ + ' requires the eigenvalues for all k-points, '
+                             'eig.shape[0] != len(mp)')
+        nb = eig.shape[1]
+        nt = max(1, _CHUNK_SIZE // nb)
+        for i in range(0, len(self._tetra), nt):
+            sl = slice(i, min(i + nt, len(self._tetra)))
+            tet = self._tetra[sl]
+            e = eig[tet].transpose(0, 2, 1) # (ntet, nb, 4)
+            idx = np.argsort(e, axis=-1)
+            e = np.sort(e, axis=-1)
+            yield sl, tet, e, idx
+
+    @staticmethod
+    def _dos(E, e):
+        """ DOS of tetrahedra with sorted corner eigenvalues `e` (of unit volume) """
+        e1, e2, e3, e4 = e[..., 0], e[..., 1], e[..., 2], e[..., 3]
+        D = np.zeros(e1.shape)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            m = np.logical_and(e1 <= E, E < e2)
+            x = E - e1[m]
+            D[m] = 3 * x ** 2 / ((e2 - e1) * (e3 - e1) * (e4 - e1))[m]
+            m = np.logical_and(e2 <= E, E < e3)
+            x = E - e2[m]
+            e21, e31, e41 = (e2 - e1)[m], (e3 - e1)[m], (e4 - e1)[m]
+            e32, e42 = (e3 - e2)[m], (e4 - e2)[m]
+            D[m] = (3 * e21 + 6 * x - 3 * (e31 + e42) * x ** 2 / (e32 * e42)) / (e31 * e41)
+            m = np.logical_and(e3 <= E, E < e4)
+            x = e4[m] - E
+            D[m] = 3 * x ** 2 / ((e4 - e1) * (e4 - e2) * (e4 - e3))[m]
+        return D
+
+    @staticmethod
+    def _idos(E, e):
+        """ Integrated DOS of tetrahedra with sorted corner eigenvalues `e` (of unit volume) """
+        e1, e2, e3, e4 = e[..., 0], e[..., 1], e[..., 2], e[..., 3]
+        N = (e4 <= E).astype(np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            m = np.logical_and(e1 <= E, E < e2)
+            x = E - e1[m]
+            N[m] = x ** 3 / ((e2 - e1) * (e3 - e1) * (e4 - e1))[m]
+            m = np.logical_and(e2 <= E, E < e3)
+            x = E - e2[m]
+            e21, e31, e41 = (e2 - e1)[m], (e3 - e1)[m], (e4 - e1)[m]
+            e32, e42 = (e3 - e2)[m], (e4 - e2)[m]
+            N[m] = (e21 ** 2 + 3 * e21 * x + 3 * x ** 2 - (e31 + e42) * x ** 3 / (e32 * e42)) / (e31 * e41)
+            m = np.logical_and(e3 <= E, E < e4)
+            x = e4[m] - E
+            N[m] = 1 - x ** 3 / ((e4 - e1) * (e4 - e2) * (e4 - e3))[m]
+        return N
+
+    @staticmethod
+    def _weights(E, e):
+        """ Integration weights of the corners of tetrahedra with sorted corner eigenvalues `e` (of unit volume) """
+        e1, e2, e3, e4 = e[..., 0], e[..., 1], e[..., 2], e[..., 3]
+        w = np.zeros(e.shape)
+        w[e4 <= E, :] = 0.25
+        with np.errstate(divide='ignore', invalid='ignore'):
+            m = np.logical_and(e1 <= E, E < e2)
+            x = E - e1[m]
+            e21, e31, e41 = (e2 - e1)[m], (e3 - e1)[m], (e4 - e1)[m]
+            C = x ** 3 / (4 * e21 * e31 * e41)
+            w[m, 0] = C * (4 - x * (1 / e21 + 1 / e31 + 1 / e41))
+            w[m, 1] = C * x / e21
+            w[m, 2] = C * x / e31
+            w[m, 3] = C * x / e41
+
+            m = np.logical_and(e2 <= E, E < e3)
+            x1, x2, x3, x4 = E - e1[m], E - e2[m], e3[m] - E, e4[m] - E
+            e31, e41, e32, e42 = (e3 - e1)[m], (e4 - e1)[m], (e3 - e2)[m], (e4 - e2)[m]
+            C1 = x1 ** 2 / (4 * e41 * e31)
+            C2 = x1 * x2 * x3 / (4 * e41 * e32 * e31)
+            C3 = x2 ** 2 * x4 / (4 * e42 * e32 * e41)
+            w[m, 0] = C1 + (C1 + C2) * x3 / e31 + (C1 + C2 + C3) * x4 / e41
+            w[m, 1] = C1 + C2 + C3 + (C2 + C3) * x3 / e32 + C3 * x4 / e42
+            w[m, 2] = (C1 + C2) * x1 / e31 + (C2 + C3) * x2 / e32
+            w[m, 3] = (C1 + C2 + C3) * x1 / e41 + C3 * x2 / e42
+
+            m = np.logical_and(e3 <= E, E < e4)
+            x = e4[m] - E
+            e41, e42, e43 = (e4 - e1)[m], (e4 - e2)[m], (e4 - e3)[m]
+            C = x ** 3 / (4 * e41 * e42 * e43)
+            w[m, 0] = 0.25 - C * x / e41
+            w[m, 1] = 0.25 - C * x / e42
+            w[m, 2] = 0.25 - C * x / e43
+            w[m, 3] = 0.25 - C * (4 - x * (1 / e41 + 1 / e42 + 1 / e43))
+        return w
+
+    def DOS(self, E, eig):
+        r""" Density of states at energies `E`
+
+        The DOS is normalized such that the integral of a band is 1 (as `EigenvalueElectron.DOS` averaged
+        over the k-points).
+
+        Parameters
+        ----------
+        E : array_like
+           energies to calculate the DOS at
+        eig : array_like
+           eigenvalues for all k-points, shape ``(len(mp), nbands)``
+
+        Returns
+        -------
+        numpy.ndarray
+            DOS at the energies `E`
+        """
+        E = _a.asarrayd(E)
+        DOS = _a.zerosd(E.size)
+        for _, _, e, _ in self._chunks(eig):
+            for i, ie in enumerate(E.ravel()):
+                DOS[i] += self._dos(ie, e).sum()
+        return DOS.reshape(E.shape) / len(self)
+
+    def IDOS(self, E, eig):
+        r""" Integrated density of states (number of states below `E`)
+
+        Parameters
+        ----------
+        E : array_like
+           energies to calculate the integrated DOS at
+        eig : array_like
+           eigenvalues for all k-points, shape ``(len(mp), nbands)``
+
+        Returns
+        -------
+        numpy.ndarray
+            integrated DOS at the energies `E`
+        """
+        E = _a.asarrayd(E)
+        IDOS = _a.zerosd(E.size)
+        for _, _, e, _ in self._chunks(eig):
+            for i, ie in enumerate(E.ravel()):
+                IDOS[i] += self._idos(ie, e).sum()
+        return IDOS.reshape(E.shape) / len(self)
+
+    def weights(self, E, eig, bloechl=True):
+        r""" Integration weights for all states below `E` (occupations multiplied by the k-point weights)
+
+        Any k-integrated quantity of the occupied states may be calculated as ``(weights * A).sum()``
+        where ``A`` has the same shape as `eig`, e.g. the band energy ``(weights * eig).sum()``.
+        The sum of the weights equals the integrated DOS.
+
+        Parameters
+        ----------
+        E : float
+           the Fermi-level
+        eig : array_like
+           eigenvalues for all k-points, shape ``(len(mp), nbands)``
+        bloechl : bool, optional
+           whether the Blöchl correction is applied to the weights. The correction corrects
+           the curvature error of the linear interpolation and does not change the sum of the weights.
+
+        Returns
+        -------
+        numpy.ndarray
+            integration weights with the same shape as `eig`
+        """
+        eig = _a.asarrayd(eig)
+        W = np.zeros(eig.shape, dtype=np.float64).reshape(self._nk, -1)
+        for _, tet, e, idx in self._chunks(eig):
+            w = self._weights(E, e)
+            if bloechl:
+                # dw_i = D(E) / 40 * sum_j (e_j - e_i)
+                D = self._dos(E, e)
+                w += D[..., None] * (e.sum(-1)[..., None] - 4 * e) / 40
+            # Move weights back to the un-sorted corners
+            ww = np.empty(w.shape)
+            it, ib = np.ogrid[:w.shape[0], :w.shape[1]]
+            ww[it[..., None], ib[..., None], idx] = w
+            for c in range(4):
+                np.add.at(W, tet[:, c], ww[:, :, c])
+        return W.reshape(eig.shape) / len(self)
+
+    def fermi_level(self, eig, q, tol=1e-10):
+        r""" Calculate the Fermi-level such that the integrated DOS equals `q`
+
+        Parameters
+        ----------
+        eig : array_like
+           eigenvalues for all k-points, shape ``(len(mp), nbands)``.
+           For spin-polarized calculations the two spin channels should be concatenated
+           along the band axis
+        q : float
+           the number of electrons (per unit-cell)
+        tol : float, optional
+           tolerance of the Fermi-level
+
+        Returns
+        -------
+        float
+            the Fermi-level
+        """
+        from scipy.optimize import brentq
+        eig = _a.asarrayd(eig)
+        if q <= 0 or q >= eig.size // self._nk:
+            raise ValueError(self.__class__.__name__ + '.fermi_level requires 0 < q < number of bands')
+        return brentq(lambda E: float(self.IDOS(E, eig)) - q, eig.min(), eig.max(), xtol=tol)
@@ -0,0 +1,197 @@
+r"""Matrix-free tiled operators
+============================
+
+.. module:: sisl.physics.tiled
+   :noindex:
+
+A sparse orbital matrix (e.g. a `Hamiltonian`) tiled into a large supercell
+may be applied to vectors without creating the tiled matrix. Only the unit-cell
+matrix is stored, regardless of the size of the supercell.
+
+The operator is a `scipy.sparse.linalg.LinearOperator` and may thus be used
+directly in iterative solvers, e.g. `scipy.sparse.linalg.eigsh`, or in kernel
+polynomial expansions.
+
+.. autosummary::
+   :toctree:
+
+   TiledOperator
+
+"""
+from __future__ import print_function, division
+
+import numpy as np
+from numpy import pi, exp
+from scipy.sparse.linalg import LinearOperator
+
+import sisl._array as _a
+from sisl._help import dtype_real_to_complex
+
+
+__all__ = ['TiledOperator']
+
+
+class TiledOperator(LinearOperator):
+    r""" Matrix-free operator of a sparse orbital matrix tiled into a supercell
+
+    The operator is equivalent to ``parent.tile(reps[0], 0).tile(reps[1], 1).tile(reps[2], 2).Pk(k)``
+    (with the same orbital ordering as `Geometry.tile`), but only the unit-cell matrix is stored.
+    Applying the operator on a vector costs the same as applying the unit-cell matrix on
+    ``prod(reps)`` vectors.
+
+    Optionally, a sparse perturbation (e.g. a defect) of the tiled matrix may be added.
+
+    Parameters
+    ----------
+    parent : SparseOrbitalBZ
+       the unit-cell matrix
+    reps : (3,) of int
+       number of repetitions of the unit-cell along each lattice vector
+    k : (3,) of float, optional
+       k-point in reduced coordinates of the *tiled* cell
+    dim : int, optional
+       the dimension of `parent` to apply, e.g. the spin component of a polarized
+       `Hamiltonian` or ``parent.S_idx`` for the overlap matrix
+    perturbation : scipy.sparse.spmatrix, optional
+       a matrix with the same shape as the tiled operator which is added to the operator
+
+    Examples
+    --------
+    Calculate the lowest eigenvalues of a graphene flake with 6.4 million orbitals:
+
+    >>> from scipy.sparse.linalg import eigsh
+    >>> H = Hamiltonian(graphene())
+    >>> H.construct([(0.1, 1.44), (0., -2.7)])
+    >>> op = TiledOperator(H, [1600, 2000, 1])
+    >>> eig = eigsh(op, k=4, which='SA', return_eigenvectors=False)
+    """
+
+    def __init__(self, parent, reps, k=(0, 0, 0), dim=0, perturbation=None):
+        spin = getattr(parent, 'spin', None)
+        if spin is not None and (spin.is_noncolinear or spin.is_spinorbit):
+            raise NotImplementedError(self.__class__.__name__ + ' is not implemented for non-colinear spin')
+
+        self._parent = parent
+        self._reps = _a.arrayi(reps).ravel()
+        if self._reps.size != 3 or np.any(self._reps < 1):
+            raise ValueError(self.__class__.__name__ + ' requires 3 positive repetitions')
+        self._k = _a.arrayd(k).ravel()
+
+        # Split the unit-cell matrix into the supercell blocks
+        no = parent.no
+        sc_off = parent.geometry.sc.sc_off
+        csr = parent.tocsr(dim)
+        self._blocks = []
+        for s in range(parent.n_s):
+            block = csr[:, s * no:(s + 1) * no].tocsr()
+            if block.nnz > 0:
+                self._blocks.append((sc_off[s, :], block))
+        del csr
+
+        dtype = parent.dtype
+        if perturbation is not None:
+            dtype = np.result_type(dtype, perturbation.dtype)
+        if not np.allclose(self._k, 0.):
+            dtype = dtype_real_to_complex(dtype)
+        self._perturbation = perturbation
+
+        N = no * self._reps.prod()
+        super(TiledOperator, self).__init__(dtype, (N, N))
+        if perturbation is not None and perturbation.shape != self.shape:
+            raise ValueError(self.__class__.__name__ + ' perturbation does not have the same shape as the tiled operator')
+
+    @property
+    def parent(self):
+        """ The unit-cell matrix """
+        return self._parent
+
+    @property
+    def reps(self):
+        """ Number of repetitions along each lattice vector """
+        return self._reps
+
+    @property
+    def k(self):
+        """ k-point (in reduced coordinates of the tiled cell) """
+        return self._k
+
+    @property
+    def geometry(self):
+        """ The tiled geometry (created on each call) """
+        geom = self._parent.geometry
+        for ax in range(3):
+            geom = geom.tile(self._reps[ax], ax)
+        return geom
+
+    def __str__(self):
+        """ Representation of the tiled operator """
+        R = self._reps
+        return self.__class__.__name__ + '{{reps: [{0} {1} {2}], shape: {3},\n {4}\n}}'.format(
+            R[0], R[1], R[2], self.shape, str(self._parent).replace('\n', '\n '))
+
+    def _phases(self, isc):
+        """ Phases along each (C-ordered) block axis for the supercell offset `isc` (None if all 1) """
+        if np.allclose(self._k, 0.):
+            return None
+        phases = []
+        for ax in range(3):
+            t = _a.arangei(self._reps[ax])
+            # The tiled supercell image of each block
+            q = (t + isc[ax]) // self._reps[ax]
+            phases.append(exp(-2j * pi * self._k[ax] * q))
+        return phases
+
+    def _apply(self, x, adjoint):
+        """ Apply the operator (or its adjoint) on the columns of `x` """
+        R = self._reps
+        no = self._parent.no
+        m = x.shape[1]
+        dtype = np.result_type(self.dtype, x.dtype)
+        # The blocks are ordered as Geometry.tile, i.e. C-order (t2, t1, t0)
+        X = x.reshape(R[2], R[1], R[0], no, m)
+        Y = np.zeros(X.shape, dtype=dtype)
+
+        for isc, block in self._blocks:
+            phases = self._phases(isc)
+            if adjoint:
+                block = block.getH()
+                # Contributions to the blocks t + isc
+                Z = block.dot(X.reshape(-1, no, m).transpose(1, 0, 2).reshape(no, -1))
+                Z = Z.reshape(no, R[2], R[1], R[0], m).transpose(1, 2, 3, 0, 4)
+                if phases is not None:
+                    Z = Z * (phases[2].conj().reshape(-1, 1, 1, 1, 1) *
+                             phases[1].conj().reshape(1, -1, 1, 1, 1) *
+                             phases[0].conj().reshape(1, 1, -1, 1, 1))
+                Y += np.roll(Z, (isc[2], isc[1], isc[0]), axis=(0, 1, 2))
+            else:
+                # The blocks t + isc
+                W = np.roll(X, (-isc[2], -isc[1], -isc[0]), axis=(0, 1, 2))
+                Z = block.dot(W.reshape(-1, no, m).transpose(1, 0, 2).reshape(no, -1))
+                del W
+                Z = Z.reshape(no, R[2], R[1], R[0], m).transpose(1, 2, 3, 0, 4)
+                if phases is not None:
+                    Z = Z * (phases[2].reshape(-1, 1, 1, 1, 1) *
+                             phases[1].reshape(1, -1, 1, 1, 1) *
+                             phases[0].reshape(1, 1, -1, 1, 1))
+                Y += Z
+            del Z
+
+        Y = Y.reshape(-1, m)
+        if self._perturbation is not None:
+            if adjoint:
+                Y += self._perturbation.getH().dot(x)
+            else:
+                Y += self._perturbation.dot(x)
+        return Y
+
+    def _matvec(self, x):
+        return self._apply(x.reshape(-1, 1), False).ravel()
+
+    def _rmatvec(self, x):
+        return self._apply(x.reshape(-1, 1), True).ravel()
+
+    def _matmat(self, X):
+        return self._apply(X, False)
+
+    def _rmatmat(self, X):
+        return self._apply(X, True)
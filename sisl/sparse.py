@@ -1,14 +1,15 @@
 from __future__ import print_function, division
 
 from numbers import Integral
+from itertools import count
 
 # To speed up the extension algorithm we limit
 # the lookup table
 import numpy as np
 from numpy import int32
 from numpy import empty, zeros, asarray, arange
-from numpy import insert, take, delete, copyto, split
-from numpy import intersect1d, setdiff1d, unique, in1d
+from numpy import insert, take, delete, split
+from numpy import setdiff1d, unique, in1d
 from numpy import diff, count_nonzero
 from numpy import any as np_any
 from numpy import all as np_all
@@ -24,6 +25,7 @@ from scipy.sparse import isspmatrix_lil
 from . import _array as _a
 from ._array import asarrayi, arrayi
 from ._indices import indices, indices_only, sorted_unique
+from ._sparse import csr_index_map
 from .messages import warn, SislError
 from ._help import array_fill_repeat, get_dtype, isiterable
 from ._help import _range as range, _zip as zip, _map as map
@@ -35,6 +37,10 @@ from .utils.ranges import array_arange
 __all__ = ['SparseCSR', 'ispmatrix', 'ispmatrixd']
 
 
+# Globally unique versions of the data in SparseCSR objects
+_version = count(1)
+
+
 class SparseCSR(object):
     """
     A compressed sparse row matrix, slightly different than :class:`~scipy.sparse.csr_matrix`.
@@ -106,6 +112,13 @@ class SparseCSR(object):
     finalized: boolean
        whether the sparse matrix is finalized and non-set elements
        are removed
+
+    Notes
+    -----
+    The sparsity pattern (`ptr`, `ncol` and `col`) may be shared between several
+    sparse matrices, e.g. after `copy` or `share_pattern`. A shared sparsity pattern
+    is copied before it is changed (copy-on-write), i.e. the sparse matrices
+    behave as if they had their own sparsity pattern.
     """
 
     # These overrides are necessary to be able to perform
@@ -121,9 +134,15 @@ class SparseCSR(object):
     __numpy_ufunc__ = None
     __array_ufunc__ = None
 
+    # Version of the sparsity pattern (changed in `_own_pattern`)
+    _pattern_version = 0
+    # Last calculated index map (see `_index_map`)
+    _index_map_cache = None
+
     def __init__(self, arg1, dim=1, dtype=None, nnzpr=20, nnz=None,
                  **kwargs):
         """ Initialize a new sparse CSR matrix """
+        self._modified()
 
         # step size in sparse elements
         # If there isn't enough room for adding
@@ -227,7 +246,7 @@ class SparseCSR(object):
         # in the sparsity pattern
         self.ncol = _a.zerosi([M])
         # Create pointer array
-        self.ptr = _a.cumsumi(arrayi([nnzpr] * (M+1))) - nnzpr
+        self.ptr = _a.arangei(M + 1) * nnzpr
         # Create column array
         self.col = _a.zerosi(nnz)
         # Store current number of non-zero elements
@@ -240,6 +259,17 @@ class SparseCSR(object):
 
         # Denote that this sparsity pattern hasn't been finalized
         self._finalized = False
+        # The sparsity pattern is not shared with other sparse matrices
+        self._shared = False
+
+    def _modified(self):
+        """ Signal that the data has changed
+
+        Every change of the data (or sparsity pattern) through the methods of this class
+        gives a new, globally unique, ``_version``. This enables caching of quantities
+        derived from the data (e.g. eigenvalues).
+        """
+        self._version = next(_version)
 
     def diags(self, diagonals, offsets=0, dim=None, dtype=None):
         """ Create a `SparseCSR` with diagonal elements with the same shape as the routine
@@ -292,12 +322,14 @@ class SparseCSR(object):
            This may be advantagegous when re-constructing a new sparse
            matrix from an old sparse matrix
         """
+        self._modified()
         self._D[:, :] = 0.
 
         if not keep_nnz:
             self._finalized = False
             # The user does not wish to retain the
             # sparse pattern
+            self._own_pattern()
             self.ncol[:] = 0
             self._nnz = 0
             # We do not mess with the other arrays
@@ -357,6 +389,8 @@ class SparseCSR(object):
         """
         if self.finalized:
             return
+        self._modified()
+        self._own_pattern()
 
         # Create and index array to retain the indices we want
         ptr = self.ptr
@@ -450,6 +484,7 @@ class SparseCSR(object):
            columns will be shifted according to the number of columns deleted below,
            if ``False``, only the elements will be deleted.
         """
+        self._modified()
         # Shorthand function for retrieval
         cnz = count_nonzero
 
@@ -457,6 +492,7 @@ class SparseCSR(object):
         columns = unique(_a.asarrayi(columns))
         n_cols = cnz(columns < self.shape[1])
 
+        self._own_pattern()
         # Grab pointers
         ptr = self.ptr
         ncol = self.ncol
@@ -523,6 +559,7 @@ class SparseCSR(object):
 
     def _clean_columns(self):
         """ Remove all intrinsic columns that are not defined in the sparse matrix """
+        self._own_pattern()
         # Grab pointers
         ptr = self.ptr
         ncol = self.ncol
@@ -568,6 +605,7 @@ class SparseCSR(object):
         clean : bool, optional
            whether the new translated columns, outside the shape, should be deleted or not (default delete)
         """
+        self._modified()
         old = _a.asarrayi(old)
         new = _a.asarrayi(new)
 
@@ -586,6 +624,7 @@ class SparseCSR(object):
         pvt = _a.arangei(self.shape[1])
         pvt[old] = new
 
+        self._own_pattern()
         # Get indices of valid column entries
         idx = array_arange(self.ptr[:-1], n=self.ncol)
         # Convert the old column indices to new ones
@@ -598,6 +637,117 @@ class SparseCSR(object):
             if np_any(new >= self.shape[1]):
                 self._clean_columns()
 
+    def _index_map(self, other):
+        """ Indices of the non-zero elements of `other` in this sparse matrix
+
+        Parameters
+        ----------
+        other : SparseCSR
+           the other sparse matrix (with the same number of rows)
+
+        Returns
+        -------
+        numpy.ndarray
+           for each non-zero element in `other` (traversed row by row), the index of the
+           element in this sparse matrix, ``-1`` for elements not in this sparse matrix.
+           The index map of the last `other` is cached (read-only) and re-used until
+           one of the sparsity patterns change.
+        """
+        if self.is_pattern_shared(other):
+            idx = self._data_index()
+            if isinstance(idx, slice):
+                return _a.arangei(self.nnz)
+            return idx.astype(int32, copy=False)
+
+        arrays, versions = self._index_map_key(other)
+        cache = self._index_map_cache
+        if cache is not None and cache[1] == versions and \
+           all(a is b for a, b in zip(cache[0], arrays)):
+            return cache[2]
+        return self._cache_index_map(other, csr_index_map(self.ptr, self.ncol, self.col,
+                                                          other.ptr, other.ncol, other.col))
+
+    def _index_map_key(self, other):
+        """ The sparsity pattern arrays and versions the index map of `other` depends on """
+        return ((self.ptr, self.ncol, self.col, other.ptr, other.ncol, other.col),
+                (self._pattern_version, other._pattern_version))
+
+    def _cache_index_map(self, other, idx):
+        """ Store `idx` (read-only) as the index map of `other` """
+        idx.flags.writeable = False
+        self._index_map_cache = self._index_map_key(other) + (idx,)
+        return idx
+
+    def _data_index(self):
+        """ Indices of the non-zero elements in the data array (traversed row by row) """
+        if self.ptr[-1] == self.nnz:
+            # there are no holes in the data array
+            return slice(0, self.nnz)
+        return array_arange(self.ptr[:-1], n=self.ncol)
+
+    def _own_pattern(self):
+        """ Copy the sparsity pattern if it is shared with other sparse matrices (copy-on-write)
+
+        This *must* be called before the sparsity pattern arrays are changed in-place.
+        """
+        self._pattern_version = next(_version)
+        self._index_map_cache = None
+        if self._shared:
+            self.ptr = self.ptr.copy()
+            self.ncol = self.ncol.copy()
+            self.col = self.col.copy()
+            self._shared = False
+
+    def is_pattern_shared(self, other):
+        """ Whether this sparse matrix and `other` share the same sparsity pattern (in memory)
+
+        Parameters
+        ----------
+        other : SparseCSR
+
+        See Also
+        --------
+        share_pattern : share the sparsity pattern between two sparse matrices
+        """
+        return self.col is other.col and self.ptr is other.ptr and self.ncol is other.ncol
+
+    def share_pattern(self, other):
+        """ Use the sparsity pattern of `other` for this sparse matrix
+
+        The two sparse matrices must have the same non-zero elements (see `spsame`).
+        Afterwards both sparse matrices reference the same sparsity pattern which
+        reduces memory and enables faster arithmetic between the two sparse matrices.
+        Any subsequent changes to the sparsity pattern of one of the sparse matrices
+        copies the sparsity pattern first (copy-on-write).
+
+        Parameters
+        ----------
+        other : SparseCSR
+           the sparse matrix containing the sparsity pattern to be shared
+
+        Raises
+        ------
+        ValueError : if the sparse matrices do not have the same non-zero elements
+        """
+        if self.is_pattern_shared(other):
+            return
+        if not self.spsame(other):
+            raise ValueError(self.__class__.__name__ + '.share_pattern requires the same '
+                             'non-zero elements in both sparse matrices')
+
+        # Re-arrange the data according to the sparsity pattern of other
+        idx = other._index_map(self)
+        D = zeros([len(other.col), self.shape[2]], dtype=self._D.dtype)
+        D[idx, :] = self._D[self._data_index(), :]
+
+        self.ptr = other.ptr
+        self.ncol = other.ncol
+        self.col = other.col
+        self._D = D
+        self._finalized = other._finalized
+        self._shared = True
+        other._shared = True
+
     def spsame(self, other):
         """ Check whether two sparse matrices have the same non-zero elements
 
@@ -612,23 +762,16 @@ class SparseCSR(object):
         """
         if self.shape[:2] != other.shape[:2]:
             return False
-
-        sptr = self.ptr
-        sncol = self.ncol
-        scol = self.col
-        optr = other.ptr
-        oncol = other.ncol
-        ocol = other.col
+        if self.is_pattern_shared(other):
+            return True
 
         # Easy check for non-equal number of elements
-        if (sncol == oncol).sum() != self.shape[0]:
+        if not np_all(self.ncol == other.ncol):
             return False
 
-        for r in range(self.shape[0]):
-            if len(intersect1d(scol[sptr[r]:sptr[r]+sncol[r]],
-                               ocol[optr[r]:optr[r]+oncol[r]])) != sncol[r]:
-                return False
-        return True
+        # Equal number of elements per row and all elements of other
+        # in self means the same sparsity pattern.
+        return not np_any(self._index_map(other) < 0)
 
     def align(self, other):
         """ Aligns this sparse matrix with the sparse elements of the other sparse matrix
@@ -644,29 +787,65 @@ class SparseCSR(object):
         ----------
         other : SparseCSR
            the other sparse matrix to align.
+
+        Returns
+        -------
+        numpy.ndarray
+           the indices of the non-zero elements of `other` (traversed row by row)
+           in this sparse matrix. The indices may be re-used for subsequent element-wise
+           operations as long as neither of the sparsity patterns change.
         """
+        self._modified()
 
         if self.shape[:2] != other.shape[:2]:
             raise ValueError('Aligning two sparse matrices requires same shapes')
 
-        lsetdiff1d = setdiff1d
-        sptr = self.ptr
-        sncol = self.ncol
-        scol = self.col
-        optr = other.ptr
-        oncol = other.ncol
-        ocol = other.col
-        for r in range(self.shape[0]):
-            # pointers
-            sp = sptr[r]
-            sn = sncol[r]
-            op = optr[r]
-            on = oncol[r]
-
-            adds = lsetdiff1d(ocol[op:op+on], scol[sp:sp+sn])
-            if len(adds) > 0:
-                # simply extend the elements
-                self._extend(r, adds)
+        idx = self._index_map(other)
+        missing = (idx < 0).nonzero()[0]
+        if len(missing) == 0:
+            return idx
+
+        # Number of missing elements per row
+        nr = self.shape[0]
+        rows = np.repeat(_a.arangei(nr), other.ncol)
+        nmiss = np.bincount(rows[missing], minlength=nr).astype(int32)
+        del rows
+
+        ptr = self.ptr
+        ncol = self.ncol
+        new_ncol = ncol + nmiss
+        new_ptr = _a.zerosi(nr + 1)
+        _a.cumsumi(new_ncol, out=new_ptr[1:])
+        nnz = new_ptr[-1]
+
+        # The existing elements are placed first in each row,
+        # followed by the missing elements (in the order of other).
+        old = array_arange(ptr[:-1], n=ncol)
+        new = array_arange(new_ptr[:-1], n=ncol)
+        add = array_arange(new_ptr[:-1] + ncol, n=nmiss)
+
+        col = empty(nnz, dtype=self.col.dtype)
+        col[new] = self.col[old]
+        col[add] = other.col[other._data_index()][missing]
+        D = zeros([nnz, self.shape[2]], dtype=self._D.dtype)
+        D[new, :] = self._D[old, :]
+
+        # Convert the index map
+        old2new = empty(len(self.col), dtype=int32)
+        old2new[old] = new
+        idx = idx.copy()
+        found = idx >= 0
+        idx[found] = old2new[idx[found]]
+        idx[missing] = add
+
+        self.ptr = new_ptr
+        self.ncol = new_ncol
+        self.col = col
+        self._D = D
+        self._nnz = int(nnz)
+        self._finalized = False
+        self._shared = False
+        return self._cache_index_map(other, idx)
 
     def iter_nnz(self, row=None):
         """ Iterations of the non-zero elements, returns a tuple of row and column with non-zero elements
@@ -775,6 +954,12 @@ class SparseCSR(object):
         # and adding long and 32 is horribly slow in Python!
         new_n = len(new_j)
 
+        if new_n > 0:
+            self._own_pattern()
+            ptr = self.ptr
+            ncol = self.ncol
+            col = self.col
+
         ncol_ptr_i = ptr_i + ncol_i
 
         # Check how many elements cannot fit in the currently
@@ -882,6 +1067,7 @@ class SparseCSR(object):
 
     def __delitem__(self, key):
         """ Remove items from the sparse patterns """
+        self._modified()
         # Get indices of sparse data (-1 if non-existing)
         key = list(key)
         key[0] = self._slice2list(key[0], 0)
@@ -903,6 +1089,7 @@ class SparseCSR(object):
             # There are no elements to delete...
             return
 
+        self._own_pattern()
         # Get short-hand
         ptr = self.ptr
         ncol = self.ncol
@@ -974,6 +1161,7 @@ class SparseCSR(object):
         If the `data` parameter is ``None`` or an array
         only with `None` then the data will not be stored.
         """
+        self._modified()
         # Ensure data type... possible casting...
         if data is None:
             return
@@ -1060,6 +1248,7 @@ class SparseCSR(object):
         atol : float, optional
             absolute tolerance below this value will be considered 0.
         """
+        self._modified()
         shape2 = self.shape[2]
 
         ptr = self.ptr
@@ -1123,13 +1312,13 @@ class SparseCSR(object):
 
         new = self.__class__(shape, dtype=dtype, nnz=1)
 
-        # The default sizes are not passed
-        # Hence we *must* copy the arrays
-        # directly
-        copyto(new.ptr, self.ptr, casting='no')
-        copyto(new.ncol, self.ncol, casting='no')
-        new.col = self.col.copy()
+        # The sparsity pattern is shared (copy-on-write)
+        new.ptr = self.ptr
+        new.ncol = self.ncol
+        new.col = self.col
         new._nnz = self.nnz
+        self._shared = True
+        new._shared = True
 
         if dims is None:
             new._D = self._D.astype(dtype, copy=True)
@@ -1321,22 +1510,13 @@ class SparseCSR(object):
     __radd__ = __add__
 
     def __iadd__(self, other):
+        self._modified()
         if isinstance(other, SparseCSR):
             if self.shape != other.shape:
                 raise ValueError('Adding two sparse matrices requires the same shape')
             # Ensure that a is aligned with b
-            self.align(other)
-
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-                sl = slice(bptr, bptr+bn, None)
-
-                # Get positions of b-elements in a:
-                in_a = self._get(r, other.col[sl])
-                self._D[in_a, :] += other._D[sl, :]
+            in_a = self.align(other)
+            self._D[in_a, :] += other._D[other._data_index(), :]
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1360,22 +1540,13 @@ class SparseCSR(object):
         return c
 
     def __isub__(self, other):
+        self._modified()
         if isinstance(other, SparseCSR):
             if self.shape != other.shape:
                 raise ValueError('Subtracting two sparse matrices requires the same shape')
             # Ensure that a is aligned with b
-            self.align(other)
-
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-                sl = slice(bptr, bptr+bn, None)
-
-                # Get positions of b-elements in a:
-                in_a = self._get(r, other.col[sl])
-                self._D[in_a, :] -= other._D[sl, :]
+            in_a = self.align(other)
+            self._D[in_a, :] -= other._D[other._data_index(), :]
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1392,6 +1563,7 @@ class SparseCSR(object):
     __rmul__ = __mul__
 
     def __imul__(self, other):
+        self._modified()
         if isinstance(other, SparseCSR):
             if self.shape != other.shape:
                 raise ValueError('Multiplication of two sparse matrices requires the same shape')
@@ -1401,25 +1573,16 @@ class SparseCSR(object):
             # 0 * float == 0
             # Hence aligning is superfluous
 
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                aptr = self.ptr[r]
-                an = self.ncol[r]
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-
-                acol = self.col[aptr:aptr+an]
-                bcol = other.col[bptr:bptr+bn]
-
-                # Get positions of b-elements in a:
-                in_a = self._get_only(r, bcol)
-                # Everything else *must* be zeroes! :)
-                self._D[in_a, :] *= other._D[bptr:bptr+bn, :]
+            in_a = self._index_map(other)
+            in_b = (in_a >= 0).nonzero()[0]
+            in_a = in_a[in_b]
+            # Everything else *must* be zeroes! :)
+            self._D[in_a, :] *= other._D[other._data_index(), :][in_b, :]
 
-                # Now set everything *not* in b but in a, to zero
-                not_in_b = in1d(acol, bcol, invert=True).nonzero()[0]
-                self._D[aptr+not_in_b, :] = 0
+            # Now set everything *not* in b but in a, to zero
+            not_in_b = np.ones(len(self.col), dtype=np.bool_)
+            not_in_b[in_a] = False
+            self._D[not_in_b, :] = 0
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1440,22 +1603,14 @@ class SparseCSR(object):
         return c
 
     def __idiv__(self, other):
+        self._modified()
         if isinstance(other, SparseCSR):
             if self.shape != other.shape:
                 raise ValueError('Division of two sparse matrices requires the same shape')
 
             # Ensure that a is aligned with b
-            self.align(other)
-
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-
-                # Get positions of b-elements in a:
-                in_a = self._get(r, other.col[bptr:bptr+bn])
-                self._D[in_a, :] /= other._D[bptr:bptr+bn, :]
+            in_a = self.align(other)
+            self._D[in_a, :] /= other._D[other._data_index(), :]
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1471,21 +1626,13 @@ class SparseCSR(object):
         return c
 
     def __ifloordiv__(self, other):
+        self._modified()
         if isinstance(other, SparseCSR):
             if self.shape != other.shape:
                 raise ValueError('Floor-division of two sparse matrices requires the same shape')
             # Ensure that a is aligned with b
-            self.align(other)
-
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-
-                # Get positions of b-elements in a:
-                in_a = self._get(r, other.col[bptr:bptr+bn])
-                self._D[in_a, :] //= other._D[bptr:bptr+bn, :]
+            in_a = self.align(other)
+            self._D[in_a, :] //= other._D[other._data_index(), :]
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1501,21 +1648,13 @@ class SparseCSR(object):
         return c
 
     def __itruediv__(self, other):
+        self._modified()
         if isinstance(other, SparseCSR):
             if self.shape != other.shape:
                 raise ValueError('True-division of two sparse matrices requires the same shape')
             # Ensure that a is aligned with b
-            self.align(other)
-
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-
-                # Get positions of b-elements in a:
-                in_a = self._get(r, other.col[bptr:bptr+bn])
-                self._D[in_a, :].__itruediv__(other._D[bptr:bptr+bn, :])
+            in_a = self.align(other)
+            self._D[in_a, :] /= other._D[other._data_index(), :]
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1538,32 +1677,21 @@ class SparseCSR(object):
         return c
 
     def __ipow__(self, other):
+        self._modified()
         if isinstance(other, SparseCSR):
             if self.shape != other.shape:
                 raise ValueError('True-division of two sparse matrices requires the same shape')
             # Ensure that a is aligned with b
             # 0 ** float == 1.
-            self.align(other)
-
-            # loop and add elements
-            for r in range(self.shape[0]):
-                # pointers
-                aptr = self.ptr[r]
-                an = self.ncol[r]
-                bptr = other.ptr[r]
-                bn = other.ncol[r]
-
-                acol = self.col[aptr:aptr+an]
-                bcol = other.col[bptr:bptr+bn]
-
-                # Get positions of b-elements in a:
-                in_a = self._get(r, bcol)
-                self._D[in_a, :] **= other._D[bptr:bptr+bn, :]
+            in_a = self.align(other)
+            self._D[in_a, :] **= other._D[other._data_index(), :]
 
-                # Now set everything *not* in b but in a, to 1
-                #  float ** 0 == 1
-                not_in_b = in1d(acol, bcol, invert=True).nonzero()[0]
-                self._D[aptr+not_in_b, :] = 1
+            # Now set everything *not* in b but in a, to 1
+            #  float ** 0 == 1
+            not_in_b = np.zeros(len(self.col), dtype=np.bool_)
+            not_in_b[self._data_index()] = True
+            not_in_b[in_a] = False
+            self._D[not_in_b, :] = 1
 
         elif isspmatrix(other):
             tmp = SparseCSR(other, shape=self.shape[:2])
@@ -1586,11 +1714,13 @@ class SparseCSR(object):
 
     def __setstate__(self, state):
         """ Reset state of the object """
+        self._modified()
         self._shape = tuple(state['shape'][:])
         self.ncol = state['ncol']
         self.ptr = insert(_a.cumsumi(self.ncol), 0, 0)
         self.col = state['col']
         self._D = state['D']
+        self._shared = False
 
 
 def ispmatrix(matrix, map_row=None, map_col=None):
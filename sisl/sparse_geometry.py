@@ -1,10 +1,10 @@
 from __future__ import print_function, division
 
 import warnings
-import functools as ftool
 from numbers import Integral
 import numpy as np
 from numpy import int32
+from scipy.sparse import csr_matrix
 from numpy import insert, unique, take, delete, argsort
 from numpy import tile, repeat, concatenate
 
@@ -18,6 +18,7 @@ from ._help import get_dtype
 from ._help import _zip as zip, _range as range, _map as map
 from .utils.ranges import array_arange
 from .sparse import SparseCSR
+from ._sparse import csr_tile
 
 __all__ = ['SparseAtom', 'SparseOrbital']
 
@@ -421,6 +422,70 @@ class _SparseGeometry(object):
 
         return T
 
+    def _tile_repeat(self, reps, axis, count):
+        """ Tile or repeat the sparse geometry along one or all lattice vectors
+
+        Parameters
+        ----------
+        reps : int or (3,) of int
+            number of repetitions along `axis`, or along all lattice vectors
+        axis : int or None
+            the lattice vector, if None `reps` must contain all repetitions
+        count : numpy.ndarray or None
+            if None the sparse geometry is tiled, else it is repeated
+            and `count` is the number of rows per atom
+        """
+        if axis is None:
+            reps = _a.arrayi(reps).ravel()
+            if reps.size != 3:
+                raise ValueError(self.__class__.__name__ + '.tile/repeat requires 3 repetitions when axis is not specified')
+        else:
+            rep = reps
+            reps = _a.onesi(3)
+            reps[axis] = rep
+        if np.any(reps < 1):
+            raise ValueError(self.__class__.__name__ + '.tile/repeat requires positive repetitions')
+
+        # Create the new geometry (axis by axis)
+        geom = self.geometry
+        geom_n = geom.copy()
+        for ax in range(3):
+            if reps[ax] > 1:
+                if count is None:
+                    geom_n = geom_n.tile(reps[ax], ax)
+                else:
+                    geom_n = geom_n.repeat(reps[ax], ax)
+        S = self.__class__(geom_n, self.dim, self.dtype, 1, **self._cls_kwargs())
+
+        # New row (and column) of row i in block t is
+        #   base[i] + mult[i] * dot(t, strides)
+        n = self._size
+        R = reps.prod()
+        if count is None:
+            base = _a.arangei(n)
+            mult = _a.fulli(n, n)
+            strides = _a.arrayi([1, reps[0], reps[0] * reps[1]])
+        else:
+            first = _a.cumsumi(count) - count
+            atom = repeat(_a.arangei(len(count)), count)
+            base = (_a.arangei(n) + (R - 1) * first[atom]).astype(int32)
+            mult = count[atom].astype(int32)
+            strides = _a.arrayi([reps[1] * reps[2], reps[2], 1])
+
+        csr = self._csr
+        D = np.ascontiguousarray(csr._D)
+        ptr, ncol, col, D_n = csr_tile(csr.ptr, csr.ncol, csr.col, D.view(np.uint8), base, mult,
+                                       _a.asarrayi(geom.sc.sc_off), geom_n.sc._isc_off, reps, strides)
+
+        csr_n = S._csr
+        csr_n.ptr = ptr
+        csr_n.ncol = ncol
+        csr_n.col = col
+        csr_n._D = D_n.view(D.dtype).reshape(-1, D.shape[1])
+        csr_n._nnz = len(col)
+        csr_n._finalized = False
+        return S
+
     def spalign(self, other):
         """ See :meth:`~sisl.sparse.SparseCSR.align` for details """
         if isinstance(other, SparseCSR):
@@ -676,7 +741,11 @@ class _SparseGeometry(object):
 
     @classmethod
     def fromsp(cls, geom, *sp):
-        """ Create a sparse model from a preset Geometry and a list of sparse matrices """
+        """ Create a sparse model from a preset Geometry and a list of sparse matrices
+
+        All components share a single sparsity pattern which is the union of the
+        sparsity patterns of the sparse matrices.
+        """
         # Ensure it is a list (no tuples can be used)
         sp = list(sp)
         for i, s in enumerate(sp):
@@ -689,33 +758,36 @@ class _SparseGeometry(object):
 
         # Number of dimensions
         dim = len(sp)
-        nnzpr = 1
         # Sort all indices for the passed sparse matrices
         for i in range(dim):
             sp[i] = sp[i].tocsr()
             sp[i].sort_indices()
             sp[i].sum_duplicates()
 
-            # Figure out the maximum connections per
-            # row to reduce number of re-allocations to 0
-            nnzpr = max(nnzpr, sp[i].nnz // sp[i].shape[0])
-
         # Create the sparse object
-        S = cls(geom, dim, sp[0].dtype, nnzpr)
+        S = cls(geom, dim, sp[0].dtype, 1)
 
         if S._size != sp[0].shape[0]:
             raise ValueError(cls.__name__ + '.fromsp cannot create a new class, the geometry ' + \
                              'and sparse matrices does not have coinciding dimensions size != sp.shape[0]')
 
-        for i in range(dim):
-            ptr = sp[i].indptr
-            col = sp[i].indices
-            D = sp[i].data
-
-            # loop and add elements
-            for r in range(S.shape[0]):
-                sl = slice(ptr[r], ptr[r+1], None)
-                S[r, col[sl], i] = D[sl]
+        # All components share a single sparsity pattern (the union of
+        # the sparsity patterns of the sparse matrices)
+        shape = (sp[0].shape[0], max(s.shape[1] for s in sp))
+        pattern = csr_matrix(shape, dtype=np.int32)
+        for s in sp:
+            pattern = pattern + csr_matrix((np.ones(s.nnz, np.int32), s.indices, s.indptr), shape=shape)
+        pattern.sort_indices()
+        if pattern.nnz > 0 and pattern.indices.max() >= S.shape[1]:
+            raise IndexError('column index is out-of-bounds')
+
+        csr = SparseCSR((np.zeros([pattern.nnz, dim], S.dtype), pattern.indices, pattern.indptr),
+                        shape=S.shape, dtype=S.dtype)
+        for i, s in enumerate(sp):
+            idx = csr._index_map(SparseCSR(s, shape=S.shape[:2]))
+            csr._D[idx, i] = s.data
+        csr._finalized = True
+        S._csr = csr
 
         return S
 
@@ -1087,102 +1159,52 @@ class SparseAtom(_SparseGeometry):
 
         return S
 
-    def tile(self, reps, axis):
+    def tile(self, reps, axis=None):
         """ Create a tiled sparse atom object, equivalent to `Geometry.tile`
 
         The already existing sparse elements are extrapolated
         to the new supercell by repeating them in blocks like the coordinates.
 
-        Notes
-        -----
-        Calling this routine will automatically `finalize` the `SparseAtom`. This
-        is required to greatly increase performance.
+        The sparse elements are created in a single pass (without intermediate
+        objects), also when tiling along several lattice vectors.
 
         Parameters
         ----------
-        reps : int
-            number of repetitions along cell-vector `axis`
-        axis : int
+        reps : int or (3,) of int
+            number of repetitions along cell-vector `axis`, or along all
+            cell-vectors if `axis` is not specified
+        axis : int, optional
             0, 1, 2 according to the cell-direction
 
+        Examples
+        --------
+        >>> s = SparseAtom(geom)
+        >>> s.tile((4, 4, 1)).spsame(s.tile(4, 0).tile(4, 1))
+        True
+
         See Also
         --------
         Geometry.tile: the same ordering as the final geometry
         Geometry.repeat: a different ordering of the final geometry
         repeat: a different ordering of the final geometry
         """
-        # Create the new sparse object
-        g = self.geometry.tile(reps, axis)
-        S = self.__class__(g, self.dim, self.dtype, 1, **self._cls_kwargs())
+        return self._tile_repeat(reps, axis, None)
 
-        # Now begin to populate it accordingly
-        # Retrieve local pointers to the information
-        # regarding the current Hamiltonian sparse matrix
-        geom = self.geometry
-        na = int32(self.na)
-        csr = self._csr
-        ncol = csr.ncol
-        if self.finalized or csr.nnz == csr.ptr[-1]:
-            col = csr.col
-            D = csr._D
-        else:
-            ptr = csr.ptr
-            idx = array_arange(ptr[:-1], n=ncol)
-            col = csr.col[idx]
-            D = csr._D[idx, :]
-            del ptr, idx
-
-        # Information for the new Hamiltonian sparse matrix
-        na_n = int32(S.na)
-        geom_n = S.geom
-
-        # First loop on axis tiling and local
-        # atoms in the geometry
-        sc_index = geom_n.sc_index
-
-        # Create new indptr, indices and D
-        ncol = tile(ncol, reps)
-        # Now indptr is complete
-        indptr = insert(_a.cumsumi(ncol), 0, 0)
-        del ncol
-        indices = _a.emptyi([indptr[-1]])
-        indices.shape = (reps, -1)
-
-        # Now we should fill the data
-        isc = geom.a2isc(col)
-        # resulting atom in the new geometry (without wrapping
-        # for correct supercell, that will happen below)
-        JA = col % na + na * isc[:, axis]
-
-        # Create repetitions
-        for rep in range(reps):
-            # Correct the supercell information
-            isc[:, axis] = JA // na_n
-
-            indices[rep, :] = JA % na_n + sc_index(isc) * na_n
-
-            # Step atoms
-            JA += na
-
-        # Clean-up
-        del isc, JA
-
-        S._csr = SparseCSR((tile(D, (reps, 1)), indices.ravel(), indptr),
-                           shape=(geom_n.na, geom_n.na_s))
-
-        return S
-
-    def repeat(self, reps, axis):
+    def repeat(self, reps, axis=None):
         """ Create a repeated sparse atom object, equivalent to `Geometry.repeat`
 
         The already existing sparse elements are extrapolated
         to the new supercell by repeating them in blocks like the coordinates.
 
+        The sparse elements are created in a single pass (without intermediate
+        objects), also when repeating along several lattice vectors.
+
         Parameters
         ----------
-        reps : int
-            number of repetitions along cell-vector `axis`
-        axis : int
+        reps : int or (3,) of int
+            number of repetitions along cell-vector `axis`, or along all
+            cell-vectors if `axis` is not specified
+        axis : int, optional
             0, 1, 2 according to the cell-direction
 
         See Also
@@ -1191,77 +1213,7 @@ class SparseAtom(_SparseGeometry):
         Geometry.tile: a different ordering of the final geometry
         tile: a different ordering of the final geometry
         """
-        # Create the new sparse object
-        g = self.geometry.repeat(reps, axis)
-        S = self.__class__(g, self.dim, self.dtype, 1, **self._cls_kwargs())
-
-        # Now begin to populate it accordingly
-        # Retrieve local pointers to the information
-        # regarding the current Hamiltonian sparse matrix
-        geom = self.geometry
-        na = int32(self.na)
-        csr = self._csr
-        ncol = csr.ncol
-        if self.finalized or csr.nnz == csr.ptr[-1]:
-            col = csr.col
-            D = csr._D
-        else:
-            ptr = csr.ptr
-            idx = array_arange(ptr[:-1], n=ncol)
-            col = csr.col[idx]
-            D = csr._D[idx, :]
-            del ptr, idx
-
-        # Information for the new Hamiltonian sparse matrix
-        na_n = int32(S.na)
-        geom_n = S.geom
-
-        # First loop on axis tiling and local
-        # atoms in the geometry
-        sc_index = geom_n.sc_index
-
-        # Create new indptr, indices and D
-        ncol = repeat(ncol, reps)
-        # Now indptr is complete
-        indptr = insert(_a.cumsumi(ncol), 0, 0)
-        del ncol
-        indices = _a.emptyi([indptr[-1]])
-
-        # Now we should fill the data
-        isc = geom.a2isc(col)
-        # resulting atom in the new geometry (without wrapping
-        # for correct supercell, that will happen below)
-        JA = (col % na) * reps
-        # Get the offset atoms
-        A = isc[:, axis] - 1
-
-        for rep in range(reps):
-
-            # Update the offset
-            A += 1
-            # Correct supercell information
-            isc[:, axis] = A // reps
-
-            # Create the indices for the repetition
-            idx = array_arange(indptr[rep:-1:reps], n=csr.ncol)
-            indices[idx] = JA + A % reps + sc_index(isc) * na_n
-
-        # Clean-up
-        del isc, JA, A, idx
-
-        # In the repeat we have to tile individual atomic couplings
-        # So we should split the arrays and tile them individually
-        # Now D is made up of D values, per atom
-        if geom.na == 1:
-            D = tile(D, (reps, 1))
-        else:
-            ntile = ftool.partial(tile, reps=(reps, 1))
-            D = np.vstack(tuple(map(ntile, np.split(D, _a.cumsumi(csr.ncol[:-1]), axis=0))))
-
-        S._csr = SparseCSR((D, indices, indptr),
-                           shape=(geom_n.na, geom_n.na_s))
-
-        return S
+        return self._tile_repeat(reps, axis, _a.onesi(self.na))
 
     def rij(self, dtype=np.float64):
         r""" Create a sparse matrix with the distance between atoms
@@ -1764,97 +1716,52 @@ class SparseOrbital(_SparseGeometry):
 
         return SG
 
-    def tile(self, reps, axis):
+    def tile(self, reps, axis=None):
         """ Create a tiled sparse orbital object, equivalent to `Geometry.tile`
 
         The already existing sparse elements are extrapolated
         to the new supercell by repeating them in blocks like the coordinates.
 
+        The sparse elements are created in a single pass (without intermediate
+        objects), also when tiling along several lattice vectors.
+
         Parameters
         ----------
-        reps : int
-            number of repetitions along cell-vector `axis`
-        axis : int
+        reps : int or (3,) of int
+            number of repetitions along cell-vector `axis`, or along all
+            cell-vectors if `axis` is not specified
+        axis : int, optional
             0, 1, 2 according to the cell-direction
 
+        Examples
+        --------
+        >>> s = SparseOrbital(geom)
+        >>> s.tile((4, 4, 1)).spsame(s.tile(4, 0).tile(4, 1))
+        True
+
         See Also
         --------
         Geometry.tile: the same ordering as the final geometry
         Geometry.repeat: a different ordering of the final geometry
         repeat: a different ordering of the final geometry
         """
-        # Create the new sparse object
-        g = self.geometry.tile(reps, axis)
-        S = self.__class__(g, self.dim, self.dtype, 1, **self._cls_kwargs())
-
-        # Now begin to populate it accordingly
-        # Retrieve local pointers to the information
-        # regarding the current Hamiltonian sparse matrix
-        geom = self.geometry
-        no = int32(self.no)
-        csr = self._csr
-        ncol = csr.ncol
-        if self.finalized or csr.nnz == csr.ptr[-1]:
-            col = csr.col
-            D = csr._D
-        else:
-            ptr = csr.ptr
-            idx = array_arange(ptr[:-1], n=ncol)
-            col = csr.col[idx]
-            D = csr._D[idx, :]
-            del ptr, idx
-
-        # Information for the new Hamiltonian sparse matrix
-        no_n = int32(S.no)
-        geom_n = S.geom
-
-        # First loop on axis tiling and local
-        # atoms in the geometry
-        sc_index = geom_n.sc_index
-
-        # Create new indptr, indices and D
-        ncol = tile(ncol, reps)
-        # Now indptr is complete
-        indptr = insert(_a.cumsumi(ncol), 0, 0)
-        del ncol
-        indices = _a.emptyi([indptr[-1]])
-        indices.shape = (reps, -1)
-
-        # Now we should fill the data
-        isc = geom.o2isc(col)
-        # resulting atom in the new geometry (without wrapping
-        # for correct supercell, that will happen below)
-        JO = col % no + no * isc[:, axis]
-
-        # Create repetitions
-        for rep in range(reps):
-            # Correct the supercell information
-            isc[:, axis] = JO // no_n
-
-            indices[rep, :] = JO % no_n + sc_index(isc) * no_n
+        return self._tile_repeat(reps, axis, None)
 
-            # Step orbitals
-            JO += no
-
-        # Clean-up
-        del isc, JO
-
-        S._csr = SparseCSR((tile(D, (reps, 1)), indices.ravel(), indptr),
-                           shape=(geom_n.no, geom_n.no_s))
-
-        return S
-
-    def repeat(self, reps, axis):
+    def repeat(self, reps, axis=None):
         """ Create a repeated sparse orbital object, equivalent to `Geometry.repeat`
 
         The already existing sparse elements are extrapolated
         to the new supercell by repeating them in blocks like the coordinates.
 
+        The sparse elements are created in a single pass (without intermediate
+        objects), also when repeating along several lattice vectors.
+
         Parameters
         ----------
-        reps : int
-            number of repetitions along cell-vector `axis`
-        axis : int
+        reps : int or (3,) of int
+            number of repetitions along cell-vector `axis`, or along all
+            cell-vectors if `axis` is not specified
+        axis : int, optional
             0, 1, 2 according to the cell-direction
 
         See Also
@@ -1863,102 +1770,7 @@ class SparseOrbital(_SparseGeometry):
         Geometry.tile: a different ordering of the final geometry
         tile: a different ordering of the final geometry
         """
-        # Create the new sparse object
-        g = self.geometry.repeat(reps, axis)
-        S = self.__class__(g, self.dim, self.dtype, 1, **self._cls_kwargs())
-
-        # Now begin to populate it accordingly
-        # Retrieve local pointers to the information
-        # regarding the current Hamiltonian sparse matrix
-        geom = self.geometry
-        no = int32(self.no)
-        csr = self._csr
-        ncol = csr.ncol
-        if self.finalized or csr.nnz == csr.ptr[-1]:
-            col = csr.col
-            D = csr._D
-        else:
-            ptr = csr.ptr
-            idx = array_arange(ptr[:-1], n=ncol)
-            col = csr.col[idx]
-            D = csr._D[idx, :]
-            del ptr, idx
-
-        # Information for the new Hamiltonian sparse matrix
-        no_n = int32(S.no)
-        geom_n = S.geom
-
-        # First loop on axis tiling and local
-        # orbitals in the geometry
-        sc_index = geom_n.sc_index
-
-        # Create new indptr, indices and D
-        ncol = repeat(ncol, reps)
-        # Now indptr is complete
-        indptr = insert(_a.cumsumi(ncol), 0, 0)
-        del ncol
-        indices = _a.emptyi([indptr[-1]])
-
-        # Now we should fill the data
-        isc = geom.o2isc(col)
-        # resulting orbital in the new geometry (without wrapping
-        # for correct supercell, that will happen below)
-        JO = col % no
-        # Get number of orbitals per atom (lasto - firsto + 1)
-        # This is faster than the direct call
-
-        ja = geom.o2a(JO)
-        oJ = geom.firsto[ja]
-        oA = geom.lasto[ja] + 1 - oJ
-        # Shift the orbitals corresponding to the
-        # repetitions of all previous atoms
-        JO += oJ * (reps - 1)
-        # Get the offset orbitals
-        O = isc[:, axis] - 1
-        # We need to create and indexable atomic array
-        # This is required for multi-orbital cases where
-        # we should tile atomic orbitals, and repeat the atoms (only).
-        # 'A' is now the first (non-repeated) atom in the new structure
-        A = _a.arangei(geom.na) * reps
-        AO = geom_n.lasto[A] - geom_n.firsto[A] + 1
-        # subtract AO for first iteration in repetition loop
-        OA = geom_n.firsto[A] - AO
-
-        # Clean
-        del ja, oJ, A
-
-        # Get view of ncol
-        ncol = self._csr.ncol
-
-        # Create repetitions
-        for _ in range(reps):
-
-            # Update atomic offset
-            OA += AO
-            # Update the offset
-            O += 1
-            # Correct supercell information
-            isc[:, axis] = O // reps
-
-            # Create the indices for the repetition
-            idx = array_arange(indptr[array_arange(OA, n=AO)], n=ncol)
-            indices[idx] = JO + oA * (O % reps) + sc_index(isc) * no_n
-
-        # Clean-up
-        del isc, JO, O, OA, AO, idx
-
-        # In the repeat we have to tile individual atomic couplings
-        # So we should split the arrays and tile them individually
-        # Now D is made up of D values, per atom
-        if geom.na == 1:
-            D = tile(D, (reps, 1))
-        else:
-            ntile = ftool.partial(tile, reps=(reps, 1))
-            D = np.vstack(tuple(map(ntile, np.split(D, _a.cumsumi(ncol)[geom.lasto[:geom.na-1]], axis=0))))
-        S._csr = SparseCSR((D, indices, indptr),
-                           shape=(geom_n.no, geom_n.no_s))
-
-        return S
+        return self._tile_repeat(reps, axis, self.geometry.orbitals)
 
     def rij(self, what='orbital', dtype=np.float64):
         r""" Create a sparse matrix with the distance between atoms/orbitals
@@ -2298,6 +2110,7 @@ class SparseOrbital(_SparseGeometry):
 
         # Correct the new csr shape
         csr = total._csr
+        csr._own_pattern()
         csr._shape = (total_no, total_no * n_s, csr.dim)
 
         # Fix columns in the self part
@@ -6,6 +6,7 @@ from __future__ import print_function, division
 
 import math
 from numbers import Integral
+from itertools import product
 import numpy as np
 from numpy import dot
 
@@ -882,6 +883,42 @@ class SuperCell(object):
             return ang
         return math.degrees(ang)
 
+    def symmetry_operations(self, tol=1e-5):
+        r""" Point-group operations of the lattice, in reduced coordinates
+
+        An operation is an integer matrix :math:`\mathbf W` which transforms the lattice vectors
+        to a rotated (or mirrored) version of the same lattice, i.e. the metric is retained:
+
+        .. math::
+           \mathbf W \mathbf G \mathbf W^T = \mathbf G, \quad \mathbf G = \mathbf A \mathbf A^T
+
+        where :math:`\mathbf A` is `cell`.
+        Fractional coordinates transform as ``fxyz.dot(W)`` and reduced :math:`\mathbf k`-points
+        as ``k.dot(W.T)`` (for the group as a whole).
+
+        Only matrices with elements in :math:`\{-1, 0, 1\}` are searched, hence the lattice vectors
+        should be the shortest possible (Niggli reduced), as is the case for all standard cells.
+
+        Parameters
+        ----------
+        tol : float, optional
+           relative tolerance of the metric
+
+        Returns
+        -------
+        numpy.ndarray
+            integer operations of shape ``(nop, 3, 3)``, the first being the identity
+        """
+        # All integer matrices with elements in {-1, 0, 1}
+        W = np.array(list(product((0, 1, -1), repeat=9)), dtype=np.int32).reshape(-1, 3, 3)
+        G = dot(self.cell, self.cell.T)
+        WGW = np.einsum('aij,jk,alk->ail', W, G, W)
+        same = (np.abs(WGW - G.reshape(1, 3, 3)) <= tol * np.abs(G).max()).reshape(-1, 9).all(1)
+        W = W[same]
+        # Sort the identity first
+        idx = np.argsort(np.abs(W - np.eye(3, dtype=np.int32)).reshape(-1, 9).sum(1), kind='mergesort')
+        return W[idx]
+
     @staticmethod
     def read(sile, *args, **kwargs):
         """ Reads the supercell from the `Sile` using ``Sile.read_supercell``
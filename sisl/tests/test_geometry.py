@@ -236,6 +236,16 @@ class TestGeometry(object):
         assert np.allclose(fxyz, [[0, 0, 0], [1./3, 1./3, 0]])
         assert np.allclose(np.dot(fxyz, setup.g.cell), setup.g.xyz)
 
+    def test_symmetry_operations(self, setup):
+        ops, t = setup.g.symmetry_operations(ret_trans=True)
+        assert len(ops) == 24
+        assert np.allclose(ops[0], np.eye(3))
+        assert np.allclose(t[0], 0)
+        # hBN only has half the operations
+        g = setup.g.copy()
+        g.atoms[1] = Atom(5, R=g.atoms[0].R)
+        assert len(g.symmetry_operations()) == 12
+
     def test_axyz(self, setup):
         assert np.allclose(setup.g[:], setup.g.xyz[:])
         assert np.allclose(setup.g[0], setup.g.xyz[0, :])
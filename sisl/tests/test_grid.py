@@ -151,6 +151,44 @@ class TestGrid(object):
         # grid... Perhaps this is ok, but not good... :(
         assert np.allclose(setup.g.grid, g1.grid)
 
+    @pytest.mark.parametrize("method", ['linear', 'nearest', 'cubic', 'fft'])
+    def test_interp_periodic(self, setup, method):
+        g = Grid([10, 11, 12], sc=setup.sc)
+        g.grid = np.random.rand(*g.shape)
+        up = g.interp([20, 22, 24], method)
+        # Periodic grids retain the original grid points
+        assert np.allclose(up.grid[::2, ::2, ::2], g.grid)
+        assert np.allclose(up.interp(g.shape, method).grid, g.grid)
+
+    def test_interp_fft(self, setup):
+        g = Grid([16, 16, 16], sc=setup.sc)
+        x = np.arange(16) / 16
+        g.grid = np.sin(2 * np.pi * x).reshape(-1, 1, 1) * np.cos(2 * np.pi * x).reshape(1, -1, 1) * np.ones([1, 1, 16])
+        g1 = g.interp([30, 20, 16], 'fft')
+        x0 = np.arange(30) / 30
+        x1 = np.arange(20) / 20
+        assert np.allclose(g1.grid, np.sin(2 * np.pi * x0).reshape(-1, 1, 1) * np.cos(2 * np.pi * x1).reshape(1, -1, 1))
+
+    def test_interp_kwargs(self, setup):
+        from scipy.signal import resample
+        g = Grid([10, 11, 12], sc=setup.sc)
+        g.grid = np.random.rand(*g.shape)
+        g1 = g.interp([20, 11, 12], 'fft', window='hann')
+        assert np.allclose(g1.grid, resample(g.grid, 20, axis=0, window='hann'))
+
+    @pytest.mark.xfail(raises=ValueError)
+    def test_interp_kwargs_fail(self, setup):
+        setup.g.interp([10, 10, 10], 'linear', fill_value=0.)
+
+    def test_interp_non_periodic(self, setup):
+        from scipy.interpolate import RegularGridInterpolator
+        g = Grid([7, 8, 9], sc=setup.sc, bc=Grid.DIRICHLET)
+        g.grid = np.random.rand(*g.shape)
+        shape = [11, 5, 13]
+        f = RegularGridInterpolator([np.linspace(0, 1, n) for n in g.shape], g.grid)
+        xyz = np.stack(np.meshgrid(*[np.linspace(0, 1, n) for n in shape], indexing='ij'), -1)
+        assert np.allclose(f(xyz), g.interp(shape).grid)
+
     def test_index_ndim1(self, setup):
         mid = np.array(setup.g.shape, np.int32) // 2 - 1
         v = [0.001, 0., 0.001]
@@ -361,3 +399,144 @@ def test_grid_fold():
     assert np.all(grid.index_fold(idx, False) == idx)
     assert not np.all(grid.index_fold(idx) == idx) # sorted from unique
     assert np.all(grid.index_fold(idx) == np.sort(idx, axis=0))
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+def test_grid_poisson_periodic(dtype):
+    sc = SuperCell([4, 5, 6, 90, 70, 60])
+    grid = Grid([20, 24, 28], sc=sc, dtype=dtype)
+    fxyz = np.stack(np.meshgrid(*[np.arange(n) / n for n in grid.shape], indexing='ij'), -1)
+    G = np.array([1, -2, 1])
+    V = np.cos(2 * np.pi * fxyz.dot(G))
+    k = 2 * np.pi * G.dot(sc.icell)
+    # The constant is removed from the source
+    grid.grid = V * k.dot(k) + 3.
+    assert np.allclose(grid.poisson().grid, V)
+
+
+@pytest.mark.parametrize("bc", [[Grid.DIRICHLET, Grid.DIRICHLET],
+                                [Grid.NEUMANN, Grid.DIRICHLET],
+                                [Grid.DIRICHLET, Grid.NEUMANN]])
+@pytest.mark.parametrize("axis", [0, 1, 2])
+def test_grid_poisson_bc(bc, axis):
+    shape = [1, 1, 1]
+    shape[axis] = 10
+    grid = Grid(shape, sc=SuperCell([4, 5, 6]))
+    grid.bc[axis, :] = bc
+    rho = np.random.rand(10)
+    grid.grid = rho.reshape(shape)
+
+    # Explicit finite difference stencil
+    h = grid.cell[axis, axis] / 10
+    A = (np.diag(np.full(10, -2.)) + np.diag(np.ones(9), 1) + np.diag(np.ones(9), -1)) / h ** 2
+    if bc[0] == Grid.NEUMANN:
+        A[0, 0] += 1 / h ** 2
+    if bc[1] == Grid.NEUMANN:
+        A[-1, -1] += 1 / h ** 2
+    V = np.linalg.solve(A, -rho)
+    assert np.allclose(grid.poisson().grid.ravel(), V)
+
+
+@pytest.mark.xfail(raises=NotImplementedError)
+def test_grid_poisson_fail():
+    grid = Grid([4, 5, 6], bc=Grid.DIRICHLET)
+    grid.poisson()
+
+
+@pytest.mark.parametrize("shape", [Ellipsoid([1., 0.5, 2.], center=[2., 1., 3.]),
+                                   Cuboid([1., 1.5, 0.5], center=[2., 1., 3.])])
+def test_grid_index_shape_brute(shape):
+    sc = SuperCell([4, 5, 6, 90, 70, 60])
+    grid = Grid([20, 24, 28], sc=sc)
+    idx = grid.index(shape)
+    # All points in the grid and its neighbouring images
+    i = np.stack(np.meshgrid(*[np.arange(-n, 2 * n) for n in grid.shape], indexing='ij'), -1).reshape(-1, 3)
+    i = i[shape.within_index(grid.index2xyz(i))]
+    assert len(idx) == len(i)
+    assert np.all(np.unique(idx, axis=0) == np.unique(i, axis=0))
+
+
+def test_grid_partition_voronoi():
+    sc = SuperCell([4, 5, 6, 90, 70, 60])
+    geom = Geometry([[0.5, 0.5, 0.5], [2., 2., 3.], [3.5, 4., 5.5]], Atom(1, R=1.), sc=sc)
+    grid = Grid([10, 12, 14], sc=sc, geometry=geom)
+    labels = grid.partition()
+    assert labels.shape == grid.shape
+
+    # Brute-force closest atom (including periodic images)
+    i = np.stack(np.meshgrid(*[np.arange(n) for n in grid.shape], indexing='ij'), -1).reshape(-1, 3)
+    xyz = grid.index2xyz(i)
+    d = np.full([len(xyz), geom.na], np.inf)
+    for a in [-1, 0, 1]:
+        for b in [-1, 0, 1]:
+            for c in [-1, 0, 1]:
+                off = np.dot([a, b, c], sc.cell)
+                dd = ((xyz[:, None, :] - geom.xyz[None, :, :] - off) ** 2).sum(-1) ** .5
+                d = np.minimum(d, dd)
+    assert np.all(labels.ravel() == np.argmin(d, axis=1))
+
+    # The charge is conserved for all atoms
+    grid.grid = np.random.rand(*grid.shape)
+    Q = grid.integrate(labels, minlength=geom.na)
+    assert Q.shape == (geom.na,)
+    assert np.allclose(Q.sum(), grid.integrate())
+
+
+def test_grid_partition_sphere():
+    sc = SuperCell([5, 6, 7])
+    geom = Geometry([[1.5, 1.5, 1.5], [3., 3.5, 4.]], [Atom(1, R=1.), Atom(2, R=1.5)], sc=sc)
+    grid = Grid([20, 24, 28], sc=sc, geometry=geom)
+    labels = grid.partition(method='sphere')
+    assert np.any(labels == -1)
+    for ia, R in enumerate([1., 1.5]):
+        idx = np.array(np.nonzero(labels == ia)).T
+        d = ((grid.index2xyz(idx) - geom.xyz[ia]) ** 2).sum(-1) ** .5
+        assert np.all(d <= R)
+        # All points within the sphere (not closer to the other atom) are found
+        sphere = grid.index_fold(grid.index(geom.atoms[ia].toSphere(geom.xyz[ia])))
+        assert np.all(np.isin(labels[sphere[:, 0], sphere[:, 1], sphere[:, 2]], [ia]))
+
+    # Integrating labels is the same as integrating the shape
+    grid.grid = np.random.rand(*grid.shape) + 1j * np.random.rand(*grid.shape)
+    Q = grid.integrate(labels)
+    assert np.allclose(Q[0], grid.integrate(geom.atoms[0].toSphere(geom.xyz[0])))
+    Q = grid.integrate([geom.atoms[ia].toSphere(geom.xyz[ia]) for ia in range(2)])
+    assert Q.shape == (2,)
+    assert np.iscomplexobj(Q)
+
+
+def test_grid_partition_sphere_dense():
+    # Many small atoms are closer to the grid points than the large atom
+    sc = SuperCell([3, 3, 3])
+    xyz = np.random.rand(40, 3) * 3
+    R = np.full(40, 0.2)
+    R[0] = 2.7
+    geom = Geometry(xyz, Atom(1, R=1.), sc=sc)
+    grid = Grid([12, 12, 12], sc=sc, geometry=geom)
+    labels = grid.partition(method='sphere', R=R)
+
+    # Brute-force closest atom within its radius (including periodic images)
+    i = np.stack(np.meshgrid(*[np.arange(n) for n in grid.shape], indexing='ij'), -1).reshape(-1, 3)
+    xyz = grid.index2xyz(i)
+    d = np.full([len(xyz), geom.na], np.inf)
+    for a in [-1, 0, 1]:
+        for b in [-1, 0, 1]:
+            for c in [-1, 0, 1]:
+                off = np.dot([a, b, c], sc.cell)
+                dd = ((xyz[:, None, :] - geom.xyz[None, :, :] - off) ** 2).sum(-1) ** .5
+                d = np.minimum(d, dd)
+    d[d > R.reshape(1, -1)] = np.inf
+    ref = np.where(np.isfinite(d).any(1), np.argmin(d, axis=1), -1)
+    assert np.all(labels.ravel() == ref)
+    assert np.all(labels >= 0)
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_grid_partition_fail():
+    Grid([4, 5, 6]).partition()
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_grid_integrate_fail():
+    grid = Grid([4, 5, 6])
+    grid.integrate(np.zeros([4, 5, 5], np.int32))
@@ -2,6 +2,7 @@ from __future__ import print_function, division
 
 import pytest
 
+import sys
 import math as m
 import numpy as np
 import scipy as sc
@@ -950,3 +951,136 @@ def test_sparse_row_out_of_bounds(i):
 def test_sparse_column_out_of_bounds(j):
     S = SparseCSR((10, 10, 1), dtype=np.int32)
     S[0, j] = 1
+
+
+def _random_sparse(seed, nnzpr=5):
+    # Random (unsorted, non-finalized) sparse matrix with many zero rows
+    rng = np.random.RandomState(seed)
+    S = SparseCSR((50, 60, 2), nnzpr=2)
+    for r in rng.randint(50, size=40):
+        S[r, rng.choice(60, rng.randint(nnzpr), replace=False)] = rng.rand(2) + 1
+    return S
+
+
+@pytest.mark.parametrize("op", ['add', 'sub', 'mul', 'truediv', 'pow'])
+def test_sparse_op_random(op):
+    S1 = _random_sparse(1)
+    S2 = _random_sparse(2)
+    s = getattr(S1, '__{}__'.format(op))(S2)
+    d1 = np.stack([S1.tocsr(i).toarray() for i in range(2)])
+    d2 = np.stack([S2.tocsr(i).toarray() for i in range(2)])
+    d = np.stack([s.tocsr(i).toarray() for i in range(2)])
+    in1 = d1 != 0
+    in2 = d2 != 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expected = getattr(d1, '__{}__'.format(op))(d2)
+    if op == 'truediv':
+        # Elements not in S2 are not divided
+        expected[~in2] = d1[~in2]
+    elif op == 'pow':
+        # Only elements of both matrices
+        expected[~(in1 | in2)] = 0
+    assert np.allclose(d, expected)
+
+
+def test_sparse_align_index_map():
+    S1 = _random_sparse(3)
+    S2 = _random_sparse(4)
+    S = S1.copy()
+    idx = S.align(S2)
+    assert not S.spsame(S1)
+    assert S.nnz == len(np.union1d(*[S_.tocsr(0).nonzero()[0] * 60 + S_.tocsr(0).nonzero()[1]
+                                       for S_ in [S1, S2]]))
+    # Re-aligning does not change anything
+    assert np.all(S.align(S2) == idx)
+    # The index map gives the location of each element
+    for r, c in zip(*S2.tocsr(0).nonzero()):
+        i = S._get(r, c)[0]
+        assert i in idx
+    # The original elements are retained
+    assert np.allclose(S.tocsr(0).toarray(), S1.tocsr(0).toarray())
+    # spsame
+    S2.align(S)
+    assert S.spsame(S2)
+    assert S2.spsame(S)
+    r = (S2.ncol > 0).nonzero()[0][0]
+    del S2[r, S2.col[S2.ptr[r]]]
+    assert not S.spsame(S2)
+    assert not S2.spsame(S)
+
+
+def test_sparse_index_map_cache(monkeypatch):
+    # sisl.sparse is shadowed by sisl.physics.sparse in the sisl namespace
+    sparse = sys.modules[SparseCSR.__module__]
+    calls = []
+    index_map = sparse.csr_index_map
+
+    def count(*args):
+        calls.append(1)
+        return index_map(*args)
+    monkeypatch.setattr(sparse, 'csr_index_map', count)
+
+    S1 = _random_sparse(3)
+    S2 = _random_sparse(4)
+    S = S1.copy()
+    S += S2
+    n = len(calls)
+    # Repeated additions re-use the index map
+    for _ in range(3):
+        S += S2
+    assert len(calls) == n
+    d = S1.tocsr(0).toarray() + 4 * S2.tocsr(0).toarray()
+    assert np.allclose(S.tocsr(0).toarray(), d)
+
+    # Changing either sparsity pattern invalidates the map
+    r = (S2.ncol > 0).nonzero()[0][0]
+    del S2[r, S2.col[S2.ptr[r]]]
+    S += S2
+    assert len(calls) == n + 1
+    assert np.allclose(S.tocsr(0).toarray(), d + S2.tocsr(0).toarray())
+
+
+def test_sparse_copy_shared_pattern():
+    S1 = _random_sparse(5)
+    r = (S1.ncol > 0).nonzero()[0][0]
+    c = S1.col[S1.ptr[r]]
+    c_new = np.setdiff1d(np.arange(S1.shape[1]), S1.col[S1.ptr[r]:S1.ptr[r]+S1.ncol[r]])[0]
+    nnz = S1.nnz
+
+    S2 = S1.copy()
+    assert S1.is_pattern_shared(S2)
+    # Changing existing elements does not change the pattern
+    S2[r, c] = 3.
+    assert S1.is_pattern_shared(S2)
+    assert S1[r, c, 0] != 3.
+
+    # Copy-on-write of the pattern
+    S2[r, c_new] = 1.
+    assert not S1.is_pattern_shared(S2)
+    assert S1.nnz == nnz
+    assert S1[r, c_new, 0] == 0.
+    S3 = S1.copy()
+    del S3[r, c]
+    assert S1.nnz == nnz
+    assert S1[r, c, 0] != 0.
+    S3 = S1.copy()
+    S3.finalize()
+    assert S3.spsame(S1)
+    assert S1.nnz == nnz
+
+
+def test_sparse_share_pattern():
+    S1 = _random_sparse(6)
+    S2 = S1.copy()
+    S2.finalize()
+    S2 *= 2
+    assert not S1.is_pattern_shared(S2)
+    S2.share_pattern(S1)
+    assert S1.is_pattern_shared(S2)
+    assert np.allclose((S1 * 2).tocsr(1).toarray(), S2.tocsr(1).toarray())
+    assert np.allclose((S2 - S1).tocsr(0).toarray(), S1.tocsr(0).toarray())
+
+
+@pytest.mark.xfail(raises=ValueError)
+def test_sparse_share_pattern_fail():
+    _random_sparse(7).share_pattern(_random_sparse(8))
@@ -267,6 +267,32 @@ class TestSparseAtom(object):
         s2.finalize()
         assert np.allclose(s1._csr._D, s2._csr._D)
 
+    def test_tile3(self, setup):
+        setup.s1.construct([[0.1, 1.5], [1, 2]])
+        s1 = setup.s1.tile((2, 3, 1))
+        s2 = setup.s1.tile(2, 0).tile(3, 1)
+        setup.s1.empty()
+        assert s1.geometry == s2.geometry
+        assert s1.spsame(s2)
+        s1.finalize()
+        s2.finalize()
+        assert np.allclose(s1._csr._D, s2._csr._D)
+
+    def test_repeat3(self, setup):
+        setup.s1.construct([[0.1, 1.5], [1, 2]])
+        s1 = setup.s1.repeat((2, 1, 3))
+        setup.s1.empty()
+        s2 = SparseAtom(setup.g * ([2, 1, 3], 'r'))
+        s2.construct([[0.1, 1.5], [1, 2]])
+        assert s1.spsame(s2)
+        s1.finalize()
+        s2.finalize()
+        assert np.allclose(s1._csr._D, s2._csr._D)
+
+    @pytest.mark.xfail(raises=ValueError)
+    def test_tile_fail(self, setup):
+        setup.s1.tile((2, 3))
+
     def test_supercell_poisition1(self, setup):
         g1 = setup.g.copy()
         g2 = setup.g.translate([100, 100, 100])
@@ -145,3 +145,38 @@ def test_sparse_orbital_sub_orbital():
     spo_rem = spo.remove_orbital([0, 1], 1)
     spo_sub = spo.sub_orbital(0, [0, 2]).sub_orbital(1, 0)
     assert spo_rem.spsame(spo_sub)
+
+
+@pytest.mark.parametrize("reps", [(2, 1, 1), (1, 3, 1), (2, 2, 3)])
+def test_sparse_orbital_repeat_tile_multi(reps):
+    # Different number of non-zero elements for the orbitals on an atom
+    g = Geometry([[0, 0, 0], [0.5, 0.5, 0.5]], [Atom(1, R=[1.1, 1.1]), Atom(1, R=[1.1, 1.1, 1.1])],
+                 sc=SuperCell(1., nsc=[3, 3, 3]))
+    s = SparseOrbital(g, dtype=np.complex128)
+    for io in range(g.no):
+        for jo in range(io % 4 + 1):
+            s[io, (io + jo * 7) % g.no_s] = io + 1 + 1j * jo
+
+    # Sequential single axis operations are the same
+    tile = s.tile(reps)
+    repeat = s.repeat(reps)
+    S = s
+    for ax in range(3):
+        S = S.tile(reps[ax], ax)
+    assert tile.geometry == S.geometry
+    assert abs(tile.tocsr() - S.tocsr()).max() == 0.
+    S = s
+    for ax in range(3):
+        S = S.repeat(reps[ax], ax)
+    assert repeat.geometry == S.geometry
+    assert abs(repeat.tocsr() - S.tocsr()).max() == 0.
+    assert repeat.nnz == tile.nnz
+
+    # The repeated matrix is a permutation of the tiled matrix
+    gt = tile.geometry
+    gr = repeat.geometry
+    atom = np.argmin(((gr.xyz[:, None, :] - gt.xyz[None, :, :]) ** 2).sum(-1), axis=1)
+    assert np.allclose(gr.xyz, gt.xyz[atom])
+    orb = np.concatenate([gt.a2o(ia, all=True) for ia in atom])
+    orb = np.concatenate([orb + gt.no * isc for isc in range(gt.n_s)])
+    assert abs(repeat.tocsr() - tile.tocsr()[orb[:gt.no], :][:, orb]).max() == 0.
@@ -417,3 +417,11 @@ def test_tocuboid_complex():
     assert np.allclose(sc.cell, c1._v)
     c2 = sc.toCuboid(True)
     assert not np.allclose(np.diagonal(c1._v), np.diagonal(c2._v))
+
+
+def test_symmetry_operations():
+    ops = SuperCell(1).symmetry_operations()
+    assert len(ops) == 48
+    assert np.allclose(ops[0], np.eye(3))
+    assert len(SuperCell([2, 2, 10, 90, 90, 60]).symmetry_operations()) == 24
+    assert len(SuperCell([1, 2, 3]).symmetry_operations()) == 8
@@ -0,0 +1,41 @@
+from __future__ import print_function, division
+
+import pytest
+
+import numpy as np
+
+from sisl import Geometry, Trajectory
+from sisl.geom import graphene
+
+
+pytestmark = pytest.mark.trajectory
+
+
+def test_trajectory_index():
+    g = graphene()
+    xyz = np.stack([g.xyz + i for i in range(5)])
+    traj = Trajectory(xyz, g.atoms, g.cell, g.nsc)
+    assert len(traj) == 5
+    assert traj.na == g.na
+    assert traj.cell.shape == (5, 3, 3)
+
+    g2 = traj[2]
+    assert isinstance(g2, Geometry)
+    assert np.allclose(g2.xyz, g.xyz + 2)
+    assert g2.sc == g.sc
+    assert g2.atoms == g.atoms
+
+    sub = traj[1::2]
+    assert isinstance(sub, Trajectory)
+    assert len(sub) == 2
+    assert np.allclose(sub.xyz[1], g.xyz + 3)
+    assert len(list(sub)) == 2
+
+
+def test_trajectory_fromgeometries():
+    g = graphene()
+    geoms = [g.move([i, 0, 0]) for i in range(3)]
+    traj = Trajectory.fromgeometries(geoms)
+    assert len(traj) == 3
+    for geom, g2 in zip(geoms, traj):
+        assert geom == g2
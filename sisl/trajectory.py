@@ -0,0 +1,128 @@
+from __future__ import print_function, division
+
+from numbers import Integral
+
+import numpy as np
+
+from . import _array as _a
+from .supercell import SuperCell
+from .atom import Atoms
+from .geometry import Geometry
+
+__all__ = ['Trajectory']
+
+
+class Trajectory(object):
+    """ A sequence of geometries with the same atoms, e.g. a molecular dynamics simulation
+
+    Only a single `Atoms` object is stored together with the coordinates and
+    lattice vectors of all frames. This is far more compact than a list of
+    `Geometry` objects. Each frame may be extracted as a `Geometry` by indexing.
+
+    .. code:: python
+
+       >>> traj = get_sile('MD.xyz').read_geometry(all=True)
+       >>> traj.xyz.shape
+       (nframes, na, 3)
+       >>> geom = traj[-1] # the last frame as a Geometry
+       >>> traj = traj[::10] # every 10th frame as a Trajectory
+
+    Parameters
+    ----------
+    xyz : (nframes, na, 3) array_like
+       atomic coordinates of all frames
+    atom : Atoms or list of Atom, optional
+       the atoms (same for all frames)
+    cell : (3, 3) or (nframes, 3, 3) array_like, optional
+       lattice vectors, either the same for all frames or for each frame.
+       Defaults to the unit-cell.
+    nsc : (3,) of int, optional
+       number of supercells along each lattice vector
+
+    Attributes
+    ----------
+    xyz : (nframes, na, 3) numpy.ndarray
+       atomic coordinates
+    cell : (nframes, 3, 3) numpy.ndarray
+       lattice vectors of each frame
+    atoms : Atoms
+       the atoms of all frames
+    nsc : (3,) numpy.ndarray
+       number of supercells along each lattice vector
+    """
+
+    def __init__(self, xyz, atom=None, cell=None, nsc=None):
+        xyz = _a.asarrayd(xyz)
+        self.xyz = xyz.reshape(-1, xyz.shape[-2], 3)
+        nframes, na = self.xyz.shape[:2]
+        self.atoms = Atoms(atom, na=na)
+        if cell is None:
+            cell = np.identity(3)
+        cell = _a.asarrayd(cell)
+        if cell.ndim == 2:
+            cell = np.tile(cell.reshape(1, 3, 3), (nframes, 1, 1))
+        self.cell = cell.reshape(nframes, 3, 3)
+        if nsc is None:
+            nsc = [1, 1, 1]
+        self.nsc = _a.arrayi(nsc).ravel()
+
+    @property
+    def na(self):
+        """ Number of atoms in each frame """
+        return self.xyz.shape[1]
+
+    @property
+    def nframes(self):
+        """ Number of frames """
+        return self.xyz.shape[0]
+
+    def __len__(self):
+        """ Number of frames """
+        return self.nframes
+
+    def geometry(self, frame):
+        """ The `Geometry` of a single frame
+
+        Parameters
+        ----------
+        frame : int
+           the frame index
+        """
+        return Geometry(self.xyz[frame].copy(), self.atoms.copy(),
+                        sc=SuperCell(self.cell[frame].copy(), nsc=self.nsc))
+
+    def __getitem__(self, key):
+        """ A single frame as a `Geometry`, or a subset of the frames as a `Trajectory` """
+        if isinstance(key, Integral):
+            return self.geometry(key)
+        traj = self.__class__.__new__(self.__class__)
+        traj.xyz = self.xyz[key]
+        traj.cell = self.cell[key]
+        traj.atoms = self.atoms
+        traj.nsc = self.nsc
+        return traj
+
+    def __iter__(self):
+        """ Iterate the frames as `Geometry` objects """
+        for i in range(len(self)):
+            yield self.geometry(i)
+
+    @classmethod
+    def fromgeometries(cls, geometries):
+        """ Create a trajectory from a list of geometries with the same atoms
+
+        Parameters
+        ----------
+        geometries : list of Geometry
+           the frames, the atoms and supercells of the first geometry are used for all frames
+        """
+        geom = geometries[0]
+        xyz = np.stack([g.xyz for g in geometries])
+        cell = np.stack([g.cell for g in geometries])
+        return cls(xyz, geom.atoms, cell, geom.nsc)
+
+    def __str__(self):
+        """ str of the object """
+        s = self.__class__.__name__ + '{{frames: {0}, na: {1},\n '.format(self.nframes, self.na)
+        s += str(self.atoms).replace('\n', '\n ')
+        return (s + ',\n nsc: [{} {} {}]\n}}'.format(*self.nsc)).strip()
@@ -1,7 +1,5 @@
 from __future__ import print_function, division
 
-import pyparsing as pp
-
 
 __all__ = ['unit_group', 'unit_convert', 'unit_default', 'units']
 
@@ -187,10 +185,19 @@ class UnitParser(object):
     unit_table : dict
        a table with the units parsable by the class
     """
-    __slots__ = ['_table', '_p_left', '_left', '_p_right', '_right']
+    __slots__ = ['_table', '_parsers', '_left', '_right']
 
     def __init__(self, table):
         self._table = table
+        self._left = []
+        self._right = []
+        # The parsers are created on first use (pyparsing is slow to import)
+        self._parsers = None
+
+    def _create_parsers(self):
+        """ Create the left and right parsers (only done once) """
+        if self._parsers is not None:
+            return self._parsers
 
         def convert(fr, to):
             tbl = self._table
@@ -213,10 +220,17 @@ class UnitParser(object):
                 raise ValueError('The unit-group {} does not exist!'.format(group))
             return k['DEFAULT']
 
-        self._left = []
-        self._p_left = self.create_parser(convert, default, group, self._left)
-        self._right = []
-        self._p_right = self.create_parser(convert, default, group, self._right)
+        self._parsers = (self.create_parser(convert, default, group, self._left),
+                         self.create_parser(convert, default, group, self._right))
+        return self._parsers
+
+    @property
+    def _p_left(self):
+        return self._create_parsers()[0]
+
+    @property
+    def _p_right(self):
+        return self._create_parsers()[1]
 
     @staticmethod
     def _empty_list(lst):
@@ -226,6 +240,7 @@ class UnitParser(object):
     @staticmethod
     def create_parser(convert, default, group, group_table=None):
         """ Routine to internally create a parser with specified unit_convert, unit_default and unit_group routines """
+        import pyparsing as pp
 
         # Any length of characters will be used as a word.
         if group_table is None:
@@ -339,8 +354,38 @@ class UnitParser(object):
             return False
         return all(a == b for a, b in zip(A, B))
 
+    def _simple(self, A):
+        """ Conversion factor (to the default units) and groups of a simple unit, or None
+
+        A simple unit is one, or two space separated, units in the table.
+        Simple units are converted without the parser.
+        """
+        units = A.split()
+        if not 0 < len(units) < 3:
+            return None
+        conv = 1.
+        groups = []
+        for unit in units:
+            if unit == 'DEFAULT':
+                return None
+            for group, tbl in self._table.items():
+                if unit in tbl:
+                    break
+            else:
+                return None
+            groups.append(group)
+            conv *= tbl[unit] / tbl[tbl['DEFAULT']]
+        return conv, groups
+
     def _convert(self, A, B):
         """ Internal routine used to convert unit `A` to unit `B` """
+        simple_A = self._simple(A)
+        simple_B = self._simple(B)
+        if not (simple_A is None or simple_B is None):
+            if not self.same_group(simple_A[1], simple_B[1]):
+                raise ValueError('The unit conversion is not from the same group: {} to {}!'.format(simple_A[1], simple_B[1]))
+            return simple_A[0] / simple_B[0]
+
         conv_A = self._p_left.parseString(A)[0]
         conv_B = self._p_right.parseString(B)[0]
         if not self.same_group(self._left, self._right):